@@ -1,12 +1,15 @@
 """Database connection and session management."""
 from .base import Base, get_db, engine, SessionLocal, init_db
+from . import events  # 커밋 후 행 변경 알림 리스너 등록
 from .models import (
     CmpInfo, 
     EmpInfo, 
     Env, 
     Report, 
     ChatSession, 
+    ChatMessage,
     DataImportLog,
+    ImportJob,
     Company  # CmpInfo의 별칭
 )
 
@@ -21,6 +24,8 @@ __all__ = [
     "Env",          # 새로운 환경 현황 모델
     "Report", 
     "ChatSession", 
+    "ChatMessage",  # 대화 전체 기록
     "DataImportLog",
+    "ImportJob",    # 백그라운드 가져오기 작업
     "Company"       # 하위 호환성을 위한 별칭
 ]
@@ -1,6 +1,6 @@
 """Database base configuration and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -33,4 +33,19 @@ def get_db() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes()
+
+
+def ensure_indexes(bind=None) -> None:
+    """Create indexes declared on models that are missing from existing tables.
+
+    create_all()은 이미 있는 테이블에 새로 선언한 인덱스를 만들지 않으므로 따로 확인해 생성한다.
+    """
+    bind = bind or engine
+    existing = set(inspect(bind).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
\ No newline at end of file
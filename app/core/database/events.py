@@ -0,0 +1,131 @@
+"""Row-level change notifications delivered after a successful commit.
+
+flush 시점에 구독 중인 모델의 추가/수정/삭제 행을 세션에 모아 두었다가,
+commit이 끝난 뒤에만 구독자에게 전달하고 rollback되면 버린다.
+검색 인덱스처럼 DB 내용을 메모리에 들고 있는 구성 요소가 쓰기 때마다 전체를 다시 읽지 않고
+바뀐 행만 반영하는 데 쓴다.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "_row_changes"
+
+
+@dataclass(frozen=True)
+class RowChange:
+    """커밋된 행 변경 하나.
+
+    - ``op``: ``insert`` / ``update`` / ``delete`` / ``bulk``
+      (``bulk``는 ``query.update()``/``delete()`` 같은 일괄 쿼리라 어느 행이 바뀌었는지 모름)
+    - ``key``: 기본키 값 튜플 (``bulk``는 None)
+    - ``values``: 컬럼 속성 이름 → 변경 후 값 (삭제는 삭제 전 값)
+    - ``previous``: ``update``에서 바뀐 컬럼의 변경 전 값 (기본키가 바뀐 경우 이전 행을 찾는 데 사용)
+    """
+
+    op: str
+    model: type
+    key: Optional[Tuple[Any, ...]] = None
+    values: Dict[str, Any] = field(default_factory=dict)
+    previous: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def previous_key(self) -> Optional[Tuple[Any, ...]]:
+        """기본키가 바뀐 update의 이전 기본키 (바뀌지 않았으면 None)"""
+        if not self.previous or self.key is None:
+            return None
+        pk_attrs = [inspect(self.model).get_property_by_column(c).key for c in inspect(self.model).primary_key]
+        if not any(attr in self.previous for attr in pk_attrs):
+            return None
+        return tuple(self.previous.get(attr, self.values.get(attr)) for attr in pk_attrs)
+
+
+ChangeListener = Callable[[List[RowChange]], None]
+
+_listeners: Dict[type, List[ChangeListener]] = {}
+_lock = threading.Lock()
+
+
+def subscribe(model: type, listener: ChangeListener) -> Callable[[], None]:
+    """모델의 커밋된 변경을 받을 함수 등록 (커밋한 스레드에서 호출됨). 해제 함수 반환."""
+    with _lock:
+        _listeners.setdefault(model, []).append(listener)
+
+    def unsubscribe() -> None:
+        with _lock:
+            if listener in _listeners.get(model, []):
+                _listeners[model].remove(listener)
+
+    return unsubscribe
+
+
+def _snapshot(op: str, obj: Any) -> RowChange:
+    state = inspect(obj)
+    mapper = state.mapper
+    values = {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+    previous = {}
+    if op == "update":
+        for attr in mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if history.deleted:
+                previous[attr.key] = history.deleted[0]
+    return RowChange(op, mapper.class_, tuple(mapper.primary_key_from_instance(obj)), values, previous)
+
+
+def _watched(obj: Any) -> bool:
+    return type(obj) in _listeners
+
+
+@event.listens_for(Session, "after_flush")
+def _collect(session: Session, flush_context: Any) -> None:
+    if not _listeners:
+        return
+    # after_flush 시점에는 new/dirty/deleted가 아직 flush 이전 상태로 남아 있음
+    changes = [_snapshot("insert", obj) for obj in session.new if _watched(obj)]
+    changes += [
+        _snapshot("update", obj)
+        for obj in session.dirty
+        if _watched(obj) and session.is_modified(obj, include_collections=False)
+    ]
+    changes += [_snapshot("delete", obj) for obj in session.deleted if _watched(obj)]
+    if changes:
+        session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state: Any) -> None:
+    if not _listeners or not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in _listeners:
+        orm_execute_state.session.info.setdefault(_PENDING_KEY, []).append(RowChange("bulk", mapper.class_))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    by_model: Dict[type, List[RowChange]] = {}
+    for change in changes:
+        by_model.setdefault(change.model, []).append(change)
+    for model, model_changes in by_model.items():
+        with _lock:
+            listeners = list(_listeners.get(model, ()))
+        for listener in listeners:
+            try:
+                listener(model_changes)
+            except Exception as e:
+                logger.warning("행 변경 구독자 오류 (%s): %s", model.__name__, e)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
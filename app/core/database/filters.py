@@ -0,0 +1,129 @@
+"""Compile search-panel criteria into SQL WHERE clauses.
+
+각 페이지는 검색 패널의 입력 키와 DB 컬럼/연산을 ``FilterSpec`` 목록으로 선언하고,
+입력값 dict를 ``filter_query``에 넘기면 하나의 쿼리 조건으로 변환된다.
+전체 행을 읽어 파이썬에서 반복 필터링하는 대신 DB 인덱스로 한 번에 조회한다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+# 선택 상자의 "전체" 등 조건 없음으로 보는 값
+EMPTY_VALUES = (None, "", "전체")
+
+OPS = ("eq", "like", "prefix", "range", "flag", "year_range", "search")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """검색 조건 하나의 선언.
+
+    - ``eq``: 같음 (값이 list/tuple이면 IN)
+    - ``like``: 부분 일치, 대소문자 무시
+    - ``prefix``: 앞부분 일치 (인덱스 사용 가능)
+    - ``range``: ``(최소, 최대)`` 범위, 각 경계는 생략 가능 / DB 값 = 화면 값 ÷ ``unit`` (예: % → 비율은 100)
+    - ``flag``: Y/N 여부
+    - ``year_range``: YYYYMMDD 문자열 컬럼을 ``(시작년도, 끝년도)``로 검색
+    - ``search``: ``to_db``가 입력값으로 만든 조건식(예: 검색 인덱스의 키 IN 조건)을 그대로 사용,
+      None을 반환하면 ``like``로 대신 검색
+    - ``null_value``: 화면에서 NULL/빈 값을 이 값으로 표시하는 컬럼이면, 조건이 이 값에 맞을 때 NULL 행도 포함
+    """
+
+    key: str
+    column: Any
+    op: str = "eq"
+    unit: float = 1
+    to_db: Optional[Callable[[Any], Any]] = None
+    null_value: Any = None
+
+    def __post_init__(self):
+        if self.op not in OPS:
+            raise ValueError(f"지원하지 않는 필터 연산: {self.op}")
+
+    def _with_null(self, clause: Any, matches_null: bool) -> Any:
+        if self.null_value is None or not matches_null:
+            return clause
+        empty = [self.column.is_(None)]
+        if isinstance(self.null_value, str):
+            empty.append(self.column == "")
+        return or_(clause, *empty)
+
+    def compile(self, value: Any) -> Optional[Any]:
+        """입력값 → 조건식 (조건 없음이면 None)"""
+        if self.op in ("range", "year_range"):
+            low, high = value if isinstance(value, (list, tuple)) else (value, None)
+            if low in EMPTY_VALUES and high in EMPTY_VALUES:
+                return None
+            return self._range(low, high)
+
+        if value in EMPTY_VALUES:
+            return None
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return None
+        if self.op == "search":
+            clause = self.to_db(value) if self.to_db else None
+            if clause is not None:
+                return clause
+            return self.column.ilike(f"%{_escape_like(str(value))}%", escape="\\")
+
+        db_value = self.to_db(value) if self.to_db else value
+
+        if self.op == "like":
+            return self.column.ilike(f"%{_escape_like(str(db_value))}%", escape="\\")
+        if self.op == "prefix":
+            return self.column.like(f"{_escape_like(str(db_value))}%", escape="\\")
+        if self.op == "flag":
+            db_value = str(db_value).upper()
+        if isinstance(db_value, (list, tuple, set)):
+            clause = self.column.in_(list(db_value))
+        else:
+            clause = self.column == db_value
+        return self._with_null(clause, value == self.null_value)
+
+    def _to_unit(self, value: Any) -> Any:
+        return value if self.unit == 1 else value / self.unit
+
+    def _range(self, low: Any, high: Any) -> Any:
+        low = None if low in EMPTY_VALUES else low
+        high = None if high in EMPTY_VALUES else high
+        clauses = []
+        if self.op == "year_range":
+            # YYYYMMDD 문자열 비교: 시작년도 이상, (끝년도 + 1) 미만
+            if low is not None:
+                clauses.append(self.column >= f"{int(low):04d}")
+            if high is not None:
+                clauses.append(self.column < f"{int(high) + 1:04d}")
+            return and_(*clauses)
+
+        if low is not None:
+            clauses.append(self.column >= self._to_unit(low))
+        if high is not None:
+            clauses.append(self.column <= self._to_unit(high))
+        matches_null = self.null_value is not None and (
+            (low is None or self.null_value >= low) and (high is None or self.null_value <= high)
+        )
+        return self._with_null(and_(*clauses), matches_null)
+
+
+def compile_filters(specs: Iterable[FilterSpec], criteria: Mapping[str, Any]) -> List[Any]:
+    """입력값 dict → 조건식 목록 (값이 없는 조건은 제외)"""
+    clauses = []
+    for spec in specs:
+        clause = spec.compile(criteria.get(spec.key))
+        if clause is not None:
+            clauses.append(clause)
+    return clauses
+
+
+def filter_query(query: Query, specs: Iterable[FilterSpec], criteria: Mapping[str, Any]) -> Query:
+    clauses = compile_filters(specs, criteria)
+    return query.filter(*clauses) if clauses else query
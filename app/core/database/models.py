@@ -1,6 +1,6 @@
 """Database models for ESG Reporter."""
 
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Date,JSON, Numeric
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, JSON, Date,JSON, Numeric, Index
 from decimal import Decimal  # Python Decimal 타입
 
 from sqlalchemy.orm import relationship
@@ -119,7 +119,7 @@ class ChatSession(Base):
     company_id = Column(String(10), ForeignKey("cmp_info.cmp_num"), nullable=True)
     user_id = Column(String(255))
     title = Column(String(255))
-    messages = Column(JSON)
+    messages = Column(JSON)  # 프롬프트에 넣는 최근 대화 창 (전체 기록은 transcript)
     context = Column(JSON)
     message_count = Column(Integer, default=0)
     last_activity = Column(DateTime, default=datetime.utcnow)
@@ -128,6 +128,21 @@ class ChatSession(Base):
     
     # Relationships
     company = relationship("CmpInfo", back_populates="chat_sessions")
+    # 전체 대화 기록: 추가만 하고 기록 조회 때만 읽음 (세션을 불러올 때 함께 읽지 않음)
+    transcript = relationship("ChatMessage", lazy="write_only", order_by="ChatMessage.id",
+                              cascade="all, delete-orphan", passive_deletes=True)
+
+
+class ChatMessage(Base):
+    """Full transcript of a chat session (ChatSession.messages keeps only the recent window)."""
+
+    __tablename__ = "chat_messages"
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    type = Column(String(20), nullable=False)  # human / ai
+    content = Column(Text)
+    timestamp = Column(DateTime, default=datetime.now)
 
 class CmpInfo(Base):
     """Company information model for company management."""
@@ -144,6 +159,12 @@ class CmpInfo(Base):
     cmp_ethics_yn = Column(String(1))  # 윤리경영 여부
     cmp_comp_yn = Column(String(1))  # 컴플라이언스 정책 여부
     
+    # 회사관리 검색 패널의 지점(일치)/사외 이사회 수(범위) 조건용
+    __table_args__ = (
+        Index("ix_cmp_info_branch", "cmp_branch"),
+        Index("ix_cmp_info_extemp", "cmp_extemp"),
+    )
+    
     # Relationships
     reports = relationship("Report", back_populates="company")
     chat_sessions = relationship("ChatSession", back_populates="company")
@@ -170,6 +191,14 @@ class EmpInfo(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # 직원관리 표의 서버 정렬/keyset 페이지 이동/검색 조건용 (컬럼, 사번) 복합 인덱스
+    __table_args__ = (
+        Index("ix_emp_info_nm_id", "EMP_NM", "EMP_ID"),
+        Index("ix_emp_info_join_id", "EMP_JOIN", "EMP_ID"),
+        Index("ix_emp_info_comp_id", "EMP_COMP", "EMP_ID"),
+        Index("ix_emp_info_gender_id", "EMP_GENDER", "EMP_ID"),
+    )
+
 
 class Env(Base):
     """환경현황 테이블"""
@@ -206,5 +235,36 @@ class DataImportLog(Base):
     # Relationships
     company = relationship("CmpInfo", back_populates="data_import_logs")
 
+
+class ImportJob(Base):
+    """Background import job (app.services.jobs 작업 큐)."""
+
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)  # 작업 종류 (employee_rows, excel_import, ...)
+    company_id = Column(String(10))  # 요청한 회사 사업장번호 (환경 데이터 등은 없음)
+    source = Column(String(500))  # 업로드 파일 이름 등
+    status = Column(String(20), nullable=False, default="queued")  # queued/running/succeeded/failed/cancelled
+    progress = Column(Float, default=0.0)  # 진행률 (0 ~ 100)
+    message = Column(String(500))  # 현재 단계 또는 결과 요약
+    payload = Column(JSON)  # 작업 입력 (행 목록, 파일 경로, 연결 설정 등)
+    result = Column(JSON)  # 작업 결과 (건수, 오류 메시지)
+    error = Column(Text)
+    attempts = Column(Integer, default=0)
+    import_log_id = Column(Integer, ForeignKey("data_import_logs.id"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 작업자의 다음 작업 조회, 화면의 회사별 진행 중 작업 조회용
+    __table_args__ = (
+        Index("ix_import_jobs_status_id", "status", "id"),
+        Index("ix_import_jobs_company_kind", "company_id", "kind", "id"),
+    )
+
+    import_log = relationship("DataImportLog")
+
 # 하위 호환성을 위한 별칭
 Company = CmpInfo
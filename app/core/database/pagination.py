@@ -0,0 +1,144 @@
+"""Keyset (seek) pagination for SQLAlchemy queries.
+
+OFFSET 페이지네이션은 뒤쪽 페이지로 갈수록 앞의 행을 모두 건너뛰어야 하지만,
+keyset 방식은 직전 페이지의 마지막 (정렬값, 키)부터 인덱스를 타고 바로 이어서 읽으므로
+테이블 크기와 무관하게 페이지마다 일정한 비용으로 가져온다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, not_, or_, true
+from sqlalchemy.orm import Query, Session
+
+Cursor = Tuple[Any, Any]  # (정렬 컬럼 값, 키 컬럼 값)
+
+
+def _not(clause: Any) -> Any:
+    """NULL 비교로 결과가 NULL인 경우도 참으로 보는 NOT"""
+    return or_(not_(clause), clause.is_(None))
+
+
+@dataclass
+class Page:
+    """한 페이지 결과와 앞/뒤 페이지로 이동할 커서."""
+
+    rows: List[Any] = field(default_factory=list)
+    first: Optional[Cursor] = None
+    last: Optional[Cursor] = None
+    has_prev: bool = False
+    has_next: bool = False
+
+
+class KeysetPaginator:
+    """정렬 컬럼 + 고유 키 컬럼(동순위 구분)으로 페이지를 자르는 페이지네이터.
+
+    - 정렬·잘라내기 모두 SQL에서 수행하며 ``(sort, key)`` 복합 인덱스가 있으면 인덱스만 탐색
+    - NULL은 가장 작은 값으로 취급 (오름차순 맨 앞, 내림차순 맨 뒤)
+    - 커서는 서버 쪽에만 보관하는 (정렬값, 키) 튜플
+    """
+
+    def __init__(
+        self,
+        query: Query,
+        key: Any,
+        sort: Optional[Any] = None,
+        descending: bool = False,
+        page_size: int = 50,
+    ):
+        self.query = query
+        self.key = key
+        self.sort = sort if sort is not None and sort is not key else None
+        self.descending = descending
+        self.page_size = max(1, page_size)
+
+    # --- SQL 조각 -----------------------------------------------------
+
+    def _cursor_of(self, row: Any) -> Cursor:
+        sort_value = getattr(row, self.sort.key) if self.sort is not None else None
+        return sort_value, getattr(row, self.key.key)
+
+    def _order_by(self, ascending: bool) -> List[Any]:
+        nulls_first = self.query.session.get_bind().dialect.name == "postgresql"
+        columns = []
+        if self.sort is not None:
+            expr = self.sort.asc() if ascending else self.sort.desc()
+            if nulls_first:  # PostgreSQL만 NULL을 가장 큰 값으로 정렬하므로 다른 DB와 맞춤
+                expr = expr.nulls_first() if ascending else expr.nulls_last()
+            columns.append(expr)
+        columns.append(self.key.asc() if ascending else self.key.desc())
+        return columns
+
+    def _seek(self, cursor: Cursor, ascending: bool) -> Any:
+        """커서 바로 다음(ascending 방향) 행부터 선택하는 조건"""
+        sort_value, key_value = cursor
+        key_after = self.key > key_value if ascending else self.key < key_value
+        if self.sort is None:
+            return key_after
+        s = self.sort
+        if ascending:
+            if sort_value is None:
+                return or_(s.isnot(None), and_(s.is_(None), key_after))
+            return or_(s > sort_value, and_(s == sort_value, key_after))
+        if sort_value is None:
+            return and_(s.is_(None), key_after)
+        return or_(s < sort_value, s.is_(None), and_(s == sort_value, key_after))
+
+    def _fetch(self, cursor: Optional[Cursor], forward: bool, size: Optional[int] = None) -> Tuple[List[Any], bool]:
+        ascending = forward != self.descending
+        size = size or self.page_size
+        query = self.query
+        if cursor is not None:
+            query = query.filter(self._seek(cursor, ascending))
+        rows = query.order_by(*self._order_by(ascending)).limit(size + 1).all()
+        more = len(rows) > size
+        rows = rows[:size]
+        return (rows if forward else rows[::-1]), more
+
+    def _page(self, rows: List[Any], has_prev: bool, has_next: bool) -> Page:
+        if not rows:
+            return Page(has_prev=has_prev, has_next=has_next)
+        return Page(rows, self._cursor_of(rows[0]), self._cursor_of(rows[-1]), has_prev, has_next)
+
+    # --- 페이지 이동 --------------------------------------------------
+
+    def first(self) -> Page:
+        rows, more = self._fetch(None, forward=True)
+        return self._page(rows, False, more)
+
+    def last(self, size: Optional[int] = None) -> Page:
+        """마지막 페이지 (size: 전체 건수로 계산한 마지막 페이지의 행 수)"""
+        rows, more = self._fetch(None, forward=False, size=size)
+        return self._page(rows, more, False)
+
+    def after(self, cursor: Optional[Cursor]) -> Page:
+        if cursor is None:
+            return self.first()
+        rows, more = self._fetch(cursor, forward=True)
+        return self._page(rows, True, more)
+
+    def before(self, cursor: Optional[Cursor]) -> Page:
+        if cursor is None:
+            return self.first()
+        rows, more = self._fetch(cursor, forward=False)
+        if not rows:
+            return self.first()
+        return self._page(rows, more, True)
+
+    def within(self, page: Page) -> Any:
+        """행이 이 페이지 범위(첫 행~마지막 행)에 들어가는 조건.
+
+        첫 페이지는 첫 행 앞쪽, 마지막 페이지는 마지막 행 뒤쪽도 포함한다 (새로 추가된 행을 현재 페이지에 끼울지 판단).
+        """
+        ascending = not self.descending
+        clauses = []
+        if page.has_prev and page.first is not None:
+            clauses.append(_not(self._seek(page.first, not ascending)))
+        if page.has_next and page.last is not None:
+            clauses.append(_not(self._seek(page.last, ascending)))
+        return and_(*clauses) if clauses else true()
+
+    def count(self, session: Optional[Session] = None) -> int:
+        """전체 건수 - 인덱스 스캔이 필요하므로 페이지 표시와 분리해 (별도 세션으로) 호출"""
+        query = self.query if session is None else self.query.with_session(session)
+        return query.order_by(None).count()
@@ -1,7 +1,7 @@
 """Base class for data importers."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -15,6 +15,8 @@ class BaseImporter(ABC):
         self.db = db
         self.company_id = company_id
         self.import_log = None
+        # 진행률 콜백 progress(fraction, message) — 백그라운드 작업(app.services.jobs)에서 설정
+        self.progress: Optional[Callable[[float, Optional[str]], None]] = None
         
     def start_import_log(self, import_type: str, source_file: Optional[str] = None) -> DataImportLog:
         """Start a new import log entry."""
@@ -46,6 +48,11 @@ class BaseImporter(ABC):
             
             self.db.commit()
     
+    def report_progress(self, done: int, total: int) -> None:
+        """Report record progress to the progress callback, if any."""
+        if self.progress is not None and total:
+            self.progress(done / total, f"{done}/{total}건 처리 중...")
+
     def finish_import_log(self, status: str = "success") -> None:
         """Finish the import log."""
         if self.import_log:
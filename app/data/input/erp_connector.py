@@ -54,6 +54,7 @@ class ERPConnector(BaseImporter):
         }
         
         for i, record in enumerate(raw_data):
+            self.report_progress(i, len(raw_data))
             try:
                 # Transform ERP data to ESG format
                 esg_data = self.transform_erp_record(record)
@@ -69,7 +69,8 @@ class ExcelImporter(BaseImporter):
         
         df = df.rename(columns=column_mapping)
         
-        for index, row in df.iterrows():
+        for i, (index, row) in enumerate(df.iterrows()):
+            self.report_progress(i, len(df))
             try:
                 # Convert row to dict and clean NaN values
                 data = row.to_dict()
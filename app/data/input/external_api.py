@@ -31,7 +31,8 @@ class ExternalAPIConnector(BaseImporter):
             }
             
             # Process each API configuration
-            for config in api_configs:
+            for i, config in enumerate(api_configs):
+                self.report_progress(i, len(api_configs))
                 try:
                     api_name = config.get('name', 'unknown')
                     logger.info(f"Fetching data from {api_name} API...")
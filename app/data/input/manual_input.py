@@ -24,6 +24,7 @@ class ManualInputHandler(BaseImporter):
             }
             
             for i, data in enumerate(data_records):
+                self.report_progress(i, len(data_records))
                 try:
                     # Validate data
                     validation_errors = self.validate_data(data)
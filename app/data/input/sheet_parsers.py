@@ -0,0 +1,385 @@
+"""Excel/CSV upload parsing/validation and template generation for the ERP pages.
+
+UI 콜백 밖(작업 스레드)에서 실행하도록 화면 요소에 의존하지 않는다.
+진행률은 ``progress(fraction, message)`` 콜백으로 알린다 (0.0 ~ 1.0).
+디스크에 spool 된 파일(``SpooledUpload``)은 CSV·엑셀 모두 청크 단위로 읽어 검증하고,
+화면에는 건수/오류와 앞부분 미리보기 표본만 돌려준다. 저장 작업은 같은 파일을 다시 청크 단위로 읽는다.
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from app.data.input.upload_spool import SpooledUpload, spool_upload
+from config.settings import settings
+
+ProgressFn = Callable[[float, Optional[str]], None]
+SheetSource = Union[bytes, BinaryIO, SpooledUpload]
+
+# 행 검증 중 진행률 보고 간격 (행)
+PROGRESS_EVERY = 500
+
+# 화면에 돌려주는 오류 메시지 최대 개수 (건수는 전부 셈)
+MAX_REPORTED_ERRORS = 1000
+
+EMPLOYEE_COLUMNS = ['지점', '사번', '이름', '생년월일', '전화번호', '이메일',
+                    '입사일', '산재발생횟수', '이사회여부', '성별', '재직여부']
+COMPANY_COLUMNS = ['지점', '업종', '산업', '주소', '사외이사회수', '윤리경영여부', '컴플라이언스정책여부']
+
+EMPLOYEE_TEMPLATE = {
+    '지점': ['서울지점', '구미지사'],
+    '사번': ['1001', '1002'],
+    '이름': ['홍길동', '김철수'],
+    '생년월일': ['1990-01-15', '1985-05-20'],
+    '전화번호': ['010-1234-5678', '010-9876-5432'],
+    '이메일': ['hong@company.com', 'kim@company.com'],
+    '입사일': ['2020-03-01', '2018-07-15'],
+    '산재발생횟수': [0, 1],
+    '이사회여부': ['N', 'Y'],
+    '성별': ['남자', '남자'],
+    '재직여부': ['Y', 'Y']
+}
+COMPANY_TEMPLATE = {
+    '지점': ['서울지사', '구미지사'],
+    '업종': ['제조업', '서비스업'],
+    '산업': ['전자부품', 'IT서비스'],
+    '주소': ['서울시 강남구 테헤란로 123', '경북 구미시 산업로 456'],
+    '사외이사회수': [3, 2],
+    '윤리경영여부': ['Y', 'N'],
+    '컴플라이언스정책여부': ['Y', 'Y']
+}
+
+
+@dataclass
+class SheetResult:
+    """검증 결과: 저장할 행과 행별 오류 메시지.
+
+    파일 전체 요약(``summarize``)에서는 ``rows``/``errors``가 앞부분 표본이고 전체 건수는 ``total_*``에 있다.
+    """
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    missing_columns: List[str] = field(default_factory=list)
+    total_rows: Optional[int] = None
+    total_errors: Optional[int] = None
+
+    @property
+    def valid_count(self) -> int:
+        return len(self.rows) if self.total_rows is None else self.total_rows
+
+    @property
+    def error_count(self) -> int:
+        return len(self.errors) if self.total_errors is None else self.total_errors
+
+    @property
+    def truncated(self) -> bool:
+        """미리보기 행이 전체 유효 행보다 적은지"""
+        return self.valid_count > len(self.rows)
+
+
+def _report(progress: Optional[ProgressFn], fraction: float, message: Optional[str] = None) -> None:
+    if progress is not None:
+        progress(fraction, message)
+
+
+def iter_sheet(
+    source: SheetSource,
+    progress: Optional[ProgressFn] = None,
+    strip_spaces: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """첫 번째 시트(CSV는 파일 전체)를 청크 단위로 읽고 열 이름 정리 (``strip_spaces``면 공백 모두 제거, 아니면 앞뒤만).
+
+    spool 된 파일은 CSV·엑셀 모두 스트리밍, 바이트/스트림은 시트 전체를 한 번에 읽는다.
+    청크의 행 인덱스는 파일 전체 기준으로 이어지므로 ``idx + 2``가 그대로 엑셀/CSV 행 번호다.
+    """
+    _report(progress, 0.0, '파일 읽는 중...')
+    if isinstance(source, SpooledUpload):
+        frames = source.iter_frames()
+    else:
+        frames = iter([pd.read_excel(io.BytesIO(source) if isinstance(source, bytes) else source, sheet_name=0)])
+    rows = 0
+    for df in frames:
+        df.columns = df.columns.astype(str)
+        df.columns = df.columns.str.replace(' ', '').str.strip() if strip_spaces else df.columns.str.strip()
+        rows += len(df)
+        if isinstance(source, SpooledUpload):
+            _report(progress, 0.95 * source.fraction_read, f'{rows:,}행 검증 중...')
+        yield df
+
+
+def iter_validated(
+    source: SheetSource,
+    validate: Callable[[pd.DataFrame], SheetResult],
+    progress: Optional[ProgressFn] = None,
+    strip_spaces: bool = True,
+) -> Iterator[SheetResult]:
+    """청크별 검증 결과 (필수 열이 없으면 그 결과 하나로 끝남)"""
+    for df in iter_sheet(source, progress, strip_spaces):
+        part = validate(df)
+        yield part
+        if part.missing_columns:
+            return
+
+
+def summarize(
+    parts: Iterable[SheetResult],
+    preview_rows: Optional[int] = None,
+    max_errors: int = MAX_REPORTED_ERRORS,
+) -> SheetResult:
+    """청크별 결과 → 전체 건수 + 앞부분 미리보기 행/오류 메시지 (메모리 사용량이 파일 크기와 무관)"""
+    preview_rows = settings.app.UPLOAD_PREVIEW_ROWS if preview_rows is None else preview_rows
+    result = SheetResult(total_rows=0, total_errors=0)
+    for part in parts:
+        if part.missing_columns:
+            return part
+        result.total_rows += part.valid_count
+        result.total_errors += part.error_count
+        if len(result.rows) < preview_rows:
+            result.rows.extend(part.rows[:preview_rows - len(result.rows)])
+        if len(result.errors) < max_errors:
+            result.errors.extend(part.errors[:max_errors - len(result.errors)])
+    return result
+
+
+def batches(chunks: Iterable[List[Dict[str, Any]]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """청크별 행 목록을 최대 ``size``행씩 다시 나눔 (저장 시 IN 조회/flush 단위)"""
+    for rows in chunks:
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+
+def _cell(row: pd.Series, column: str, default: str = '') -> str:
+    return str(row[column]).strip() if pd.notna(row[column]) else default
+
+
+def _format_date(value: str) -> str:
+    """YYYYMMDD 또는 날짜 문자열 → YYYY-MM-DD (잘못된 형식이면 ValueError)"""
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
+    return pd.to_datetime(value).strftime('%Y-%m-%d')
+
+
+def _rows(df: pd.DataFrame, progress: Optional[ProgressFn]):
+    """검증 진행률(0.5 ~ 1.0)을 보고하며 행 순회"""
+    total = max(len(df), 1)
+    for i, (idx, row) in enumerate(df.iterrows()):
+        if i and i % PROGRESS_EVERY == 0:
+            _report(progress, 0.5 + 0.5 * i / total, f'{i}/{total}행 검증 중...')
+        yield idx, row
+
+
+def _text(df: pd.DataFrame, column: str, default: str = '') -> pd.Series:
+    """열 전체를 ``str(값).strip()``으로 변환 (빈 칸은 ``default``)"""
+    values = df[column].astype(object)
+    present = values.notna()
+    text = pd.Series(default, index=df.index, dtype=object)
+    text[present] = [str(value).strip() for value in values[present]]
+    return text
+
+
+def _dates(text: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """날짜 열 → (YYYY-MM-DD 문자열, 잘못된 형식 여부). 빈 값은 ''.
+
+    YYYYMMDD는 문자열 자르기, YYYY-MM-DD와 엑셀 날짜 셀은 형식 지정 ``to_datetime`` 한 번씩,
+    그 밖의 드문 형식만 한 건씩 해석한다.
+    """
+    formatted = pd.Series('', index=text.index, dtype=object)
+    invalid = pd.Series(False, index=text.index)
+    present = (text != '') & (text != 'nan')
+
+    digits = present & text.str.len().eq(8) & text.str.isdigit()
+    if digits.any():
+        d = text[digits]
+        formatted[digits] = d.str[:4] + '-' + d.str[4:6] + '-' + d.str[6:8]
+
+    rest = text[present & ~digits]
+    if rest.empty:
+        return formatted, invalid
+    parsed = pd.to_datetime(rest, format='%Y-%m-%d', errors='coerce')
+    missing = parsed.isna()
+    if missing.any():  # 엑셀 날짜 셀 (str(Timestamp))
+        parsed[missing] = pd.to_datetime(rest[missing], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    ok = parsed.notna()
+    formatted[ok[ok].index] = parsed[ok].dt.strftime('%Y-%m-%d')
+    for idx, value in rest[~ok].items():
+        try:
+            formatted[idx] = _format_date(value)
+        except Exception:
+            invalid[idx] = True
+    return formatted, invalid
+
+
+def _accident_counts(raw: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """산재발생횟수 → (0 이상 정수, 변환 중 예외 메시지). 숫자가 아니면 0."""
+    numbers = pd.to_numeric(raw, errors='coerce').astype('float64')
+    simple = numbers.notna() & numbers.abs().lt(2 ** 53)
+    counts = pd.Series(0, index=raw.index, dtype='int64')
+    counts[simple] = numbers[simple].astype('int64').clip(lower=0)
+    failures = pd.Series(None, index=raw.index, dtype=object)
+    rest = raw[raw.notna() & ~simple]
+    if not rest.empty:
+        counts = counts.astype(object)  # int64 범위를 넘는 값
+    for idx, value in rest.items():
+        try:
+            counts[idx] = max(int(float(value)), 0)
+        except (ValueError, TypeError):
+            counts[idx] = 0
+        except Exception as e:  # inf 등
+            failures[idx] = str(e)
+    return counts, failures
+
+
+def validate_employee_frame(df: pd.DataFrame, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """직원정보 시트 검증 (열 단위 벡터 연산).
+
+    행마다 아래 규칙 중 처음 어긋난 것 하나를 오류로 보고하고 그 행은 제외한다.
+    사번/이름 빈 값 → 생년월일/입사일 형식 → 성별(남자/여자).
+    산재발생횟수는 숫자가 아니면 0, Y/N 값은 유효하지 않으면 기본값으로 바꾼다.
+    """
+    result = SheetResult(missing_columns=[col for col in EMPLOYEE_COLUMNS if col not in df.columns])
+    if result.missing_columns:
+        return result
+
+    emp_id = _text(df, '사번')
+    emp_name = _text(df, '이름')
+    birth, bad_birth = _dates(_text(df, '생년월일'))
+    _report(progress, 0.7, f'{len(df)}행 검증 중...')
+    hire, bad_hire = _dates(_text(df, '입사일'))
+    gender = _text(df, '성별', '남자')
+    accidents, accident_errors = _accident_counts(df['산재발생횟수'])
+    board_yn = _text(df, '이사회여부', 'N').str.upper()
+    employment_yn = _text(df, '재직여부', 'Y').str.upper()
+    _report(progress, 0.9, f'{len(df)}행 검증 중...')
+
+    # 규칙별 오류 (앞의 규칙이 우선하도록 뒤에서부터 덮어씀)
+    error = accident_errors.copy()
+    error[~gender.isin(['남자', '여자'])] = '성별은 남자/여자만 가능'
+    error[bad_hire] = '잘못된 입사일 형식'
+    error[bad_birth] = '잘못된 생년월일 형식'
+    error[emp_name.isin(['', 'nan'])] = '이름이 비어있음'
+    error[emp_id.isin(['', 'nan'])] = '사번이 비어있음'
+    failed = error.notna()
+    result.errors = [f'행 {idx + 2}: {message}' for idx, message in error[failed].items()]
+
+    valid = ~failed
+    columns = {
+        '지점': _text(df, '지점', '서울지점'),
+        '사번': emp_id,
+        '이름': emp_name,
+        '생년월일': birth,
+        '전화번호': _text(df, '전화번호'),
+        '이메일': _text(df, '이메일'),
+        '입사년도': hire.str[:4],
+        '입사일': hire,
+        '산재발생횟수': accidents,
+        '이사회여부': board_yn.where(board_yn.isin(['Y', 'N']), 'N'),
+        '성별': gender,
+        '재직여부': employment_yn.where(employment_yn.isin(['Y', 'N']), 'Y'),
+    }
+    names = list(columns) + ['상태']
+    values = [column[valid].tolist() for column in columns.values()]
+    result.rows = [dict(zip(names, row + ('업로드 대기',))) for row in zip(*values)]
+
+    _report(progress, 1.0, None)
+    return result
+
+
+def parse_employee_sheet(source: SheetSource, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """직원정보 엑셀/CSV 검증 → 건수/오류 + 미리보기 행 (오류 행은 제외하고 메시지로 보고)"""
+    result = summarize(iter_validated(source, validate_employee_frame, progress))
+    _report(progress, 1.0, None)
+    return result
+
+
+def validate_company_frame(df: pd.DataFrame, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """회사정보 시트 검증 (사업장번호/회사명은 고정값)"""
+    result = SheetResult(missing_columns=[col for col in COMPANY_COLUMNS if col not in df.columns])
+    if result.missing_columns:
+        return result
+
+    for idx, row in _rows(df, progress):
+        try:
+            # 사외이사회수 처리
+            try:
+                extemp = int(float(row['사외이사회수'])) if pd.notna(row['사외이사회수']) else 0
+            except (ValueError, TypeError):
+                extemp = 0
+
+            # Y/N 값 처리 (유효하지 않으면 N)
+            ethics_yn = _cell(row, '윤리경영여부', 'N').upper()
+            comp_yn = _cell(row, '컴플라이언스정책여부', 'N').upper()
+            if ethics_yn not in ['Y', 'N']:
+                ethics_yn = 'N'
+            if comp_yn not in ['Y', 'N']:
+                comp_yn = 'N'
+
+            result.rows.append({
+                '사업장번호': '6182618882',
+                '지점': _cell(row, '지점'),
+                '회사명': '국민AI 주식회사',
+                '업종': _cell(row, '업종'),
+                '산업': _cell(row, '산업'),
+                '주소': _cell(row, '주소'),
+                '사외 이사회 수': extemp,
+                '윤리경영 여부': ethics_yn,
+                '컴플라이언스 정책 여부': comp_yn,
+                '상태': '업로드 대기'
+            })
+        except Exception as row_error:
+            result.errors.append(f'행 {idx + 2}: {str(row_error)}')
+
+    _report(progress, 1.0, None)
+    return result
+
+
+def parse_company_sheet(source: SheetSource, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """회사정보 엑셀/CSV 검증 → 건수/오류 + 미리보기 행"""
+    result = summarize(iter_validated(source, validate_company_frame, progress))
+    _report(progress, 1.0, None)
+    return result
+
+
+def validate_env_frame(df: pd.DataFrame, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """환경 데이터 시트 → 행 목록 (값 검증은 저장 시)"""
+    return SheetResult(rows=df.to_dict(orient='records'))
+
+
+def parse_env_sheet(source: SheetSource, progress: Optional[ProgressFn] = None) -> SheetResult:
+    """환경 데이터 엑셀/CSV → 건수 + 미리보기 행 (열 이름 앞뒤 공백만 제거)"""
+    result = summarize(iter_validated(source, validate_env_frame, progress, strip_spaces=False))
+    _report(progress, 1.0, None)
+    return result
+
+
+def stage_upload(
+    stream: BinaryIO,
+    name: str,
+    parser: Callable[[SheetSource, Optional[ProgressFn]], SheetResult],
+    tenant: Optional[str] = None,
+    progress: Optional[ProgressFn] = None,
+) -> Tuple[SheetResult, Optional[SpooledUpload]]:
+    """업로드 스트림을 디스크에 spool 한 뒤 ``parser``로 검증 (작업 스레드에서 실행).
+
+    검증을 통과한 파일은 지우지 않고 함께 반환하고 저장 작업이 다시 읽는다. 저장하지 않으면 호출자가 ``close()``.
+    필수 열이 없거나 유효한 행이 없으면 파일을 지우고 None. 크기/형식/회사별 한도를 넘으면 ``UploadRejected``.
+    """
+    upload = spool_upload(stream, name, tenant, progress)
+    try:
+        result = parser(upload, progress)
+    except BaseException:
+        upload.close()
+        raise
+    if result.missing_columns or not result.valid_count:
+        upload.close()
+        return result, None
+    return result, upload
+
+
+def build_template(data: Dict[str, List[Any]], sheet_name: str) -> bytes:
+    """업로드 양식 엑셀 파일 생성"""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        pd.DataFrame(data).to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
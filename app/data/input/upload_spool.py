@@ -0,0 +1,413 @@
+"""Spool uploads to disk and stream-parse them (Excel, CSV, gzip/zip-compressed CSV).
+
+업로드 파일 전체를 메모리에 올리지 않도록 청크 단위로 임시 파일에 복사한 뒤 디스크에서 읽는다.
+CSV는 압축을 풀면서, 엑셀(.xlsx)은 openpyxl 읽기 전용 모드로 ``chunksize`` 행씩 읽으므로
+파일 크기와 관계없이 메모리 사용량이 일정하다. 검증이 끝난 파일은 저장 작업이 다시 읽을 수 있도록
+디스크에 남겨 두고(``to_ref``/``adopt``), 회사(tenant)별로 디스크에 보관 중인 업로드 총량을 제한한다.
+"""
+
+import codecs
+import gzip
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
+
+import pandas as pd
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ProgressFn = Callable[[float, Optional[str]], None]
+
+CHUNK_BYTES = 1024 * 1024
+CSV_CHUNK_ROWS = 50_000
+EXCEL_CHUNK_ROWS = 20_000
+EXCEL_SUFFIXES = ('.xlsx', '.xls')
+CSV_SUFFIXES = ('.csv', '.csv.gz', '.csv.zip', '.gz', '.zip')
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZIP_MAGIC = b'PK\x03\x04'
+
+
+class UploadRejected(ValueError):
+    """업로드 거부 (형식, 크기, 회사별 한도). 메시지는 화면에 그대로 표시."""
+
+
+class TenantQuota:
+    """회사별로 디스크에 보관 중인 업로드 바이트 수 한도 (스레드 안전)"""
+
+    def __init__(self, limit_bytes: int):
+        self.limit_bytes = limit_bytes
+        self._usage: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def usage(self, tenant: str) -> int:
+        with self._lock:
+            return self._usage.get(tenant, 0)
+
+    def reserve(self, tenant: str, nbytes: int, check: bool = True) -> None:
+        with self._lock:
+            used = self._usage.get(tenant, 0) + nbytes
+            if check and self.limit_bytes and used > self.limit_bytes:
+                raise UploadRejected(
+                    f'회사별 업로드 한도({_mb(self.limit_bytes)})를 넘었습니다. 진행 중인 업로드가 끝난 뒤 다시 시도해주세요.'
+                )
+            self._usage[tenant] = used
+
+    def release(self, tenant: str, nbytes: int) -> None:
+        with self._lock:
+            left = self._usage.get(tenant, 0) - nbytes
+            if left > 0:
+                self._usage[tenant] = left
+            else:
+                self._usage.pop(tenant, None)
+
+
+_quota: Optional[TenantQuota] = None
+_quota_lock = threading.Lock()
+
+
+def get_upload_quota() -> TenantQuota:
+    global _quota
+    if _quota is None:
+        with _quota_lock:
+            if _quota is None:
+                _quota = TenantQuota(settings.app.UPLOAD_TENANT_QUOTA_BYTES)
+    return _quota
+
+
+def _mb(nbytes: int) -> str:
+    return f'{nbytes / (1024 * 1024):,.0f}MB'
+
+
+class _LimitedReader(io.RawIOBase):
+    """압축 해제된 바이트 수가 한도를 넘으면 중단 (압축 폭탄 방지)"""
+
+    def __init__(self, raw: BinaryIO, source: BinaryIO, limit: int):
+        self.raw = raw
+        self.source = source
+        self.limit = limit
+        self.count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        self.count += len(data)
+        if self.limit and self.count > self.limit:
+            raise UploadRejected(f'압축을 푼 크기가 한도({_mb(self.limit)})를 넘었습니다.')
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self.raw.close()
+        self.source.close()
+        super().close()
+
+
+def _sniff_encoding(sample: bytes) -> str:
+    """UTF-8(BOM 포함)이 아니면 한글 윈도우 인코딩(cp949)으로 간주"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+# 이 프로세스가 열어 둔 spool 파일 (경로 → 업로드). 저장 작업이 같은 객체를 이어받고, 정리 시 한도를 반납
+_open_uploads: Dict[str, 'SpooledUpload'] = {}
+_open_lock = threading.Lock()
+
+
+@dataclass
+class SpooledUpload:
+    """디스크에 복사된 업로드 파일. 다 쓰면 ``close()``(또는 with 블록)로 삭제하고 한도를 반납."""
+
+    path: Path
+    name: str
+    size: int
+    tenant: str
+    kind: str  # 'excel' | 'csv'
+    compression: Optional[str] = None  # None | 'gzip' | 'zip'
+    member: Optional[str] = None  # zip 안의 CSV 파일 이름
+    closed: bool = field(default=False, repr=False)
+    _raw: Optional[BinaryIO] = field(default=None, repr=False, compare=False)
+    _rows_read: int = field(default=0, repr=False, compare=False)
+    _rows_total: Optional[int] = field(default=None, repr=False, compare=False)
+
+    def __enter__(self) -> 'SpooledUpload':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        with _open_lock:
+            _open_uploads.pop(str(self.path), None)
+        try:
+            self.path.unlink(missing_ok=True)
+        finally:
+            get_upload_quota().release(self.tenant, self.size)
+
+    # --- 저장 작업으로 넘기기 ---------------------------------------------
+
+    def to_ref(self) -> Dict[str, Any]:
+        """작업 입력(JSON)에 넣을 파일 정보"""
+        return {
+            'path': str(self.path), 'name': self.name, 'size': self.size, 'tenant': self.tenant,
+            'kind': self.kind, 'compression': self.compression, 'member': self.member,
+        }
+
+    @classmethod
+    def adopt(cls, ref: Dict[str, Any]) -> 'SpooledUpload':
+        """``to_ref()``로 넘긴 파일 다시 열기 (같은 프로세스면 화면이 만든 객체를 그대로 이어받음).
+
+        파일이 정리되어 없으면 ``UploadRejected``.
+        """
+        path = Path(ref['path'])
+        with _open_lock:
+            try:
+                os.utime(path)  # 사용 중인 파일은 정리 대상에서 제외
+            except FileNotFoundError:
+                _open_uploads.pop(str(path), None)
+                raise UploadRejected('업로드 파일이 만료되어 삭제되었습니다. 파일을 다시 업로드해주세요.') from None
+            upload = _open_uploads.get(str(path))
+            if upload is not None:
+                return upload
+            upload = cls(path=path, name=ref['name'], size=int(ref['size']), tenant=ref['tenant'],
+                         kind=ref['kind'], compression=ref.get('compression'), member=ref.get('member'))
+            # 재시작 전에 spool 된 파일: 이미 디스크에 있으므로 한도 검사 없이 사용량에만 반영
+            get_upload_quota().reserve(upload.tenant, upload.size, check=False)
+            _open_uploads[str(path)] = upload
+        return upload
+
+    # --- 읽기 -----------------------------------------------------------
+
+    def open_binary(self) -> BinaryIO:
+        """압축을 푼 원본 바이트 스트림"""
+        self._raw = raw = open(self.path, 'rb')
+        if self.compression == 'gzip':
+            stream = gzip.GzipFile(fileobj=raw, mode='rb')
+        elif self.compression == 'zip':
+            stream = zipfile.ZipFile(raw).open(self.member)
+        else:
+            return raw
+        return io.BufferedReader(_LimitedReader(stream, raw, settings.app.UPLOAD_MAX_DECOMPRESSED_BYTES), CHUNK_BYTES)
+
+    @property
+    def fraction_read(self) -> float:
+        """스트리밍 파싱 진행률 - CSV는 디스크 파일(압축 상태)을 읽은 비율, 엑셀은 읽은 행 비율"""
+        if self.kind == 'excel':
+            return min(self._rows_read / self._rows_total, 1.0) if self._rows_total else 0.0
+        raw = self._raw
+        if raw is None or raw.closed or not self.size:
+            return 0.0
+        return min(raw.tell() / self.size, 1.0)
+
+    def open_text(self) -> io.TextIOWrapper:
+        stream = self.open_binary()
+        encoding = _sniff_encoding(stream.peek(64 * 1024)[:64 * 1024])
+        return io.TextIOWrapper(stream, encoding=encoding, newline='')
+
+    def iter_frames(self, chunksize: Optional[int] = None, **kwargs) -> Iterator[pd.DataFrame]:
+        """``chunksize`` 행씩 DataFrame으로 (인덱스는 파일 전체 기준으로 이어짐, ``kwargs``는 CSV에만 적용)"""
+        if self.kind == 'excel':
+            yield from self._iter_excel(chunksize or EXCEL_CHUNK_ROWS)
+            return
+        with self.open_text() as text:
+            yield from pd.read_csv(text, chunksize=chunksize or CSV_CHUNK_ROWS, **kwargs)
+
+    def _iter_excel(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """첫 번째 시트를 openpyxl 읽기 전용 모드로 스트리밍 (결과는 ``pd.read_excel``과 같고 행 인덱스도 동일)."""
+        self._rows_read = 0
+        if self.name.lower().endswith('.xls'):
+            # 구형 .xls는 스트리밍 읽기를 지원하지 않음 (형식상 최대 65,536행이라 전체를 읽어도 한정됨)
+            df = pd.read_excel(self.path, sheet_name=0)
+            self._rows_total = self._rows_read = len(df)
+            yield df
+            return
+
+        from openpyxl import load_workbook
+
+        # spool 파일은 확장자가 .upload 라서 경로 대신 파일 객체로 연다 (openpyxl은 경로의 확장자를 검사)
+        with open(self.path, 'rb') as fh:
+            yield from self._iter_workbook(load_workbook(fh, read_only=True, data_only=True), chunksize)
+
+    def _iter_workbook(self, workbook, chunksize: int) -> Iterator[pd.DataFrame]:
+        # 청크는 ``pd.read_excel``과 같은 TextParser로 만든다 (숫자 문자열 변환, 빈/중복 열 이름 처리가 동일)
+        from pandas.io.parsers import TextParser
+
+        try:
+            sheet = workbook.worksheets[0]
+            self._rows_total = sheet.max_row
+            rows = sheet.iter_rows(values_only=True)
+            header = [_excel_cell(value) for value in next(rows, None) or ()]
+            while header and header[-1] == '':  # read_excel처럼 뒤쪽 빈 열 이름은 버림
+                header.pop()
+            width = len(header)
+            batch, index = [], []
+            blank = []  # 빈 행은 뒤에 데이터 행이 나올 때만 포함 (끝의 빈 행은 read_excel처럼 버림)
+            yielded = False
+            for position, row in enumerate(rows):
+                self._rows_read = position + 1
+                if not any(value is not None and value != '' for value in row):
+                    blank.append(position)
+                    continue
+                for empty in blank:
+                    batch.append([''] * width)
+                    index.append(empty)
+                blank.clear()
+                batch.append([_excel_cell(value) for value in row[:width]] + [''] * (width - len(row)))
+                index.append(position)
+                if len(batch) >= chunksize:
+                    yield self._frame(TextParser, header, batch, index)
+                    yielded = True
+                    batch, index = [], []
+            if batch or not yielded:  # 데이터 행이 없어도 열 이름 확인용 빈 DataFrame
+                yield self._frame(TextParser, header, batch, index)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _frame(parser, header: list, batch: list, index: list) -> pd.DataFrame:
+        df = parser([header] + batch, header=0).read()
+        df.index = pd.Index(index)
+        return df
+
+
+def _excel_cell(value: Any) -> Any:
+    """셀 값 변환 - ``pd.read_excel``(openpyxl)과 동일: 빈 칸은 ''(→ NaN), 정수인 실수는 int"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def sweep_spool(max_age_seconds: Optional[int] = None) -> int:
+    """저장되지 않고 남은 오래된 spool 파일 삭제 (열어 둔 업로드면 한도도 반납). 삭제한 파일 수 반환."""
+    max_age = settings.app.UPLOAD_SPOOL_TTL_SECONDS if max_age_seconds is None else max_age_seconds
+    if not max_age:
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    for path in spool_dir().glob('*.upload'):
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+        except FileNotFoundError:
+            continue
+        with _open_lock:
+            upload = _open_uploads.get(str(path))
+        if upload is not None:
+            upload.close()
+        else:
+            path.unlink(missing_ok=True)
+        removed += 1
+    if removed:
+        logger.info(f"Removed {removed} stale spooled uploads")
+    return removed
+
+
+def _detect(path: Path, name: str) -> Dict[str, Optional[str]]:
+    """파일 내용(매직 바이트)과 이름으로 형식 판별"""
+    lower = name.lower()
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith(_GZIP_MAGIC):
+        return {'kind': 'csv', 'compression': 'gzip', 'member': None}
+    if head.startswith(_ZIP_MAGIC):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = archive.namelist()
+        except zipfile.BadZipFile as e:
+            raise UploadRejected(f'압축 파일을 열 수 없습니다: {e}')
+        if '[Content_Types].xml' in names:  # xlsx 자체가 zip
+            return {'kind': 'excel', 'compression': None, 'member': None}
+        members = [n for n in names if n.lower().endswith('.csv') and not n.endswith('/')]
+        if len(members) != 1:
+            raise UploadRejected('zip 파일에는 CSV 파일이 하나만 있어야 합니다.')
+        return {'kind': 'csv', 'compression': 'zip', 'member': members[0]}
+    if lower.endswith(EXCEL_SUFFIXES):
+        return {'kind': 'excel', 'compression': None, 'member': None}
+    if lower.endswith('.csv'):
+        return {'kind': 'csv', 'compression': None, 'member': None}
+    raise UploadRejected('엑셀(.xlsx, .xls) 또는 CSV(.csv, .csv.gz, .zip) 파일만 업로드할 수 있습니다.')
+
+
+def _remaining(stream: BinaryIO) -> Optional[int]:
+    """seek 가능한 스트림이면 남은 바이트 수 (진행률 계산용)"""
+    try:
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def spool_dir() -> Path:
+    path = Path(settings.app.UPLOAD_DIR) / 'spool'
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def spool_upload(
+    stream: BinaryIO,
+    name: str,
+    tenant: Optional[str] = None,
+    progress: Optional[ProgressFn] = None,
+    total: Optional[int] = None,
+) -> SpooledUpload:
+    """업로드 스트림을 청크 단위로 임시 파일에 복사 (작업 스레드에서 실행).
+
+    파일당 ``UPLOAD_MAX_BYTES``, 회사별 ``UPLOAD_TENANT_QUOTA_BYTES``를 넘으면 ``UploadRejected``.
+    """
+    tenant = tenant or 'default'
+    sweep_spool()
+    if total is None:
+        total = _remaining(stream)
+    if not name.lower().endswith(EXCEL_SUFFIXES + CSV_SUFFIXES):
+        raise UploadRejected('엑셀(.xlsx, .xls) 또는 CSV(.csv, .csv.gz, .zip) 파일만 업로드할 수 있습니다.')
+
+    quota = get_upload_quota()
+    max_bytes = settings.app.UPLOAD_MAX_BYTES
+    fd, tmp = tempfile.mkstemp(dir=spool_dir(), suffix='.upload')
+    path = Path(tmp)
+    size = 0
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(CHUNK_BYTES)
+                if not chunk:
+                    break
+                if max_bytes and size + len(chunk) > max_bytes:
+                    raise UploadRejected(f'파일 크기가 한도({_mb(max_bytes)})를 넘었습니다.')
+                quota.reserve(tenant, len(chunk))
+                size += len(chunk)
+                out.write(chunk)
+                if progress is not None and total:
+                    progress(min(size / total, 1.0), f'업로드 파일 저장 중... {_mb(size)}')
+        upload = SpooledUpload(path=path, name=name, size=size, tenant=tenant, **_detect(path, name))
+        with _open_lock:
+            _open_uploads[str(path)] = upload
+        logger.info(f"Spooled upload {name} ({_mb(size)}, {upload.kind}/{upload.compression or 'plain'}) for {tenant}")
+        return upload
+    except BaseException:
+        path.unlink(missing_ok=True)
+        quota.release(tenant, size)
+        raise
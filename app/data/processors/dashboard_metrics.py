@@ -0,0 +1,149 @@
+"""Dashboard card aggregates shared across clients with a TTL cache."""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.database import events
+from app.core.database.models import CmpInfo, EmpInfo, Env
+from app.utils.bounded_store import BoundedStore, get_bounded_store
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DashboardMetrics:
+    """대시보드 카드 전체에 필요한 값 (재직자 기준)."""
+
+    company: Optional[Dict[str, Any]]
+    total_employees: int = 0
+    male_count: int = 0
+    female_count: int = 0
+    board_members: int = 0
+    accident_count: int = 0
+    recent_env: List[Dict[str, Any]] = field(default_factory=list)  # 최근 연도부터 최대 3년
+
+    @property
+    def female_ratio(self) -> float:
+        return self.female_count / self.total_employees * 100 if self.total_employees else 0.0
+
+    @property
+    def accident_rate(self) -> float:
+        return self.accident_count / self.total_employees * 100 if self.total_employees else 0.0
+
+    @property
+    def latest_env(self) -> Optional[Dict[str, Any]]:
+        return self.recent_env[0] if self.recent_env else None
+
+
+def load_dashboard_metrics(db: Session, cmp_num: str) -> DashboardMetrics:
+    """회사 1건 + 직원 집계 1건(조건부 집계) + 최근 환경 3건으로 카드 값 전체를 조회"""
+    company = db.query(CmpInfo).filter_by(cmp_num=cmp_num).first()
+    if company is None:
+        return DashboardMetrics(company=None)
+
+    emp = db.query(
+        func.count(EmpInfo.EMP_ID),
+        func.sum(case((EmpInfo.EMP_GENDER == '1', 1), else_=0)),
+        func.sum(case((EmpInfo.EMP_GENDER == '2', 1), else_=0)),
+        func.sum(case((EmpInfo.EMP_BOARD_YN == 'Y', 1), else_=0)),
+        func.sum(EmpInfo.EMP_ACIDENT_CNT),
+    ).filter(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y').one()
+
+    recent_env = [
+        {
+            "year": env.year,
+            "energy_use": env.energy_use,
+            "renewable_yn": env.renewable_yn,
+            "renewable_ratio": env.renewable_ratio,
+        }
+        for env in db.query(Env).order_by(Env.year.desc()).limit(3)
+    ]
+    total, male, female, board, accidents = (int(v or 0) for v in emp)
+    return DashboardMetrics(
+        company={
+            "cmp_num": company.cmp_num,
+            "cmp_nm": company.cmp_nm,
+            "cmp_industry": company.cmp_industry,
+            "cmp_sector": company.cmp_sector,
+            "cmp_extemp": company.cmp_extemp,
+            "cmp_ethics_yn": company.cmp_ethics_yn,
+            "cmp_comp_yn": company.cmp_comp_yn,
+        },
+        total_employees=total,
+        male_count=male,
+        female_count=female,
+        board_members=board,
+        accident_count=accidents,
+        recent_env=recent_env,
+    )
+
+
+class DashboardMetricsService:
+    """회사별 대시보드 집계를 프로세스 전역에서 공유.
+
+    - 같은 회사는 TTL 동안 몇 명이 보든 한 번만 조회하고, 동시에 들어온 조회도 하나로 합침
+    - 직원/회사/환경 테이블에 커밋된 변경이 생기면 캐시를 비움
+    - 조회 중에 변경이 커밋되면 그 결과는 캐시에 넣지 않음 (세대 번호 비교)
+    """
+
+    def __init__(self, store: BoundedStore):
+        self.store = store
+        self.loads = 0
+        self._generation = 0
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        for model in (EmpInfo, CmpInfo, Env):
+            events.subscribe(model, self._on_changes)
+
+    def _on_changes(self, changes: List[events.RowChange]) -> None:
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        with self._guard:
+            self._generation += 1
+        self.store.clear()
+
+    def get(self, cmp_num: str, session_factory: Callable[[], Session]) -> DashboardMetrics:
+        cached = self.store.get(cmp_num)
+        if cached is not None:
+            return cached
+        with self._guard:
+            lock = self._locks.setdefault(cmp_num, threading.Lock())
+        with lock:
+            cached = self.store.get(cmp_num)
+            if cached is not None:
+                return cached
+            generation = self._generation
+            with session_factory() as db:
+                metrics = load_dashboard_metrics(db, cmp_num)
+            self.loads += 1
+            with self._guard:
+                if generation == self._generation:
+                    self.store.set(cmp_num, metrics)
+            return metrics
+
+
+_service: Optional[DashboardMetricsService] = None
+_service_lock = threading.Lock()
+
+
+def get_dashboard_metrics_service() -> DashboardMetricsService:
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = DashboardMetricsService(
+                    get_bounded_store(
+                        "dashboard_metrics",
+                        max_entries=settings.app.DASHBOARD_CACHE_MAX_ENTRIES,
+                        ttl_seconds=settings.app.DASHBOARD_CACHE_TTL_SECONDS,
+                        max_bytes=0,
+                    )
+                )
+    return _service
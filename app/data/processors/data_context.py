@@ -0,0 +1,133 @@
+"""Per-turn memoized ESG dataset access."""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from .data_processor import ESGDataProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class ESGDataContext:
+    """챗봇 한 턴 동안 각 데이터셋을 한 번만 조회해 노드/도구가 공유한다.
+
+    - 데이터셋과 파생 지표는 처음 요청될 때 로드(lazy)하고 이후 캐시를 반환
+    - 데이터가 바뀌면 ``invalidate()``로 캐시를 비움
+    - ``queries``로 실제 DB 조회 횟수를 확인할 수 있음
+    - ``session_factory``가 주어지면 조회마다 별도 세션을 사용하므로
+      여러 스레드에서 동시에 로드해도 안전함
+    """
+
+    def __init__(
+        self,
+        processor: ESGDataProcessor,
+        cmp_num: Optional[str],
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.processor = processor
+        self.cmp_num = cmp_num
+        self.session_factory = session_factory
+        self.queries = 0
+        self._values: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _memo(self, name: str, loader: Callable[[], Any], query: bool = True) -> Any:
+        if name in self._values:
+            return self._values[name]
+        with self._guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._values:
+                self._values[name] = loader()
+                if query:
+                    self.queries += 1
+        return self._values[name]
+
+    @contextmanager
+    def _processor_scope(self) -> Iterator[ESGDataProcessor]:
+        if self.session_factory is None:
+            yield self.processor
+            return
+        db = self.session_factory()
+        try:
+            yield ESGDataProcessor(db)
+        finally:
+            db.close()
+
+    def _load(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        with self._processor_scope() as processor:
+            return getattr(processor, method)(*args, **kwargs)
+
+    def invalidate(self, *names: str) -> None:
+        """지정한 항목(없으면 전체) 캐시 삭제"""
+        with self._guard:
+            if names:
+                for name in names:
+                    self._values.pop(name, None)
+            else:
+                self._values.clear()
+
+    # --- 원본 데이터 ---------------------------------------------------
+
+    def company_info(self) -> Optional[Dict[str, Any]]:
+        if not self.cmp_num:
+            return None
+        return self._memo("company_info", lambda: self._load("get_company_info", self.cmp_num))
+
+    def employees(self) -> pd.DataFrame:
+        """전체 직원 데이터"""
+        return self._memo("employees", lambda: self._load("get_employee_data"))
+
+    def company_employees(self) -> pd.DataFrame:
+        """선택 회사 소속 직원 (전체 직원 데이터에서 파생, 추가 조회 없음)"""
+        def _filter() -> pd.DataFrame:
+            emp_df = self.employees()
+            if emp_df.empty or not self.cmp_num:
+                return emp_df
+            return emp_df[emp_df["emp_comp"] == self.cmp_num].reset_index(drop=True)
+        return self._memo("company_employees", _filter, query=False)
+
+    def environmental(self) -> pd.DataFrame:
+        return self._memo("environmental", lambda: self._load("get_environmental_data"))
+
+    # --- 파생 지표 -----------------------------------------------------
+
+    def comprehensive_report(self) -> Dict[str, Any]:
+        def _build() -> Dict[str, Any]:
+            company_info = self.company_info()
+            if not company_info:
+                return {"error": f"회사 정보를 찾을 수 없습니다: {self.cmp_num} / -"}
+            return self._load(
+                "generate_comprehensive_report",
+                self.cmp_num,
+                company_info=company_info,
+                emp_df=self.company_employees(),
+                env_df=self.environmental(),
+            )
+        return self._memo("comprehensive_report", _build, query=False)
+
+    def environmental_metrics(self) -> Dict[str, Any]:
+        return self._memo(
+            "environmental_metrics",
+            lambda: self._load("calculate_environmental_metrics", self.environmental()),
+            query=False,
+        )
+
+    def data_gaps(self) -> Dict[str, Any]:
+        return self._memo(
+            "data_gaps",
+            lambda: self._load(
+                "identify_data_gaps",
+                self.cmp_num,
+                company_info=self.company_info() or {},
+                emp_df=self.company_employees(),
+                env_df=self.environmental(),
+            ),
+            query=False,
+        )
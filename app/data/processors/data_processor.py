@@ -304,13 +304,24 @@ class ESGDataProcessor:
         
     #     return metrics
 
-    def generate_comprehensive_report(self, cmp_num: str, cmp_branch: Optional[str] = None) -> Dict[str, Any]:
-        company_info = self.get_company_info(cmp_num, cmp_branch=cmp_branch)
+    def generate_comprehensive_report(
+        self,
+        cmp_num: str,
+        cmp_branch: Optional[str] = None,
+        company_info: Optional[Dict[str, Any]] = None,
+        emp_df: Optional[pd.DataFrame] = None,
+        env_df: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, Any]:
+        """종합 ESG 보고서 데이터. 이미 로드한 데이터가 있으면 재조회하지 않음."""
+        if company_info is None:
+            company_info = self.get_company_info(cmp_num, cmp_branch=cmp_branch)
         if not company_info:
             return {"error": f"회사 정보를 찾을 수 없습니다: {cmp_num} / {cmp_branch or '-'}"}
 
-        emp_df = self.get_employee_data(cmp_num=cmp_num)
-        env_df = self.get_environmental_data()
+        if emp_df is None:
+            emp_df = self.get_employee_data(cmp_num=cmp_num)
+        if env_df is None:
+            env_df = self.get_environmental_data()
 
         social = self.calculate_social_metrics(emp_df)
         env = self.calculate_environmental_metrics(env_df, emp_df)  # emp_df 전달
@@ -335,6 +346,58 @@ class ESGDataProcessor:
             },
         }
 
+    def identify_data_gaps(
+        self,
+        cmp_num: str,
+        company_info: Optional[Dict[str, Any]] = None,
+        emp_df: Optional[pd.DataFrame] = None,
+        env_df: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, Any]:
+        """ESG 영역별 누락 데이터 식별"""
+        if company_info is None:
+            company_info = self.get_company_info(cmp_num)
+        if emp_df is None:
+            emp_df = self.get_employee_data(cmp_num=cmp_num)
+        if env_df is None:
+            env_df = self.get_environmental_data()
+
+        gaps: Dict[str, List[str]] = {"environmental": [], "social": [], "governance": []}
+
+        # 환경
+        if env_df.empty:
+            gaps["environmental"].append("환경 데이터(에너지 사용량, 온실가스 배출량)가 없습니다.")
+        else:
+            for col, label in [("energy_use", "에너지 사용량"), ("green_use", "온실가스 배출량"), ("renewable_ratio", "재생에너지 비율")]:
+                missing_years = env_df.loc[env_df[col].isna(), "year"].astype(int).tolist()
+                if missing_years:
+                    gaps["environmental"].append(f"{label} 누락 연도: {', '.join(map(str, missing_years))}")
+            latest_year = int(env_df["year"].max())
+            if latest_year < datetime.now().year - 1:
+                gaps["environmental"].append(f"최근 환경 데이터가 {latest_year}년까지만 등록되어 있습니다.")
+
+        # 사회
+        if emp_df.empty:
+            gaps["social"].append("직원 데이터가 없습니다.")
+        else:
+            for col, label in [("emp_gender", "성별"), ("emp_join", "입사일"), ("emp_acident_cnt", "산재 발생 횟수"), ("emp_board_yn", "이사회 여부")]:
+                missing = int(emp_df[col].isna().sum())
+                if missing:
+                    gaps["social"].append(f"{label} 정보가 없는 직원 {missing}명")
+
+        # 지배구조
+        if not company_info:
+            gaps["governance"].append("회사 정보가 없습니다.")
+        else:
+            for key, label in [("cmp_extemp", "사외이사 수"), ("cmp_ethics_yn", "윤리경영 여부"), ("cmp_comp_yn", "컴플라이언스 여부")]:
+                if company_info.get(key) is None:
+                    gaps["governance"].append(f"{label} 정보가 없습니다.")
+
+        return {
+            "gaps": gaps,
+            "gap_count": sum(len(v) for v in gaps.values()),
+            "complete_categories": [k for k, v in gaps.items() if not v],
+        }
+
     # 하위 호환성을 위한 메서드
     def get_company_data(self, company_id: str, **kwargs) -> pd.DataFrame:
         """하위 호환성을 위한 메서드 - company_id를 cmp_num으로 처리"""
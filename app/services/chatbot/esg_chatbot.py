@@ -6,12 +6,14 @@ from datetime import datetime
 import logging
 import json
 
-from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain.schema import BaseMessage, SystemMessage
 from langchain.memory import ConversationBufferWindowMemory
 from sqlalchemy.orm import Session
 
 from app.core.database.models import ChatSession, Company, ESGData
 from app.data.processors.data_processor import ESGDataProcessor
+from .intent_classifier import classify_intent
+from .memory import ConversationMemory
 from .langchain_handler import LangChainHandler
 
 logger = logging.getLogger(__name__)
@@ -25,7 +27,9 @@ class ESGChatbot:
         self.company_id = company_id
         self.langchain_handler = LangChainHandler()
         self.data_processor = ESGDataProcessor(db)
-        self.memory = ConversationBufferWindowMemory(k=10, return_messages=True)
+        self.conversation_memory = ConversationMemory()
+        self.memory = ConversationBufferWindowMemory(k=self.conversation_memory.window_turns, return_messages=True)
+        self.conversation_summary = ""  # 창 밖으로 밀려난 이전 대화 요약 (창 메모리와 따로 보관)
         
         # ESG-specific system prompt
         self.system_prompt = """
@@ -73,16 +77,21 @@ class ESGChatbot:
         session = self.db.query(ChatSession).filter_by(session_id=session_id).first()
         
         if session:
-            # Restore conversation history
+            # Restore bounded history: last N turns into the window memory, older turns as a summary
             self.memory.clear()
-            for msg in session.messages or []:
-                if msg['type'] == 'human':
-                    self.memory.chat_memory.add_message(HumanMessage(content=msg['content']))
-                elif msg['type'] == 'ai':
-                    self.memory.chat_memory.add_message(AIMessage(content=msg['content']))
+            for msg in self.conversation_memory.window_messages(session):
+                self.memory.chat_memory.add_message(msg)
+            self.conversation_summary = self.conversation_memory.summary(session)
         
         return session
     
+    def _history(self) -> List[BaseMessage]:
+        """Previous conversation for the prompt: summary of older turns + the window memory."""
+        return [
+            *self.conversation_memory.summary_message(self.conversation_summary),
+            *self.memory.chat_memory.messages,
+        ]
+    
     def chat(self, message: str, session_id: str) -> Dict[str, Any]:
         """Process chat message and generate response."""
         try:
@@ -150,78 +159,12 @@ class ESGChatbot:
         return context
     
     def _analyze_intent(self, message: str) -> Dict[str, Any]:
-        """Analyze user message intent."""
-        message_lower = message.lower()
-        
-        # Data query patterns
-        data_keywords = ['show', 'display', 'what is', 'how much', 'data', 'metrics', 'values']
-        if any(keyword in message_lower for keyword in data_keywords):
-            return {
-                'type': 'data_query',
-                'confidence': 0.8,
-                'entities': self._extract_entities(message)
-            }
-        
-        # Report generation patterns
-        report_keywords = ['report', 'generate', 'create', 'summary', 'analysis']
-        if any(keyword in message_lower for keyword in report_keywords):
-            return {
-                'type': 'report_generation',
-                'confidence': 0.9,
-                'entities': self._extract_entities(message)
-            }
-        
-        # Analysis request patterns
-        analysis_keywords = ['analyze', 'trend', 'compare', 'benchmark', 'performance']
-        if any(keyword in message_lower for keyword in analysis_keywords):
-            return {
-                'type': 'analysis_request',
-                'confidence': 0.7,
-                'entities': self._extract_entities(message)
-            }
-        
-        return {
-            'type': 'general_query',
-            'confidence': 0.5,
-            'entities': []
-        }
+        """Analyze user message intent with the shared classifier."""
+        return classify_intent(message).to_dict()
     
     def _extract_entities(self, message: str) -> List[Dict[str, Any]]:
-        """Extract ESG-related entities from message."""
-        entities = []
-        message_lower = message.lower()
-        
-        # ESG categories
-        categories = ['environmental', 'social', 'governance']
-        for category in categories:
-            if category in message_lower:
-                entities.append({
-                    'type': 'category',
-                    'value': category.title(),
-                    'confidence': 0.9
-                })
-        
-        # Time periods
-        time_keywords = ['2023', '2024', 'last year', 'this year', 'quarterly', 'annual']
-        for keyword in time_keywords:
-            if keyword in message_lower:
-                entities.append({
-                    'type': 'time_period',
-                    'value': keyword,
-                    'confidence': 0.8
-                })
-        
-        # Common ESG metrics
-        metrics = ['energy', 'water', 'emissions', 'waste', 'carbon', 'diversity', 'safety']
-        for metric in metrics:
-            if metric in message_lower:
-                entities.append({
-                    'type': 'metric',
-                    'value': metric,
-                    'confidence': 0.7
-                })
-        
-        return entities
+        """Extract ESG-related entities (category, period, metric) from message."""
+        return classify_intent(message).to_dict()['entities']
     
     def _handle_data_query(self, message: str, intent: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle data query requests."""
@@ -257,7 +200,7 @@ class ESGChatbot:
         Provide a clear, informative response about the company's ESG data.
         """
         
-        response = self.langchain_handler.generate_response(prompt, self.system_prompt)
+        response = self.langchain_handler.generate_response(prompt, self.system_prompt, self._history())
         
         return {
             'content': response,
@@ -304,7 +247,7 @@ class ESGChatbot:
         6. Data Quality Assessment
         """
         
-        response = self.langchain_handler.generate_response(prompt, self.system_prompt)
+        response = self.langchain_handler.generate_response(prompt, self.system_prompt, self._history())
         
         return {
             'content': response,
@@ -348,7 +291,7 @@ class ESGChatbot:
         Provide detailed insights, identify patterns, and suggest improvements.
         """
         
-        response = self.langchain_handler.generate_response(prompt, self.system_prompt)
+        response = self.langchain_handler.generate_response(prompt, self.system_prompt, self._history())
         
         return {
             'content': response,
@@ -365,7 +308,7 @@ class ESGChatbot:
         Provide helpful information about ESG reporting, best practices, or answer their question.
         """
         
-        response = self.langchain_handler.generate_response(prompt, self.system_prompt)
+        response = self.langchain_handler.generate_response(prompt, self.system_prompt, self._history())
         
         return {
             'content': response
@@ -373,25 +316,7 @@ class ESGChatbot:
     
     def _save_conversation(self, session: ChatSession, user_message: str, ai_response: str) -> None:
         """Save conversation to database."""
-        # Update messages
-        messages = session.messages or []
-        messages.extend([
-            {
-                'type': 'human',
-                'content': user_message,
-                'timestamp': datetime.now().isoformat()
-            },
-            {
-                'type': 'ai', 
-                'content': ai_response,
-                'timestamp': datetime.now().isoformat()
-            }
-        ])
-        
-        session.messages = messages
-        session.message_count = len(messages)
-        session.last_activity = datetime.now()
-        
+        self.conversation_memory.append_turn(session, user_message, ai_response)
         self.db.commit()
     
     def get_session_history(self, session_id: str) -> Dict[str, Any]:
@@ -404,7 +329,7 @@ class ESGChatbot:
         return {
             'session_id': session_id,
             'title': session.title,
-            'messages': session.messages or [],
+            'messages': self.conversation_memory.transcript(self.db, session),
             'message_count': session.message_count,
             'created_at': session.created_at.isoformat(),
             'last_activity': session.last_activity.isoformat()
@@ -0,0 +1,274 @@
+"""Deterministic answers for simple metric questions (no LLM call)."""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _fmt_int(v: Any) -> str:
+    return f"{int(v):,}"
+
+
+def _fmt_float(v: Any) -> str:
+    return f"{float(v):,.2f}".rstrip("0").rstrip(".")
+
+
+def _fmt_pct(v: Any) -> str:
+    # 비율 지표는 0~1 값으로 저장됨
+    return f"{float(v) * 100:.1f}%"
+
+
+def _fmt_yn(v: Any) -> str:
+    return "도입되어 있습니다" if v in (True, "Y") else "도입되어 있지 않습니다"
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """질문 키워드 → 지표 경로 → 한국어 답변 템플릿"""
+    key: str
+    keywords: Sequence[Sequence[str]]  # 각 그룹에서 하나 이상의 단어(토큰)가 있어야 매칭
+    path: Tuple[str, ...]  # generate_comprehensive_report() 결과 내 경로
+    template: str  # {company}, {value}, {year} 사용 가능
+    fmt: Callable[[Any], str] = _fmt_int
+    trend_field: Optional[str] = None  # 연도 지정 질문은 environmental.trends에서 조회
+
+
+_COUNT = ("몇", "몇명", "몇 명", "수", "인원", "얼마")
+_RATIO = ("비율", "비중", "퍼센트", "%")
+
+CATALOG: List[MetricSpec] = [
+    MetricSpec("female_board_ratio", [("여성 이사", "여성이사"), _RATIO],
+               ("esg_metrics", "social", "board_composition", "female_board_ratio"),
+               "{company}의 이사회 내 여성 비율은 {value}입니다.", _fmt_pct),
+    MetricSpec("board_members", [("이사회",), _COUNT],
+               ("esg_metrics", "social", "board_composition", "total_board_members"),
+               "{company}의 이사회 구성원은 {value}명입니다."),
+    MetricSpec("female_ratio", [("여성", "여직원"), _RATIO],
+               ("esg_metrics", "social", "diversity", "female_ratio"),
+               "{company}의 여성 직원 비율은 {value}입니다.", _fmt_pct),
+    MetricSpec("female_count", [("여성", "여직원"), _COUNT],
+               ("esg_metrics", "social", "diversity", "female_count"),
+               "{company}의 여성 직원은 {value}명입니다."),
+    MetricSpec("male_count", [("남성", "남직원"), _COUNT],
+               ("esg_metrics", "social", "diversity", "male_count"),
+               "{company}의 남성 직원은 {value}명입니다."),
+    MetricSpec("employee_count", [("직원", "임직원", "인원", "종업원"), _COUNT],
+               ("esg_metrics", "social", "diversity", "total_employees"),
+               "{company}의 전체 직원 수는 {value}명입니다."),
+    MetricSpec("accident_rate", [("산재", "사고", "재해"), ("율", "비율")],
+               ("esg_metrics", "social", "safety", "accident_rate"),
+               "{company}의 직원 1인당 산재 발생률은 {value}입니다.", _fmt_pct),
+    MetricSpec("total_accidents", [("산재", "사고", "재해"), _COUNT + ("건", "건수")],
+               ("esg_metrics", "social", "safety", "total_accidents"),
+               "{company}의 총 산재 발생 건수는 {value}건입니다."),
+    MetricSpec("renewable_ratio", [("재생에너지", "신재생"), _RATIO],
+               ("esg_metrics", "environmental", "current_status", "renewable_ratio"),
+               "{company}의 {year}년 재생에너지 비율은 {value}입니다.", _fmt_pct, "renewable_ratio"),
+    MetricSpec("ghg_emissions", [("온실가스", "탄소", "co2", "배출량"), ("배출량", "배출")],
+               ("esg_metrics", "environmental", "current_status", "green_use"),
+               "{company}의 {year}년 온실가스 배출량은 {value} tCO2e입니다.", _fmt_float, "green_use"),
+    MetricSpec("energy_use", [("에너지",), ("사용량", "사용", "소비")],
+               ("esg_metrics", "environmental", "current_status", "energy_use"),
+               "{company}의 {year}년 에너지 사용량은 {value} kWh입니다.", _fmt_float, "energy_use"),
+    MetricSpec("external_directors", [("사외이사",), _COUNT],
+               ("esg_metrics", "governance", "basic_governance", "external_directors"),
+               "{company}의 사외이사는 {value}명입니다."),
+    MetricSpec("ethics_policy", [("윤리경영", "윤리 경영")],
+               ("esg_metrics", "governance", "basic_governance", "ethics_policy"),
+               "{company}에는 윤리경영 정책이 {value}.", _fmt_yn),
+    MetricSpec("compliance_policy", [("컴플라이언스", "준법")],
+               ("esg_metrics", "governance", "basic_governance", "compliance_policy"),
+               "{company}에는 컴플라이언스 정책이 {value}.", _fmt_yn),
+]
+
+# 해석/추천/정의가 필요한 질문은 LLM으로 넘김
+_OPEN_ENDED = ("왜", "분석", "개선", "추천", "비교", "방법", "어떻게", "전략", "트렌드", "추이",
+               "보고서", "리포트", "평가", "의견", "설명", "예측", "제안",
+               "줄이", "늘리", "낮추", "높이", "방안", "목표", "계획", "언제", "무엇", "의미", "정의", "제도", "뜻")
+# 한 글자 단어는 토큰 첫머리로만 비교 (준법, 방법 등 다른 단어 안의 글자와 구분)
+_OPEN_ENDED_TOKENS = ("법", "뭐", "뭔")
+# 값을 묻는 질문 형태: 물음표, 묻는/요청하는 말, 또는 측정 단위로 끝나는 짧은 명사구 ("직원 수")
+_ASK_TOKENS = ("몇", "얼마", "알려", "보여", "말해", "확인", "궁금")
+_MEASURES = ("수", "인원", "비율", "비중", "퍼센트", "%", "율", "건수", "사용량", "배출량", "명")
+# 복합명사 분리용 접미 단위 ("직원수" → "직원" + "수")
+_SUFFIXES = ("사용량", "배출량", "비율", "건수", "율", "수")
+_PARTICLES = ("입니까", "인가요", "이에요", "에서는", "이랑", "이야", "예요", "에서", "으로", "하고",
+              "은", "는", "와", "과", "랑", "이", "가", "을", "를", "의", "도", "만", "에", "요", "야", "로", "나", "들", "니", "냐")
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣%]+")
+_MAX_QUESTION_LEN = 60
+_MAX_METRICS_PER_ANSWER = 3
+_YEAR_RE = re.compile(r"(20\d{2})\s*년?")
+
+
+def _resolve_year(query: str) -> Optional[int]:
+    now = datetime.now().year
+    if "재작년" in query:
+        return now - 2
+    if "작년" in query or "전년" in query:
+        return now - 1
+    if "올해" in query or "금년" in query:
+        return now
+    m = _YEAR_RE.search(query)
+    return int(m.group(1)) if m else None
+
+
+def _strip_particles(token: str) -> str:
+    for _ in range(2):
+        for particle in _PARTICLES:
+            if len(token) > len(particle) and token.endswith(particle):
+                token = token[: -len(particle)]
+                break
+        else:
+            break
+    return token
+
+
+def _tokens(query: str) -> Tuple[List[str], List[str]]:
+    """(원래 토큰, 조사를 떼고 복합명사를 나눈 단어 목록)"""
+    raw = _TOKEN_RE.findall(query)
+    words: List[str] = []
+    for token in raw:
+        word = _strip_particles(token)
+        words.append(word)
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                words.extend((word[: -len(suffix)], suffix))
+                break
+    return raw, words
+
+
+def _is_question(query: str, raw: List[str], words: List[str]) -> bool:
+    if query.endswith("?"):
+        return True
+    if any(token.startswith(w) for token in raw for w in _ASK_TOKENS):
+        return True
+    return bool(words) and words[-1] in _MEASURES
+
+
+def _lookup(data: Dict[str, Any], path: Sequence[str]) -> Any:
+    cur: Any = data
+    for part in path:
+        if not isinstance(cur, dict) or part not in cur:
+            return None
+        cur = cur[part]
+    return cur
+
+
+class FastAnswerEngine:
+    """카탈로그에 있는 단순 지표 질문을 LLM 없이 템플릿 답변으로 처리."""
+
+    def __init__(self, catalog: Sequence[MetricSpec] = CATALOG):
+        self.catalog = list(catalog)
+        self.lookups = 0
+        self.hits = 0
+        self.hits_by_metric: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def match(self, query: str) -> List[MetricSpec]:
+        """질문에 해당하는 지표 목록 (개방형 질문이거나 값을 묻는 질문이 아니면 빈 목록).
+
+        키워드는 부분 문자열이 아니라 단어 단위로 비교한다 ("수요일"의 "수", "탄소중립"의 "탄소"는 불일치).
+        """
+        q = query.strip().lower()
+        if not q or len(q) > _MAX_QUESTION_LEN or any(w in q for w in _OPEN_ENDED):
+            return []
+        raw, words = _tokens(q)
+        if any(token.startswith(w) for token in raw for w in _OPEN_ENDED_TOKENS):
+            return []
+        if not _is_question(q, raw, words):
+            return []
+        word_set = set(words)
+        phrase = f" {' '.join(words)} "
+
+        def found(keyword: str) -> bool:
+            return f" {keyword} " in phrase if " " in keyword else keyword in word_set
+
+        matched: List[MetricSpec] = []
+        used: List[str] = []
+        subjects: List[str] = []
+        for spec in self.catalog:
+            hits = [next((k for k in group if found(k)), None) for group in spec.keywords]
+            if None in hits:
+                continue
+            # 더 구체적인 지표가 이미 매칭되면 일반 지표는 제외
+            # (예: "여성 이사" 비율 vs "여성" 비율, "여성 직원" 수 vs "직원" 수)
+            if any(h != u and h in u for h in hits for u in used):
+                continue
+            if any(f" {u} {hits[0]} " in phrase for u in subjects):
+                continue
+            # 같은 대상은 먼저 매칭된 지표 하나만 (예: 여성 비율 vs 여성 수)
+            if hits[0] in subjects:
+                continue
+            matched.append(spec)
+            used.extend(hits)
+            subjects.append(hits[0])
+        return matched[:_MAX_METRICS_PER_ANSWER]
+
+    def answer(self, query: str, report: Optional[Dict[str, Any]]) -> Optional[str]:
+        """답변 문자열 또는 None(LLM 경로로 처리)."""
+        specs = self.match(query)
+        answer = None
+        if specs and report and "error" not in report:
+            answer = self._render(query, specs, report)
+
+        with self._lock:
+            self.lookups += 1
+            if answer is not None:
+                self.hits += 1
+                for spec in specs:
+                    self.hits_by_metric[spec.key] = self.hits_by_metric.get(spec.key, 0) + 1
+        return answer
+
+    def _render(self, query: str, specs: List[MetricSpec], report: Dict[str, Any]) -> Optional[str]:
+        company = (report.get("company_info") or {}).get("cmp_nm") or "귀사"
+        year = _resolve_year(query)
+        lines: List[str] = []
+        for spec in specs:
+            value, value_year = self._value(spec, report, year)
+            if value is None:
+                if spec.trend_field and year is not None:
+                    lines.append(f"{company}의 {year}년 데이터가 등록되어 있지 않습니다.")
+                    continue
+                return None  # 값이 없으면 LLM이 데이터 부족을 설명하도록
+            lines.append(spec.template.format(company=company, value=spec.fmt(value), year=value_year))
+        return "\n".join(lines) if lines else None
+
+    @staticmethod
+    def _value(spec: MetricSpec, report: Dict[str, Any], year: Optional[int]) -> Tuple[Any, Optional[int]]:
+        env = _lookup(report, ("esg_metrics", "environmental")) or {}
+        if spec.trend_field and year is not None:
+            for row in env.get("trends") or []:
+                if row.get("year") == year:
+                    return row.get(spec.trend_field), year
+            return None, year
+        latest_year = (env.get("current_status") or {}).get("latest_year")
+        return _lookup(report, spec.path), latest_year
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "llm_calls_avoided": self.hits,
+                "hit_rate": (self.hits / self.lookups) if self.lookups else 0.0,
+                "hits_by_metric": dict(self.hits_by_metric),
+            }
+
+
+_engine: Optional[FastAnswerEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_fast_answer_engine() -> FastAnswerEngine:
+    """프로세스 전역 엔진 (hit-rate 카운터 공유)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = FastAnswerEngine()
+    return _engine
@@ -0,0 +1,270 @@
+"""Shared intent and entity classifier for every chatbot entry point.
+
+키워드/지표명을 Aho-Corasick 오토마톤 하나로 컴파일해 질문을 한 번만 훑어
+의도 점수와 엔티티(카테고리, 기간, 지표)를 함께 추출한다.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+INTENTS = ("data_query", "report_generation", "analysis_request", "general_query")
+DEFAULT_INTENT = "general_query"
+
+# 동점일 때 우선순위 (보고서 요청이 가장 구체적)
+_INTENT_PRIORITY = {"report_generation": 3, "analysis_request": 2, "data_query": 1}
+# 이 점수 미만이면 일반 질문으로 분류
+_MIN_INTENT_SCORE = 1.0
+
+# ``to_dict()`` 엔티티(ESGChatbot 규약): 타입 이름과 타입별 신뢰도
+_DICT_ENTITY_TYPES = {"category": "category", "period": "time_period", "metric": "metric"}
+_DICT_ENTITY_CONFIDENCE = {"category": 0.9, "period": 0.8, "metric": 0.7}
+# 집계 단위 표현 - 엔티티로만 내보내고 조회 기간(``period``)으로는 쓰지 않음
+_GRANULARITY_PERIODS = ("quarterly", "annual")
+
+
+@dataclass(frozen=True)
+class Keyword:
+    """오토마톤에 등록되는 패턴 하나 (kind: intent/category/period/metric)"""
+    text: str
+    kind: str
+    value: str
+    weight: float = 1.0
+
+
+@dataclass
+class Entity:
+    type: str  # category / period / metric
+    value: str
+    text: str
+    start: int
+    end: int
+
+
+@dataclass
+class IntentResult:
+    intent: str
+    confidence: float
+    scores: Dict[str, float] = field(default_factory=dict)
+    entities: List[Entity] = field(default_factory=list)
+
+    def _values(self, entity_type: str) -> List[str]:
+        seen: List[str] = []
+        for e in self.entities:
+            if e.type == entity_type and e.value not in seen:
+                seen.append(e.value)
+        return seen
+
+    @property
+    def categories(self) -> List[str]:
+        return self._values("category")
+
+    @property
+    def category(self) -> Optional[str]:
+        """단일 카테고리만 언급되면 해당 값, 여러 개면 'all'"""
+        cats = self.categories
+        if not cats:
+            return None
+        return cats[0] if len(cats) == 1 else "all"
+
+    @property
+    def period(self) -> Optional[str]:
+        periods = [p for p in self._values("period") if p not in _GRANULARITY_PERIODS]
+        return periods[0] if periods else None
+
+    @property
+    def metrics(self) -> List[str]:
+        return self._values("metric")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ESGChatbot 의도 dict. 엔티티는 기존 규약을 유지한다 (타입/값당 하나).
+
+        카테고리는 ESGData.category 값('Environmental'), 기간은 'time_period' 타입에 언급된 표현('last year'),
+        지표도 언급된 표현이 값이다.
+        """
+        entities: List[Dict[str, Any]] = []
+        seen = set()
+        for e in self.entities:
+            value = e.value.title() if e.type == "category" else e.text
+            key = (e.type, value)
+            if key in seen:
+                continue
+            seen.add(key)
+            entities.append({
+                "type": _DICT_ENTITY_TYPES[e.type],
+                "value": value,
+                "confidence": _DICT_ENTITY_CONFIDENCE[e.type],
+            })
+        return {
+            "type": self.intent,
+            "confidence": self.confidence,
+            "scores": dict(self.scores),
+            "entities": entities,
+        }
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 오토마톤 (입력 길이에 선형)."""
+
+    def __init__(self, patterns: Sequence[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]  # (패턴 길이, payload)
+        for text, payload in patterns:
+            self._add(text, payload)
+        self._build()
+
+    def _add(self, text: str, payload: Any) -> None:
+        node = 0
+        for ch in text:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(text), payload))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(start, end, payload) 생성"""
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, payload in self._out[node]:
+                yield i - length + 1, i + 1, payload
+
+
+def _keywords() -> List[Keyword]:
+    kw: List[Keyword] = []
+
+    def add(kind: str, value: str, weight: float, *texts: str) -> None:
+        kw.extend(Keyword(t.lower(), kind, value, weight) for t in texts)
+
+    # --- 의도 ---
+    add("intent", "report_generation", 3.0, "보고서", "리포트", "report")
+    add("intent", "report_generation", 1.5, "생성", "작성", "만들어", "generate", "create", "pdf", "다운로드")
+    add("intent", "analysis_request", 2.0, "분석", "트렌드", "추이", "추세", "비교", "벤치마크", "진단",
+        "analyze", "analysis", "trend", "compare", "benchmark")
+    add("intent", "analysis_request", 1.5, "개선", "평가", "갭", "누락", "부족", "gap", "performance", "improve")
+    add("intent", "data_query", 1.5, "데이터", "수치", "현황", "보여줘", "조회", "얼마", "몇",
+        "show", "display", "data", "how much", "how many")
+    add("intent", "data_query", 1.0, "알려줘", "비율", "비중", "what is", "ratio", "metrics", "values")
+
+    # --- 카테고리 ---
+    add("category", "environmental", 1.0, "환경", "environmental", "environment")
+    add("category", "social", 1.0, "사회", "social")
+    add("category", "governance", 1.0, "지배구조", "거버넌스", "governance")
+
+    # --- 기간 ---
+    add("period", "current_year", 1.0, "올해", "금년", "이번 연도", "this year", "current year")
+    add("period", "last_year", 1.0, "작년", "전년", "지난해", "last year", "previous year")
+    add("period", "last_3_years", 1.0, "최근 3년", "최근3년", "3개년", "last 3 years")
+    add("period", "all_time", 1.0, "전체 기간", "전체기간", "모든 기간", "all time")
+    add("period", "quarterly", 1.0, "분기", "quarterly")
+    add("period", "annual", 1.0, "연간", "annual")
+    this_year = datetime.now().year
+    for year in range(2000, this_year + 2):
+        add("period", str(year), 1.0, str(year))
+
+    # --- 지표 (카테고리 엔티티도 함께 추론) ---
+    metrics = {
+        ("environmental", "energy_use"): ("에너지", "전력", "energy"),
+        ("environmental", "ghg_emissions"): ("온실가스", "탄소", "배출량", "emissions", "emission", "carbon", "ghg"),
+        ("environmental", "renewable_ratio"): ("재생에너지", "신재생", "renewable"),
+        ("environmental", "water"): ("용수", "water"),
+        ("environmental", "waste"): ("폐기물", "waste"),
+        ("social", "diversity"): ("여성", "성별", "다양성", "diversity", "gender"),
+        ("social", "employees"): ("직원", "임직원", "인원", "employee"),
+        ("social", "safety"): ("산재", "안전", "사고", "재해", "safety", "accident"),
+        ("governance", "board"): ("이사회", "board"),
+        ("governance", "external_directors"): ("사외이사", "external director"),
+        ("governance", "ethics"): ("윤리경영", "윤리", "ethics"),
+        ("governance", "compliance"): ("컴플라이언스", "준법", "compliance"),
+    }
+    for (category, metric), texts in metrics.items():
+        add("metric", f"{category}:{metric}", 0.5, *texts)
+    return kw
+
+
+class IntentClassifier:
+    """가중치 기반 의도 분류 + 엔티티 추출 (단일 패스)."""
+
+    def __init__(self, keywords: Optional[Sequence[Keyword]] = None):
+        self.keywords = list(keywords or _keywords())
+        self._automaton = AhoCorasick([(k.text, k) for k in self.keywords])
+
+    def _select(self, text: str) -> List[Tuple[int, int, Keyword]]:
+        """겹치는 매칭은 가장 왼쪽-가장 긴 것만 채택 (예: '재생에너지' 안의 '에너지' 제외)."""
+        matches = sorted(self._automaton.iter_matches(text), key=lambda m: (m[0], -(m[1] - m[0])))
+        chosen: List[Tuple[int, int, Keyword]] = []
+        last_end = -1
+        for start, end, kw in matches:
+            if start >= last_end:
+                chosen.append((start, end, kw))
+                last_end = end
+        return chosen
+
+    def classify(self, text: str) -> IntentResult:
+        lowered = (text or "").lower()
+        scores: Dict[str, float] = {}
+        entities: List[Entity] = []
+
+        for start, end, kw in self._select(lowered):
+            matched = lowered[start:end]
+            if kw.kind == "intent":
+                scores[kw.value] = scores.get(kw.value, 0.0) + kw.weight
+            elif kw.kind == "metric":
+                category, metric = kw.value.split(":", 1)
+                entities.append(Entity("metric", metric, matched, start, end))
+                entities.append(Entity("category", category, matched, start, end))
+                # 구체적 지표 언급은 데이터 조회 성격
+                scores["data_query"] = scores.get("data_query", 0.0) + kw.weight
+            else:
+                entities.append(Entity(kw.kind, kw.value, matched, start, end))
+
+        intent = DEFAULT_INTENT
+        confidence = 0.5
+        if scores:
+            best = max(scores, key=lambda k: (scores[k], _INTENT_PRIORITY.get(k, 0)))
+            if scores[best] >= _MIN_INTENT_SCORE:
+                intent = best
+                confidence = round(min(0.95, 0.5 + 0.45 * scores[best] / sum(scores.values())), 2)
+
+        return IntentResult(intent=intent, confidence=confidence, scores=scores, entities=entities)
+
+
+_classifier: Optional[IntentClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """프로세스 전역 분류기 (오토마톤은 최초 1회만 빌드)"""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = IntentClassifier()
+    return _classifier
+
+
+def classify_intent(text: str) -> IntentResult:
+    return get_intent_classifier().classify(text)
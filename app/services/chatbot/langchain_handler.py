@@ -5,8 +5,6 @@ import logging
 from functools import lru_cache
 
 try:
-    from langchain_community.llms import OpenAI
-    from langchain_community.chat_models import ChatOpenAI
     from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
     from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
     from langchain.chains import ConversationChain
@@ -17,10 +15,8 @@ try:
 except ImportError:
     # Fallback if LangChain/LangGraph not available
     logging.warning("LangChain/LangGraph not available. Using fallback implementation.")
-    OpenAI = None
-    ChatOpenAI = None
 
-from config.settings import settings
+from .intent_classifier import classify_intent
 
 logger = logging.getLogger(__name__)
 
@@ -46,22 +42,16 @@ class LangChainHandler:
     
     def _initialize_models(self) -> None:
         """Initialize LangChain models."""
-        if not settings.openai or not settings.openai.OPENAI_API_KEY:
+        from app.services.llm import get_chat_model, llm_available
+
+        if not llm_available():
             logger.warning("OpenAI API key not configured. Chatbot will use fallback responses.")
             return
         
         try:
-            # Initialize OpenAI models
-            self.chat_model = ChatOpenAI(
-                openai_api_key=settings.openai.OPENAI_API_KEY,
-                model=settings.openai.OPENAI_MODEL,
-                temperature=settings.openai.OPENAI_TEMPERATURE
-            )
-            
-            self.llm = OpenAI(
-                openai_api_key=settings.openai.OPENAI_API_KEY,
-                temperature=settings.openai.OPENAI_TEMPERATURE
-            )
+            # Shared process-wide client (connection pool + concurrency limits)
+            self.chat_model = get_chat_model(streaming=False)
+            self.llm = self.chat_model
             
             logger.info("LangChain models initialized successfully")
             
@@ -101,8 +91,9 @@ class LangChainHandler:
             logger.error(f"Error setting up LangGraph workflow: {str(e)}")
             self.workflow = None
     
-    def generate_response(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Generate response using LangChain."""
+    def generate_response(self, prompt: str, system_prompt: Optional[str] = None,
+                          history: Optional[List[BaseMessage]] = None) -> str:
+        """Generate response using LangChain (``history``: previous-conversation messages placed before the prompt)."""
         if not self.chat_model:
             return self._fallback_response(prompt)
         
@@ -112,9 +103,10 @@ class LangChainHandler:
             if system_prompt:
                 messages.append(SystemMessage(content=system_prompt))
             
+            messages.extend(history or [])
             messages.append(HumanMessage(content=prompt))
             
-            response = self.chat_model(messages)
+            response = self.chat_model.invoke(messages)
             return response.content
             
         except Exception as e:
@@ -129,7 +121,7 @@ class LangChainHandler:
         if not self.workflow:
             return {
                 'response': self._fallback_response(user_input),
-                'intent': 'general',
+                'intent': 'general_query',
                 'confidence': 0.5
             }
         
@@ -156,25 +148,14 @@ class LangChainHandler:
             logger.error(f"Error processing conversation: {str(e)}")
             return {
                 'response': self._fallback_response(user_input),
-                'intent': 'general',
+                'intent': 'general_query',
                 'confidence': 0.5
             }
     
     def _analyze_intent_node(self, state: GraphState) -> GraphState:
         """Analyze user intent node for LangGraph."""
-        user_input = state['user_input'].lower()
-        
-        # ESG-specific intent analysis
-        if any(word in user_input for word in ['report', 'generate', 'create']):
-            intent = 'report_generation'
-        elif any(word in user_input for word in ['show', 'display', 'what', 'data']):
-            intent = 'data_query'
-        elif any(word in user_input for word in ['analyze', 'trend', 'compare']):
-            intent = 'analysis'
-        elif any(word in user_input for word in ['help', 'how', 'what is']):
-            intent = 'help'
-        else:
-            intent = 'general'
+        # Shared classifier so every chatbot entry point agrees on the intent
+        intent = classify_intent(state['user_input']).intent
         
         state['intent'] = intent
         return state
@@ -207,7 +188,7 @@ class LangChainHandler:
                 HumanMessage(content=prompt)
             ]
             
-            response = self.chat_model(messages)
+            response = self.chat_model.invoke(messages)
             state['response'] = response.content
             
         except Exception as e:
@@ -240,7 +221,7 @@ class LangChainHandler:
             prompt_parts.append("The user wants to generate an ESG report.")
         elif intent == 'data_query':
             prompt_parts.append("The user is asking about specific ESG data.")
-        elif intent == 'analysis':
+        elif intent == 'analysis_request':
             prompt_parts.append("The user wants ESG data analysis.")
         
         # Add context information
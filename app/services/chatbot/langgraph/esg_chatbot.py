@@ -4,24 +4,38 @@ import uuid
 import os
 import json
 import asyncio
+import contextvars
+import time
 from typing import Dict, List, Any, Optional, Literal
 from datetime import datetime
 import logging
 
-from langchain_openai import ChatOpenAI
 from langchain.tools import tool
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from typing_extensions import TypedDict
 from typing import Annotated
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.database import events
 from app.core.database.models import CmpInfo, EmpInfo, Env, ChatSession, Report, DataImportLog  # 새로운 모델 import
 from app.data.processors.data_processor import ESGDataProcessor
-from app.services.report.ai_enrich import ESGEnricher
-from app.services.report.generator import build_report_html
+from app.data.processors.data_context import ESGDataContext
+from app.services.chatbot.fast_answer import get_fast_answer_engine
+from app.services.chatbot.intent_classifier import classify_intent
+from app.services.chatbot.memory import ConversationMemory
+from app.services.chatbot.prompt_compaction import compact_tool_results, compact_value, to_prompt_json
+from app.services.llm import get_chat_model
+from app.services.checkpoint import (
+    compiled_for, delete_thread, get_checkpointer, maybe_sweep, pending_nodes, thread_config,
+)
+from app.services.report.pipeline import ReportPipeline
 from app.services.report.renderer import html_to_pdf
+from app.utils.bounded_store import BoundedStore, get_bounded_store
+from app.utils.cancellation import CancellationToken, RequestCancelled, check_cancelled, current_token, resolve_token
+from app.utils.singleflight import SingleFlight, digest_key
 from config.settings import settings
 
 
@@ -55,6 +69,36 @@ def normalize_enriched_keys(enriched: dict) -> dict:
 
 logger = logging.getLogger(__name__)
 
+# 동일 프롬프트로 동시에 들어온 응답 생성 요청은 한 번의 LLM 호출을 공유
+_RESPONSE_FLIGHTS = SingleFlight("chat_response")
+
+# 빠른 답변용 지표 캐시 유지 시간 (초)
+_FAST_METRICS_TTL = 60
+
+# 직원/회사/환경 테이블에 변경이 커밋될 때마다 증가 - 빠른 답변용 지표 캐시 무효화
+_metrics_generation = 0
+
+
+def _on_metric_changes(changes: List[events.RowChange]) -> None:
+    global _metrics_generation
+    _metrics_generation += 1
+
+
+for _model in (EmpInfo, CmpInfo, Env):
+    events.subscribe(_model, _on_metric_changes)
+
+# 도구 실행 중 현재 턴의 데이터 컨텍스트 (도구 인자로는 전달할 수 없으므로)
+_turn_data: contextvars.ContextVar[Optional[ESGDataContext]] = contextvars.ContextVar("esg_turn_data", default=None)
+
+def _outcome_store() -> BoundedStore:
+    """세션별 마지막 대화 결과 저장소 (프로세스 전역 공유)"""
+    return get_bounded_store(
+        "chat_outcomes",
+        max_entries=settings.app.CHAT_OUTCOME_MAX_ENTRIES,
+        ttl_seconds=settings.app.CHAT_OUTCOME_TTL_SECONDS,
+        max_bytes=settings.app.CHAT_OUTCOME_MAX_BYTES,
+    )
+
 class ESGAgentState(TypedDict):
     """ESG 챗봇의 상태를 정의하는 TypedDict"""
     messages: Annotated[List, add_messages]
@@ -69,6 +113,9 @@ class ESGAgentState(TypedDict):
     report_generated: bool
     session_id: str
     iteration_count: int
+    conversation_history: List  # 최근 N턴 (ConversationMemory 창)
+    conversation_summary: str  # 창 밖으로 밀려난 이전 대화 요약
+    ui_context: Dict[str, Any]  # UI 선택값 + 질문에서 추출한 카테고리/기간
 
 class ESGReportChatbot:
     """ESG 보고서 생성을 위한 LangGraph 기반 챗봇"""
@@ -78,23 +125,18 @@ class ESGReportChatbot:
         self.cmp_num = cmp_num or "6182618882"  # 더미 데이터 회사코드 (기본값)
         self.log_element = log_element
         self.data_processor = ESGDataProcessor(db)
+        # 스레드로 분산된 DB 조회는 각자 세션을 사용 (Session은 스레드 간 공유 불가)
+        self._session_factory = sessionmaker(bind=db.get_bind(), autocommit=False, autoflush=False)
         self.max_iterations = 3
-        api_key = settings.openai.OPENAI_API_KEY if settings.openai else None
-        self._last_outcomes: Dict[str, dict] = {}  # session_id -> outcome dict
-        
-        # OpenAI LLM 설정
-        self.llm = ChatOpenAI(
-            model="gpt-4.1",
-            openai_api_key=api_key,
-            streaming=True,
-            temperature=0.7
-        )
-        self.llm_nostream = ChatOpenAI(
-            model=self.llm.model_name, 
-            temperature=0.7, 
-            streaming=False, 
-            openai_api_key=api_key
-        )
+        self._last_outcomes = _outcome_store()  # session_id -> outcome dict (LRU + TTL + 메모리 상한)
+        self.fast_answers = get_fast_answer_engine()
+        self.memory = ConversationMemory()
+        self._fast_metrics: Optional[tuple] = None  # (cmp_num, generation, loaded_at, report)
+        
+        # OpenAI LLM 설정 - 프로세스 전역 클라이언트 공유 (모델/온도는 OpenAISettings)
+        self.llm = get_chat_model(streaming=True)
+        self.llm_nostream = get_chat_model(streaming=False)
+        self.report_pipeline = ReportPipeline(self.llm_nostream, self._session_factory)
         
         # ESG 시스템 프롬프트
         self.system_prompt = """
@@ -138,12 +180,14 @@ class ESGReportChatbot:
         def get_company_esg_data(cmp_num: str, category: str = None) -> str:
             """회사의 실제 ESG 원본 데이터와 메트릭을 모두 제공"""
             try:
+                data = self._data_context(cmp_num=cmp_num)
+
                 # 1. 원본 데이터 수집
-                emp_df = self.data_processor.get_employee_data()
-                env_df = self.data_processor.get_environmental_data() 
+                emp_df = data.employees()
+                env_df = data.environmental()
                 
                 # 2. 메트릭 계산
-                comprehensive_report = self.data_processor.generate_comprehensive_report(cmp_num)
+                comprehensive_report = data.comprehensive_report()
                 
                 # 3. 원본 + 메트릭 모두 반환
                 result = {
@@ -169,11 +213,11 @@ class ESGReportChatbot:
             """특정 ESG 지표의 트렌드를 분석합니다."""
             try:
                 # 환경 데이터 트렌드 분석
-                env_df = self.data_processor.get_environmental_data()
-                if env_df.empty:
+                data = self._data_context(cmp_num=cmp_num)
+                if data.environmental().empty:
                     return "환경 데이터가 없어 트렌드 분석을 수행할 수 없습니다."
                 
-                env_metrics = self.data_processor.calculate_environmental_metrics(env_df)
+                env_metrics = data.environmental_metrics()
                 return json.dumps(env_metrics, ensure_ascii=False, indent=2)
             except Exception as e:
                 return f"트렌드 분석 중 오류 발생: {str(e)}"
@@ -182,7 +226,7 @@ class ESGReportChatbot:
         def identify_data_gaps(cmp_num: str) -> str:
             """ESG 데이터의 누락 영역을 식별합니다."""
             try:
-                gaps = self.data_processor.identify_data_gaps(cmp_num)
+                gaps = self._data_context(cmp_num=cmp_num).data_gaps()
                 return json.dumps(gaps, ensure_ascii=False, indent=2)
             except Exception as e:
                 return f"데이터 갭 분석 중 오류 발생: {str(e)}"
@@ -192,77 +236,50 @@ class ESGReportChatbot:
             """ESG 보고서를 HTML 형식으로 생성하고 ID를 포함한 결과를 반환합니다."""
             logger.info(f"'{cmp_num}'에 대한 보고서 생성 도구를 시작합니다.")
             try:
-                company = self.db.query(CmpInfo).filter_by(cmp_num=cmp_num).first()
-                if not company:
-                    raise ValueError("회사 정보를 찾을 수 없습니다.")
-
-                report_data = self.data_processor.generate_comprehensive_report(cmp_num)
-                if 'error' in report_data:
-                    raise ValueError(f"보고서 데이터 생성 실패 - {report_data['error']}")
-                
-                company_info = report_data.get("company_info", {})
-                esg_metrics = report_data.get("esg_metrics", {})
-                
-                 # LLM으로 텍스트/권고 보강 (구조화)
-                enricher = ESGEnricher(self.llm_nostream)  # self.llm은 __init__에서 ChatOpenAI(...)
-                enriched_raw  = await enricher._enrich_with_guard(esg_metrics)
-                enriched = normalize_enriched_keys(enriched_raw)
-
-
-                # 템플릿 입력은 우리가 만든 정규화 루틴이 처리
-                ## build_report_html에 전달할 때, 'ai' 블럭을 함께 넘겨 템플릿에서 사용
-                # period_label = f"{datetime.now().year - 1}년도 기준"
-                # final_html = build_report_html(
-                #     company_info=company_info,
-                #     period_label=period_label,
-                #     summary_metrics=enriched.get("summary", {}),     # 상단 Executive Summary 카드에 활용
-                #     env_metrics={**esg_metrics.get("environment", {}), "ai": enriched["environment"]["ai"]},
-                #     soc_metrics={**esg_metrics.get("social", {}), "ai": enriched["social"]["ai"]},
-                #     gov_metrics={**esg_metrics.get("governance", {}), "ai": enriched["governance"]["ai"]},
-                # )
-                period_label = f"{datetime.now().year - 1}년도 기준"
-                final_html = build_report_html(
-                    company_info=company_info,
-                    period_label=period_label,
-                    summary_metrics=enriched.get("summary", {}),     # 상단 Executive Summary 카드에 활용,
-                    env_metrics={**esg_metrics.get("environmental", {}), "ai": enriched["environmental"]["ai"]},
-                    soc_metrics={**esg_metrics.get("social", {}), "ai": enriched["social"]["ai"]},
-                    gov_metrics={**esg_metrics.get("governance", {}), "ai": enriched["governance"]["ai"]},
-
-                    # env_metrics={**esg_metrics.get("environmental", {}), "ai": enriched.get("environmental", {}).get("ai", {})},
-                    # soc_metrics={**esg_metrics.get("social", {}), "ai": enriched.get("social", {}).get("ai", {})},
-                    # gov_metrics={**esg_metrics.get("governance", {}), "ai": enriched.get("governance", {}).get("ai", {})},
-                )   
-
-
-                report_title = f"{company.cmp_nm} ESG 보고서 ({datetime.now().strftime('%Y-%m-%d')})"
-                report = Report(
-                    company_id=cmp_num, 
-                    title=report_title,
-                    report_type=report_type,
-                    content=final_html,
-                    generated_by="langgraph_chatbot",
-                    format="html"
+                # 단계별 체크포인트 - 중단된 생성은 완료된 단계(보강 섹션 포함)를 건너뛰고 이어서 실행
+                final = await self.report_pipeline.run(
+                    cmp_num, self._data_context(cmp_num=cmp_num), report_type, cancel_token=current_token()
                 )
-                self.db.add(report)
-                self.db.commit()
-                self.db.refresh(report)
-                
-                logger.info(f"성공: 보고서를 DB에 저장했습니다. (ID: {report.id})")
-                
                 result = {
                     "status": "success",
-                    "message": f"'{report.title}' 보고서가 생성되었습니다.",
-                    "report_id": report.id 
+                    "message": f"'{final['report_title']}' 보고서가 생성되었습니다.",
+                    "report_id": final["report_id"]
                 }
                 return json.dumps(result)
 
+            except RequestCancelled:
+                raise
             except Exception as e:
                 logger.error(f"보고서 생성 도중 오류 발생: {e}", exc_info=True)
                 return json.dumps({"status": "error", "message": str(e)})
         
         self.tools = [get_company_esg_data, analyze_esg_trends, identify_data_gaps, generate_esg_report]
     
+    def _data_context(
+        self,
+        state: Optional[Dict[str, Any]] = None,
+        cmp_num: Optional[str] = None,
+        config: Optional[RunnableConfig] = None,
+    ) -> ESGDataContext:
+        """현재 턴의 데이터 컨텍스트 (없거나 다른 회사면 새로 생성)
+
+        체크포인트에 직렬화되지 않도록 상태가 아닌 실행 config로 전달된다.
+        """
+        state = state or {}
+        cmp_num = cmp_num or state.get("cmp_num") or self.cmp_num
+        data = ((config or {}).get("configurable") or {}).get("data_context") or _turn_data.get()
+        if data is None or data.cmp_num != cmp_num:
+            data = self._new_data_context(cmp_num)
+        return data
+    
+    @staticmethod
+    def _cancel_token(config: Optional[RunnableConfig]) -> Optional[CancellationToken]:
+        """실행 config로 전달된 요청 취소 토큰"""
+        return ((config or {}).get("configurable") or {}).get("cancel_token")
+    
+    def _new_data_context(self, cmp_num: Optional[str]) -> ESGDataContext:
+        return ESGDataContext(self.data_processor, cmp_num, session_factory=self._session_factory)
+    
     def _build_workflow(self):
         """ESG 챗봇 워크플로우 구성"""
         workflow_builder = StateGraph(ESGAgentState)
@@ -271,6 +288,7 @@ class ESGReportChatbot:
         workflow_builder.add_node("analyze_intent", self._analyze_intent)
         workflow_builder.add_node("load_company_context", self._load_company_context)
         workflow_builder.add_node("check_data_availability", self._check_data_availability)
+        workflow_builder.add_node("join_context", self._join_context)
         workflow_builder.add_node("execute_esg_tools", self._execute_esg_tools)
         workflow_builder.add_node("generate_response", self._generate_response)
         workflow_builder.add_node("save_conversation", self._save_conversation)
@@ -280,20 +298,18 @@ class ESGReportChatbot:
         # 워크플로우 구축 (동일)
         workflow_builder.add_edge(START, "analyze_intent")
         
+        # 회사 컨텍스트 로드와 데이터 가용성 확인은 서로 독립적이므로 동시에 실행
         workflow_builder.add_conditional_edges(
             "analyze_intent",
             self._decide_company_check,
-            {
-                "has_company": "load_company_context",
-                "no_company": "handle_no_company"
-            }
+            ["load_company_context", "check_data_availability", "handle_no_company"]
         )
         
         workflow_builder.add_edge("handle_no_company", END)
-        workflow_builder.add_edge("load_company_context", "check_data_availability")
+        workflow_builder.add_edge(["load_company_context", "check_data_availability"], "join_context")
         
         workflow_builder.add_conditional_edges(
-            "check_data_availability",
+            "join_context",
             self._decide_data_availability,
             {
                 "has_data": "execute_esg_tools",
@@ -306,7 +322,9 @@ class ESGReportChatbot:
         workflow_builder.add_edge("generate_response", "save_conversation")
         workflow_builder.add_edge("save_conversation", END)
         
-        # 그래프 컴파일
+        # 그래프 컴파일 (체크포인트 버전은 이벤트 루프별 체크포인터로 실행 시 컴파일)
+        self._workflow_builder = workflow_builder
+        self._checkpointed_workflows: Dict[int, Any] = {}
         self.agent_workflow = workflow_builder.compile()
     
     def _analyze_intent(self, state: ESGAgentState) -> ESGAgentState:
@@ -314,19 +332,19 @@ class ESGReportChatbot:
         query = state.get("query", "").lower()
         ui_context = state.get("ui_context") or {}
         
-        # UI에서 선택된 intent가 있으면 우선 사용
+        # UI에서 선택된 intent가 있으면 우선 사용, 없으면 공용 분류기로 판단
+        result = classify_intent(query)
         if ui_context and ui_context.get("selected_intent"):
             intent = ui_context["selected_intent"]
         else:
-            # 기존 텍스트 분석 로직
-            if any(keyword in query for keyword in ["보고서", "리포트", "생성", "작성"]):
-                intent = "report_generation"
-            elif any(keyword in query for keyword in ["데이터", "수치", "현황", "보여줘"]):
-                intent = "data_query"
-            elif any(keyword in query for keyword in ["분석", "트렌드", "비교", "개선"]):
-                intent = "analysis_request"
-            else:
-                intent = "general_query"
+            intent = result.intent
+        
+        # UI에서 고르지 않은 카테고리/기간은 질문에서 추출한 엔티티로 보완
+        ui_context = dict(ui_context)
+        if result.category and not ui_context.get("selected_category"):
+            ui_context["selected_category"] = result.category
+        if result.period and not ui_context.get("selected_period"):
+            ui_context["selected_period"] = result.period
         
         return {
             "intent": intent,
@@ -335,18 +353,24 @@ class ESGReportChatbot:
             "messages": [SystemMessage(content="ESG 챗봇이 질문을 분석중입니다...")]
         }
     
-    def _decide_company_check(self, state: ESGAgentState) -> Literal["has_company", "no_company"]:
-        """회사 선택 여부 확인"""
-        return "has_company" if state.get("cmp_num") else "no_company"
+    def _decide_company_check(self, state: ESGAgentState) -> List[str]:
+        """회사 선택 여부 확인 - 선택되어 있으면 컨텍스트 로드/데이터 확인으로 분기(fan-out)"""
+        if state.get("cmp_num"):
+            return ["load_company_context", "check_data_availability"]
+        return ["handle_no_company"]
+    
+    def _join_context(self, state: ESGAgentState) -> None:
+        """병렬 노드 합류 지점 (상태 변경 없음 - 빈 dict는 LangGraph가 거부함)"""
+        return None
     
-    def _load_company_context(self, state: ESGAgentState) -> ESGAgentState:
+    async def _load_company_context(self, state: ESGAgentState, config: RunnableConfig) -> ESGAgentState:
         """회사 컨텍스트 로드"""
         cmp_num = state.get("cmp_num")
         if not cmp_num:
             return {"company_context": {}}
         
         try:
-            company_info = self.data_processor.get_company_info(cmp_num)
+            company_info = await asyncio.to_thread(self._data_context(state, config=config).company_info)
             if company_info:
                 context = {
                     "cmp_nm": company_info["cmp_nm"],
@@ -361,7 +385,7 @@ class ESGReportChatbot:
             logger.error(f"회사 컨텍스트 로드 오류: {str(e)}")
             return {"company_context": {}}
     
-    def _check_data_availability(self, state: ESGAgentState) -> ESGAgentState:
+    async def _check_data_availability(self, state: ESGAgentState, config: RunnableConfig) -> ESGAgentState:
         """ESG 데이터 가용성 확인"""
         cmp_num = state.get("cmp_num")
         if not cmp_num:
@@ -369,8 +393,11 @@ class ESGReportChatbot:
         
         try:
             # 직원 및 환경 데이터 확인
-            emp_df = self.data_processor.get_employee_data()
-            env_df = self.data_processor.get_environmental_data()
+            data = self._data_context(state, config=config)
+            emp_df, env_df = await asyncio.gather(
+                asyncio.to_thread(data.employees),
+                asyncio.to_thread(data.environmental),
+            )
             
             has_data = not emp_df.empty or not env_df.empty
             
@@ -395,7 +422,7 @@ class ESGReportChatbot:
         """데이터 가용성에 따른 분기"""
         return "no_data" if state.get("needs_data_collection", True) else "has_data"
     
-    async def _execute_esg_tools(self, state: ESGAgentState) -> ESGAgentState:
+    async def _execute_esg_tools(self, state: ESGAgentState, config: RunnableConfig) -> ESGAgentState:
         """ESG 도구 실행 - UI 컨텍스트 반영"""
         intent = state.get("intent", "")
         cmp_num = state.get("cmp_num")
@@ -407,22 +434,25 @@ class ESGReportChatbot:
         
         tool_results = {}
         logger.info(f"분석된 의도: {intent}, 선택된 카테고리: {selected_category}, 선택된 기간: {selected_period}")
+        check_cancelled(self._cancel_token(config))
         
+        # 도구들이 같은 턴의 데이터 컨텍스트를 공유하도록 설정
+        data_token = _turn_data.set(self._data_context(state, config=config))
         try:
             if intent == "data_query":
                 # 데이터 조회 도구 실행
-                result = self.tools[0].invoke({"cmp_num": cmp_num, "category": selected_category})
+                result = await self.tools[0].ainvoke({"cmp_num": cmp_num, "category": selected_category})
                 tool_results["esg_data"] = result
                 tool_results["requested_category"] = selected_category
                 tool_results["requested_period"] = selected_period
                 
             elif intent == "analysis_request":
-                # 트렌드 분석 도구 실행
-                result = self.tools[1].invoke({"cmp_num": cmp_num, "category": selected_category})
+                # 트렌드 분석 + 데이터 갭 분석 동시 실행 (동기 도구는 스레드에서 실행됨)
+                result, gap_result = await asyncio.gather(
+                    self.tools[1].ainvoke({"cmp_num": cmp_num, "category": selected_category}),
+                    self.tools[2].ainvoke({"cmp_num": cmp_num}),
+                )
                 tool_results["trend_analysis"] = result
-                
-                # 데이터 갭 분석
-                gap_result = self.tools[2].invoke({"cmp_num": cmp_num})
                 tool_results["data_gaps"] = gap_result
                 tool_results["analysis_category"] = selected_category
                 tool_results["analysis_period"] = selected_period
@@ -435,35 +465,56 @@ class ESGReportChatbot:
                 tool_results["report_category"] = selected_category
                 tool_results["report_period"] = selected_period
                 
+        except RequestCancelled:
+            raise
         except Exception as e:
             logger.error(f"도구 실행 오류: {str(e)}")
             tool_results["error"] = str(e)
+        finally:
+            _turn_data.reset(data_token)
         
         return {"tool_results": tool_results}
     
-    def _generate_response(self, state: ESGAgentState) -> ESGAgentState:
+    async def _generate_response(self, state: ESGAgentState, config: RunnableConfig) -> ESGAgentState:
         """응답 생성"""
         query = state.get("query", "")
         intent = state.get("intent", "")
         company_context = state.get("company_context", {})
         tool_results = state.get("tool_results", {})
+        check_cancelled(self._cancel_token(config))
         
-        # 프롬프트 구성
+        # 프롬프트 구성 (이전 대화는 요약 + 최근 창만 포함되어 길이가 제한됨)
         messages = [
             SystemMessage(content=self.system_prompt),
+            *self.memory.summary_message(state.get("conversation_summary", "")),
+            *state.get("conversation_history", []),
             HumanMessage(content=f"""
             사용자 질문: {query}
             의도: {intent}
-            회사 정보: {json.dumps(company_context, ensure_ascii=False)}
-            도구 실행 결과: {json.dumps(tool_results, ensure_ascii=False)}
+            회사 정보: {to_prompt_json(compact_value(company_context))}
+            도구 실행 결과: {compact_tool_results(tool_results, settings.llm.LLM_TOOL_RESULT_TOKEN_BUDGET)}
 
             위 정보를 바탕으로 사용자의 질문에 대한 전문적이고 유용한 답변을 제공해주세요.
             """)
         ]
         
+        key = digest_key(
+            self.llm.model_name,
+            self.llm.temperature,
+            [m.content for m in messages],
+        )
+
+        async def _stream_llm():
+            # 토큰 청크는 그래프 콜백을 통해 astream_events로 UI에 바로 전달되고,
+            # 여기서는 최종 상태 저장용으로 이어 붙인다
+            merged = None
+            async for chunk in self.llm.astream(messages, config=config):
+                merged = chunk if merged is None else merged + chunk
+            return merged
+
         try:
-            response = self.llm.invoke(messages)
-            content = response.content
+            response = await _RESPONSE_FLIGHTS.do(key, _stream_llm)
+            content = response.content if response is not None else ""
         except Exception as e:
             content = f"응답 생성 중 오류가 발생했습니다: {str(e)}"
         
@@ -525,23 +576,7 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
         try:
             session = self.db.query(ChatSession).filter_by(session_id=session_id).first()
             if session:
-                messages = session.messages or []
-                messages.extend([
-                    {
-                        "type": "human",
-                        "content": query,
-                        "timestamp": datetime.now().isoformat()
-                    },
-                    {
-                        "type": "ai", 
-                        "content": response,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                ])
-                
-                session.messages = messages
-                session.message_count = len(messages)
-                session.last_activity = datetime.now()
+                self.memory.append_turn(session, query, response)
                 self.db.commit()
                 
         except Exception as e:
@@ -566,9 +601,21 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
         self.db.commit()
         return session_id
     
-    async def stream_response(self, query: str, session_id: str, context: Dict[str, Any] = None) -> str: # type: ignore
-        """스트리밍 응답 처리 - 추가 컨텍스트 지원"""
+    async def stream_response(
+        self,
+        query: str,
+        session_id: str,
+        context: Dict[str, Any] = None,  # type: ignore
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> str: # type: ignore
+        """스트리밍 응답 처리 - 추가 컨텍스트 지원
+
+        cancel_token이 취소되거나 마감되면 RequestCancelled로 중단된다
+        (완료된 단계는 체크포인트에 남아 같은 질문 재시도 시 이어서 실행).
+        """
+        request_token = resolve_token(cancel_token)
         try:
+            session = self.db.query(ChatSession).filter_by(session_id=session_id).first()
             initial_state = {
                 "messages": [HumanMessage(content=query)],
                 "query": query,
@@ -582,29 +629,78 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
                 "report_generated": False,
                 "session_id": session_id,
                 "iteration_count": 0,
+                "conversation_history": self.memory.window_messages(session),
+                "conversation_summary": self.memory.summary(session),
                 "ui_context": context or {}  # UI 컨텍스트 추가
             }
             
-            # 워크플로우 실행
-            complete_response = ""
-            last_tool_results, last_report_generated = {}, False
-            async for chunk in self.agent_workflow.astream(initial_state, stream_mode="values"):
-                if "response_content" in chunk and chunk["response_content"]:
-                    current_content = chunk["response_content"]
-                    if len(current_content) > len(complete_response):
-                        new_tokens = current_content[len(complete_response):]
-                        complete_response = current_content
-                        
-                        # 토큰 단위 스트리밍
-                        for char in new_tokens:
-                            yield char
-                            await asyncio.sleep(0.01)
-                
-                if "tool_results" in chunk:
-                    last_tool_results = chunk["tool_results"] or last_tool_results
-                if "report_generated" in chunk:
-                    last_report_generated = bool(chunk["report_generated"])
+            data = self._new_data_context(self.cmp_num)
             
+            # 단순 지표 질문은 LLM 없이 캐시된 지표로 즉시 답변
+            if (context or {}).get("selected_intent") in (None, "", "data_query"):
+                fast = await self._fast_answer(query, data)
+                if fast:
+                    yield fast
+                    self._save_conversation({"session_id": session_id, "query": query, "response_content": fast})
+                    self._last_outcomes.set(session_id, {
+                        "report_generated": False,
+                        "report_id": None,
+                        "tool_results": {"fast_answer": True},
+                        "full_text": fast,
+                    })
+                    return
+            
+            # 턴 단위 체크포인트 - 같은 질문을 재시도하면 중단된 단계부터 이어서 실행
+            saver = get_checkpointer()
+            await maybe_sweep(saver)
+            workflow = compiled_for(self._workflow_builder, self._checkpointed_workflows, saver)
+            thread_id = f"chat:{session_id}:{digest_key(query, context or {})}"
+            run_config = thread_config(thread_id, data_context=data, cancel_token=request_token)
+            run_config["metadata"] = {"tenant_id": self.cmp_num}  # LLM 동시성 제한 단위
+            pending = await pending_nodes(workflow, run_config)
+            if pending:
+                logger.info("중단된 대화 턴을 이어서 실행합니다: %s (다음 단계: %s)", thread_id, ", ".join(pending))
+            
+            # 워크플로우 실행 - 응답 노드의 LLM 토큰을 생성되는 즉시 전달
+            complete_response = ""
+            final_state: Dict[str, Any] = {}
+            resumable = False
+            try:
+                async for event in workflow.astream_events(
+                    None if pending else initial_state,
+                    config=run_config,
+                    version="v2",
+                ):
+                    check_cancelled(request_token)
+                    kind = event["event"]
+                    if kind == "on_chat_model_stream":
+                        if event.get("metadata", {}).get("langgraph_node") != "generate_response":
+                            continue
+                        token = event["data"]["chunk"].content
+                        if token:
+                            complete_response += token
+                            yield token
+                    elif kind == "on_chain_end" and not event.get("parent_ids"):
+                        # 루트 그래프 종료 이벤트의 출력이 최종 상태
+                        final_state = event["data"].get("output") or {}
+            except (RequestCancelled, asyncio.CancelledError, GeneratorExit):
+                # 취소/마감된 턴은 체크포인트를 남겨 같은 질문 재시도 시 이어서 실행 (남은 것은 TTL 정리)
+                resumable = True
+                raise
+            finally:
+                if not resumable:
+                    await delete_thread(saver, thread_id)
+
+            # LLM을 거치지 않은 응답(데이터/회사 없음 안내)이나
+            # 다른 요청과 공유된 응답은 최종 상태에서 한 번에 전달
+            if not complete_response:
+                complete_response = final_state.get("response_content") or ""
+                if complete_response:
+                    yield complete_response
+
+            last_tool_results = final_state.get("tool_results") or {}
+            last_report_generated = bool(final_state.get("report_generated"))
+
             report_id = None
             try:
                 # 도구가 JSON 문자열을 반환했다면 파싱
@@ -617,28 +713,43 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
             except Exception:
                 pass
 
-            self._last_outcomes[session_id] = {
+            self._last_outcomes.set(session_id, {
                 "report_generated": last_report_generated or bool(report_id),
                 "report_id": report_id,
                 "tool_results": last_tool_results,
                 "full_text": complete_response,
-            }
+            })
 
             if not complete_response.strip():
-                complete_response = "죄송합니다. 응답을 생성할 수 없습니다."
-                for char in complete_response:
-                    yield char
-                    await asyncio.sleep(0.01)
+                yield "죄송합니다. 응답을 생성할 수 없습니다."
                     
+        except RequestCancelled:
+            raise
         except Exception as e:
-            error_message = f"오류가 발생했습니다: {str(e)}"
-            for char in error_message:
-                yield char
-                await asyncio.sleep(0.01)
+            yield f"오류가 발생했습니다: {str(e)}"
+
+    async def _fast_answer(self, query: str, data: ESGDataContext) -> Optional[str]:
+        """카탈로그 지표 질문이면 템플릿 답변, 아니면 None"""
+        report = None
+        if self.fast_answers.match(query):
+            cached = self._fast_metrics
+            generation = _metrics_generation
+            if (cached and cached[:2] == (data.cmp_num, generation)
+                    and time.monotonic() - cached[2] < _FAST_METRICS_TTL):
+                report = cached[3]
+            else:
+                report = await asyncio.to_thread(data.comprehensive_report)
+                # 조회 중에 변경이 커밋됐으면 세대 번호가 달라 다음 질문에서 다시 조회
+                self._fast_metrics = (data.cmp_num, generation, time.monotonic(), report)
+        return self.fast_answers.answer(query, report)
 
     def get_last_outcome(self, session_id: str) -> Dict[str, Any]:
         """마지막 대화 결과 가져오기"""
-        return self._last_outcomes.get(session_id, {})
+        return self._last_outcomes.get(session_id) or {}
+
+    def outcome_store_stats(self) -> Dict[str, Any]:
+        """세션 결과 저장소 상태 (항목 수, 바이트, 적중률, 제거 횟수)"""
+        return self._last_outcomes.stats()
 
 # --- PDF Export Helpers -------------------------------------------------
 
@@ -656,18 +767,25 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
             return None
 
 
-    def export_report_to_pdf(self, report_id: Optional[int] = None, out_dir: str = "generated_reports") -> Optional[str]:
+    def export_report_to_pdf(
+        self,
+        report_id: Optional[int] = None,
+        out_dir: str = "generated_reports",
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Optional[str]:
         """
         최신(또는 지정) 보고서의 HTML을 PDF로 변환해 파일 경로를 반환.
-        기존에 만든 html_to_pdf 렌더러 사용.
+        기존에 만든 html_to_pdf 렌더러 사용. 요청이 취소되면 RequestCancelled.
+        UI에서 스레드로 실행되므로 챗봇 세션(self.db) 대신 전용 세션을 사용한다.
         """
+        db = self._session_factory()
         try:
             os.makedirs(out_dir, exist_ok=True)
             report = None
             if report_id:
-                report = self.db.query(Report).filter(Report.id == report_id).first()
+                report = db.query(Report).filter(Report.id == report_id).first()
             else:
-                report = self.db.query(Report).filter(Report.company_id == self.cmp_num).order_by(Report.created_at.desc()).first()
+                report = db.query(Report).filter(Report.company_id == self.cmp_num).order_by(Report.created_at.desc()).first()
 
             if not report:
                 logger.warning(f"{self.cmp_num}에 대해 내보낼 보고서가 없습니다.")
@@ -677,7 +795,7 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
                 return None
 
             # 파일명 생성
-            company = self.db.query(CmpInfo).filter_by(cmp_num=report.company_id).first()
+            company = db.query(CmpInfo).filter_by(cmp_num=report.company_id).first()
             company_name = company.cmp_nm if company else "Unknown_Company"
             safe_title = f"ESG_Report_{company_name}".replace("/", "_")
             
@@ -688,14 +806,18 @@ ESG 분석과 보고서 생성을 위해 먼저 회사를 선택해 주세요.
             pdf_path = os.path.join(out_dir, f"{safe_title_with_ts}.pdf")
 
             # ✅ WeasyPrint 대신 우리가 만든 PDF 변환 함수 사용
-            html_to_pdf(report.content, pdf_path)
+            html_to_pdf(report.content, pdf_path, cancel_token=cancel_token)
 
             # DB에 파일 경로 업데이트
             report.file_path = pdf_path
             report.file_size = os.path.getsize(pdf_path)
-            self.db.commit()
+            db.commit()
 
             return pdf_path
+        except RequestCancelled:
+            raise
         except Exception as e:
             logger.error(f"export_report_to_pdf 오류: {e}", exc_info=True)
-            return None
\ No newline at end of file
+            return None
+        finally:
+            db.close()
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""Bounded chat memory: recent turns verbatim + rolling summary of older turns."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from sqlalchemy.orm import Session
+
+from app.core.database.models import ChatMessage, ChatSession
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_MEMORY_KEY = "memory"
+_QUESTION_CHARS = 80
+_ANSWER_CHARS = 160
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _first_sentence(text: str) -> str:
+    text = " ".join((text or "").split())
+    for sep in (". ", "다. ", "요. ", "\n"):
+        idx = text.find(sep)
+        if 0 < idx < _ANSWER_CHARS:
+            return text[: idx + len(sep)].strip()
+    return text
+
+
+class ConversationMemory:
+    """프롬프트에는 최근 N턴 + 압축 요약만 넣고, 대화 원문은 따로 쌓아 둠.
+
+    - ``ChatSession.messages``: 최근 창 메시지만 (세션을 불러오거나 턴을 추가할 때 창 크기만큼만 읽고 씀)
+    - ``ChatSession.context["memory"]``: 창 밖으로 밀려난 턴의 누적 요약
+    - ``ChatSession.transcript`` (``chat_messages``): 전체 대화 원문, 추가만 하고 기록 조회 때만 읽음
+    - 프롬프트 크기는 대화 길이와 무관하게 창 크기 + 요약 길이로 제한
+    """
+
+    def __init__(self, window_turns: Optional[int] = None, summary_max_chars: Optional[int] = None):
+        self.window_turns = window_turns or settings.app.CHAT_MEMORY_WINDOW_TURNS
+        self.summary_max_chars = summary_max_chars or settings.app.CHAT_MEMORY_SUMMARY_MAX_CHARS
+
+    # --- 저장 ---------------------------------------------------------
+
+    def append_turn(self, session: ChatSession, human: str, ai: str) -> None:
+        """질문/답변 한 턴 추가 후 창 밖으로 밀려난 턴을 요약에 반영 (commit은 호출자 몫)."""
+        now = datetime.now().isoformat()
+        turn = [
+            {"type": "human", "content": human, "timestamp": now},
+            {"type": "ai", "content": ai, "timestamp": now},
+        ]
+        messages = list(session.messages or [])
+
+        context = dict(session.context or {})
+        memory = dict(context.get(_MEMORY_KEY) or {})
+        if not memory.get("archived"):
+            # 전체 대화를 messages에 두던 이전 버전 세션: 처음 한 번만 기록 테이블로 옮김
+            self._archive(session, messages)
+            memory["archived"] = True
+        self._archive(session, turn)
+        messages.extend(turn)
+
+        # 창 밖으로 밀려난 구간만 요약에 이어 붙임 (이전 버전 세션은 이미 요약한 앞부분을 건너뜀)
+        summarized = int(memory.pop("summarized_messages", 0))
+        window_start = max(len(messages) - self.window_turns * 2, 0)
+        if window_start > summarized:
+            memory["summary"] = self._fold(memory.get("summary", ""), messages[summarized:window_start])
+        context[_MEMORY_KEY] = memory
+
+        # JSON 컬럼은 새 객체를 할당해야 변경이 감지됨
+        session.messages = messages[window_start:]
+        session.context = context
+        session.message_count = (session.message_count or 0) + len(turn)
+        session.last_activity = datetime.now()
+
+    @staticmethod
+    def _archive(session: ChatSession, messages: List[Dict[str, Any]]) -> None:
+        """원문을 ``chat_messages``에 추가 (기존 기록은 읽지 않음)"""
+        rows = []
+        for msg in messages:
+            try:
+                timestamp = datetime.fromisoformat(msg["timestamp"]) if msg.get("timestamp") else None
+            except (TypeError, ValueError):
+                timestamp = None
+            rows.append(ChatMessage(type=msg.get("type", ""), content=msg.get("content", ""), timestamp=timestamp))
+        session.transcript.add_all(rows)
+
+    def _fold(self, summary: str, evicted: List[Dict[str, Any]]) -> str:
+        """밀려난 메시지를 한 줄 요약으로 압축해 기존 요약 뒤에 붙이고 길이를 제한."""
+        lines = [line for line in (summary or "").split("\n") if line]
+        question = None
+        for msg in evicted:
+            if msg.get("type") == "human":
+                question = _clip(msg.get("content", ""), _QUESTION_CHARS)
+            elif msg.get("type") == "ai":
+                answer = _clip(_first_sentence(msg.get("content", "")), _ANSWER_CHARS)
+                lines.append(f"- Q: {question or '-'} / A: {answer}")
+                question = None
+        if question:
+            lines.append(f"- Q: {question}")
+
+        # 오래된 요약 줄부터 제거해 최대 길이 유지
+        dropped = 0
+        while lines and len("\n".join(lines)) > self.summary_max_chars:
+            lines.pop(0)
+            dropped += 1
+        if dropped:
+            logger.debug("대화 요약 한도 초과로 오래된 %d줄 제거", dropped)
+        return "\n".join(lines)
+
+    # --- 로드 ---------------------------------------------------------
+
+    def load(self, session: Optional[ChatSession]) -> Tuple[str, List[Dict[str, Any]]]:
+        """(요약, 최근 창 메시지)"""
+        if session is None:
+            return "", []
+        memory = (session.context or {}).get(_MEMORY_KEY) or {}
+        messages = session.messages or []
+        summary = memory.get("summary", "")
+        summarized = int(memory.get("summarized_messages", 0))
+        window_start = max(len(messages) - self.window_turns * 2, 0)
+        if window_start > summarized:
+            # 전체 대화를 messages에 두던 이전 버전 세션: 창 밖 구간을 그 자리에서 요약
+            summary = self._fold(summary, messages[summarized:window_start])
+        return summary, messages[window_start:]
+
+    def summary(self, session: Optional[ChatSession]) -> str:
+        return self.load(session)[0]
+
+    def window_messages(self, session: Optional[ChatSession]) -> List[BaseMessage]:
+        """프롬프트용 최근 창 메시지 (요약은 ``summary_message``로 따로 전달)"""
+        messages: List[BaseMessage] = []
+        for msg in self.load(session)[1]:
+            if msg.get("type") == "human":
+                messages.append(HumanMessage(content=msg.get("content", "")))
+            elif msg.get("type") == "ai":
+                messages.append(AIMessage(content=msg.get("content", "")))
+        return messages
+
+    @staticmethod
+    def summary_message(summary: str) -> List[BaseMessage]:
+        """요약 SystemMessage (요약이 없으면 빈 목록)"""
+        return [SystemMessage(content=f"이전 대화 요약:\n{summary}")] if summary else []
+
+    @staticmethod
+    def transcript(db: Session, session: Optional[ChatSession]) -> List[Dict[str, Any]]:
+        """전체 대화 기록 (기록 조회용, 대화 길이만큼 읽음)"""
+        if session is None:
+            return []
+        if not ((session.context or {}).get(_MEMORY_KEY) or {}).get("archived"):
+            return list(session.messages or [])  # 아직 옮기지 않은 이전 버전 세션
+        rows = db.scalars(session.transcript.select().order_by(ChatMessage.id))
+        return [
+            {"type": row.type, "content": row.content, "timestamp": row.timestamp.isoformat() if row.timestamp else None}
+            for row in rows
+        ]
@@ -0,0 +1,172 @@
+"""Compaction of tool results before they are placed in an LLM prompt."""
+
+import json
+import logging
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 같은 값을 다른 이름으로 중복 제공하는 키: 버릴 키 -> 남길 키
+# (온실가스 배출량은 모델이 알아보기 쉬운 ghg_emissions를 남기고 DB 열 이름 green_use를 버림)
+_ALIASES = {
+    "green_use": "ghg_emissions",
+    "summary": "data_summary",
+}
+# 응답 생성에 의미 없는 키
+_NOISE_KEYS = {"report_generated_at"}
+# 프롬프트에 원본 행을 넣지 않고 요약만 넣는 표 데이터 키
+_SAMPLE_SUFFIX = "_sample"
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # tiktoken 미설치/인코딩 파일 없음
+        logger.debug("tiktoken 사용 불가, 근사치 사용: %s", e)
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정 (tiktoken 없으면 글자 수 기반 근사)."""
+    enc = _encoding()
+    if enc is not None:
+        return len(enc.encode(text))
+    # 한글은 글자당 1토큰 내외, ASCII는 약 4글자당 1토큰
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + math.ceil((len(text) - non_ascii) / 4)
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return True
+    return isinstance(value, (dict, list, str)) and len(value) == 0
+
+
+def _maybe_json(value: str) -> Any:
+    """도구가 반환한 JSON 문자열은 파싱해서 다시 압축 (이중 인코딩 제거)."""
+    text = value.strip()
+    if text[:1] in "{[":
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return value
+
+
+def _round(value: float, digits: int) -> Any:
+    rounded = round(value, digits)
+    return int(rounded) if float(rounded).is_integer() else rounded
+
+
+def summarize_rows(rows: List[Dict[str, Any]], digits: int) -> Dict[str, Any]:
+    """표 형태(dict 리스트)를 행 수 + 컬럼별 핵심 통계로 요약."""
+    summary: Dict[str, Any] = {"rows": len(rows)}
+    columns: Dict[str, List[Any]] = {}
+    for row in rows:
+        for key, val in row.items():
+            if not _is_empty(val):
+                columns.setdefault(key, []).append(val)
+
+    stats: Dict[str, Any] = {}
+    for key, values in columns.items():
+        numeric = [float(v) for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if numeric and len(numeric) == len(values):
+            stats[key] = {
+                "min": _round(min(numeric), digits),
+                "max": _round(max(numeric), digits),
+                "avg": _round(sum(numeric) / len(numeric), digits),
+            }
+        else:
+            distinct = {str(v) for v in values}
+            # 범주형(값이 반복되는) 컬럼만 분포 표시, 이름/연락처 같은 고유값은 제외
+            if len(distinct) <= 5 and len(distinct) < len(values):
+                counts: Dict[str, int] = {}
+                for v in values:
+                    counts[str(v)] = counts.get(str(v), 0) + 1
+                stats[key] = counts
+    if stats:
+        summary["columns"] = stats
+    return summary
+
+
+def compact_value(value: Any, digits: int = 2, max_rows: int = 12) -> Any:
+    """null 제거, float 반올림, 중복 alias 제거, 큰 표는 요약."""
+    if isinstance(value, str):
+        parsed = _maybe_json(value)
+        if parsed is not value:
+            return compact_value(parsed, digits, max_rows)
+        return value
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        return _round(value, digits)
+    if isinstance(value, dict):
+        out: Dict[str, Any] = {}
+        for key, val in value.items():
+            key = str(key)
+            if key in _NOISE_KEYS:
+                continue
+            kept = _ALIASES.get(key)
+            if kept is not None and kept in value and value[kept] == val:
+                continue
+            if key.endswith(_SAMPLE_SUFFIX) and isinstance(val, list) and val and isinstance(val[0], dict):
+                out[key] = summarize_rows(val, digits)
+                continue
+            val = compact_value(val, digits, max_rows)
+            if not _is_empty(val):
+                out[key] = val
+        return out
+    if isinstance(value, (list, tuple)):
+        items = [compact_value(v, digits, max_rows) for v in value]
+        items = [v for v in items if not _is_empty(v)]
+        if len(items) > max_rows:
+            if all(isinstance(v, dict) for v in items):
+                # 연도별 시계열은 최근 행을 유지, 그 외 표는 통계로 요약
+                if all("year" in v for v in items):
+                    return items[-max_rows:] + [f"... 이전 {len(items) - max_rows}개 연도 생략"]
+                return summarize_rows(items, digits)
+            return items[:max_rows] + [f"... 외 {len(items) - max_rows}개"]
+        return items
+    if hasattr(value, "item"):  # numpy 스칼라
+        try:
+            return compact_value(value.item(), digits, max_rows)
+        except Exception:
+            pass
+    return value
+
+
+def to_prompt_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def compact_for_prompt(value: Any, token_budget: int) -> Tuple[str, int]:
+    """토큰 예산 안에 들어올 때까지 단계적으로 압축한 JSON 문자열과 추정 토큰 수."""
+    text = ""
+    tokens = 0
+    # (반올림 자릿수, 표 최대 행 수) 순으로 점점 강하게 압축
+    for digits, max_rows in ((2, 12), (1, 5), (0, 3)):
+        text = to_prompt_json(compact_value(value, digits=digits, max_rows=max_rows))
+        tokens = estimate_tokens(text)
+        if tokens <= token_budget:
+            return text, tokens
+
+    # 그래도 넘치면 예산에 맞춰 자름
+    ratio = token_budget / max(tokens, 1)
+    cut = max(0, int(len(text) * ratio) - 20)
+    text = text[:cut] + "...(생략)"
+    logger.info("도구 결과가 토큰 예산(%d)을 초과해 잘라냈습니다: %d -> %d", token_budget, tokens, estimate_tokens(text))
+    return text, estimate_tokens(text)
+
+
+def compact_tool_results(tool_results: Optional[Dict[str, Any]], token_budget: int) -> str:
+    text, tokens = compact_for_prompt(tool_results or {}, token_budget)
+    logger.debug("도구 결과 프롬프트 토큰: %d (예산 %d)", tokens, token_budget)
+    return text
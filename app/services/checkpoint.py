@@ -0,0 +1,131 @@
+"""SQLite-backed LangGraph checkpointer shared by the chatbot and report graphs.
+
+그래프 실행 중 각 단계(super-step)가 끝날 때마다 상태를 SQLite에 저장해
+타임아웃/재시작 후 같은 thread_id로 다시 실행하면 마지막으로 완료된 단계부터 이어서 진행한다.
+정상 완료된 스레드의 체크포인트는 바로 삭제하고, 중단된 뒤 ``CHECKPOINT_TTL_SECONDS`` 동안
+이어서 실행되지 않은 스레드는 주기적으로 정리해 파일이 계속 커지지 않게 한다.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+from config.settings import settings
+
+try:
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+except ImportError:  # langgraph-checkpoint-sqlite 미설치 시 프로세스 메모리에만 보관
+    aiosqlite = None
+    AsyncSqliteSaver = None
+
+logger = logging.getLogger(__name__)
+
+# AsyncSqliteSaver는 생성된 이벤트 루프에 묶이므로 루프별로 하나씩 유지
+_savers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BaseCheckpointSaver]" = weakref.WeakKeyDictionary()
+
+# 오래된 스레드 정리 간격 (초) - 체크포인터별 마지막 정리 시각
+_SWEEP_INTERVAL = 3600
+_last_sweep: "weakref.WeakKeyDictionary[BaseCheckpointSaver, float]" = weakref.WeakKeyDictionary()
+
+
+def _new_saver() -> BaseCheckpointSaver:
+    path = settings.app.CHECKPOINT_DB_PATH
+    if AsyncSqliteSaver is None or not path:
+        logger.warning("SQLite 체크포인터를 사용할 수 없어 메모리 체크포인터를 사용합니다 (재시작 시 이어하기 불가)")
+        return MemorySaver()
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # 연결은 첫 사용 시 setup()에서 열림. 연결 스레드가 프로세스 종료를 막지 않도록 daemon으로 둠
+    conn = aiosqlite.connect(path)
+    conn.daemon = True
+    return AsyncSqliteSaver(conn)
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """현재 이벤트 루프용 체크포인터 (최초 호출 시 생성)."""
+    loop = asyncio.get_running_loop()
+    saver = _savers.get(loop)
+    if saver is None:
+        saver = _new_saver()
+        _savers[loop] = saver
+    return saver
+
+
+def thread_config(thread_id: str, **configurable: Any) -> Dict[str, Any]:
+    return {"configurable": {"thread_id": thread_id, **configurable}}
+
+
+async def pending_nodes(graph: Any, config: Dict[str, Any]) -> tuple:
+    """중단된 실행이 남아 있으면 다음에 실행할 노드 이름들, 없으면 빈 튜플."""
+    snapshot = await graph.aget_state(config)
+    return tuple(snapshot.next or ()) if snapshot else ()
+
+
+async def delete_thread(saver: BaseCheckpointSaver, thread_id: str) -> None:
+    """완료된 스레드의 체크포인트/대기 쓰기 삭제."""
+    try:
+        if isinstance(saver, MemorySaver):
+            saver.storage.pop(thread_id, None)
+            for key in [k for k in saver.writes if k[0] == thread_id]:
+                saver.writes.pop(key, None)
+            return
+        if AsyncSqliteSaver is not None and isinstance(saver, AsyncSqliteSaver):
+            await saver.setup()
+            async with saver.lock:
+                await saver.conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+                await saver.conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+                await saver.conn.commit()
+    except Exception as e:
+        # 정리 실패는 다음 실행에 영향이 없으므로 기록만
+        logger.warning("체크포인트 정리 실패 (%s): %s", thread_id, e)
+
+
+async def sweep_stale_threads(saver: BaseCheckpointSaver, max_age_seconds: Optional[int] = None) -> int:
+    """마지막 체크포인트가 ``max_age_seconds``보다 오래된 스레드(이어서 실행되지 않은 중단 실행) 삭제."""
+    max_age = settings.app.CHECKPOINT_TTL_SECONDS if max_age_seconds is None else max_age_seconds
+    if not max_age:
+        return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age)
+    latest: Dict[str, datetime] = {}
+    async for item in saver.alist(None):
+        thread_id = item.config["configurable"]["thread_id"]
+        ts = datetime.fromisoformat(item.checkpoint["ts"])
+        if thread_id not in latest or ts > latest[thread_id]:
+            latest[thread_id] = ts
+    stale = [thread_id for thread_id, ts in latest.items() if ts < cutoff]
+    for thread_id in stale:
+        await delete_thread(saver, thread_id)
+    if stale:
+        logger.info("오래된 체크포인트 스레드 %d개 정리", len(stale))
+    return len(stale)
+
+
+async def maybe_sweep(saver: BaseCheckpointSaver) -> None:
+    """마지막 정리 후 ``_SWEEP_INTERVAL``이 지났으면 오래된 스레드 정리 (실패는 기록만)."""
+    now = time.monotonic()
+    last = _last_sweep.get(saver)
+    if last is not None and now - last < _SWEEP_INTERVAL:
+        return
+    _last_sweep[saver] = now
+    try:
+        await sweep_stale_threads(saver)
+    except Exception as e:
+        logger.warning("체크포인트 정리 실패: %s", e)
+
+
+def compiled_for(builder: Any, cache: Dict[int, Any], saver: Optional[BaseCheckpointSaver] = None) -> Any:
+    """체크포인터별로 한 번만 컴파일한 그래프 반환 (cache는 호출자 소유)."""
+    saver = saver or get_checkpointer()
+    graph = cache.get(id(saver))
+    if graph is None or graph.checkpointer is not saver:
+        graph = builder.compile(checkpointer=saver)
+        cache[id(saver)] = graph
+    return graph
@@ -0,0 +1,5 @@
+"""Background import jobs persisted in the import_jobs table."""
+
+from .queue import JobContext, JobOutcome, JobQueue, JobSnapshot, JobStatus, get_job_queue
+
+__all__ = ["JobContext", "JobOutcome", "JobQueue", "JobSnapshot", "JobStatus", "get_job_queue"]
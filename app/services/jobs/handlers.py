@@ -0,0 +1,169 @@
+"""Import job handlers: job kind → ``handler(ctx) -> JobOutcome``.
+
+처리기는 작업자 스레드에서 실행되며 ``ctx.payload``(JSON)만 입력으로 받는다.
+엑셀 일괄 저장은 화면이 검증해 둔 spool 파일(``payload["upload"]``)을 다시 청크 단위로 읽어 저장한다.
+저장은 트랜잭션 하나로 끝나므로 그동안 진행률은 메모리에만 반영한다 (``JobContext.holding_writes``).
+화면별 엑셀 저장 함수와 가져오기 클래스는 처음 실행할 때 import 한다 (서버 시작 경로를 가볍게 유지).
+"""
+
+from typing import Callable, Dict, Iterator, List
+
+from app.services.jobs.queue import JobContext, JobOutcome
+
+JobHandler = Callable[[JobContext], JobOutcome]
+
+HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    def decorator(func: JobHandler) -> JobHandler:
+        HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def get_handler(kind: str) -> JobHandler:
+    try:
+        return HANDLERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown import job kind: {kind}") from None
+
+
+# --- 화면 엑셀 일괄 저장 ------------------------------------------------
+
+# 예전 형식(``payload["rows"]``) 작업의 진행률 보고 단위
+_LEGACY_CHUNK_ROWS = 500
+
+
+class _RowSource:
+    """작업 입력의 행을 청크 단위로 제공 (검증 오류 행은 미리보기에서 이미 보고했으므로 건너뜀).
+
+    화면이 넘긴 spool 파일을 이어받아 읽고, 저장에 성공했을 때만 지운다 (실패/예외면 재시도할 수 있도록 남김).
+    """
+
+    def __init__(self, ctx: JobContext):
+        from app.data.input.upload_spool import SpooledUpload
+
+        self.ctx = ctx
+        ref = ctx.payload.get("upload")
+        self.upload = SpooledUpload.adopt(ref) if ref else None
+
+    def chunks(self, validate, strip_spaces: bool = True) -> Iterator[List[dict]]:
+        from app.data.input.sheet_parsers import iter_validated
+
+        if self.upload is None:
+            rows = self.ctx.payload.get("rows", [])
+            for start in range(0, len(rows), _LEGACY_CHUNK_ROWS):
+                self.ctx.progress(start / max(len(rows), 1), f"{start}/{len(rows)}건 저장 중...")
+                yield rows[start:start + _LEGACY_CHUNK_ROWS]
+            return
+        for part in iter_validated(self.upload, validate, self.ctx.progress, strip_spaces):
+            if part.missing_columns:
+                raise ValueError(f"필수 열 누락: {', '.join(part.missing_columns)}")
+            yield part.rows
+
+    def finish(self, outcome: JobOutcome) -> JobOutcome:
+        if self.upload is not None and not outcome.failed:
+            self.upload.close()
+        return outcome
+
+
+@register_handler("employee_rows")
+def save_employees(ctx: JobContext) -> JobOutcome:
+    from app.data.input.sheet_parsers import validate_employee_frame
+    from app.ui.pages.hr import save_employee_rows
+
+    source = _RowSource(ctx)
+    ctx.open_import_log("excel_employee")
+    with ctx.holding_writes():
+        saved, updated, errors = save_employee_rows(ctx.session_factory, source.chunks(validate_employee_frame))
+    if errors:  # 하나라도 실패하면 전체 롤백
+        return source.finish(JobOutcome(processed=saved + updated + len(errors), rejected=len(errors), errors=errors,
+                                        message=f"저장 실패: {len(errors)}건 오류 (전체 취소)"))
+    return source.finish(JobOutcome(processed=saved + updated, imported=saved + updated,
+                                    result={"saved": saved, "updated": updated},
+                                    message=f"저장 완료: 신규 {saved}명, 수정 {updated}명"))
+
+
+@register_handler("company_rows")
+def save_companies(ctx: JobContext) -> JobOutcome:
+    from app.data.input.sheet_parsers import validate_company_frame
+    from app.ui.pages.company_management import save_company_rows
+
+    source = _RowSource(ctx)
+    ctx.open_import_log("excel_company")
+    with ctx.holding_writes():
+        success, errors = save_company_rows(ctx.session_factory, source.chunks(validate_company_frame))
+    message = f"{success}건 저장" + (f", {len(errors)}건 실패" if errors else "")
+    return source.finish(JobOutcome(processed=success + len(errors), imported=success, rejected=len(errors),
+                                    errors=errors, message=message))
+
+
+@register_handler("env_rows")
+def save_environment(ctx: JobContext) -> JobOutcome:
+    from app.data.input.sheet_parsers import validate_env_frame
+    from app.ui.pages.environment import save_env_rows
+
+    source = _RowSource(ctx)
+    ctx.open_import_log("excel_env")
+    with ctx.holding_writes():
+        count = save_env_rows(ctx.session_factory, source.chunks(validate_env_frame, strip_spaces=False))
+    return source.finish(JobOutcome(processed=count, imported=count, message=f"{count}건 저장 완료"))
+
+
+# --- 가져오기 클래스 (app.data.input) ---------------------------------------
+
+def _run_importer(ctx: JobContext, importer, *args, **kwargs) -> JobOutcome:
+    """``BaseImporter.import_data`` 실행. 가져오기 클래스가 만든 ``DataImportLog``를 작업에 연결."""
+    importer.progress = ctx.progress
+    try:
+        results = importer.import_data(*args, **kwargs)
+    finally:
+        if importer.import_log is not None:
+            ctx.link_import_log(importer.import_log.id)
+        importer.db.close()
+    imported, rejected = results.get("imported", 0), results.get("rejected", 0)
+    return JobOutcome(
+        processed=imported + rejected,
+        imported=imported,
+        rejected=rejected,
+        errors=results.get("errors", []),
+        message=f"{imported}건 가져옴" + (f", {rejected}건 제외" if rejected else ""),
+    )
+
+
+@register_handler("excel_import")
+def import_excel(ctx: JobContext) -> JobOutcome:
+    from app.data.input import ExcelImporter
+
+    importer = ExcelImporter(ctx.session_factory(), ctx.company_id)
+    return _run_importer(ctx, importer, ctx.payload["file_path"], ctx.payload.get("sheet_name"))
+
+
+@register_handler("manual_input")
+def import_manual(ctx: JobContext) -> JobOutcome:
+    from app.data.input import ManualInputHandler
+
+    importer = ManualInputHandler(ctx.session_factory(), ctx.company_id)
+    return _run_importer(ctx, importer, ctx.payload.get("records", []))
+
+
+@register_handler("erp_import")
+def import_erp(ctx: JobContext) -> JobOutcome:
+    from app.data.input.erp_connector import OracleERPConnector, SAPConnector
+
+    erp_config = ctx.payload["erp_config"]
+    connectors = {"sap": SAPConnector, "oracle": OracleERPConnector}
+    system_type = str(erp_config.get("system_type", "")).lower()
+    if system_type not in connectors:
+        raise ValueError(f"Unsupported ERP system type: {system_type}")
+    importer = connectors[system_type](ctx.session_factory(), ctx.company_id, erp_config)
+    return _run_importer(ctx, importer, ctx.payload.get("query_config", {}))
+
+
+@register_handler("external_api")
+def import_external_api(ctx: JobContext) -> JobOutcome:
+    from app.data.input import ExternalAPIConnector
+
+    importer = ExternalAPIConnector(ctx.session_factory(), ctx.company_id)
+    return _run_importer(ctx, importer, ctx.payload.get("api_configs", []))
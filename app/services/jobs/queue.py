@@ -0,0 +1,456 @@
+"""Persistent background job queue for data imports.
+
+작업은 ``import_jobs`` 테이블에 먼저 기록한 뒤 작업자 스레드가 하나씩 가져가 실행한다.
+화면은 작업 번호로 상태/진행률을 조회하므로 새로고침하거나 다른 화면으로 이동해도 작업이 계속되고,
+서버가 재시작되면 실행 중이던 작업은 다시 대기열에 넣는다 (서버 프로세스가 하나라는 전제).
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.database.base import SessionLocal
+from app.core.database.models import DataImportLog, ImportJob
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    ACTIVE = (QUEUED, RUNNING)
+    FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+@dataclass(frozen=True)
+class JobSnapshot:
+    """화면에 넘기는 작업 상태 (DB 세션과 무관한 값)"""
+
+    id: int
+    kind: str
+    status: str
+    progress: float = 0.0  # 0 ~ 100
+    message: Optional[str] = None
+    company_id: Optional[str] = None
+    source: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    import_log_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in JobStatus.ACTIVE
+
+    @classmethod
+    def of(cls, job: ImportJob) -> "JobSnapshot":
+        return cls(
+            id=job.id,
+            kind=job.kind,
+            status=job.status,
+            progress=job.progress or 0.0,
+            message=job.message,
+            company_id=job.company_id,
+            source=job.source,
+            result=job.result,
+            error=job.error,
+            import_log_id=job.import_log_id,
+            created_at=job.created_at,
+            finished_at=job.finished_at,
+        )
+
+
+@dataclass
+class JobOutcome:
+    """작업 처리기 반환값. ``DataImportLog`` 건수와 작업 결과(result)로 기록된다."""
+
+    processed: int = 0
+    imported: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+    result: Dict[str, Any] = field(default_factory=dict)
+    message: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """오류가 있고 저장된 행이 하나도 없음 (전체 롤백 등) - 작업은 실패로 끝나고 다시 시도할 수 있음"""
+        return bool(self.errors) and not self.imported
+
+    @property
+    def log_status(self) -> str:
+        """``BaseImporter.finish_import_log``와 같은 상태 값"""
+        if not self.errors:
+            return "success"
+        return "partial" if self.imported else "error"
+
+    def to_result(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "imported": self.imported,
+            "rejected": self.rejected,
+            "errors": self.errors[:100],
+            "error_count": len(self.errors),
+            **self.result,
+        }
+
+
+class JobContext:
+    """처리기에 넘기는 실행 정보: 입력, 세션 팩토리, 진행률 보고, 가져오기 로그 연결"""
+
+    def __init__(self, queue: "JobQueue", snapshot: JobSnapshot, payload: Dict[str, Any]):
+        self.queue = queue
+        self.job_id = snapshot.id
+        self.kind = snapshot.kind
+        self.company_id = snapshot.company_id
+        self.source = snapshot.source
+        self.payload = payload
+        self.session_factory: Callable[[], Session] = queue.session_factory
+        self.import_log_id: Optional[int] = None
+        self.owns_import_log = False
+
+    def progress(self, fraction: float, message: Optional[str] = None) -> None:
+        """``progress(fraction, message)`` 콜백 규약 (0.0 ~ 1.0)"""
+        self.queue._report(self.job_id, fraction, message)
+
+    @contextmanager
+    def holding_writes(self) -> Iterator[None]:
+        """처리기가 쓰기 트랜잭션을 열어 둔 동안에는 진행률을 메모리에만 반영.
+
+        SQLite는 트랜잭션이 끝날 때까지 다른 연결의 쓰기를 막으므로, 그 사이 진행률을 DB에 쓰면 잠금을 기다리다 실패한다.
+        """
+        self.queue._memory_only.add(self.job_id)
+        try:
+            yield
+        finally:
+            self.queue._memory_only.discard(self.job_id)
+
+    def open_import_log(self, import_type: str) -> Optional[int]:
+        """작업이 직접 관리하는 ``DataImportLog`` 생성 (회사가 없는 작업은 기록하지 않음)"""
+        if not self.company_id:
+            return None
+        with self.session_factory() as db:
+            log = DataImportLog(
+                company_id=self.company_id,
+                import_type=import_type,
+                source_file=self.source,
+                status="in_progress",
+            )
+            db.add(log)
+            db.commit()
+            self.link_import_log(log.id)
+        self.owns_import_log = True
+        return self.import_log_id
+
+    def link_import_log(self, log_id: Optional[int]) -> None:
+        """가져오기 클래스(``BaseImporter``)가 만든 로그를 작업에 연결"""
+        self.import_log_id = log_id
+        self.queue._update(self.job_id, import_log_id=log_id)
+
+
+def _jsonable(payload: Any) -> Any:
+    """JSON 열에 넣을 수 있는 값으로 변환 (날짜 등은 문자열)"""
+    return json.loads(json.dumps(payload, default=str, ensure_ascii=False))
+
+
+class JobQueue:
+    """``import_jobs`` 테이블 기반 작업 큐와 작업자 스레드 풀"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        flush_seconds: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers or settings.app.IMPORT_JOB_WORKERS
+        self.poll_seconds = poll_seconds or settings.app.IMPORT_JOB_POLL_SECONDS
+        self.flush_seconds = flush_seconds if flush_seconds is not None else settings.app.IMPORT_JOB_PROGRESS_FLUSH_SECONDS
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._live: Dict[int, JobSnapshot] = {}  # 이 프로세스에서 실행 중인 작업의 최신 진행률
+        self._flushed: Dict[int, float] = {}
+        self._memory_only: Set[int] = set()  # 진행률을 DB에 쓰지 않는 작업 (``JobContext.holding_writes``)
+
+    # --- 시작/종료 ---------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stopping.clear()
+            self._recover()
+            self._threads = [
+                threading.Thread(target=self._work, name=f"import-job-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+        logger.info(f"Import job queue started ({self.workers} workers)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _recover(self) -> None:
+        """이전 프로세스가 실행하다 끝내지 못한 작업을 다시 대기열로"""
+        with self.session_factory() as db:
+            count = (
+                db.query(ImportJob)
+                .filter(ImportJob.status == JobStatus.RUNNING)
+                .update({"status": JobStatus.QUEUED, "message": "서버 재시작으로 다시 대기 중"}, synchronize_session=False)
+            )
+            db.commit()
+        if count:
+            logger.warning(f"Re-queued {count} interrupted import jobs")
+
+    # --- 조회/등록 ---------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        company_id: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> JobSnapshot:
+        """작업 등록. 처리기가 없는 종류면 ``ValueError``."""
+        from app.services.jobs.handlers import get_handler
+
+        get_handler(kind)
+        with self.session_factory() as db:
+            job = ImportJob(
+                kind=kind,
+                company_id=company_id,
+                source=source,
+                status=JobStatus.QUEUED,
+                progress=0.0,
+                message="대기 중",
+                payload=_jsonable(payload or {}),
+            )
+            db.add(job)
+            db.commit()
+            snapshot = JobSnapshot.of(job)
+        self._wake.set()
+        return snapshot
+
+    def get(self, job_id: int) -> Optional[JobSnapshot]:
+        live = self._live.get(job_id)
+        if live is not None:
+            return live
+        with self.session_factory() as db:
+            job = db.get(ImportJob, job_id)
+            return JobSnapshot.of(job) if job else None
+
+    def latest(
+        self,
+        kinds: Sequence[str],
+        company_id: Optional[str] = None,
+        active_only: bool = False,
+    ) -> Optional[JobSnapshot]:
+        """회사의 가장 최근 작업 (화면을 다시 열었을 때 진행 중 작업을 이어서 표시)"""
+        jobs = self.list_jobs(company_id, kinds, limit=1, active_only=active_only)
+        return jobs[0] if jobs else None
+
+    def list_jobs(
+        self,
+        company_id: Optional[str] = None,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        active_only: bool = False,
+    ) -> List[JobSnapshot]:
+        with self.session_factory() as db:
+            query = db.query(ImportJob).filter(ImportJob.company_id == company_id)
+            if kinds:
+                query = query.filter(ImportJob.kind.in_(list(kinds)))
+            if active_only:
+                query = query.filter(ImportJob.status.in_(JobStatus.ACTIVE))
+            jobs = [JobSnapshot.of(job) for job in query.order_by(ImportJob.id.desc()).limit(limit)]
+        return [self._live.get(job.id, job) for job in jobs]
+
+    def cancel(self, job_id: int) -> bool:
+        """대기 중인 작업 취소 (실행 중인 작업은 취소하지 않음)"""
+        return self._transition(job_id, JobStatus.QUEUED, JobStatus.CANCELLED, message="취소됨",
+                                finished_at=datetime.utcnow())
+
+    def retry(self, job_id: int) -> bool:
+        """실패한 작업을 같은 입력으로 다시 대기열에"""
+        ok = self._transition(job_id, JobStatus.FAILED, JobStatus.QUEUED, message="대기 중", progress=0.0,
+                              error=None, finished_at=None)
+        if ok:
+            self._wake.set()
+        return ok
+
+    def _transition(self, job_id: int, from_status: str, to_status: str, **values: Any) -> bool:
+        with self.session_factory() as db:
+            count = (
+                db.query(ImportJob)
+                .filter(ImportJob.id == job_id, ImportJob.status == from_status)
+                .update({"status": to_status, **values}, synchronize_session=False)
+            )
+            db.commit()
+        return count == 1
+
+    def _update(self, job_id: int, **values: Any) -> None:
+        with self.session_factory() as db:
+            db.query(ImportJob).filter(ImportJob.id == job_id).update(values, synchronize_session=False)
+            db.commit()
+
+    # --- 작업자 -------------------------------------------------------
+
+    def _claim(self) -> Optional[JobContext]:
+        """가장 오래된 대기 작업을 실행 중으로 바꾸고 가져옴 (다른 작업자와 경쟁하면 다음 작업)"""
+        with self.session_factory() as db:
+            while True:
+                job_id = (
+                    db.query(ImportJob.id)
+                    .filter(ImportJob.status == JobStatus.QUEUED)
+                    .order_by(ImportJob.id)
+                    .limit(1)
+                    .scalar()
+                )
+                if job_id is None:
+                    return None
+                claimed = (
+                    db.query(ImportJob)
+                    .filter(ImportJob.id == job_id, ImportJob.status == JobStatus.QUEUED)
+                    .update({
+                        "status": JobStatus.RUNNING,
+                        "message": "실행 중",
+                        "attempts": ImportJob.attempts + 1,
+                        "started_at": datetime.utcnow(),
+                    }, synchronize_session=False)
+                )
+                db.commit()
+                if claimed:
+                    job = db.get(ImportJob, job_id)
+                    snapshot = JobSnapshot.of(job)
+                    self._live[job_id] = snapshot
+                    return JobContext(self, snapshot, job.payload or {})
+
+    def _work(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                ctx = self._claim()
+            except Exception as e:
+                logger.error(f"Error claiming import job: {str(e)}")
+                ctx = None
+            if ctx is None:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+                continue
+            self._run(ctx)
+
+    def _run(self, ctx: JobContext) -> None:
+        from app.services.jobs.handlers import get_handler
+
+        started = time.perf_counter()
+        try:
+            outcome = get_handler(ctx.kind)(ctx)
+        except Exception as e:
+            logger.error(f"Import job {ctx.job_id} ({ctx.kind}) failed: {str(e)}", exc_info=True)
+            self._finish(ctx, JobStatus.FAILED, error=str(e))
+        else:
+            logger.info(f"Import job {ctx.job_id} ({ctx.kind}) done in {time.perf_counter() - started:.1f}s")
+            self._finish(ctx, JobStatus.FAILED if outcome.failed else JobStatus.SUCCEEDED, outcome)
+
+    def _report(self, job_id: int, fraction: float, message: Optional[str] = None) -> None:
+        """진행률은 메모리에 바로 반영하고, DB에는 ``flush_seconds`` 간격으로만 기록"""
+        live = self._live.get(job_id)
+        if live is None:
+            return
+        percent = round(min(max(fraction, 0.0), 1.0) * 100, 1)
+        live = replace(live, progress=percent, message=message if message is not None else live.message)
+        self._live[job_id] = live
+        if job_id in self._memory_only:
+            return
+        now = time.monotonic()
+        if now - self._flushed.get(job_id, 0.0) >= self.flush_seconds:
+            self._flushed[job_id] = now
+            try:
+                self._update(job_id, progress=percent, message=live.message)
+            except OperationalError as e:
+                # DB가 잠겨 있음 (처리기의 열린 트랜잭션 등) - 진행률 기록 때문에 작업을 실패시키지 않고
+                # 이후 진행률은 메모리에만 둠 (화면은 같은 프로세스의 ``get()``으로 메모리 값을 읽음)
+                logger.warning(f"Progress of import job {job_id} kept in memory: {str(e)}")
+                self._memory_only.add(job_id)
+
+    def _finish(
+        self,
+        ctx: JobContext,
+        status: str,
+        outcome: Optional[JobOutcome] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        values: Dict[str, Any] = {"status": status, "finished_at": datetime.utcnow()}
+        if outcome is not None and status == JobStatus.SUCCEEDED:
+            # 성공한 작업의 입력(행 목록)은 다시 쓸 일이 없으므로 비워 테이블을 작게 유지
+            values.update(progress=100.0, message=outcome.message or "완료", result=_jsonable(outcome.to_result()),
+                          payload=None)
+        elif outcome is not None:
+            # 아무것도 저장하지 못한 작업은 입력을 남겨 두어 retry()로 다시 실행할 수 있게 함
+            values.update(message=outcome.message or "실패", result=_jsonable(outcome.to_result()),
+                          error=outcome.message or "실패")
+        else:
+            values.update(message=f"실패: {error}", error=error)
+        try:
+            with self.session_factory() as db:
+                db.query(ImportJob).filter(ImportJob.id == ctx.job_id).update(values, synchronize_session=False)
+                if ctx.import_log_id is not None:
+                    self._close_import_log(db, ctx, outcome)
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error finishing import job {ctx.job_id}: {str(e)}")
+        finally:
+            self._live.pop(ctx.job_id, None)
+            self._flushed.pop(ctx.job_id, None)
+            self._memory_only.discard(ctx.job_id)
+
+    @staticmethod
+    def _close_import_log(db: Session, ctx: JobContext, outcome: Optional[JobOutcome]) -> None:
+        log = db.get(DataImportLog, ctx.import_log_id)
+        if log is None:
+            return
+        if outcome is not None and ctx.owns_import_log:
+            log.records_processed = outcome.processed
+            log.records_imported = outcome.imported
+            log.records_rejected = outcome.rejected
+            log.error_log = outcome.errors or None
+            log.status = outcome.log_status
+        elif outcome is None and log.status == "in_progress":
+            log.status = "error"
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
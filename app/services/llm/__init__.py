@@ -0,0 +1,17 @@
+"""Shared LLM clients and concurrency control."""
+
+from .fake import FAKE_PROFILES, FakeChatModel, FakeLLMError
+from .limiter import FairLimiter, get_llm_limiter
+from .registry import LLMRegistry, get_chat_model, get_llm_registry, llm_available
+
+__all__ = [
+    "FAKE_PROFILES",
+    "FairLimiter",
+    "FakeChatModel",
+    "FakeLLMError",
+    "LLMRegistry",
+    "get_chat_model",
+    "get_llm_limiter",
+    "get_llm_registry",
+    "llm_available",
+]
@@ -0,0 +1,253 @@
+"""Deterministic offline chat model for benchmarks and air-gapped runs.
+
+``LLM_PROVIDER=fake``로 설정하면 레지스트리가 OpenAI 대신 이 모델을 반환한다.
+같은 입력·시드에는 항상 같은 응답을 내고, 프로파일에 따라 첫 토큰 지연/토큰 속도/
+실패를 흉내 내므로 네트워크 없이 챗봇·보고서 파이프라인의 오케스트레이션 비용을 잴 수 있다.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import time
+import typing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Type
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.pydantic_v1 import Field
+from langchain_core.runnables import Runnable, RunnableLambda
+
+# 프로파일: 첫 토큰 지연(초), 초당 토큰 수(0이면 무제한), 지연 편차 비율, 실패 확률, 실패 종류
+FAKE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "instant": {"first_token_latency": 0.0, "tokens_per_second": 0.0, "jitter": 0.0, "failure_rate": 0.0},
+    "fast": {"first_token_latency": 0.05, "tokens_per_second": 400.0, "jitter": 0.1, "failure_rate": 0.0},
+    "realistic": {"first_token_latency": 0.8, "tokens_per_second": 60.0, "jitter": 0.25, "failure_rate": 0.0},
+    "slow": {"first_token_latency": 3.0, "tokens_per_second": 15.0, "jitter": 0.25, "failure_rate": 0.0},
+    "flaky": {"first_token_latency": 0.8, "tokens_per_second": 60.0, "jitter": 0.25, "failure_rate": 0.1},
+    "timeouts": {"first_token_latency": 0.8, "tokens_per_second": 60.0, "jitter": 0.25, "failure_rate": 0.1,
+                 "failure_kind": "timeout"},
+}
+
+_PHRASES = [
+    "최근 3년간 지표 추이를 보면",
+    "에너지 사용량은 전년 대비 완만하게 감소했으며",
+    "재생에너지 비중을 높이는 것이 우선 과제입니다",
+    "임직원 교육 시간과 안전 지표는 업종 평균 수준이고",
+    "이사회 독립성과 윤리경영 체계는 보완이 필요합니다",
+    "데이터 기준 기간과 산정 방식을 함께 공개하는 것이 좋습니다",
+    "단기적으로는 측정 가능한 목표를 설정하고",
+    "분기별로 이행 현황을 점검하는 것을 권장합니다",
+]
+
+
+class FakeLLMError(RuntimeError):
+    """실패 주입으로 발생한 오류"""
+
+
+def _digest(*parts: Any) -> int:
+    raw = "\x1f".join(str(p) for p in parts).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big")
+
+
+def _prompt_text(messages: List[BaseMessage]) -> str:
+    return "\n".join(f"{m.type}:{m.content}" for m in messages)
+
+
+def _last_question(messages: List[BaseMessage]) -> str:
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return " ".join(str(message.content).split())
+    return ""
+
+
+def _sample_text(seed: int, n_words: int) -> str:
+    words: List[str] = []
+    i = 0
+    while len(words) < n_words:
+        words.extend(_PHRASES[_digest(seed, i) % len(_PHRASES)].split())
+        i += 1
+    return " ".join(words[:n_words]) + "."
+
+
+def _sample_value(annotation: Any, name: str, seed: int) -> Any:
+    """타입 힌트에 맞는 결정적 예시 값 (필수 필드만 채움)"""
+    origin = typing.get_origin(annotation)
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if origin in (list, List):
+        item = args[0] if args else str
+        return [_sample_value(item, name, _digest(seed, i)) for i in range(4 + seed % 3)]
+    if origin is typing.Union or (origin is not None and args and str(origin) == "types.UnionType"):
+        return _sample_value(args[0], name, seed) if args else None
+    if isinstance(annotation, type) and hasattr(annotation, "model_fields"):
+        return _sample_model(annotation, seed)
+    if annotation in (dict, Dict) or origin in (dict, Dict):
+        return {"title": _sample_text(seed, 3), "desc": _sample_text(seed + 1, 12)}
+    if annotation is int:
+        return 2020 + seed % 5
+    if annotation is float:
+        return round((seed % 1000) / 10, 1)
+    if annotation is bool:
+        return bool(seed % 2)
+    return _sample_text(seed, 14 if "summary" in name else 8)
+
+
+def _sample_model(schema: Type[Any], seed: int) -> Dict[str, Any]:
+    payload = {}
+    for name, field in schema.model_fields.items():
+        if field.is_required():
+            payload[field.alias or name] = _sample_value(field.annotation, name, _digest(seed, name))
+    return payload
+
+
+class FakeChatModel(BaseChatModel):
+    """결정적 응답을 내는 오프라인 채팅 모델.
+
+    - 응답은 (시드, 프롬프트)로 정해지며 ``with_structured_output``은 스키마의 필수 필드를 채운 객체를 반환
+    - 호출마다 프로파일의 지연/토큰 속도를 ``asyncio.sleep``으로 재현 (취소 가능)
+    - ``failure_rate`` 확률로 오류(``error``) 또는 응답 없음(``timeout``)을 주입, 순서는 시드로 고정
+    """
+
+    model_name: str = "fake"
+    temperature: float = 0.0
+    streaming: bool = False
+    seed: int = 0
+    first_token_latency: float = 0.0
+    tokens_per_second: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    failure_kind: str = "error"
+    hang_seconds: float = 60.0
+    response_words: int = 80
+    calls: Any = Field(default_factory=itertools.count, exclude=True)
+
+    @classmethod
+    def from_profile(cls, profile: str = "realistic", **overrides: Any) -> "FakeChatModel":
+        if profile not in FAKE_PROFILES:
+            raise ValueError(f"알 수 없는 가짜 LLM 프로파일: {profile} (가능: {', '.join(FAKE_PROFILES)})")
+        params = {**FAKE_PROFILES[profile], **{k: v for k, v in overrides.items() if v is not None}}
+        params.setdefault("model_name", f"fake:{profile}")
+        return cls(**params)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "seed": self.seed}
+
+    # --- 응답 생성 ----------------------------------------------------
+
+    def _plan(
+        self, messages: List[BaseMessage], schema: Optional[Type[Any]]
+    ) -> Tuple[List[str], List[float], Optional[str]]:
+        """(응답 토큰, 토큰별 대기 시간, 실패 종류) - 프롬프트/호출 번호와 시드로 결정"""
+        call_no = next(self.calls)
+        prompt_seed = _digest(self.seed, _prompt_text(messages))
+        if schema is not None:
+            text = json.dumps(_sample_model(schema, prompt_seed), ensure_ascii=False)
+            tokens = [text[i:i + 16] for i in range(0, len(text), 16)]
+        else:
+            question = _last_question(messages)
+            body = _sample_text(prompt_seed, self.response_words)
+            text = f"'{question[:40]}'에 대한 답변입니다. {body}" if question else body
+            words = text.split(" ")
+            tokens = [w + " " for w in words[:-1]] + words[-1:]
+
+        call_seed = _digest(self.seed, "call", call_no)
+        spread = 1.0 + self.jitter * (((call_seed % 2001) / 1000.0) - 1.0)  # 1 ± jitter
+        per_token = (1.0 / self.tokens_per_second) * spread if self.tokens_per_second > 0 else 0.0
+        delays = [self.first_token_latency * spread] + [per_token] * (len(tokens) - 1)
+
+        failure = None
+        if self.failure_rate > 0 and (_digest(call_seed, "fail") % 10_000) / 10_000 < self.failure_rate:
+            failure = self.failure_kind
+        return tokens, delays, failure
+
+    def _fail(self, failure: str) -> None:
+        raise FakeLLMError(f"가짜 LLM 실패 주입 ({failure})")
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        text = "".join(c.message.content for c in self._stream(messages, stop, run_manager, **kwargs))
+        return self._result(text)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        chunks = [c.message.content async for c in self._astream(messages, stop, run_manager, **kwargs)]
+        return self._result("".join(chunks))
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        tokens, delays, failure = self._plan(messages, kwargs.get("structured_schema"))
+        if failure == "timeout":
+            time.sleep(self.hang_seconds)
+        if failure:
+            time.sleep(delays[0])
+            self._fail(failure)
+        for token, delay in zip(tokens, delays):
+            if delay:
+                time.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        tokens, delays, failure = self._plan(messages, kwargs.get("structured_schema"))
+        if failure == "timeout":
+            await asyncio.sleep(self.hang_seconds)
+        if failure:
+            await asyncio.sleep(delays[0])
+            self._fail(failure)
+        for token, delay in zip(tokens, delays):
+            if delay:
+                await asyncio.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    def _result(self, text: str) -> ChatResult:
+        message = AIMessage(content=text, response_metadata={"model_name": self.model_name, "finish_reason": "stop"})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    # --- 구조화 출력 ---------------------------------------------------
+
+    def with_structured_output(
+        self, schema: Any, *, include_raw: bool = False, **kwargs: Any
+    ) -> Runnable:
+        """스키마 필수 필드를 결정적으로 채운 pydantic 객체를 반환하는 Runnable.
+
+        호출은 일반 생성 경로(콜백/동시성 슬롯/지연/실패 주입)를 그대로 거친다.
+        """
+
+        def _parse(message: AIMessage) -> Any:
+            parsed = schema.model_validate_json(message.content)
+            return {"raw": message, "parsed": parsed, "parsing_error": None} if include_raw else parsed
+
+        return self.bind(structured_schema=schema) | RunnableLambda(_parse)
@@ -0,0 +1,122 @@
+"""Fair async concurrency limiter for LLM requests."""
+
+import asyncio
+import weakref
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+
+from config.settings import settings
+
+DEFAULT_TENANT = "default"
+
+
+class FairLimiter:
+    """전역 + 테넌트별 동시 실행 수를 제한하는 비동기 리미터.
+
+    - 한도를 넘은 요청은 테넌트별 FIFO 큐에서 대기한다.
+    - 자리가 나면 대기 중인 테넌트를 라운드로빈으로 돌며 하나씩 배정하므로
+      한 테넌트가 요청을 몰아 보내도 다른 테넌트가 굶지 않는다.
+    """
+
+    def __init__(self, global_limit: int, tenant_limit: int):
+        self.global_limit = max(1, global_limit)
+        self.tenant_limit = max(1, tenant_limit)
+        self._total = 0
+        self._active: Dict[str, int] = {}
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self.granted = 0
+        self.queued = 0
+
+    def _has_room(self, tenant: str) -> bool:
+        return self._total < self.global_limit and self._active.get(tenant, 0) < self.tenant_limit
+
+    def _grant(self, tenant: str) -> None:
+        self._total += 1
+        self._active[tenant] = self._active.get(tenant, 0) + 1
+        self.granted += 1
+
+    async def acquire(self, tenant: str = DEFAULT_TENANT) -> None:
+        # 대기열이 비어 있을 때만 바로 통과 (먼저 기다린 요청 추월 방지)
+        if not self._queues and self._has_room(tenant):
+            self._grant(tenant)
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(tenant, deque()).append(fut)
+        self.queued += 1
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # 배정된 직후 취소되었다면 자리를 돌려준다
+            if fut.done() and not fut.cancelled():
+                self.release(tenant)
+            raise
+
+    def release(self, tenant: str = DEFAULT_TENANT) -> None:
+        self._total -= 1
+        remaining = self._active.get(tenant, 0) - 1
+        if remaining > 0:
+            self._active[tenant] = remaining
+        else:
+            self._active.pop(tenant, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        progressed = True
+        while progressed and self._total < self.global_limit:
+            progressed = False
+            for tenant in list(self._queues):
+                if self._total >= self.global_limit:
+                    break
+                queue = self._queues[tenant]
+                while queue and queue[0].done():  # 대기 중 취소된 요청
+                    queue.popleft()
+                if not queue:
+                    del self._queues[tenant]
+                    continue
+                if self._active.get(tenant, 0) >= self.tenant_limit:
+                    continue
+
+                fut = queue.popleft()
+                self._grant(tenant)
+                fut.set_result(None)
+                progressed = True
+                if queue:
+                    self._queues.move_to_end(tenant)
+                else:
+                    del self._queues[tenant]
+
+    @asynccontextmanager
+    async def slot(self, tenant: str = DEFAULT_TENANT) -> AsyncIterator[None]:
+        await self.acquire(tenant)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self._total,
+            "active_by_tenant": dict(self._active),
+            "waiting": sum(len(q) for q in self._queues.values()),
+            "granted": self.granted,
+            "queued": self.queued,
+        }
+
+
+# 이벤트 루프마다 별도 인스턴스 (Future는 생성된 루프에서만 사용 가능)
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FairLimiter]" = weakref.WeakKeyDictionary()
+
+
+def get_llm_limiter() -> FairLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = FairLimiter(
+            global_limit=settings.llm.LLM_MAX_CONCURRENCY,
+            tenant_limit=settings.llm.LLM_TENANT_CONCURRENCY,
+        )
+        _limiters[loop] = limiter
+    return limiter
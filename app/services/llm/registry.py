@@ -0,0 +1,199 @@
+"""Process-wide registry of shared LLM clients."""
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from config.settings import settings
+from .fake import FakeChatModel
+from .limiter import DEFAULT_TENANT, get_llm_limiter
+
+logger = logging.getLogger(__name__)
+
+# 같은 호출 흐름에서 이미 슬롯을 잡았는지 (_agenerate → _astream 중복 획득 방지)
+_slot_held: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_slot_held", default=False)
+
+# 동기 호출 경로는 전역 한도만 적용
+_sync_slots = threading.BoundedSemaphore(max(1, settings.llm.LLM_MAX_CONCURRENCY))
+
+
+def _tenant_of(run_manager: Any) -> str:
+    """RunnableConfig metadata의 tenant_id (없으면 기본 테넌트)."""
+    metadata = getattr(run_manager, "metadata", None) or {}
+    return str(metadata.get("tenant_id") or DEFAULT_TENANT)
+
+
+def _reset_slot_flag(token: contextvars.Token) -> None:
+    try:
+        _slot_held.reset(token)
+    except ValueError:
+        # 버려진 스트림 제너레이터가 GC 시 다른 컨텍스트에서 정리되는 경우
+        pass
+
+
+@contextmanager
+def _sync_slot() -> Iterator[None]:
+    if _slot_held.get():
+        yield
+        return
+    token = _slot_held.set(True)
+    with _sync_slots:
+        try:
+            yield
+        finally:
+            _reset_slot_flag(token)
+
+
+class _SlotMixin:
+    """호출마다 동시성 슬롯을 획득 (BaseChatModel 하위 클래스 앞에 섞어 씀)."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        with _sync_slot():
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        with _sync_slot():
+            yield from super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if _slot_held.get():
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        token = _slot_held.set(True)
+        try:
+            async with get_llm_limiter().slot(_tenant_of(run_manager)):
+                return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        finally:
+            _reset_slot_flag(token)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[Any]:
+        if _slot_held.get():
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            return
+        token = _slot_held.set(True)
+        try:
+            async with get_llm_limiter().slot(_tenant_of(run_manager)):
+                async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    yield chunk
+        finally:
+            _reset_slot_flag(token)
+
+
+class PooledChatOpenAI(_SlotMixin, ChatOpenAI):
+    """공유 HTTP 풀을 쓰고 호출마다 동시성 슬롯을 획득하는 ChatOpenAI."""
+
+
+class PooledFakeChatModel(_SlotMixin, FakeChatModel):
+    """동시성 슬롯을 실제 클라이언트와 똑같이 거치는 가짜 모델 (벤치마크용)."""
+
+
+class LLMRegistry:
+    """모델/온도/스트리밍 조합별 채팅 모델 인스턴스를 프로세스 전역으로 재사용.
+
+    모든 인스턴스가 하나의 httpx 커넥션 풀을 공유하므로 세션이 늘어나도
+    연결이 새로 만들어지지 않는다. ``LLM_PROVIDER=fake``이면 네트워크 없이
+    결정적으로 응답하는 가짜 모델을 같은 방식으로 돌려준다.
+    """
+
+    def __init__(self):
+        self._models: Dict[Tuple[str, float, bool], BaseChatModel] = {}
+        self._lock = threading.Lock()
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+
+    def _http_clients(self) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        if self._http_client is None:
+            limits = httpx.Limits(
+                max_connections=settings.llm.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.llm.LLM_MAX_CONNECTIONS,
+            )
+            timeout = httpx.Timeout(settings.llm.LLM_REQUEST_TIMEOUT)
+            self._http_client = httpx.Client(limits=limits, timeout=timeout)
+            self._http_async_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        return self._http_client, self._http_async_client
+
+    def chat_model(
+        self,
+        *,
+        streaming: bool = True,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> BaseChatModel:
+        if settings.llm.LLM_PROVIDER == "fake":
+            return self._fake_model(streaming=streaming, model=model, temperature=temperature)
+
+        openai_settings = settings.openai
+        model = model or (openai_settings.OPENAI_MODEL if openai_settings else "gpt-4.1")
+        if temperature is None:
+            temperature = openai_settings.OPENAI_TEMPERATURE if openai_settings else 0.1
+        key = (model, float(temperature), streaming)
+
+        with self._lock:
+            llm = self._models.get(key)
+            if llm is None:
+                http_client, http_async_client = self._http_clients()
+                llm = PooledChatOpenAI(
+                    model=model,
+                    temperature=temperature,
+                    streaming=streaming,
+                    openai_api_key=openai_settings.OPENAI_API_KEY if openai_settings else None,
+                    http_client=http_client,
+                    http_async_client=http_async_client,
+                )
+                self._models[key] = llm
+                logger.info("LLM 클라이언트 생성: model=%s temperature=%s streaming=%s", model, temperature, streaming)
+        return llm
+
+    def _fake_model(self, *, streaming: bool, model: Optional[str], temperature: Optional[float]) -> BaseChatModel:
+        profile = settings.llm.LLM_FAKE_PROFILE
+        model = model or f"fake:{profile}"
+        key = (model, float(temperature or 0.0), streaming)
+
+        with self._lock:
+            llm = self._models.get(key)
+            if llm is None:
+                llm = PooledFakeChatModel.from_profile(
+                    profile,
+                    model_name=model,
+                    temperature=temperature,
+                    streaming=streaming,
+                    seed=settings.llm.LLM_FAKE_SEED,
+                    failure_rate=settings.llm.LLM_FAKE_FAILURE_RATE,
+                )
+                self._models[key] = llm
+                logger.info("가짜 LLM 클라이언트 생성: profile=%s model=%s streaming=%s", profile, model, streaming)
+        return llm
+
+    def stats(self) -> Dict[str, Any]:
+        return {"clients": len(self._models)}
+
+
+_registry: Optional[LLMRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMRegistry()
+    return _registry
+
+
+def get_chat_model(**kwargs: Any) -> BaseChatModel:
+    """공유 채팅 모델 인스턴스 (모델/온도 기본값은 OpenAISettings)."""
+    return get_llm_registry().chat_model(**kwargs)
+
+
+def llm_available() -> bool:
+    """LLM 호출이 가능한 설정인지 (가짜 모델이거나 OpenAI 키가 있음)."""
+    if settings.llm.LLM_PROVIDER == "fake":
+        return True
+    return bool(settings.openai and settings.openai.OPENAI_API_KEY)
@@ -0,0 +1,203 @@
+# app/services/report/ai_cache.py
+"""AI 보강(enrichment) 결과를 프로세스 전역으로 공유하는 SQLite 캐시.
+
+- 키: 정규화된 지표 + 프롬프트 버전 + 모델명의 SHA-256 다이제스트
+- TTL 만료 + 최대 항목 수 초과 시 LRU(마지막 접근 시각 기준) 제거
+- hit/miss 카운터로 적중률 확인 가능
+- 이벤트 루프에서는 ``aget``/``aset``을 사용 (SQLite 호출은 작업 스레드에서)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_FLOAT_DIGITS = 6
+
+
+def _normalize(value: Any) -> Any:
+    """캐시 키 계산용 정규화: dict 키 정렬, float 반올림, NaN/inf → None."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        return round(value, _FLOAT_DIGITS)
+    if isinstance(value, (int, str)):
+        return value
+    # numpy 스칼라 등은 파이썬 기본형으로 변환
+    if hasattr(value, "item"):
+        try:
+            return _normalize(value.item())
+        except Exception:
+            pass
+    return str(value)
+
+
+def make_cache_key(metrics: Dict[str, Any], prompt_version: str, model: Optional[str]) -> str:
+    payload = json.dumps(
+        {"v": prompt_version, "model": model or "", "metrics": _normalize(metrics)},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EnrichmentCache:
+    """SQLite 기반 TTL + LRU 캐시 (스레드 안전)."""
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_enrich_cache (
+                cache_key   TEXT PRIMARY KEY,
+                value       TEXT NOT NULL,
+                created_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_ai_enrich_cache_accessed ON ai_enrich_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM ai_enrich_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM ai_enrich_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE ai_enrich_cache SET accessed_at = ? WHERE cache_key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.warning("AI 보강 캐시 항목 손상, 무시합니다: %s", key[:12])
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO ai_enrich_cache (cache_key, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    value = excluded.value,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, payload, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """``get``을 작업 스레드에서 실행 (이벤트 루프를 막지 않음)."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Dict[str, Any]) -> None:
+        """``set``(만료/LRU 제거 포함)을 작업 스레드에서 실행."""
+        await asyncio.to_thread(self.set, key, value)
+
+    def _evict(self, now: float) -> None:
+        """만료 항목 삭제 후 최대 항목 수를 넘으면 오래 접근하지 않은 순으로 제거."""
+        removed = 0
+        if self.ttl_seconds:
+            cur = self._conn.execute(
+                "DELETE FROM ai_enrich_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            removed += cur.rowcount or 0
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM ai_enrich_cache").fetchone()
+        overflow = count - self.max_entries
+        if self.max_entries and overflow > 0:
+            cur = self._conn.execute(
+                """
+                DELETE FROM ai_enrich_cache WHERE cache_key IN (
+                    SELECT cache_key FROM ai_enrich_cache ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            removed += cur.rowcount or 0
+        self.evictions += removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_enrich_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM ai_enrich_cache").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+_cache: Optional[EnrichmentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """프로세스 전역 캐시 인스턴스 (최초 호출 시 생성)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EnrichmentCache(
+                    path=settings.app.AI_CACHE_PATH,
+                    ttl_seconds=settings.app.AI_CACHE_TTL_SECONDS,
+                    max_entries=settings.app.AI_CACHE_MAX_ENTRIES,
+                )
+    return _cache
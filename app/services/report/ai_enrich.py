@@ -1,12 +1,21 @@
 # app/services/report/ai_enrich.py
 import asyncio
+import copy
 from asyncio.log import logger
-import json
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from .ai_schemas import EnvEnrichment, SocEnrichment, GovEnrichment
+from .ai_cache import get_enrichment_cache, make_cache_key
+from app.utils.cancellation import CancellationToken, RequestCancelled, resolve_token, use_token
+from app.utils.singleflight import SingleFlight
+
+# 프롬프트/스키마를 바꾸면 올려주세요 (기존 캐시 무효화)
+PROMPT_VERSION = "1"
+
+# 동일 지표에 대한 동시 보강 요청은 한 번의 LLM 호출을 공유
+_ENRICH_FLIGHTS = SingleFlight("ai_enrich")
 
 SYS = """당신은 ESG 보고서 작성 보조 AI입니다.
 - 숫자/원시 지표는 절대 고치지 마세요.
@@ -58,6 +67,13 @@ PROMPT_GOV = ChatPromptTemplate.from_messages([
 """)
 ])
 
+# 섹션 이름(esg_metrics 키) → (요약 키, 기본 요약)
+SECTIONS = {
+    "environmental": ("E_summary", "환경 영역 데이터를 분석 중입니다."),
+    "social": ("S_summary", "사회 영역 데이터를 분석 중입니다."),
+    "governance": ("G_summary", "지배구조 영역 데이터를 분석 중입니다."),
+}
+
 def _to_dict(x):
     # pydantic v2 / v1 호환
     if hasattr(x, "model_dump"):
@@ -67,17 +83,28 @@ def _to_dict(x):
     return x  # 이미 dict라면 그대로
 
 class ESGEnricher:
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: BaseChatModel):
         # 구조화 출력(스키마 강제)
         self.llm_env: Runnable = PROMPT_ENV | llm.with_structured_output(EnvEnrichment)
         self.llm_soc: Runnable = PROMPT_SOC | llm.with_structured_output(SocEnrichment)
         self.llm_gov: Runnable = PROMPT_GOV | llm.with_structured_output(GovEnrichment)
-        self._enrich_cache = {}
+        self._chains = {"environmental": self.llm_env, "social": self.llm_soc, "governance": self.llm_gov}
+        self.model_name = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        self._enrich_cache = get_enrichment_cache()
 
-    async def _with_timeout(self, coro, seconds: float, fallback: dict):
+    async def _with_timeout(self, coro, seconds: float, fallback: dict, cancel_token: Optional[CancellationToken] = None):
+        # 요청 토큰이 있으면 남은 마감 시간까지만 기다리고, 취소되면 LLM 호출도 즉시 중단
+        token = resolve_token(cancel_token)
         try:
-            res = await asyncio.wait_for(coro, timeout=seconds)
+            if token is None:
+                res = await asyncio.wait_for(coro, timeout=seconds)
+            else:
+                res = await token.run(coro, timeout=seconds)
             return _to_dict(res)
+        except RequestCancelled:
+            # 버려진 요청은 폴백 결과를 만들지 않고 그대로 중단
+            coro.close()
+            raise
         except asyncio.TimeoutError:
             logger.warning("AI 보강 타임아웃: %s", getattr(coro, "__name__", "section"))
             return fallback
@@ -85,51 +112,77 @@ class ESGEnricher:
             logger.error("AI 보강 중 오류: %s", e, exc_info=True)
             return fallback
 
-    async def _enrich_with_guard(self, esg_metrics: Dict[str, Any]) -> Dict[str, Any]:
-        # 캐시 키 (회사/기간 단위로 키를 더 줄여도 됨)
-        key = (json.dumps(esg_metrics, sort_keys=True, ensure_ascii=False))[:20000]
-        if key in self._enrich_cache:
-            return self._enrich_cache[key]
-
-        env_raw = esg_metrics.get("environmental") or {}
-        soc_raw = esg_metrics.get("social") or {}
-        gov_raw = esg_metrics.get("governance") or {}
-
-        # 섹션별 코루틴 (네이티브 async: ainvoke 사용)
-        env_coro = self.llm_env.ainvoke({"raw": env_raw})
-        soc_coro = self.llm_soc.ainvoke({"raw": soc_raw})
-        gov_coro = self.llm_gov.ainvoke({"raw": gov_raw})
-
-        # 섹션별 개별 타임아웃 및 부분 성공 허용 (예: 각 30초)
-        # 섹션이 실패해도 최소한 ai: {}는 보장
+    async def _enrich_with_guard(
+        self, esg_metrics: Dict[str, Any], cancel_token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        # 캐시 키: 정규화된 지표 + 프롬프트 버전 + 모델 다이제스트
+        key = make_cache_key(esg_metrics, PROMPT_VERSION, self.model_name)
+        cached = await self._enrich_cache.aget(key)
+        if cached is not None:
+            return cached
+
+        enriched = await _shared(key, lambda: self._enrich(esg_metrics, key), cancel_token)
+        # 공유된 결과를 호출자별로 복사 (후처리에서 dict를 수정하는 경우 대비)
+        return copy.deepcopy(enriched)
+
+    async def _enrich(self, esg_metrics: Dict[str, Any], key: str) -> Dict[str, Any]:
+        # 섹션별 개별 타임아웃 및 부분 성공 허용, 성공한 섹션은 섹션 단위로 캐시됨
         env_en, soc_en, gov_en = await asyncio.gather(
-            self._with_timeout(env_coro, 30, {}),
-            self._with_timeout(soc_coro, 30, {}),
-            self._with_timeout(gov_coro, 30, {}),
+            *(self.enrich_section(name, esg_metrics.get(name) or {}) for name in SECTIONS)
         )
-
-        # # 항상 ai 키가 존재하도록 구성 임시백업 202509262100
-        # enriched = {
-        #     "environment": {**env_raw, "ai": env_en if isinstance(env_en, dict) else {}},
-        #     "social":      {**soc_raw, "ai": soc_en if isinstance(soc_en, dict) else {}},
-        #     "governance":  {**gov_raw, "ai": gov_en if isinstance(gov_en, dict) else {}},
-        #     "summary": {
-        #         "E_summary": (env_en or {}).get("executive_summary"),
-        #         "S_summary": (soc_en or {}).get("executive_summary"),
-        #         "G_summary": (gov_en or {}).get("executive_summary"),
-        #     },
-        # }
-        enriched = {
-            "environmental": {"ai": env_en if isinstance(env_en, dict) else {}},  # environmental로 통일
-            "social": {"ai": soc_en if isinstance(soc_en, dict) else {}},
-            "governance": {"ai": gov_en if isinstance(gov_en, dict) else {}},
-            "summary": {
-                "E_summary": (env_en or {}).get("executive_summary") or "환경 영역 데이터를 분석 중입니다.",
-                "S_summary": (soc_en or {}).get("executive_summary") or "사회 영역 데이터를 분석 중입니다.",
-                "G_summary": (gov_en or {}).get("executive_summary") or "지배구조 영역 데이터를 분석 중입니다."
-            }
-        }
-        
-
-        self._enrich_cache[key] = enriched
-        return enriched
\ No newline at end of file
+        enriched = assemble_enrichment({"environmental": env_en, "social": soc_en, "governance": gov_en})
+
+        # 일부 섹션이 실패(폴백)한 결과는 캐시하지 않음 → 다음 요청에서 실패한 섹션만 재시도
+        if env_en and soc_en and gov_en:
+            await self._enrich_cache.aset(key, enriched)
+        return enriched
+
+    async def enrich_section(
+        self,
+        section: str,
+        raw: Dict[str, Any],
+        timeout: float = 30,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """섹션 하나 보강 - 실패/타임아웃 시 {} (성공한 결과만 캐시)."""
+        key = make_cache_key(raw, f"{PROMPT_VERSION}:{section}", self.model_name)
+        cached = await self._enrich_cache.aget(key)
+        if cached is not None:
+            return cached
+
+        async def _run() -> Dict[str, Any]:
+            result = await self._with_timeout(self._chains[section].ainvoke({"raw": raw}), timeout, {})
+            result = result if isinstance(result, dict) else {}
+            if result:
+                await self._enrich_cache.aset(key, result)
+            return result
+
+        return copy.deepcopy(await _shared(key, _run, cancel_token))
+
+
+async def _shared(key: str, fn, cancel_token: Optional[CancellationToken] = None):
+    """SingleFlight로 공유 실행하고, 호출자는 자기 토큰 범위에서만 기다림.
+
+    공유 작업 자체는 특정 요청의 토큰에 묶지 않는다 - 기다리는 요청이 모두
+    취소되어야 SingleFlight가 작업을 취소한다.
+    """
+    async def _detached():
+        with use_token(None):
+            return await fn()
+
+    token = resolve_token(cancel_token)
+    flight = _ENRICH_FLIGHTS.do(key, _detached)
+    return await (token.run(flight) if token is not None else flight)
+
+
+def assemble_enrichment(sections: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """섹션별 보강 결과를 템플릿 입력 구조로 조립 (항상 ai 키 존재)."""
+    enriched: Dict[str, Any] = {}
+    summary: Dict[str, str] = {}
+    for name, (summary_key, default) in SECTIONS.items():
+        ai = sections.get(name)
+        ai = ai if isinstance(ai, dict) else {}
+        enriched[name] = {"ai": ai}
+        summary[summary_key] = ai.get("executive_summary") or default
+    enriched["summary"] = summary
+    return enriched
@@ -0,0 +1,184 @@
+# app/services/report/pipeline.py
+"""Resumable ESG report generation as a checkpointed LangGraph.
+
+데이터 로드 → 섹션별 AI 보강(환경/사회/지배구조 병렬) → HTML 생성 → DB 저장.
+각 단계가 끝날 때마다 상태가 체크포인트로 저장되므로, 타임아웃/재시작 후 같은
+회사·보고서 유형·데이터로 다시 요청하면 마지막으로 완료된 단계부터 이어서 진행한다.
+이미 성공한 섹션 보강은 다시 호출하지 않는다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START, StateGraph
+from sqlalchemy.orm import Session
+from typing_extensions import Annotated, TypedDict
+
+from app.core.database.models import Report
+from app.data.processors.data_context import ESGDataContext
+from app.services.checkpoint import (
+    compiled_for, delete_thread, get_checkpointer, maybe_sweep, pending_nodes, thread_config,
+)
+from app.utils.cancellation import CancellationToken, check_cancelled, resolve_token
+from app.utils.singleflight import digest_key
+from .ai_enrich import SECTIONS, ESGEnricher, assemble_enrichment
+from .generator import build_report_html
+
+logger = logging.getLogger(__name__)
+
+
+def _merge_sections(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """병렬 섹션 노드의 결과를 합침"""
+    return {**(left or {}), **(right or {})}
+
+
+def _token(config: Optional[RunnableConfig]) -> Optional[CancellationToken]:
+    return ((config or {}).get("configurable") or {}).get("cancel_token")
+
+
+class ReportPipelineState(TypedDict, total=False):
+    cmp_num: str
+    report_type: str
+    company_name: str
+    company_info: Dict[str, Any]
+    esg_metrics: Dict[str, Any]
+    sections: Annotated[Dict[str, Dict[str, Any]], _merge_sections]  # 섹션 이름 → AI 보강 결과
+    report_title: str
+    report_html: str
+    report_id: Optional[int]
+
+
+class ReportPipeline:
+    """체크포인트 기반 보고서 생성 그래프.
+
+    - 스레드 ID: 회사 + 보고서 유형 + 날짜 + 데이터 digest (같은 날 같은 데이터로 재시도 시 이어서 실행,
+      그 사이 데이터가 바뀌었으면 새로 생성)
+    - 데이터 컨텍스트/취소 토큰은 직렬화하지 않고 실행 config로 전달
+    - 취소된 요청은 다음 단계로 넘어가지 않음 (완료된 단계는 체크포인트에 남아 재시도 시 이어짐)
+    - 정상 완료 시 해당 스레드의 체크포인트 삭제
+    """
+
+    def __init__(self, llm: Any, session_factory: Callable[[], Session], generated_by: str = "langgraph_chatbot"):
+        self.enricher = ESGEnricher(llm)
+        self.session_factory = session_factory
+        self.generated_by = generated_by
+        self._builder = self._build()
+        self._graphs: Dict[int, Any] = {}
+
+    def _build(self) -> StateGraph:
+        builder = StateGraph(ReportPipelineState)
+        builder.add_node("load_data", self._load_data)
+        builder.add_node("build_html", self._build_html)
+        builder.add_node("save_report", self._save_report)
+
+        builder.add_edge(START, "load_data")
+        section_nodes = []
+        for section in SECTIONS:
+            node = f"enrich_{section}"
+            builder.add_node(node, self._enrich_node(section))
+            builder.add_edge("load_data", node)
+            section_nodes.append(node)
+        builder.add_edge(section_nodes, "build_html")
+        builder.add_edge("build_html", "save_report")
+        builder.add_edge("save_report", END)
+        return builder
+
+    # --- 노드 ---------------------------------------------------------
+
+    async def _load_data(self, state: ReportPipelineState, config: RunnableConfig) -> Dict[str, Any]:
+        check_cancelled(_token(config))
+        data: ESGDataContext = config["configurable"]["data_context"]
+        company = await asyncio.to_thread(data.company_info)
+        if not company:
+            raise ValueError("회사 정보를 찾을 수 없습니다.")
+
+        report_data = await asyncio.to_thread(data.comprehensive_report)
+        if "error" in report_data:
+            raise ValueError(f"보고서 데이터 생성 실패 - {report_data['error']}")
+
+        return {
+            "company_name": company["cmp_nm"],
+            "company_info": report_data.get("company_info", {}),
+            "esg_metrics": report_data.get("esg_metrics", {}),
+        }
+
+    def _enrich_node(self, section: str) -> Callable:
+        async def enrich(state: ReportPipelineState, config: RunnableConfig) -> Dict[str, Any]:
+            raw = (state.get("esg_metrics") or {}).get(section) or {}
+            result = await self.enricher.enrich_section(section, raw, cancel_token=_token(config))
+            return {"sections": {section: result}}
+
+        enrich.__name__ = f"enrich_{section}"
+        return enrich
+
+    def _build_html(self, state: ReportPipelineState, config: RunnableConfig) -> Dict[str, Any]:
+        check_cancelled(_token(config))
+        esg_metrics = state.get("esg_metrics") or {}
+        enriched = assemble_enrichment(state.get("sections") or {})
+        html = build_report_html(
+            company_info=state.get("company_info") or {},
+            period_label=f"{datetime.now().year - 1}년도 기준",
+            summary_metrics=enriched["summary"],  # 상단 Executive Summary 카드에 활용
+            env_metrics={**esg_metrics.get("environmental", {}), "ai": enriched["environmental"]["ai"]},
+            soc_metrics={**esg_metrics.get("social", {}), "ai": enriched["social"]["ai"]},
+            gov_metrics={**esg_metrics.get("governance", {}), "ai": enriched["governance"]["ai"]},
+        )
+        title = f"{state.get('company_name')} ESG 보고서 ({datetime.now().strftime('%Y-%m-%d')})"
+        return {"report_html": html, "report_title": title}
+
+    def _save_report(self, state: ReportPipelineState, config: RunnableConfig) -> Optional[Dict[str, Any]]:
+        if state.get("report_id"):
+            return None
+        check_cancelled(_token(config))
+        with self.session_factory() as db:
+            report = Report(
+                company_id=state["cmp_num"],
+                title=state["report_title"],
+                report_type=state.get("report_type"),
+                content=state["report_html"],
+                generated_by=self.generated_by,
+                format="html",
+            )
+            db.add(report)
+            db.commit()
+            db.refresh(report)
+            logger.info(f"성공: 보고서를 DB에 저장했습니다. (ID: {report.id})")
+            return {"report_id": report.id}
+
+    # --- 실행 ---------------------------------------------------------
+
+    @staticmethod
+    def thread_id(cmp_num: str, report_type: str, data_digest: str) -> str:
+        return f"report:{cmp_num}:{report_type}:{datetime.now().strftime('%Y%m%d')}:{data_digest[:16]}"
+
+    async def run(
+        self,
+        cmp_num: str,
+        data: ESGDataContext,
+        report_type: str = "comprehensive",
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """보고서 생성 (중단된 실행이 있으면 이어서) - 최종 상태 반환"""
+        token = resolve_token(cancel_token)
+        check_cancelled(token)
+        saver = get_checkpointer()
+        await maybe_sweep(saver)
+        graph = compiled_for(self._builder, self._graphs, saver)
+        # 보고서 데이터는 컨텍스트에 캐시되므로 load_data 단계에서 다시 조회하지 않음
+        report_data = await asyncio.to_thread(data.comprehensive_report)
+        data_digest = digest_key(report_data.get("company_info"), report_data.get("esg_metrics"))
+        thread_id = self.thread_id(cmp_num, report_type, data_digest)
+        config = thread_config(thread_id, data_context=data, cancel_token=token)
+
+        pending = await pending_nodes(graph, config)
+        if pending:
+            logger.info("중단된 보고서 생성을 이어서 실행합니다: %s (다음 단계: %s)", thread_id, ", ".join(pending))
+            graph_input = None
+        else:
+            graph_input = {"cmp_num": cmp_num, "report_type": report_type, "sections": {}, "report_id": None}
+
+        final_state = await graph.ainvoke(graph_input, config=config)
+        await delete_thread(saver, thread_id)
+        return {**final_state, "resumed": bool(pending)}
@@ -6,6 +6,7 @@ from typing import Optional, Union
 from xhtml2pdf import pisa
 from xhtml2pdf.files import pisaFileObject
 from .fonts import ensure_fonts, FONT_DIR
+from app.utils.cancellation import CancellationToken, resolve_token
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import logging
@@ -49,7 +50,16 @@ def _link_callback(uri: str, rel: Optional[str]) -> str:
     # 5) 상대경로는 repo 루트 기준으로
     return str((PROJECT_ROOT / uri).resolve())
 
-def html_to_pdf(html_str: str, out_path: Union[str, Path]) -> Path:
+def html_to_pdf(
+    html_str: str,
+    out_path: Union[str, Path],
+    cancel_token: Optional[CancellationToken] = None,
+) -> Path:
+    # 요청이 취소되면 단계 사이(폰트 준비/리소스 로드/렌더링 후)에서 중단
+    token = resolve_token(cancel_token)
+    check = token.check if token is not None else (lambda: None)
+    check()
+
     # 폰트 확보 (없으면 다운로드)
     fonts = ensure_fonts()
     reg = Path(fonts["regular"])
@@ -71,13 +81,24 @@ def html_to_pdf(html_str: str, out_path: Union[str, Path]) -> Path:
     logger.info("[PDF] Using fonts: regular=%s, bold=%s", reg, bld)
     logger.info("[PDF] Output path: %s", out_path)
 
-    with open(out_path, "wb") as f:
-        result = pisa.CreatePDF(
-            src=html_str,
-            dest=f,
-            encoding="utf-8",
-            link_callback=_link_callback,  # ★ 중요: 경로 문자열 반환
-        )
+    def link_callback(uri: str, rel: Optional[str]) -> str:
+        check()
+        return _link_callback(uri, rel)
+
+    check()
+    try:
+        with open(out_path, "wb") as f:
+            result = pisa.CreatePDF(
+                src=html_str,
+                dest=f,
+                encoding="utf-8",
+                link_callback=link_callback,  # ★ 중요: 경로 문자열 반환
+            )
+        check()
+    except BaseException:
+        # 취소/실패로 만들어진 불완전한 파일은 남기지 않음
+        out_path.unlink(missing_ok=True)
+        raise
 
     if result.err:
         raise RuntimeError("xhtml2pdf 변환 실패")
@@ -0,0 +1,367 @@
+"""In-memory n-gram / 초성 search index over employee and company text columns.
+
+이름·이메일·주소 부분 검색(``LIKE '%...%'``)은 DB 인덱스를 쓰지 못해 매번 전체 행을 훑고,
+'ㄱㅁㅈ' → 김민준 같은 초성 검색은 SQL로 표현할 수 없다.
+여기서는 필드별 1~3-gram과 초성 n-gram의 역색인을 메모리에 두고, 최초 사용 시 DB에서 한 번 만든 뒤
+커밋된 행 변경(``app.core.database.events``)만 반영해 최신 상태를 유지한다.
+"""
+
+import logging
+import threading
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, false, tuple_
+
+from app.core.database import events
+from app.core.database.base import SessionLocal
+from app.core.database.models import CmpInfo, EmpInfo
+from app.utils.hangul import choseong, contains, has_choseong, ngrams, ngrams_upto, normalize
+
+logger = logging.getLogger(__name__)
+
+MAX_GRAM = 3
+
+# 일반 문자열 검색 결과가 이보다 많으면 IN 목록 대신 DB의 LIKE 검색을 사용
+MAX_IN_KEYS = 2000
+
+
+class NgramIndex:
+    """필드별 n-gram 역색인 (스레드 안전).
+
+    - 문서 = 키(기본키 값) 하나의 필드 문자열들. 내부 번호는 추가 순서대로 증가하는 정수
+    - 게시 목록은 ``array('I')``에 내부 번호를 이어 붙이기만 하므로 항상 오름차순이고 메모리가 작음
+    - 수정/삭제는 이전 번호를 무효로 표시하고, 무효 번호가 절반을 넘으면 게시 목록을 다시 만듦
+    - 검색은 질의의 가장 희귀한 n-gram 게시 목록만 훑으며 실제 포함 여부를 확인하므로 오탐이 없음
+    """
+
+    def __init__(self, fields: Sequence[str], max_gram: int = MAX_GRAM):
+        self.fields = tuple(fields)
+        self.max_gram = max_gram
+        self._prefixes = [str(fi) for fi in range(len(self.fields))]
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._keys: List[Optional[Hashable]] = []
+        self._texts: List[Optional[Tuple[str, ...]]] = []
+        self._choseong: List[Optional[Tuple[str, ...]]] = []
+        self._doc_of: Dict[Hashable, int] = {}
+        self._postings: Dict[str, array] = defaultdict(lambda: array("I"))
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    # --- 색인 ---------------------------------------------------------
+
+    def _append(self, key: Hashable, texts: Tuple[str, ...]) -> None:
+        """게시 목록 키: '<필드 번호><gram>' / 초성은 '<필드 번호>^<gram>'"""
+        chos = tuple(choseong(t) for t in texts)
+        doc = len(self._keys)
+        self._keys.append(key)
+        self._texts.append(texts)
+        self._choseong.append(chos)
+        self._doc_of[key] = doc
+        postings = self._postings
+        for fi, (text, cho) in enumerate(zip(texts, chos)):
+            prefix = self._prefixes[fi]
+            for gram in ngrams_upto(text, self.max_gram):
+                postings[prefix + gram].append(doc)
+            if cho != text:
+                prefix += "^"
+                for gram in ngrams_upto(cho, self.max_gram):
+                    if has_choseong(gram):
+                        postings[prefix + gram].append(doc)
+
+    def _remove(self, key: Hashable) -> None:
+        doc = self._doc_of.pop(key, None)
+        if doc is None:
+            return
+        self._keys[doc] = self._texts[doc] = self._choseong[doc] = None
+        self._dead += 1
+
+    def upsert(self, key: Hashable, values: Dict[str, Any]) -> None:
+        texts = tuple(normalize(values.get(f) or "") for f in self.fields)
+        with self._lock:
+            doc = self._doc_of.get(key)
+            if doc is not None and self._texts[doc] == texts:
+                return
+            self._remove(key)
+            self._append(key, texts)
+            self._maybe_compact()
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+            self._maybe_compact()
+
+    def rebuild(self, rows: Iterable[Tuple[Hashable, Dict[str, Any]]]) -> None:
+        """(키, 필드 값 dict) 목록으로 전체 재구성"""
+        with self._lock:
+            self._clear()
+            for key, values in rows:
+                self._append(key, tuple(normalize(values.get(f) or "") for f in self.fields))
+
+    def _maybe_compact(self) -> None:
+        if self._dead > 1000 and self._dead > len(self._doc_of):
+            live = [(k, t) for k, t in zip(self._keys, self._texts) if k is not None]
+            self._clear()
+            for key, texts in live:
+                self._append(key, texts)
+
+    # --- 검색 ---------------------------------------------------------
+
+    def _field_numbers(self, fields: Optional[Sequence[str]]) -> List[int]:
+        if not fields:
+            return list(range(len(self.fields)))
+        return [self.fields.index(f) for f in fields]
+
+    def _candidates(self, fi: int, query: str) -> array:
+        """질의를 포함할 수 있는 문서 번호 (가장 짧은 게시 목록)"""
+        n = min(self.max_gram, len(query))
+        if has_choseong(query):
+            # 초성 게시 목록에는 초성이 들어간 gram만 있음
+            prefix = f"{fi}^"
+            grams = [g for g in ngrams(choseong(query), n) if has_choseong(g)]
+        else:
+            prefix = f"{fi}"
+            grams = list(ngrams(query, n))
+        shortest = None
+        for gram in grams:
+            posting = self._postings.get(prefix + gram)
+            if posting is None:
+                return array("I")
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest if shortest is not None else array("I")
+
+    def search(self, query: str, fields: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> List[Hashable]:
+        """질의를 부분 문자열(초성 포함)로 가진 문서의 키 목록 (추가 순서, 최대 limit개)"""
+        query = normalize(query)
+        if not query:
+            return []
+        with self._lock:
+            field_numbers = self._field_numbers(fields)
+            matched: Dict[int, None] = {}
+            for fi in field_numbers:
+                for doc in self._candidates(fi, query):
+                    if doc in matched or self._keys[doc] is None:
+                        continue
+                    if contains(self._texts[doc][fi], query, self._choseong[doc][fi]):
+                        matched[doc] = None
+                        if limit is not None and len(matched) >= limit and len(field_numbers) == 1:
+                            break
+            docs = sorted(matched)
+            if limit is not None:
+                docs = docs[:limit]
+            return [self._keys[doc] for doc in docs]
+
+    def suggest(self, query: str, field: str, limit: int = 10) -> List[str]:
+        """자동완성 후보: 질의를 포함하는 필드 값(정규화된 값) 중복 없이 최대 limit개"""
+        query = normalize(query)
+        if not query:
+            return []
+        fi = self.fields.index(field)
+        seen: Dict[str, None] = {}
+        with self._lock:
+            for doc in self._candidates(fi, query):
+                if self._keys[doc] is None:
+                    continue
+                text = self._texts[doc][fi]
+                if text not in seen and contains(text, query, self._choseong[doc][fi]):
+                    seen[text] = None
+                    if len(seen) >= limit:
+                        break
+        return list(seen)
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """인덱스를 만들 테이블: 기본키 컬럼과 검색 필드 이름 → 컬럼"""
+
+    name: str
+    model: type
+    key_columns: Tuple[Any, ...]
+    fields: Dict[str, Any]
+
+    def key_clause(self, keys: List[Hashable]) -> Any:
+        """키 목록 → ``IN`` 조건 (정수 키는 값을 SQL에 직접 넣어 바인드 변수 개수 제한을 피함)"""
+        if len(self.key_columns) == 1:
+            column = self.key_columns[0]
+            values = [k[0] for k in keys]
+            if all(isinstance(v, int) for v in values):
+                return column.in_(bindparam(f"{self.name}_keys", values, expanding=True, literal_execute=True))
+            return column.in_(values)
+        return tuple_(*self.key_columns).in_(keys)
+
+
+EMPLOYEE_SEARCH = SearchSource(
+    "employees", EmpInfo, (EmpInfo.EMP_ID,), {"name": EmpInfo.EMP_NM, "email": EmpInfo.EMP_EMAIL}
+)
+COMPANY_SEARCH = SearchSource(
+    "companies",
+    CmpInfo,
+    (CmpInfo.cmp_num, CmpInfo.cmp_branch),
+    {"name": CmpInfo.cmp_nm, "address": CmpInfo.cmp_addr, "industry": CmpInfo.cmp_industry},
+)
+
+
+class SearchIndex:
+    """테이블 하나의 검색 인덱스 - 최초 검색 시 DB에서 구성하고 커밋된 변경만 반영."""
+
+    def __init__(self, source: SearchSource, session_factory=SessionLocal):
+        self.source = source
+        self.session_factory = session_factory
+        self.index = NgramIndex(tuple(source.fields))
+        self._ready = False
+        self._build_lock = threading.Lock()
+        # 구성 중에 커밋된 변경은 버려지지 않도록 모아 두었다가 구성이 끝난 뒤 반영
+        self._changes_lock = threading.Lock()
+        self._building = False
+        self._pending: List[events.RowChange] = []
+        self._builder: Optional[threading.Thread] = None
+        self._field_attrs = {name: column.key for name, column in source.fields.items()}
+        events.subscribe(source.model, self._on_changes)
+
+    def _values(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: attrs.get(attr) for name, attr in self._field_attrs.items()}
+
+    def ensure_built(self) -> None:
+        """DB에서 인덱스 구성 (블로킹 - 이벤트 루프에서 호출하지 말 것)"""
+        if self._ready:
+            return
+        with self._build_lock:
+            if self._ready:
+                return
+            columns = [*self.source.key_columns, *self.source.fields.values()]
+            n_keys = len(self.source.key_columns)
+            while True:
+                with self._changes_lock:
+                    self._building = True
+                    self._pending = []
+                try:
+                    with self.session_factory() as session:
+                        result = session.query(*columns).yield_per(5000)
+                        self.index.rebuild(
+                            (tuple(row[:n_keys]), dict(zip(self.source.fields, row[n_keys:]))) for row in result
+                        )
+                except BaseException:
+                    with self._changes_lock:
+                        self._building = False
+                        self._pending = []
+                    raise
+                with self._changes_lock:
+                    pending, self._pending = self._pending, []
+                    # 구성 중 일괄 변경(bulk)이 있었으면 읽은 내용이 이미 낡았으므로 다시 구성
+                    if self._apply(pending):
+                        self._building = False
+                        self._ready = True
+                        break
+            logger.info("검색 인덱스 구성: %s (%d건)", self.source.name, len(self.index))
+
+    def build_in_background(self) -> None:
+        """인덱스가 없으면 작업 스레드에서 구성 시작 (이미 구성 중이면 무시)"""
+        if self._ready:
+            return
+        with self._changes_lock:
+            if self._builder is not None and self._builder.is_alive():
+                return
+            self._builder = threading.Thread(
+                target=self._build_quietly, name=f"search-index-{self.source.name}", daemon=True
+            )
+            self._builder.start()
+
+    def _build_quietly(self) -> None:
+        try:
+            self.ensure_built()
+        except Exception as e:
+            logger.warning("검색 인덱스 구성 실패 (%s): %s", self.source.name, e)
+
+    def invalidate(self) -> None:
+        """다음 검색 때 DB에서 다시 구성"""
+        self._ready = False
+
+    def _apply(self, changes: List[events.RowChange]) -> bool:
+        """변경 반영. 일괄 변경이 섞여 있으면 반영하지 않고 False (전체 재구성 필요)"""
+        for change in changes:
+            if change.op == "bulk":
+                return False
+            if change.op == "delete":
+                self.index.remove(change.key)
+            else:
+                if change.previous_key is not None:
+                    self.index.remove(change.previous_key)
+                self.index.upsert(change.key, self._values(change.values))
+        return True
+
+    def _on_changes(self, changes: List[events.RowChange]) -> None:
+        with self._changes_lock:
+            if self._building:
+                self._pending.extend(changes)
+                return
+            if not self._ready:
+                return  # 다음 구성 때 DB에서 최신 상태를 읽음
+            if not self._apply(changes):
+                self.invalidate()
+
+    def search(self, query: str, fields: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> List[Hashable]:
+        self.ensure_built()
+        return self.index.search(query, fields, limit)
+
+    def suggest(self, query: str, field: str, limit: int = 10) -> List[str]:
+        self.ensure_built()
+        return self.index.suggest(query, field, limit)
+
+    def needs_build(self, query: Optional[str]) -> bool:
+        """``match_clause``가 인덱스를 직접 구성해야 하는 질의인지 (초성 질의 + 인덱스 미구성).
+
+        화면은 검색 전에 이 값을 보고 ``ensure_built``를 스레드에서 먼저 실행한다.
+        """
+        return not self._ready and has_choseong(normalize(query or ''))
+
+    def match_clause(self, query: str, field: str) -> Optional[Any]:
+        """필드 부분 검색 조건.
+
+        초성이 섞인 질의는 인덱스로 찾은 키의 ``IN`` 조건, 일반 문자열은 결과가 ``MAX_IN_KEYS`` 이하일 때만
+        ``IN`` 조건을 반환하고 그보다 많거나 인덱스가 아직 구성되지 않았으면 None (호출 측에서 LIKE 사용).
+        """
+        choseong_query = has_choseong(normalize(query))
+        if not self._ready:
+            if not choseong_query:
+                # 일반 문자열은 구성이 끝날 때까지 LIKE 검색 (필터 적용 중에 인덱스를 만들지 않음)
+                self.build_in_background()
+                return None
+            # 초성은 LIKE로 찾을 수 없으므로 인덱스를 구성한 뒤 검색 (화면은 needs_build로 미리 스레드에서 구성)
+            try:
+                self.ensure_built()
+            except Exception as e:
+                logger.warning("검색 인덱스 구성 실패 (%s): %s", self.source.name, e)
+                return None
+        try:
+            keys = self.index.search(query, (field,), None if choseong_query else MAX_IN_KEYS + 1)
+        except Exception as e:
+            logger.warning("검색 인덱스 사용 불가 (%s): %s", self.source.name, e)
+            return None
+        if not choseong_query and len(keys) > MAX_IN_KEYS:
+            return None
+        if not keys:
+            return false()
+        return self.source.key_clause(keys)
+
+
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(source: SearchSource) -> SearchIndex:
+    """테이블별 검색 인덱스 (프로세스 공유)"""
+    index = _indexes.get(source.name)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(source.name)
+            if index is None:
+                index = _indexes[source.name] = SearchIndex(source)
+    return index
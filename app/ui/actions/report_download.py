@@ -1,12 +1,14 @@
 # app/ui/actions/report_download.py
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 
 from app.services.report.generator import build_report_html
 from app.services.report.renderer import html_to_pdf
 from app.data.processors.data_processor import ESGDataProcessor
+from app.utils.cancellation import CancellationToken, check_cancelled
 
 PERIOD_LABELS = {
     "current_year": "Current Year",
@@ -18,7 +20,12 @@ PERIOD_LABELS = {
 def _safe_name(name: str) -> str:
     return "".join(c for c in name if c.isalnum() or c in (" ", "_", "-")).rstrip()
 
-async def generate_esg_pdf(db: Session, cmp_num: str, options: Dict[str, Any]) -> Path:
+async def generate_esg_pdf(
+    db: Session,
+    cmp_num: str,
+    options: Dict[str, Any],
+    cancel_token: Optional[CancellationToken] = None,
+) -> Path:
     """
     1) DB에서 종합 리포트 데이터 수집
     2) HTML 생성
@@ -31,6 +38,7 @@ async def generate_esg_pdf(db: Session, cmp_num: str, options: Dict[str, Any]) -
     report = dp.generate_comprehensive_report(cmp_num)
     if "error" in report:
         raise RuntimeError(report["error"])
+    check_cancelled(cancel_token)
 
     company_info = report.get("company_info", {})
     summary = report.get("summary", {})
@@ -65,5 +73,5 @@ async def generate_esg_pdf(db: Session, cmp_num: str, options: Dict[str, Any]) -
     # PDF 파일명에 시간 포함
     out_path = out_dir / f"ESG_Report_{company_name}_{timestamp}.pdf"
     
-    # 4) PDF 렌더링
-    return html_to_pdf(html, out_path)
+    # 4) PDF 렌더링 (이벤트 루프를 막지 않도록 스레드에서, 취소 시 중단)
+    return await asyncio.to_thread(html_to_pdf, html, out_path, cancel_token)
@@ -0,0 +1,18 @@
+"""Reusable UI components."""
+
+from .background_work import ProgressIndicator, WorkProgress, run_blocking
+from .job_progress import JobProgress, job_errors, job_failed
+from .live_updates import LiveSubscription, LiveTable
+from .stream_coalescer import StreamCoalescer
+
+__all__ = [
+    "JobProgress",
+    "LiveSubscription",
+    "LiveTable",
+    "ProgressIndicator",
+    "StreamCoalescer",
+    "WorkProgress",
+    "job_errors",
+    "job_failed",
+    "run_blocking",
+]
@@ -0,0 +1,89 @@
+"""Run blocking pandas/DB steps off the event loop and show their progress."""
+
+import asyncio
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+from nicegui import run, ui
+
+from config.settings import settings
+
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def _get_slots() -> asyncio.Semaphore:
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.app.BLOCKING_WORK_CONCURRENCY)
+    return _slots
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, cpu: bool = False, **kwargs: Any) -> Any:
+    """엑셀 파싱, 대량 저장 같은 막히는 작업을 이벤트 루프 밖에서 실행.
+
+    - 기본은 스레드 (``run.io_bound``): 진행률 콜백, DB 세션 팩토리 등을 그대로 넘길 수 있음
+    - ``cpu=True``: 프로세스 (``run.cpu_bound``) — 인자/결과가 pickle 가능해야 하고 진행률은 없음
+    - 프로세스 전체에서 동시에 ``BLOCKING_WORK_CONCURRENCY``개까지만 실행 (나머지는 대기)
+    """
+    async with _get_slots():
+        if cpu:
+            return await run.cpu_bound(func, *args, **kwargs)
+        return await run.io_bound(func, *args, **kwargs)
+
+
+class WorkProgress:
+    """작업 스레드가 ``progress(fraction, message)``로 보고한 최신 진행률 (스레드 안전)"""
+
+    def __init__(self, message: str = ''):
+        self._lock = threading.Lock()
+        self._fraction = 0.0
+        self._message = message
+
+    def __call__(self, fraction: float, message: Optional[str] = None) -> None:
+        with self._lock:
+            self._fraction = min(max(fraction, 0.0), 1.0)
+            if message is not None:
+                self._message = message
+
+    def snapshot(self) -> Tuple[float, str]:
+        with self._lock:
+            return self._fraction, self._message
+
+
+class ProgressIndicator:
+    """진행률 막대 + 메시지. 작업 중에만 보이고 ``interval`` 초마다 값을 반영."""
+
+    def __init__(self, interval: float = 0.2):
+        with ui.column().classes('w-full gap-1') as self.container:
+            self.bar = ui.linear_progress(value=0, show_value=False).classes('w-full')
+            self.label = ui.label().classes('text-sm text-blue-600')
+        self.container.set_visibility(False)
+        self.progress: Optional[WorkProgress] = None
+        self.timer = ui.timer(interval, self._refresh, active=False)
+
+    def _refresh(self) -> None:
+        if self.progress is not None:
+            fraction, message = self.progress.snapshot()
+            self.bar.set_value(fraction)
+            self.label.set_text(message)
+
+    def start(self, message: str = '') -> WorkProgress:
+        self.progress = WorkProgress(message)
+        self._refresh()
+        self.container.set_visibility(True)
+        self.timer.activate()
+        return self.progress
+
+    def finish(self) -> None:
+        self.timer.deactivate()
+        self.progress = None
+        self.container.set_visibility(False)
+
+    async def run(self, message: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """``func(*args, progress=..., **kwargs)``를 작업 스레드에서 실행하며 진행률 표시"""
+        progress = self.start(message)
+        try:
+            return await run_blocking(func, *args, progress=progress, **kwargs)
+        finally:
+            if not self.container.is_deleted:
+                self.finish()
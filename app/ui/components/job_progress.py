@@ -0,0 +1,95 @@
+"""Show progress of background import jobs (app.services.jobs) and resume it after a reload."""
+
+import asyncio
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from nicegui import run, ui
+
+from app.services.jobs import JobSnapshot, JobStatus, get_job_queue
+from app.ui.components.background_work import run_blocking
+
+
+class JobProgress:
+    """작업 큐에 등록한 작업의 진행률 막대 + 메시지.
+
+    - ``submit()``으로 작업을 등록하면 ``interval`` 초마다 상태를 조회해 표시
+    - 화면을 새로 열면 같은 회사/종류의 진행 중 작업을 찾아 이어서 표시 (새로고침해도 작업은 계속됨)
+    - 작업이 끝나면 ``on_finished(snapshot)`` 호출 (async 함수도 가능)
+    - 상태 조회(DB)는 이벤트 루프 밖 스레드에서 실행 (무거운 작업용 ``run_blocking`` 슬롯은 쓰지 않음)
+    """
+
+    def __init__(
+        self,
+        kinds: Sequence[str],
+        company_id: Optional[str] = None,
+        on_finished: Optional[Callable[[JobSnapshot], Any]] = None,
+        interval: float = 0.5,
+    ):
+        self.kinds = tuple(kinds)
+        self.company_id = company_id
+        self.on_finished = on_finished
+        self.job_id: Optional[int] = None
+        with ui.column().classes('w-full gap-1') as self.container:
+            self.bar = ui.linear_progress(value=0, show_value=False).classes('w-full')
+            self.label = ui.label().classes('text-sm text-blue-600')
+        self.container.set_visibility(False)
+        self.timer = ui.timer(interval, self._poll, active=False)
+        ui.timer(0, self.resume, once=True)
+
+    async def resume(self) -> None:
+        snapshot = await run.io_bound(get_job_queue().latest, self.kinds, self.company_id, active_only=True)
+        if snapshot is not None and self.job_id is None and not self.container.is_deleted:
+            self.follow(snapshot)
+
+    def follow(self, snapshot: JobSnapshot) -> None:
+        self.job_id = snapshot.id
+        self._show(snapshot)
+        self.container.set_visibility(True)
+        self.timer.activate()
+
+    async def submit(self, kind: str, payload: Dict[str, Any], source: Optional[str] = None) -> JobSnapshot:
+        """작업 등록 후 진행률 표시 시작 (입력 직렬화/저장은 작업 스레드에서)"""
+        snapshot = await run_blocking(get_job_queue().submit, kind, payload, self.company_id, source)
+        self.follow(snapshot)
+        return snapshot
+
+    def _show(self, snapshot: JobSnapshot) -> None:
+        self.bar.set_value(snapshot.progress / 100)
+        self.label.set_text(f'[{snapshot.source or snapshot.kind}] {snapshot.message or ""} ({snapshot.progress:.0f}%)')
+
+    async def _poll(self) -> None:
+        if self.job_id is None:
+            self.timer.deactivate()
+            return
+        snapshot = await run.io_bound(get_job_queue().get, self.job_id)
+        if self.container.is_deleted or self.job_id is None:
+            return
+        if snapshot is None:
+            self.timer.deactivate()
+            self.container.set_visibility(False)
+            return
+        self._show(snapshot)
+        if snapshot.active:
+            return
+        self.timer.deactivate()
+        self.job_id = None
+        self.container.set_visibility(False)
+        if self.on_finished is not None:
+            result = self.on_finished(snapshot)
+            if asyncio.iscoroutine(result):
+                await result
+
+
+def job_failed(snapshot: JobSnapshot) -> bool:
+    """작업이 실패했거나 일부 행이 오류로 저장되지 않았는지"""
+    return snapshot.status != JobStatus.SUCCEEDED or bool((snapshot.result or {}).get('error_count'))
+
+
+def job_errors(snapshot: JobSnapshot, limit: int = 5) -> str:
+    """알림용 오류 요약 (앞의 ``limit``개 + 나머지 개수)"""
+    result = snapshot.result or {}
+    if snapshot.status != JobStatus.SUCCEEDED and not result.get('errors'):
+        return snapshot.error or snapshot.message or ''
+    errors = result.get('errors', [])[:limit]
+    rest = result.get('error_count', 0) - len(errors)
+    return '\n'.join(errors) + (f'\n... 외 {rest}개' if rest > 0 else '')
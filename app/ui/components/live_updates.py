@@ -0,0 +1,179 @@
+"""Push committed row changes to open pages without reloading them."""
+
+import asyncio
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from nicegui import ui
+
+from app.core.database import events
+from app.core.database.events import RowChange
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 이보다 많은 행이 바뀌면(엑셀 일괄 저장 등) 행 단위 반영 대신 다시 조회
+MAX_PATCH_ROWS = 200
+
+_live: List["LiveSubscription"] = []
+_live_lock = threading.Lock()
+
+
+def _prune() -> None:
+    """화면에서 사라진(삭제된 요소/끊긴 클라이언트) 구독 해제"""
+    with _live_lock:
+        dead = [s for s in _live if s.owner.is_deleted]
+    for subscription in dead:
+        subscription.close()
+
+
+class LiveSubscription:
+    """화면 요소 하나가 모델들의 커밋된 변경을 받는 구독.
+
+    - 커밋한 스레드에서 받은 변경을 요소가 속한 이벤트 루프로 넘겨 ``callback(changes)`` 호출
+    - ``delay`` 초 안에 이어진 커밋은 모아서 한 번에 전달 (엑셀 저장 등 연속 커밋)
+    - 요소가 삭제되면(페이지 이동, 클라이언트 종료) 자동으로 구독 해제
+    """
+
+    def __init__(
+        self,
+        owner: ui.element,
+        models: Iterable[type],
+        callback: Callable[[List[RowChange]], Any],
+        delay: float = 0.2,
+    ):
+        _prune()
+        self.owner = owner
+        self.callback = callback
+        self.delay = delay
+        self.deliveries = 0
+        self._loop = asyncio.get_running_loop()
+        self._pending: List[RowChange] = []
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._unsubscribe = [events.subscribe(model, self._on_commit) for model in models]
+        with _live_lock:
+            _live.append(self)
+
+    def close(self) -> None:
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        with _live_lock:
+            if self in _live:
+                _live.remove(self)
+
+    def _on_commit(self, changes: List[RowChange]) -> None:
+        if self.owner.is_deleted:
+            self.close()
+            return
+        with self._lock:
+            self._pending.extend(changes)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._loop.call_later, self.delay, self._deliver)
+        except RuntimeError:  # 이벤트 루프 종료
+            self.close()
+
+    def _deliver(self) -> None:
+        with self._lock:
+            changes, self._pending = self._pending, []
+            self._scheduled = False
+        if not changes or self.owner.is_deleted:
+            return
+        self.deliveries += 1
+        try:
+            result = self.callback(changes)
+            if asyncio.iscoroutine(result):
+                self._loop.create_task(result)
+        except Exception as e:
+            logger.warning("실시간 반영 오류: %s", e)
+
+
+class LiveTable:
+    """표의 행을 커밋된 변경만큼 고침 (다시 조회하지 않음).
+
+    - ``row_fn``: 모델 객체 → 표 행 (변경 값은 속성으로 접근 가능한 객체로 전달)
+    - ``key_field``: 표 행에서 행을 구분하는 필드 (``ui.table``의 ``row_key``)
+    - ``visible``: 바뀐 행의 기본키 튜플 목록 중 현재 검색 조건에 맞는 것의 집합 (없으면 모두 표시)
+    - ``insert``: 조건에 맞는 새 행을 표에 추가할지 (페이지 단위 표는 False로 두고 ``on_patch``에서 건수만 갱신)
+    - ``sort``/``reverse``: 행을 추가한 뒤 다시 정렬할 키 함수와 방향 (방향은 정렬이 바뀌는 표라면 함수로)
+    - ``reload``: 일괄 변경(``MAX_PATCH_ROWS`` 초과 또는 bulk 쿼리) 시 호출할 전체 다시 조회 함수
+    - ``on_patch``: 행을 고친 뒤 호출 (검색 건수 표시 등)
+    """
+
+    def __init__(
+        self,
+        table: ui.table,
+        model: type,
+        row_fn: Callable[[Any], Dict[str, Any]],
+        key_field: str,
+        visible: Optional[Callable[[List[Tuple[Any, ...]]], Set[Tuple[Any, ...]]]] = None,
+        insert: bool = True,
+        sort: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        reverse: Union[bool, Callable[[], bool]] = False,
+        reload: Optional[Callable[[], Any]] = None,
+        on_patch: Optional[Callable[[List[RowChange]], Any]] = None,
+    ):
+        self.table = table
+        self.row_fn = row_fn
+        self.key_field = key_field
+        self.visible = visible
+        self.insert = insert
+        self.sort = sort
+        self.reverse = reverse
+        self.reload = reload
+        self.on_patch = on_patch
+        self.subscription = LiveSubscription(table, (model,), self.apply)
+
+    def _row_key(self, values: Dict[str, Any]) -> Any:
+        return self.row_fn(SimpleNamespace(**values))[self.key_field]
+
+    def apply(self, changes: Sequence[RowChange]) -> None:
+        if self.reload is not None and (
+            len(changes) > MAX_PATCH_ROWS or any(c.op == "bulk" for c in changes)
+        ):
+            self.reload()
+            return
+
+        # 기본키별 마지막 변경만 반영, 기본키가 바뀐 행은 이전 행을 지움
+        latest: Dict[Tuple[Any, ...], RowChange] = {}
+        stale: List[Any] = []
+        for change in changes:
+            if change.op == "bulk":
+                continue
+            if change.previous_key is not None:
+                latest.pop(change.previous_key, None)
+                stale.append(self._row_key({**change.values, **change.previous}))
+            latest.pop(change.key, None)
+            latest[change.key] = change
+
+        alive = [key for key, change in latest.items() if change.op != "delete"]
+        shown = set(alive) if self.visible is None else (self.visible(alive) if alive else set())
+
+        current = list(self.table.rows)
+        index = {row.get(self.key_field): i for i, row in enumerate(current)}
+        removed = {index[k] for k in stale if k in index}
+        added: List[Dict[str, Any]] = []
+        for key, change in latest.items():
+            row = self.row_fn(SimpleNamespace(**change.values))
+            i = index.get(row[self.key_field])
+            if change.op == "delete" or key not in shown:
+                if i is not None:
+                    removed.add(i)
+            elif i is not None:
+                current[i] = row
+            elif self.insert:
+                added.append(row)
+
+        patched = [row for i, row in enumerate(current) if i not in removed] + added
+        if added and self.sort is not None:
+            reverse = self.reverse() if callable(self.reverse) else self.reverse
+            patched.sort(key=self.sort, reverse=reverse)
+        self.table.rows = patched
+        self.table.update()
+        if self.on_patch is not None:
+            self.on_patch(list(changes))
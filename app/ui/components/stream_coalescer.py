@@ -0,0 +1,79 @@
+"""Coalesced rendering of streamed text into a NiceGUI element."""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Optional
+
+
+class StreamCoalescer:
+    """스트리밍 토큰을 모아 일정 주기마다 한 번씩 화면에 반영한다.
+
+    토큰마다 ``.text``를 갱신하면 웹소켓 메시지가 토큰 수만큼 발생하므로,
+    ``interval`` 초(기본 50ms) 또는 ``max_chars`` 글자가 쌓일 때만 갱신한다.
+    토큰이 잠시 끊겨도 남은 내용은 타이머로 ``interval`` 이내에 반영된다.
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        interval: float = 0.05,
+        max_chars: int = 256,
+        on_first: Optional[Callable[[], None]] = None,
+    ):
+        self.target = target
+        self.interval = interval
+        self.max_chars = max_chars
+        self.on_first = on_first
+        self.flushes = 0
+        self._parts: List[str] = []
+        self._pending_chars = 0
+        self._last_flush = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._started = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def push(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self._parts.append(chunk)
+        self._pending_chars += len(chunk)
+
+        if not self._started:
+            # 첫 토큰은 바로 표시 (체감 응답 시간)
+            self._started = True
+            if self.on_first:
+                self.on_first()
+            self.flush()
+            return
+
+        now = time.monotonic()
+        if self._pending_chars >= self.max_chars or now - self._last_flush >= self.interval:
+            self.flush()
+        elif self._timer is None:
+            delay = max(0.0, self.interval - (now - self._last_flush))
+            self._timer = asyncio.get_running_loop().call_later(delay, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending_chars:
+            return
+        # 조각 목록을 하나로 합쳐 이후 join 비용을 줄임
+        text = "".join(self._parts)
+        self._parts = [text]
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+        self.flushes += 1
+        self.target.text = text
+
+    def close(self, fallback: Optional[str] = None) -> str:
+        """남은 토큰을 반영하고 최종 텍스트를 반환. 내용이 없으면 fallback 표시."""
+        self.flush()
+        text = self.text
+        if not text and fallback is not None:
+            self.target.text = fallback
+        return text
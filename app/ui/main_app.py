@@ -8,32 +8,10 @@ from pathlib import Path
 
 from config.settings import settings
 from app.core.database import init_db, get_db
+from app.services.jobs import get_job_queue
 
-# Import pages with error handling
-try:
-    from app.ui.pages import (
-        DashboardPage, 
-        DataInputPage, 
-        # VisualizationPage, 
-        ChatbotPage,
-        CompanyManagementPage,
-        HRPage,
-        EnvironmentPage
-    )
-except ImportError as e:
-    logging.error(f"Error importing pages: {e}")
-    # Create dummy pages for development
-    class DummyPage:
-        async def render(self, db_session, cmp_num=None):  # company_id → cmp_num
-            ui.label('Page not implemented yet')
-    
-    DashboardPage = DummyPage
-    DataInputPage = DummyPage
-    # VisualizationPage = DummyPage
-    ChatbotPage = DummyPage
-    CompanyManagementPage = DummyPage
-    HRPage = DummyPage
-    EnvironmentPage = DummyPage
+# 페이지는 첫 접속 시 import (서버 시작/재시작 시간 단축)
+from app.ui.pages.registry import PageRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -45,19 +23,8 @@ class ESGReporterApp:
         self.current_page = "dashboard"
         self.db_session = None
         
-        # Initialize database
-        init_db()
-        
-        # Initialize pages
-        self.pages = {
-            'dashboard': DashboardPage(),
-            'data_input': DataInputPage(),
-            # 'visualization': VisualizationPage(),
-            'chatbot': ChatbotPage(),
-            'company_management': CompanyManagementPage(),
-            'hr': HRPage(),
-            'environment': EnvironmentPage()
-        }
+        # Initialize pages (각 페이지는 해당 경로 첫 접속 시 import/생성)
+        self.pages = PageRegistry()
     
     def setup_app(self) -> None:
         """Setup the main application."""
@@ -65,6 +32,13 @@ class ESGReporterApp:
         app.add_static_files('/static', str(Path(__file__).parent.parent.parent / 'static'))
         ui.run_with.fast_reload = settings.app.DEBUG
         
+        # Initialize database (reload 감시 프로세스가 아닌, 실제로 서비스하는 프로세스에서만)
+        app.on_startup(init_db)
+        
+        # 백그라운드 가져오기 작업자 (테이블 생성 뒤 시작, 중단된 작업은 다시 대기열로)
+        app.on_startup(lambda: get_job_queue().start())
+        app.on_shutdown(lambda: get_job_queue().stop())
+        
         # Setup routing
         self._setup_routing()
     
@@ -189,7 +163,7 @@ class ESGReporterApp:
             self.db_session = next(get_db())
             
             # Load page content
-            page = self.pages.get(page_name)
+            page = await self.pages.load(page_name)
             if page:
                 with self.content_container:
                     # 새로운 cmp_num 파라미터 사용
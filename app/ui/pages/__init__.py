@@ -1,14 +1,29 @@
-"""UI page components."""
+"""UI page components.
 
+페이지 모듈은 무거운 의존성(LangChain, LangGraph, OpenAI, pandas 등)을 불러오므로
+여기서 미리 import 하지 않고, 클래스 이름으로 처음 접근할 때 불러온다 (PEP 562).
+라우팅은 ``registry.PageRegistry``가 첫 접속 시 페이지를 만든다.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "DashboardPage": ".dashboard",
+    "DataInputPage": ".data_input",
+    "VisualizationPage": ".visualization",
+    # "ChatbotPage": ".chatbot",
+    "ChatbotPage": ".chatbot_langgraph",
+    "CompanyManagementPage": ".company_management",
+    "HRPage": ".hr",
+    "EnvironmentPage": ".environment",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .dashboard import DashboardPage
-from .data_input import DataInputPage
-from .visualization import VisualizationPage
-# from .chatbot import ChatbotPage
-from .chatbot_langgraph import ChatbotPage
-from .company_management import CompanyManagementPage
-from .hr import HRPage
-from .environment import EnvironmentPage
 
 __all__ = [
     "DashboardPage", 
@@ -18,4 +33,4 @@ __all__ = [
     "CompanyManagementPage",
     "HRPage",
     "EnvironmentPage"
-]
\ No newline at end of file
+]
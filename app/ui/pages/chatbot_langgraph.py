@@ -10,6 +10,9 @@ import asyncio
 
 from .base_page import BasePage
 from app.services.chatbot.langgraph.esg_chatbot import ESGReportChatbot
+from app.ui.components import StreamCoalescer
+from app.utils.cancellation import CancellationToken, DeadlineExceeded, RequestCancelled
+from config.settings import settings
 
 
 import logging
@@ -26,6 +29,7 @@ class ChatbotPage(BasePage):
         self._views: dict[int, dict] = {}
         self._state: dict[int, dict] = {}
         self._sessions: dict[int, str] = {}
+        self._requests: dict[int, CancellationToken] = {}  # 클라이언트별 진행 중 요청
 
     def _get_state(self):
         cid = ui.context.client.id
@@ -36,6 +40,24 @@ class ChatbotPage(BasePage):
     def _get_view(self):
         return self._views.get(ui.context.client.id)
 
+    def _begin_request(self, timeout: float) -> CancellationToken:
+        """새 요청 토큰 발급 - 같은 클라이언트의 이전 요청은 취소"""
+        cid = ui.context.client.id
+        self._cancel_request(cid, "superseded by a new request")
+        token = CancellationToken(timeout=timeout)
+        self._requests[cid] = token
+        return token
+
+    def _end_request(self, token: CancellationToken) -> None:
+        for cid, current in list(self._requests.items()):
+            if current is token:
+                del self._requests[cid]
+
+    def _cancel_request(self, cid: int, reason: str) -> None:
+        token = self._requests.pop(cid, None)
+        if token is not None:
+            token.cancel(reason)
+
     def _get_session_id(self):
         cid = ui.context.client.id
         if cid not in self._sessions:
@@ -56,6 +78,8 @@ class ChatbotPage(BasePage):
 
         self._sessions.setdefault(cid, self.chatbot.create_session())
         self._state.setdefault(cid, {"selected_options": {}})
+        # 페이지를 떠나면 진행 중인 응답/보고서 생성을 중단해 작업 슬롯을 반환
+        ui.context.client.on_disconnect(lambda: self._cancel_request(cid, "client disconnected"))
         s = self._state[cid]["selected_options"]
 
         ui.label("🤖 ESG AI 챗봇").classes("text-4xl font-extrabold mb-6 text-black")
@@ -400,7 +424,13 @@ class ChatbotPage(BasePage):
         if intent_hint == "report_generation":
             with response_container:
                 pending_row, spinner, response_label = self._pending_bubble("보고서를 생성하고 있습니다. 잠시만 기다려 주세요...")
-            await self._handle_report_generation(text, response_container, ui_context or {})
+            token = self._begin_request(settings.app.REPORT_REQUEST_TIMEOUT_SECONDS)
+            try:
+                await token.run(self._handle_report_generation(text, response_container, ui_context or {}, token))
+            except RequestCancelled as e:
+                self._show_cancelled(response_label, e)
+            finally:
+                self._end_request(token)
             try: spinner.delete()
             except: pass
             # 스크롤
@@ -418,21 +448,33 @@ class ChatbotPage(BasePage):
         with response_container:
             pending_row, spinner, response_label = self._pending_bubble("응답을 생성하고 있습니다. 잠시만 기다려 주세요...")
 
-        full_response = ""
-        got_first_chunk = False
-        try:
+        def _on_first_chunk():
+            try: spinner.delete()
+            except: pass
+
+        # 토큰을 모아 50ms 주기로 라벨 갱신 (토큰마다 웹소켓 메시지를 보내지 않음)
+        coalescer = StreamCoalescer(response_label, interval=0.05, on_first=_on_first_chunk)
+        token = self._begin_request(settings.app.CHAT_REQUEST_TIMEOUT_SECONDS)
+
+        async def _consume() -> None:
             # UI 컨텍스트를 모델로 넘기고 싶으면 여기서 넘김
-            async for chunk in self.chatbot.stream_response(text, session_id, context=(ui_context or {})):
-                if not got_first_chunk:
-                    got_first_chunk = True
-                full_response += chunk
-                await asyncio.sleep(0.01)
+            async for chunk in self.chatbot.stream_response(
+                text, session_id, context=(ui_context or {}), cancel_token=token
+            ):
+                coalescer.push(chunk)
+
+        try:
+            # 토큰이 취소/마감되면 스트리밍 태스크를 즉시 취소 (LLM 연결도 함께 종료)
+            await token.run(_consume())
+            full_response = coalescer.close()
 
             outcome = getattr(self.chatbot, 'get_last_outcome', lambda _sid: {}) (session_id)
             if outcome.get("report_generated"):
                 rid = outcome.get("report_id")
                 if rid:
-                    pdf_path = self.chatbot.export_report_to_pdf(report_id=rid)
+                    pdf_path = await token.run(asyncio.to_thread(
+                        self.chatbot.export_report_to_pdf, report_id=rid, cancel_token=token
+                    ))
                     report_title = Path(pdf_path).name.replace(".pdf", "").replace("_", " ") if pdf_path else None
                     self._render_report_download_block(response_container, pdf_path=pdf_path, report_title=report_title, dense=False)
                     try: spinner.delete()
@@ -440,10 +482,18 @@ class ChatbotPage(BasePage):
             else:
                 try: spinner.delete()
                 except: pass
-                response_label.text = full_response or "응답이 없습니다."
+                if not full_response:
+                    response_label.text = "응답이 없습니다."
+        except RequestCancelled as e:
+            coalescer.flush()
+            self._show_cancelled(response_label, e)
         except Exception as e:
+            coalescer.flush()
             response_label.text = f"스트리밍 중 오류가 발생했습니다: {e}"
         finally:
+            self._end_request(token)
+            try: spinner.delete()
+            except: pass
             # 맨 아래로 스크롤
             try:
                 ui.element('div').style('height: 1px;').classes('scroll-anchor')
@@ -481,7 +531,19 @@ class ChatbotPage(BasePage):
         )
 
 
-    async def _handle_report_generation(self, query: str, container: ui.column, context: dict) -> None:
+    def _show_cancelled(self, label, error: RequestCancelled) -> None:
+        """취소/시간 초과 안내 (클라이언트가 떠난 경우 무시)"""
+        try:
+            if isinstance(error, DeadlineExceeded):
+                label.text = "응답 시간이 초과되어 요청을 중단했습니다. 다시 시도해 주세요."
+            else:
+                label.text = "요청이 취소되었습니다."
+        except Exception:
+            pass
+
+    async def _handle_report_generation(
+        self, query: str, container: ui.column, context: dict, cancel_token: CancellationToken | None = None
+    ) -> None:
         try:
            # 1) 보고서 직접 생성(LLM 스트리밍 우회): 도구를 dict로 호출
             report_type = "comprehensive" if context.get("category") in (None, "all") else "category_specific"
@@ -495,13 +557,17 @@ class ChatbotPage(BasePage):
             if not report_id:
                 raise RuntimeError("보고서 ID를 받지 못했습니다.")
 
-            # 2) 받은 report_id로 바로 PDF 내보내기
-            pdf_path = self.chatbot.export_report_to_pdf(report_id=report_id)
+            # 2) 받은 report_id로 바로 PDF 내보내기 (스레드에서 렌더링, 취소 시 중단)
+            pdf_path = await asyncio.to_thread(
+                self.chatbot.export_report_to_pdf, report_id=report_id, cancel_token=cancel_token
+            )
 
             # ✅ 공통 렌더러로 출력 (필터 실행 쪽은 보통 기본/비-컴팩트)
             report_title = Path(pdf_path).name.replace(".pdf", "").replace("_", " ") if pdf_path else None
             self._render_report_download_block(container, pdf_path=pdf_path, report_title=report_title, dense=False)
 
+        except RequestCancelled:
+            raise
         except Exception as e:
             logger.error(f"보고서 생성 실패: {e}", exc_info=True)
             container.clear()
@@ -1,16 +1,107 @@
 """Company management page with table and add dialog."""
 
-from nicegui import ui
+from nicegui import run, ui
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Iterable, List, Optional
 import datetime
-import pandas as pd
-import io
 import os
 from pathlib import Path
 
 from .base_page import BasePage
+from app.core.database.filters import FilterSpec, filter_query
 from app.core.database.models import CmpInfo
+from app.services.search_index import COMPANY_SEARCH, get_search_index
+from config.settings import settings
+from app.data.input.sheet_parsers import COMPANY_TEMPLATE, batches, build_template, parse_company_sheet, stage_upload
+from app.ui.components.background_work import ProgressIndicator, run_blocking
+from app.ui.components.job_progress import JobProgress, job_errors, job_failed
+from app.ui.components.live_updates import LiveTable
+
+# 검색 패널 조건 → SQL 조건
+COMPANY_FILTERS = (
+    FilterSpec('branch', CmpInfo.cmp_branch, 'eq'),
+    # 업종/주소는 검색 인덱스로 부분·초성 검색
+    FilterSpec('industry', CmpInfo.cmp_industry, 'search',
+               to_db=lambda v: get_search_index(COMPANY_SEARCH).match_clause(v, 'industry')),
+    FilterSpec('sector', CmpInfo.cmp_sector, 'like'),
+    FilterSpec('address', CmpInfo.cmp_addr, 'search',
+               to_db=lambda v: get_search_index(COMPANY_SEARCH).match_clause(v, 'address')),
+    FilterSpec('extemp', CmpInfo.cmp_extemp, 'range', null_value=0),  # NULL은 0명으로 표시
+    FilterSpec('ethics', CmpInfo.cmp_ethics_yn, 'flag'),
+    FilterSpec('compliance', CmpInfo.cmp_comp_yn, 'flag'),
+)
+
+
+def company_row(c: CmpInfo) -> dict:
+    """CmpInfo → 표 행"""
+    return {
+        '사업장번호': c.cmp_num or '',
+        '지점': c.cmp_branch or '',
+        '회사명': c.cmp_nm,
+        '업종': c.cmp_industry or '',
+        '산업': c.cmp_sector or '',
+        '주소': c.cmp_addr or '',
+        '사외 이사회 수': c.cmp_extemp or 0,
+        '윤리경영 여부': c.cmp_ethics_yn,
+        '컴플라이언스 정책 여부': c.cmp_comp_yn,
+        'unique_key': f"{c.cmp_num}_{c.cmp_branch}",  # 복합키용 유니크 키
+        'actions': '수정'  # 액션 컬럼 추가
+    }
+
+
+def save_company_rows(session_factory, chunks: Iterable[List[dict]], chunk_size: int = 500):
+    """검증된 엑셀 행을 청크 단위로 저장 (작업 스레드에서 실행). 실패한 행은 건너뛰고 나머지는 커밋.
+
+    청크마다 flush 하므로 앞 청크와 사업장번호/지점이 겹치면 조회로 찾아 덮어쓴다.
+    반환: (성공 건수, 오류 메시지 목록)
+    """
+    success_count = 0
+    error_messages = []
+    with session_factory() as db:
+        for chunk in batches(chunks, chunk_size):
+            keys = [(data['사업장번호'], data['지점']) for data in chunk]
+            existing = {
+                (c.cmp_num, c.cmp_branch): c
+                for c in db.query(CmpInfo).filter(tuple_(CmpInfo.cmp_num, CmpInfo.cmp_branch).in_(keys))
+            }
+            for data in chunk:
+                try:
+                    # 기존 데이터 확인 (중복 방지, 같은 파일 안의 중복은 뒤의 행으로 덮어씀)
+                    company = existing.get((data['사업장번호'], data['지점']))
+                    if company:
+                        # 기존 데이터 업데이트
+                        company.cmp_industry = data['업종']
+                        company.cmp_sector = data['산업']
+                        company.cmp_addr = data['주소']
+                        company.cmp_extemp = data['사외 이사회 수']
+                        company.cmp_ethics_yn = data['윤리경영 여부']
+                        company.cmp_comp_yn = data['컴플라이언스 정책 여부']
+                    else:
+                        # 신규 데이터 추가
+                        company = CmpInfo(
+                            cmp_num=data['사업장번호'],
+                            cmp_branch=data['지점'],
+                            cmp_nm=data['회사명'],
+                            cmp_industry=data['업종'],
+                            cmp_sector=data['산업'],
+                            cmp_addr=data['주소'],
+                            cmp_extemp=data['사외 이사회 수'],
+                            cmp_ethics_yn=data['윤리경영 여부'],
+                            cmp_comp_yn=data['컴플라이언스 정책 여부']
+                        )
+                        existing[(data['사업장번호'], data['지점'])] = company
+                        db.add(company)
+
+                    success_count += 1
+
+                except Exception as row_error:
+                    error_messages.append(f'{data["지점"]}: {str(row_error)}')
+            db.flush()
+
+        # 데이터베이스 커밋
+        db.commit()
+    return success_count, error_messages
 
 
 class CompanyManagementPage(BasePage):
@@ -19,21 +110,7 @@ class CompanyManagementPage(BasePage):
 
         companies = []
         if db_session:
-            db_companies = db_session.query(CmpInfo).all()
-            for c in db_companies:
-                companies.append({
-                    '사업장번호': c.cmp_num or '',
-                    '지점': c.cmp_branch or '',
-                    '회사명': c.cmp_nm,
-                    '업종': c.cmp_industry or '',
-                    '산업': c.cmp_sector or '',
-                    '주소': c.cmp_addr or '',
-                    '사외 이사회 수': c.cmp_extemp or 0,
-                    '윤리경영 여부': c.cmp_ethics_yn,
-                    '컴플라이언스 정책 여부': c.cmp_comp_yn,
-                    'unique_key': f"{c.cmp_num}_{c.cmp_branch}",  # 복합키용 유니크 키
-                    'actions': '수정'  # 액션 컬럼 추가
-                })
+            companies = [company_row(c) for c in db_session.query(CmpInfo).all()]
 
         # =======================
         # 테이블 정의
@@ -54,46 +131,43 @@ class CompanyManagementPage(BasePage):
         # =======================
         # 검색 / 필터 UI
         # =======================
-        original_companies = companies.copy()
-        filtered_companies = companies.copy()
+        def build_query():
+            """검색 조건을 WHERE 절로 변환"""
+            criteria = {
+                'branch': branch_input.value,
+                'industry': industry_input.value,
+                'sector': sector_input.value,
+                'address': address_input.value,
+                'extemp': (extemp_min_input.value, extemp_max_input.value),
+                'ethics': ethics_select.value,
+                'compliance': compliance_select.value,
+            }
+            # 화면이 살아 있는 동안 쓰는 세션이라 이미 읽은 행은 identity map의 옛 값이 나옴 → 조회 때마다 DB 값으로 갱신
+            return filter_query(db_session.query(CmpInfo).populate_existing(), COMPANY_FILTERS, criteria)
 
         def apply_filters():
-            nonlocal filtered_companies
-            filtered_companies = original_companies.copy()
-
-            # 지점 검색 (SELECT BOX)
-            if branch_input.value and branch_input.value != '전체':
-                filtered_companies = [r for r in filtered_companies if r['지점'] == branch_input.value]
-            
-            # 업종 검색
-            if industry_input.value:
-                filtered_companies = [r for r in filtered_companies if industry_input.value.upper() in str(r['업종']).upper()]
-            
-            # 산업 검색
-            if sector_input.value:
-                filtered_companies = [r for r in filtered_companies if sector_input.value.upper() in str(r['산업']).upper()]
-            
-            # 주소 검색
-            if address_input.value:
-                filtered_companies = [r for r in filtered_companies if address_input.value.upper() in str(r['주소']).upper()]
-
-            # 사외 이사회 수 범위 검색
-            if extemp_min_input.value is not None:
-                filtered_companies = [r for r in filtered_companies if r['사외 이사회 수'] >= extemp_min_input.value]
-            if extemp_max_input.value is not None:
-                filtered_companies = [r for r in filtered_companies if r['사외 이사회 수'] <= extemp_max_input.value]
-
-            # 윤리경영 여부 필터
-            if ethics_select.value and ethics_select.value != '전체':
-                filtered_companies = [r for r in filtered_companies if r['윤리경영 여부'] == ethics_select.value]
+            if not db_session:
+                return
+            rows = [company_row(c) for c in build_query()]
+            table.rows = rows
+            table.update()
+            result_count.text = f'검색 결과: {len(rows)}건'
+
+        async def search() -> None:
+            """검색 버튼: 업종/주소가 초성 검색이면 인덱스를 먼저 스레드에서 구성 (구성 중에는 안내 표시)"""
+            index = get_search_index(COMPANY_SEARCH)
+            if db_session and any(index.needs_build(v) for v in (industry_input.value, address_input.value)):
+                result_count.text = '검색 결과: 검색 색인 준비 중...'
+                await run.io_bound(index.ensure_built)
+            apply_filters()
 
-            # 컴플라이언스 정책 여부 필터
-            if compliance_select.value and compliance_select.value != '전체':
-                filtered_companies = [r for r in filtered_companies if r['컴플라이언스 정책 여부'] == compliance_select.value]
+        def visible_keys(keys) -> set:
+            """바뀐 회사 중 검색 조건에 맞는 (사업장번호, 지점)"""
+            query = build_query().filter(tuple_(CmpInfo.cmp_num, CmpInfo.cmp_branch).in_(keys))
+            return set(query.with_entities(CmpInfo.cmp_num, CmpInfo.cmp_branch).tuples())
 
-            table.rows = filtered_companies
-            table.update()
-            result_count.text = f'검색 결과: {len(filtered_companies)}건'
+        def on_live_patch(changes) -> None:
+            result_count.text = f'검색 결과: {len(table.rows)}건'
 
         def reset_filters():
             branch_input.set_value('전체')
@@ -104,10 +178,7 @@ class CompanyManagementPage(BasePage):
             extemp_max_input.set_value(None)
             ethics_select.set_value('전체')
             compliance_select.set_value('전체')
-
-            table.rows = original_companies
-            table.update()
-            result_count.text = f'검색 결과: {len(original_companies)}건'
+            apply_filters()
 
        # =======================
         # 검색 UI 카드 (사업자번호, 회사명 제거)
@@ -158,7 +229,7 @@ class CompanyManagementPage(BasePage):
 
                 # 버튼들을 오른쪽으로 밀어서 배치
                 with ui.row().classes('items-center gap-2 ml-auto'):
-                    ui.button('검색', color='primary', on_click=apply_filters) \
+                    ui.button('검색', color='primary', on_click=search) \
                         .classes('rounded-md shadow-sm px-4 py-2 text-sm font-medium')
                     ui.button('초기화', color='secondary', on_click=reset_filters) \
                         .classes('rounded-md shadow-sm px-4 py-2 text-sm font-medium')
@@ -253,9 +324,6 @@ class CompanyManagementPage(BasePage):
                             
                             db_session.commit()
                             ui.notify(f"{existing_company.cmp_nm} 회사 정보가 수정되었습니다 ✅", type='positive')
-                            
-                            # 테이블 데이터만 새로고침
-                            refresh_table_data()
                         else:
                             ui.notify("수정할 회사를 찾을 수 없습니다", type='negative')
                     else:
@@ -274,9 +342,6 @@ class CompanyManagementPage(BasePage):
                         db_session.add(new_company)
                         db_session.commit()
                         ui.notify(f"{new_company.cmp_nm} 회사가 등록되었습니다 ✅", type='positive')
-                        
-                        # 테이블 데이터만 새로고침
-                        refresh_table_data()
                     
                     dialog.close()
                 except Exception as e:
@@ -289,35 +354,14 @@ class CompanyManagementPage(BasePage):
                 ui.button('저장', on_click=save_company).props('color=primary text-color=white').classes('px-6 py-2 rounded-lg')
                 ui.button('취소', on_click=dialog.close).props('color=negative text-color=white').classes('px-6 py-2 rounded-lg')
 
-        # 테이블 새로고침 함수
-        def refresh_table_data():
-            """테이블 데이터만 새로고침"""
-            nonlocal original_companies, filtered_companies
-            updated_companies = []
-            if db_session:
-                db_companies = db_session.query(CmpInfo).all()
-                for c in db_companies:
-                    updated_companies.append({
-                        '사업장번호': c.cmp_num or '',
-                        '지점': c.cmp_branch or '',
-                        '회사명': c.cmp_nm,
-                        '업종': c.cmp_industry or '',
-                        '산업': c.cmp_sector or '',
-                        '주소': c.cmp_addr or '',
-                        '사외 이사회 수': c.cmp_extemp or 0,
-                        '윤리경영 여부': c.cmp_ethics_yn,
-                        '컴플라이언스 정책 여부': c.cmp_comp_yn,
-                        'unique_key': f"{c.cmp_num}_{c.cmp_branch}",
-                        'actions': '수정'
-                    })
-            original_companies = updated_companies
-            # 필터 재적용
-            apply_filters()
-
         # 테이블 생성
-        table = ui.table(columns=columns, rows=filtered_companies, row_key='unique_key').classes(
+        table = ui.table(columns=columns, rows=companies, row_key='unique_key').classes(
             'w-full text-center bordered dense flat rounded shadow-sm'
         ).props('table-header-class=bg-blue-200 text-black')
+        if db_session:
+            # 저장된 변경(다른 사용자 포함)은 바뀐 행만 표에 반영
+            LiveTable(table, CmpInfo, company_row, 'unique_key',
+                      visible=visible_keys, reload=apply_filters, on_patch=on_live_patch)
         
         # 각 행의 액션 컬럼에 수정 버튼 추가
         table.add_slot('body-cell-actions', '''
@@ -370,30 +414,10 @@ class CompanyManagementPage(BasePage):
                 ui.label('💡 열 이름에 공백이 있어도 자동으로 처리됩니다.').classes('text-sm text-blue-600 mt-1')
             
             # 엑셀 양식 다운로드 버튼
-            def download_template():
+            async def download_template():
                 try:
-                    # 엑셀 양식 데이터 생성
-                    template_data = {
-                        '지점': ['서울지사', '구미지사'],
-                        '업종': ['제조업', '서비스업'],
-                        '산업': ['전자부품', 'IT서비스'],
-                        '주소': ['서울시 강남구 테헤란로 123', '경북 구미시 산업로 456'],
-                        '사외이사회수': [3, 2],
-                        '윤리경영여부': ['Y', 'N'],
-                        '컴플라이언스정책여부': ['Y', 'Y']
-                    }
-                    
-                    # DataFrame 생성
-                    template_df = pd.DataFrame(template_data)
-                    
-                    # 메모리에 엑셀 파일 생성
-                    output = io.BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        template_df.to_excel(writer, sheet_name='회사정보양식', index=False)
-                    
-                    # 파일 다운로드
-                    output.seek(0)
-                    ui.download(output.getvalue(), filename='회사정보_업로드양식.xlsx')
+                    content = await run_blocking(build_template, COMPANY_TEMPLATE, '회사정보양식')
+                    ui.download(content, filename='회사정보_업로드양식.xlsx')
                     ui.notify('✅ 엑셀 양식이 다운로드되었습니다', type='positive')
                     
                 except Exception as e:
@@ -407,89 +431,51 @@ class CompanyManagementPage(BasePage):
             upload_result = ui.label()
             preview_data = []
             preview_table = None
+            upload_name = None
+            staged = None  # 검증을 통과해 저장 작업이 다시 읽을 spool 파일
             
-            def handle_upload(e):
-                nonlocal preview_data, preview_table
+            progress = ProgressIndicator()
+            
+            def discard_staged():
+                nonlocal staged
+                if staged is not None:
+                    staged.close()
+                    staged = None
+            
+            # 저장하지 않고 창을 닫으면 spool 파일 정리
+            excel_dialog.on_value_change(lambda e: None if e.value else discard_staged())
+            
+            async def handle_upload(e):
+                nonlocal preview_data, preview_table, upload_name, staged
                 try:
                     upload_result.text = '파일 처리 중...'
                     upload_result.classes('text-blue-600')
                     
-                    # 업로드된 파일 읽기
-                    content = e.content.read()
-                    
-                    # 엑셀 파일 파싱
+                    # 디스크에 spool 후 파싱/검증은 작업 스레드에서 (메모리에 파일 전체를 올리지 않고, 다른 사용자 화면이 멈추지 않도록)
                     try:
-                        # 엑셀 파일 읽기 (첫 번째 시트)
-                        df = pd.read_excel(io.BytesIO(content), sheet_name=0)
-                        
-                        # 열 이름 정리 (모든 공백 제거)
-                        df.columns = df.columns.str.replace(' ', '').str.strip()
+                        # 화면에는 건수/오류와 앞부분 표본만 받고, 파일은 저장 작업용으로 남김
+                        result, upload = await progress.run(
+                            '업로드 파일 저장 중...', stage_upload, e.content, e.name, parse_company_sheet, tenant=company_num)
+                        discard_staged()  # 이전 업로드 파일 정리 (업로드가 겹쳐도 마지막 것만 남김)
+                        staged = upload
                         
-                        # 필수 열 확인 (공백 제거된 버전)
-                        required_cols = ['지점', '업종', '산업', '주소', '사외이사회수', '윤리경영여부', '컴플라이언스정책여부']
-                        missing_cols = [col for col in required_cols if col not in df.columns]
-                        
-                        if missing_cols:
-                            upload_result.text = f'❌ 누락된 열: {", ".join(missing_cols)}'
+                        if result.missing_columns:
+                            upload_result.text = f'❌ 누락된 열: {", ".join(result.missing_columns)}'
                             upload_result.classes('text-red-600')
                             return
                         
-                        # 데이터 검증 및 임시 저장
-                        preview_data = []
-                        valid_count = 0
-                        error_count = 0
-                        error_messages = []
-                        
-                        for idx, row in df.iterrows():
-                            try:
-                                # 데이터 검증
-                                branch = str(row['지점']).strip() if pd.notna(row['지점']) else ''
-                                industry = str(row['업종']).strip() if pd.notna(row['업종']) else ''
-                                sector = str(row['산업']).strip() if pd.notna(row['산업']) else ''
-                                addr = str(row['주소']).strip() if pd.notna(row['주소']) else ''
-                                
-                                # 사외이사회수 처리
-                                try:
-                                    extemp = int(float(row['사외이사회수'])) if pd.notna(row['사외이사회수']) else 0
-                                except (ValueError, TypeError):
-                                    extemp = 0
-                                
-                                # Y/N 값 처리
-                                ethics_yn = str(row['윤리경영여부']).strip().upper() if pd.notna(row['윤리경영여부']) else 'N'
-                                comp_yn = str(row['컴플라이언스정책여부']).strip().upper() if pd.notna(row['컴플라이언스정책여부']) else 'N'
-                                
-                                # Y/N 값 유효성 검사
-                                if ethics_yn not in ['Y', 'N']:
-                                    ethics_yn = 'N'
-                                if comp_yn not in ['Y', 'N']:
-                                    comp_yn = 'N'
-                                
-                                # 유효한 데이터를 임시 저장
-                                preview_data.append({
-                                    '사업장번호': '6182618882',
-                                    '지점': branch,
-                                    '회사명': '국민AI 주식회사',
-                                    '업종': industry,
-                                    '산업': sector,
-                                    '주소': addr,
-                                    '사외 이사회 수': extemp,
-                                    '윤리경영 여부': ethics_yn,
-                                    '컴플라이언스 정책 여부': comp_yn,
-                                    '상태': '업로드 대기'
-                                })
-                                valid_count += 1
-                                
-                            except Exception as row_error:
-                                error_count += 1
-                                error_messages.append(f'행 {idx + 2}: {str(row_error)}')
+                        preview_data = result.rows
+                        upload_name = e.name
                         
                         # 결과 메시지
-                        if error_count == 0:
-                            upload_result.text = f'✅ 검증 완료: {valid_count}건의 유효한 데이터가 준비되었습니다.'
+                        if result.error_count == 0:
+                            upload_result.text = f'✅ 검증 완료: {result.valid_count}건의 유효한 데이터가 준비되었습니다.'
                             upload_result.classes('text-green-600')
                         else:
-                            upload_result.text = f'⚠️ 부분 성공: {valid_count}건 유효, {error_count}건 오류\n오류: {"; ".join(error_messages[:3])}'
+                            upload_result.text = f'⚠️ 부분 성공: {result.valid_count}건 유효, {result.error_count}건 오류\n오류: {"; ".join(result.errors[:3])}'
                             upload_result.classes('text-orange-600')
+                        if result.truncated:
+                            upload_result.text += f'\n🔍 미리보기: 처음 {len(preview_data)}건 (전체 {result.valid_count}건)'
                         
                         # 미리보기 테이블 업데이트
                         if preview_data:
@@ -528,73 +514,28 @@ class CompanyManagementPage(BasePage):
             
             # 파일 업로드 컴포넌트
             ui.upload(
-                label='엑셀 파일 선택 (.xlsx, .xls)',
+                label='엑셀/CSV 파일 선택 (.xlsx, .xls, .csv, .csv.gz, .zip)',
                 auto_upload=True,
                 on_upload=handle_upload,
+                max_file_size=settings.app.UPLOAD_MAX_BYTES,
+                on_rejected=lambda: ui.notify(f'❌ 파일이 너무 큽니다 (최대 {settings.app.UPLOAD_MAX_BYTES // (1024 * 1024)}MB)', type='negative'),
                 multiple=False
-            ).props('accept=".xlsx,.xls"').classes('w-full mb-4')
+            ).props('accept=".xlsx,.xls,.csv,.gz,.zip"').classes('w-full mb-4')
             
             # 저장 기능
-            def save_excel_data():
+            async def save_excel_data():
                 """Staged 데이터를 실제 데이터베이스에 저장"""
-                nonlocal preview_data
-                if not preview_data:
+                nonlocal preview_data, staged
+                if staged is None:
                     ui.notify('저장할 데이터가 없습니다.', type='warning')
                     return
                 
                 try:
-                    success_count = 0
-                    error_count = 0
-                    error_messages = []
-                    
-                    for data in preview_data:
-                        try:
-                            # 기존 데이터 확인 (중복 방지)
-                            existing = db_session.query(CmpInfo).filter(
-                                CmpInfo.cmp_num == data['사업장번호'],
-                                CmpInfo.cmp_branch == data['지점']
-                            ).first()
-                            
-                            if existing:
-                                # 기존 데이터 업데이트
-                                existing.cmp_industry = data['업종']
-                                existing.cmp_sector = data['산업']
-                                existing.cmp_addr = data['주소']
-                                existing.cmp_extemp = data['사외 이사회 수']
-                                existing.cmp_ethics_yn = data['윤리경영 여부']
-                                existing.cmp_comp_yn = data['컴플라이언스 정책 여부']
-                            else:
-                                # 신규 데이터 추가
-                                new_company = CmpInfo(
-                                    cmp_num=data['사업장번호'],
-                                    cmp_branch=data['지점'],
-                                    cmp_nm=data['회사명'],
-                                    cmp_industry=data['업종'],
-                                    cmp_sector=data['산업'],
-                                    cmp_addr=data['주소'],
-                                    cmp_extemp=data['사외 이사회 수'],
-                                    cmp_ethics_yn=data['윤리경영 여부'],
-                                    cmp_comp_yn=data['컴플라이언스 정책 여부']
-                                )
-                                db_session.add(new_company)
-                            
-                            success_count += 1
-                            
-                        except Exception as row_error:
-                            error_count += 1
-                            error_messages.append(f'{data["지점"]}: {str(row_error)}')
-                    
-                    # 데이터베이스 커밋
-                    db_session.commit()
-                    
-                    # 결과 메시지
-                    if error_count == 0:
-                        ui.notify(f'✅ 성공: {success_count}건이 저장되었습니다.', type='positive')
-                    else:
-                        ui.notify(f'⚠️ 부분 성공: {success_count}건 성공, {error_count}건 실패', type='warning')
-                    
-                    # 테이블 새로고침
-                    refresh_table_data()
+                    # 대량 저장은 작업 큐에서 (창을 닫거나 새로고침해도 계속, 표는 LiveTable이 반영)
+                    # 작업은 검증한 spool 파일을 다시 청크 단위로 읽어 저장 (행 전체를 작업 입력에 복사하지 않음)
+                    await save_job.submit('company_rows', {'upload': staged.to_ref()}, source=upload_name)
+                    staged = None
+                    ui.notify('⏳ 백그라운드에서 저장을 시작했습니다. 창을 닫거나 새로고침해도 계속 진행됩니다.', type='info')
                     
                     # 다이얼로그 닫기
                     excel_dialog.close()
@@ -604,13 +545,13 @@ class CompanyManagementPage(BasePage):
                     
                 except Exception as e:
                     ui.notify(f'❌ 저장 오류: {str(e)}', type='negative')
-                    db_session.rollback()
             
             # 취소 기능
             def cancel_upload():
                 """Staged 데이터 취소"""
                 nonlocal preview_data, preview_table
                 preview_data = []
+                discard_staged()
                 if preview_table:
                     preview_table.rows = []
                     preview_table.update()
@@ -636,3 +577,12 @@ class CompanyManagementPage(BasePage):
             
             ui.button('엑셀 일괄등록', on_click=excel_dialog.open) \
                 .props('color=green-200 text-color=black').classes('rounded-lg shadow-md')
+
+        # 엑셀 일괄 저장 작업 진행률 (백그라운드 작업, 새로고침 후에도 이어서 표시)
+        def on_save_finished(job):
+            if job_failed(job):
+                ui.notify(f'⚠️ {job.message}\n{job_errors(job)}', type='warning', multi_line=True)
+            else:
+                ui.notify(f'✅ 성공: {job.message}', type='positive')
+
+        save_job = JobProgress(['company_rows'], company_num, on_finished=on_save_finished)
@@ -1,13 +1,15 @@
 """Dashboard page for ESG overview."""
 
-from nicegui import ui
-from typing import Optional
+from nicegui import run, ui
+from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
 from datetime import datetime, timedelta
 
 from .base_page import BasePage
+from app.core.database.events import RowChange
 from app.core.database.models import CmpInfo, EmpInfo, Env
+from app.data.processors.dashboard_metrics import DashboardMetrics, get_dashboard_metrics_service
+from app.ui.components.live_updates import LiveSubscription
 
 
 class DashboardPage(BasePage):
@@ -31,23 +33,55 @@ class DashboardPage(BasePage):
             # self._render_empty_state()
             # return
         
-        # Get company information
-        company = db_session.query(CmpInfo).filter_by(cmp_num=cmp_num).first()
-        if not company:
+        # 카드 값 전체를 한 번에 조회 (클라이언트 간 공유 캐시, 쓰기 시 무효화)
+        bind = db_session.get_bind()
+        metrics = await run.io_bound(
+            get_dashboard_metrics_service().get, cmp_num, lambda: Session(bind=bind)
+        )
+        if not metrics.company:
             self._render_company_not_found()
             return
         
+        cards = ui.column().classes('w-full gap-0')
+        with cards:
+            await self._render_cards(metrics)
+
+        async def refresh_cards(changes) -> None:
+            """이 회사에 해당하는 변경이 커밋되면 카드 영역만 다시 그림"""
+            if not any(self._affects(change, cmp_num) for change in changes):
+                return
+            fresh = await run.io_bound(
+                get_dashboard_metrics_service().get, cmp_num, lambda: Session(bind=bind)
+            )
+            if cards.is_deleted or not fresh.company:
+                return
+            cards.clear()
+            with cards:
+                await self._render_cards(fresh)
+
+        LiveSubscription(cards, (EmpInfo, CmpInfo, Env), refresh_cards, delay=0.5)
+        
+        # Recent activity and alerts
+        await self._render_activity_section(db_session, cmp_num)
+    
+    async def _render_cards(self, metrics: DashboardMetrics) -> None:
+        """Render company header, metric overview and ESG category cards."""
         # Company header card
-        await self._render_company_header(company)
+        await self._render_company_header(metrics.company)
         
         # Key metrics overview cards
-        await self._render_metrics_overview(db_session, cmp_num)
+        await self._render_metrics_overview(metrics)
         
         # ESG category sections
-        await self._render_esg_categories(db_session, cmp_num)
-        
-        # Recent activity and alerts
-        await self._render_activity_section(db_session, cmp_num)
+        await self._render_esg_categories(metrics)
+
+    @staticmethod
+    def _affects(change: RowChange, cmp_num: str) -> bool:
+        """변경이 이 회사의 카드 값에 영향을 주는지 (환경 데이터는 회사 구분 없음)"""
+        if change.model is Env or change.op == "bulk":
+            return True
+        attr = 'cmp_num' if change.model is CmpInfo else 'EMP_COMP'
+        return cmp_num in (change.values.get(attr), change.previous.get(attr))
     
     def _render_empty_state(self) -> None:
         """Render empty state when no company is selected."""
@@ -63,22 +97,22 @@ class DashboardPage(BasePage):
             ui.label('회사 정보를 찾을 수 없습니다').classes('text-xl font-semibold text-red-700 mb-2')
             ui.label('선택한 회사의 데이터가 존재하지 않습니다.').classes('text-sm text-red-600')
     
-    async def _render_company_header(self, company: CmpInfo) -> None:
+    async def _render_company_header(self, company: Dict[str, Any]) -> None:
         """Render company information header."""
         with ui.card().classes('w-full mb-6 bg-white shadow-md hover:shadow-lg transition-shadow'):
             with ui.card_section().classes('p-6'):
                 with ui.row().classes('w-full items-center justify-between'):
                     with ui.column().classes('flex-grow'):
-                        ui.label(company.cmp_nm).classes('text-2xl font-bold text-gray-800 mb-2')
+                        ui.label(company['cmp_nm']).classes('text-2xl font-bold text-gray-800 mb-2')
                         with ui.row().classes('gap-6'):
-                            if company.cmp_industry:
+                            if company['cmp_industry']:
                                 with ui.row().classes('items-center gap-2'):
                                     ui.icon('business', size='1.2rem').classes('text-blue-500')
-                                    ui.label(f'업종: {company.cmp_industry}').classes('text-sm text-gray-600')
-                            if company.cmp_sector:
+                                    ui.label(f"업종: {company['cmp_industry']}").classes('text-sm text-gray-600')
+                            if company['cmp_sector']:
                                 with ui.row().classes('items-center gap-2'):
                                     ui.icon('category', size='1.2rem').classes('text-green-500')
-                                    ui.label(f'산업: {company.cmp_sector}').classes('text-sm text-gray-600')
+                                    ui.label(f"산업: {company['cmp_sector']}").classes('text-sm text-gray-600')
                     
                     # ESG Score badge (placeholder)
                     with ui.column().classes('items-end'):
@@ -86,31 +120,14 @@ class DashboardPage(BasePage):
                         with ui.badge().classes('bg-green-500 text-white px-4 py-2 text-lg font-bold'):
                             ui.label('A-')
     
-    async def _render_metrics_overview(self, db_session: Session, cmp_num: str) -> None:
+    async def _render_metrics_overview(self, metrics: DashboardMetrics) -> None:
         """Render key metrics overview cards."""
-        # Calculate key metrics
-        total_employees = db_session.query(func.count(EmpInfo.EMP_ID)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y')
-        ).scalar() or 0
-        
-        female_count = db_session.query(func.count(EmpInfo.EMP_ID)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y', EmpInfo.EMP_GENDER == '2')
-        ).scalar() or 0
-        
-        board_members = db_session.query(func.count(EmpInfo.EMP_ID)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y', EmpInfo.EMP_BOARD_YN == 'Y')
-        ).scalar() or 0
-        
-        accident_count = db_session.query(func.sum(EmpInfo.EMP_ACIDENT_CNT)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y')
-        ).scalar() or 0
-        
-        # Latest environmental data
-        latest_env = db_session.query(Env).order_by(Env.year.desc()).first()
-        
-        # Calculate percentages
-        female_ratio = (female_count / total_employees * 100) if total_employees > 0 else 0
-        accident_rate = (accident_count / total_employees * 100) if total_employees > 0 else 0
+        total_employees = metrics.total_employees
+        board_members = metrics.board_members
+        accident_count = metrics.accident_count
+        latest_env = metrics.latest_env
+        female_ratio = metrics.female_ratio
+        accident_rate = metrics.accident_rate
         
         with ui.row().classes('w-full gap-6 mb-8'):
             # Social metrics
@@ -144,8 +161,8 @@ class DashboardPage(BasePage):
             self._create_metric_card(
                 icon='eco',
                 title='환경 성과',
-                value=f'{latest_env.energy_use:,.0f}kWh' if latest_env and latest_env.energy_use else 'N/A',
-                subtitle=f'{latest_env.year}년 기준' if latest_env else '데이터 없음',
+                value=f"{latest_env['energy_use']:,.0f}kWh" if latest_env and latest_env['energy_use'] else 'N/A',
+                subtitle=f"{latest_env['year']}년 기준" if latest_env else '데이터 없음',
                 color='green',
                 trend='-12%' if latest_env else 'N/A'
             )
@@ -175,7 +192,7 @@ class DashboardPage(BasePage):
                 ui.label(value).classes('text-2xl font-bold text-gray-800 mb-1')
                 ui.label(subtitle).classes('text-xs text-gray-500')
     
-    async def _render_esg_categories(self, db_session: Session, cmp_num: str) -> None:
+    async def _render_esg_categories(self, metrics: DashboardMetrics) -> None:
         """Render detailed ESG category sections."""
         with ui.row().classes('w-full gap-6 mb-8'):
             # Environmental section
@@ -186,7 +203,7 @@ class DashboardPage(BasePage):
                         ui.label('Environmental').classes('text-xl font-bold text-gray-800')
                         ui.badge('A-').classes('bg-green-500 text-white ml-auto')
                     
-                    await self._render_environmental_details(db_session)
+                    await self._render_environmental_details(metrics)
             
             # Social section  
             with ui.card().classes('flex-1 bg-gradient-to-br from-blue-50 to-sky-100 border-0 shadow-lg'):
@@ -196,7 +213,7 @@ class DashboardPage(BasePage):
                         ui.label('Social').classes('text-xl font-bold text-gray-800')
                         ui.badge('A').classes('bg-blue-500 text-white ml-auto')
                     
-                    await self._render_social_details(db_session, cmp_num)
+                    await self._render_social_details(metrics)
             
             # Governance section
             with ui.card().classes('flex-1 bg-gradient-to-br from-purple-50 to-violet-100 border-0 shadow-lg'):
@@ -206,37 +223,32 @@ class DashboardPage(BasePage):
                         ui.label('Governance').classes('text-xl font-bold text-gray-800')
                         ui.badge('B').classes('bg-purple-500 text-white ml-auto')
                     
-                    await self._render_governance_details(db_session, cmp_num)
+                    await self._render_governance_details(metrics)
     
-    async def _render_environmental_details(self, db_session: Session) -> None:
+    async def _render_environmental_details(self, metrics: DashboardMetrics) -> None:
         """Render environmental metrics details."""
-        recent_env = db_session.query(Env).order_by(Env.year.desc()).limit(3).all()
+        recent_env = metrics.recent_env
         
         if recent_env:
             for env in recent_env:
                 with ui.row().classes('w-full items-center justify-between py-2 border-b border-green-200 last:border-b-0'):
-                    ui.label(f'{env.year}년').classes('text-sm font-medium text-gray-700')
-                    if env.energy_use:
-                        ui.label(f'{env.energy_use:,.0f} kWh').classes('text-sm text-gray-600')
+                    ui.label(f"{env['year']}년").classes('text-sm font-medium text-gray-700')
+                    if env['energy_use']:
+                        ui.label(f"{env['energy_use']:,.0f} kWh").classes('text-sm text-gray-600')
                 
             # Renewable energy status
-            if recent_env[0].renewable_yn == 'Y':
+            if recent_env[0]['renewable_yn'] == 'Y':
                 with ui.row().classes('w-full items-center mt-4 p-3 bg-green-100 rounded-lg'):
                     ui.icon('wb_sunny', size='1.2rem').classes('text-green-600 mr-2')
-                    ui.label(f'재생에너지 {recent_env[0].renewable_ratio or 0:.1f}% 사용').classes('text-sm font-medium text-green-800')
+                    ui.label(f"재생에너지 {recent_env[0]['renewable_ratio'] or 0:.1f}% 사용").classes('text-sm font-medium text-green-800')
         else:
             ui.label('환경 데이터가 없습니다').classes('text-sm text-gray-500 italic')
     
-    async def _render_social_details(self, db_session: Session, cmp_num: str) -> None:
+    async def _render_social_details(self, metrics: DashboardMetrics) -> None:
         """Render social metrics details."""
         # Gender diversity
-        male_count = db_session.query(func.count(EmpInfo.EMP_ID)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y', EmpInfo.EMP_GENDER == '1')
-        ).scalar() or 0
-        
-        female_count = db_session.query(func.count(EmpInfo.EMP_ID)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y', EmpInfo.EMP_GENDER == '2')
-        ).scalar() or 0
+        male_count = metrics.male_count
+        female_count = metrics.female_count
         
         with ui.row().classes('w-full items-center justify-between py-2 border-b border-blue-200'):
             ui.label('남성 직원').classes('text-sm font-medium text-gray-700')
@@ -247,31 +259,29 @@ class DashboardPage(BasePage):
             ui.label(f'{female_count}명').classes('text-sm text-gray-600')
         
         # Safety metrics
-        total_accidents = db_session.query(func.sum(EmpInfo.EMP_ACIDENT_CNT)).filter(
-            and_(EmpInfo.EMP_COMP == cmp_num, EmpInfo.EMP_ENDYN == 'Y')
-        ).scalar() or 0
+        total_accidents = metrics.accident_count
         
         if total_accidents == 0:
             with ui.row().classes('w-full items-center mt-4 p-3 bg-blue-100 rounded-lg'):
                 ui.icon('verified', size='1.2rem').classes('text-blue-600 mr-2')
                 ui.label('무재해 사업장').classes('text-sm font-medium text-blue-800')
     
-    async def _render_governance_details(self, db_session: Session, cmp_num: str) -> None:
+    async def _render_governance_details(self, metrics: DashboardMetrics) -> None:
         """Render governance metrics details."""
-        company = db_session.query(CmpInfo).filter_by(cmp_num=cmp_num).first()
+        company = metrics.company
         
         if company:
             # External directors
-            if company.cmp_extemp:
+            if company['cmp_extemp']:
                 with ui.row().classes('w-full items-center justify-between py-2 border-b border-purple-200'):
                     ui.label('사외이사').classes('text-sm font-medium text-gray-700')
-                    ui.label(f'{company.cmp_extemp}명').classes('text-sm text-gray-600')
+                    ui.label(f"{company['cmp_extemp']}명").classes('text-sm text-gray-600')
             
             # Ethics and compliance
             policies = []
-            if company.cmp_ethics_yn == 'Y':
+            if company['cmp_ethics_yn'] == 'Y':
                 policies.append('윤리경영')
-            if company.cmp_comp_yn == 'Y':  
+            if company['cmp_comp_yn'] == 'Y':  
                 policies.append('컴플라이언스')
             
             if policies:
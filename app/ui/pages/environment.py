@@ -2,12 +2,61 @@
 
 from nicegui import ui
 from sqlalchemy.orm import Session
-from typing import Optional
-import pandas as pd
-import io
+from typing import Iterable, List, Optional
 
 from .base_page import BasePage
+from app.core.database.filters import FilterSpec, filter_query
 from app.core.database.models import Env
+from config.settings import settings
+from app.data.input.sheet_parsers import batches, parse_env_sheet, stage_upload
+from app.ui.components.background_work import ProgressIndicator
+from app.ui.components.job_progress import JobProgress, job_errors, job_failed
+from app.ui.components.live_updates import LiveTable
+
+# 검색 패널 조건 → SQL 조건 (NULL 지표는 화면에 0 / N으로 표시되므로 그 값으로 검색)
+ENV_FILTERS = (
+    FilterSpec('year', Env.year, 'range'),
+    FilterSpec('renewable', Env.renewable_yn, 'flag', null_value='N'),
+    FilterSpec('energy', Env.energy_use, 'range', null_value=0),
+    FilterSpec('green', Env.green_use, 'range', null_value=0),
+    FilterSpec('ratio', Env.renewable_ratio, 'range', unit=100, null_value=0),  # 화면 %, DB 0~1
+)
+
+
+def env_row(env: Env) -> dict:
+    """Env → 표 행"""
+    return {
+        '년도': str(env.year),
+        '에너지 사용량': f"{env.energy_use:,.2f}" if env.energy_use else '0.00',
+        '온실가스 배출량': f"{env.green_use:,.2f}" if env.green_use else '0.00',
+        '재생에너지 사용여부': env.renewable_yn or 'N',
+        '재생에너지 비율': f"{(env.renewable_ratio * 100):,.1f}" if env.renewable_ratio else '0.0',
+        'year_pk': env.year,
+        'actions': '수정/삭제'
+    }
+
+
+def save_env_rows(session_factory, chunks: Iterable[List[dict]], chunk_size: int = 500) -> int:
+    """엑셀 행을 청크 단위로 저장 (작업 스레드에서 실행, 같은 연도는 덮어씀). 하나라도 실패하면 전체 롤백.
+
+    반환: 저장한 행 수
+    """
+    count = 0
+    with session_factory() as db:
+        for chunk in batches(chunks, chunk_size):
+            for row in chunk:
+                new_env = Env(
+                    year=int(row['년도']),
+                    energy_use=float(row['에너지 사용량']),
+                    green_use=float(row['온실가스 배출량']),
+                    renewable_yn=row['재생에너지 사용여부'],
+                    renewable_ratio=float(row['재생에너지 비율']) / 100,
+                )
+                db.merge(new_env)
+            db.flush()
+            count += len(chunk)
+        db.commit()
+    return count
 
 
 class EnvironmentPage(BasePage):
@@ -19,17 +68,7 @@ class EnvironmentPage(BasePage):
         # =======================
         env_data = []
         if db_session:
-            db_envs = db_session.query(Env).order_by(Env.year.desc()).all()
-            for env in db_envs:
-                env_data.append({
-                    '년도': str(env.year),
-                    '에너지 사용량': f"{env.energy_use:,.2f}" if env.energy_use else '0.00',
-                    '온실가스 배출량': f"{env.green_use:,.2f}" if env.green_use else '0.00',
-                    '재생에너지 사용여부': env.renewable_yn or 'N',
-                    '재생에너지 비율': f"{(env.renewable_ratio * 100):,.1f}" if env.renewable_ratio else '0.0',
-                    'year_pk': env.year,
-                    'actions': '수정/삭제'
-                })
+            env_data = [env_row(env) for env in db_session.query(Env).order_by(Env.year.desc()).all()]
 
         # =======================
         # 테이블 컬럼 정의
@@ -46,39 +85,33 @@ class EnvironmentPage(BasePage):
         # =======================
         # 검색 / 필터 UI
         # =======================
-        original_env_data = env_data.copy()
-        filtered_env_data = env_data.copy()
+        def build_query():
+            """검색 조건을 WHERE 절로 변환"""
+            criteria = {
+                'year': (year_from_input.value, year_to_input.value),
+                'renewable': renewable_select.value,
+                'energy': (energy_min_input.value, energy_max_input.value),
+                'green': (green_min_input.value, green_max_input.value),
+                'ratio': (ratio_min_input.value, ratio_max_input.value),
+            }
+            # 화면이 살아 있는 동안 쓰는 세션이라 이미 읽은 행은 identity map의 옛 값이 나옴 → 조회 때마다 DB 값으로 갱신
+            return filter_query(db_session.query(Env).populate_existing(), ENV_FILTERS, criteria)
 
         def apply_filters():
-            nonlocal filtered_env_data
-            filtered_env_data = original_env_data.copy()
-
-            if year_from_input.value:
-                filtered_env_data = [r for r in filtered_env_data if int(r['년도']) >= year_from_input.value]
-            if year_to_input.value:
-                filtered_env_data = [r for r in filtered_env_data if int(r['년도']) <= year_to_input.value]
-
-            if renewable_select.value and renewable_select.value != '전체':
-                filtered_env_data = [r for r in filtered_env_data if r['재생에너지 사용여부'] == renewable_select.value]
-
-            if energy_min_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['에너지 사용량'].replace(',', '')) >= energy_min_input.value]
-            if energy_max_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['에너지 사용량'].replace(',', '')) <= energy_max_input.value]
-
-            if green_min_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['온실가스 배출량'].replace(',', '')) >= green_min_input.value]
-            if green_max_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['온실가스 배출량'].replace(',', '')) <= green_max_input.value]
+            if not db_session:
+                return
+            rows = [env_row(env) for env in build_query().order_by(Env.year.desc())]
+            table.rows = rows
+            table.update()
+            result_count.text = f'검색 결과: {len(rows)}건'
 
-            if ratio_min_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['재생에너지 비율']) >= ratio_min_input.value]
-            if ratio_max_input.value:
-                filtered_env_data = [r for r in filtered_env_data if float(r['재생에너지 비율']) <= ratio_max_input.value]
+        def visible_keys(keys) -> set:
+            """바뀐 연도 중 검색 조건에 맞는 연도"""
+            query = build_query().filter(Env.year.in_([k[0] for k in keys])).with_entities(Env.year)
+            return {(year,) for (year,) in query}
 
-            table.rows = filtered_env_data
-            table.update()
-            result_count.text = f'검색 결과: {len(filtered_env_data)}건'
+        def on_live_patch(changes) -> None:
+            result_count.text = f'검색 결과: {len(table.rows)}건'
 
         def reset_filters():
             year_from_input.set_value(None)
@@ -90,10 +123,7 @@ class EnvironmentPage(BasePage):
             green_max_input.set_value(None)
             ratio_min_input.set_value(None)
             ratio_max_input.set_value(None)
-
-            table.rows = original_env_data
-            table.update()
-            result_count.text = f'검색 결과: {len(original_env_data)}건'
+            apply_filters()
 
         # =======================
         # 검색 UI 카드
@@ -203,38 +233,50 @@ class EnvironmentPage(BasePage):
         with ui.dialog() as excel_dialog, ui.card().classes('p-4 w-[600px]'):
             ui.label('📥 환경 데이터 엑셀 업로드').classes('text-base font-bold text-green-700 mb-3')
             upload_result = ui.label().classes('text-sm mb-2')
-            preview_data = []
+            upload_name = None
+            staged = None  # 저장 작업이 다시 읽을 spool 파일
 
-            def handle_upload(e):
-                nonlocal preview_data
+            progress = ProgressIndicator()
+
+            def discard_staged():
+                nonlocal staged
+                if staged is not None:
+                    staged.close()
+                    staged = None
+
+            # 저장하지 않고 창을 닫으면 spool 파일 정리
+            excel_dialog.on_value_change(lambda e: None if e.value else discard_staged())
+
+            async def handle_upload(e):
+                nonlocal upload_name, staged
                 try:
-                    content = e.content.read()
-                    df = pd.read_excel(io.BytesIO(content))
-                    df.columns = df.columns.str.strip()
-                    preview_data = df.to_dict(orient='records')
-                    ui.notify(f'✅ {len(preview_data)}건 로드됨', type='positive')
+                    # 디스크에 spool 후 파싱은 작업 스레드에서 (메모리에 파일 전체를 올리지 않고, 다른 사용자 화면이 멈추지 않도록)
+                    result, upload = await progress.run(
+                        '업로드 파일 저장 중...', stage_upload, e.content, e.name, parse_env_sheet, tenant=company_num)
+                    discard_staged()  # 이전 업로드 파일 정리 (업로드가 겹쳐도 마지막 것만 남김)
+                    staged = upload
+                    upload_name = e.name
+                    ui.notify(f'✅ {result.valid_count}건 로드됨', type='positive')
                 except Exception as err:
                     ui.notify(f'엑셀 오류: {str(err)}', type='negative')
 
-            ui.upload(label='엑셀 파일 선택', auto_upload=True, on_upload=handle_upload) \
-                .props('accept=".xlsx,.xls"').classes('w-full mb-3')
+            ui.upload(label='엑셀/CSV 파일 선택', auto_upload=True, on_upload=handle_upload,
+                      max_file_size=settings.app.UPLOAD_MAX_BYTES,
+                      on_rejected=lambda: ui.notify(f'❌ 파일이 너무 큽니다 (최대 {settings.app.UPLOAD_MAX_BYTES // (1024 * 1024)}MB)', type='negative')) \
+                .props('accept=".xlsx,.xls,.csv,.gz,.zip"').classes('w-full mb-3')
 
-            def save_all():
+            async def save_all():
+                nonlocal staged
+                if staged is None:
+                    ui.notify('저장할 데이터가 없습니다.', type='warning')
+                    return
                 try:
-                    for row in preview_data:
-                        new_env = Env(
-                            year=int(row['년도']),
-                            energy_use=float(row['에너지 사용량']),
-                            green_use=float(row['온실가스 배출량']),
-                            renewable_yn=row['재생에너지 사용여부'],
-                            renewable_ratio=float(row['재생에너지 비율']) / 100,
-                        )
-                        db_session.merge(new_env)
-                    db_session.commit()
-                    ui.notify('엑셀 데이터 저장 완료 ✅', type='positive')
+                    # 저장은 작업 큐에서 spool 파일을 다시 읽어 (창을 닫거나 새로고침해도 계속, 표는 LiveTable이 반영)
+                    await save_job.submit('env_rows', {'upload': staged.to_ref()}, source=upload_name)
+                    staged = None
+                    ui.notify('⏳ 백그라운드에서 저장을 시작했습니다.', type='info')
                     excel_dialog.close()
                 except Exception as err:
-                    db_session.rollback()
                     ui.notify(f'엑셀 저장 오류: {str(err)}', type='negative')
 
             with ui.row().classes('justify-end gap-2 mt-3'):
@@ -244,12 +286,26 @@ class EnvironmentPage(BasePage):
         def open_excel_dialog():
             excel_dialog.open()
 
+        # 엑셀 저장 작업 진행률 (백그라운드 작업, 새로고침 후에도 이어서 표시)
+        def on_save_finished(job):
+            if job_failed(job):
+                ui.notify(f'엑셀 저장 오류: {job_errors(job)}', type='negative')
+            else:
+                ui.notify('엑셀 데이터 저장 완료 ✅', type='positive')
+
+        save_job = JobProgress(['env_rows'], company_num, on_finished=on_save_finished)
+
         # =======================
         # 테이블
         # =======================
-        table = ui.table(columns=columns, rows=filtered_env_data, row_key='year_pk').classes(
+        table = ui.table(columns=columns, rows=env_data, row_key='year_pk').classes(
             'w-full text-center bordered dense flat rounded shadow-sm'
         ).props('table-header-class=bg-blue-200 text-black')
+        if db_session:
+            # 저장된 변경(다른 사용자 포함)은 바뀐 행만 표에 반영 (연도 내림차순 유지)
+            LiveTable(table, Env, env_row, 'year_pk', visible=visible_keys,
+                      sort=lambda row: row['year_pk'], reverse=True,
+                      reload=apply_filters, on_patch=on_live_patch)
 
         table.add_slot('body-cell-actions', '''
             <q-td key="actions" :props="props">
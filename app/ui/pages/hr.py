@@ -1,18 +1,154 @@
-from nicegui import ui
+from nicegui import background_tasks, run, ui
 import datetime
-import pandas as pd
-import io
+import math
 from pathlib import Path
+from sqlalchemy import String, cast
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Iterable, List, Optional
 from app.core.database.models import EmpInfo, CmpInfo
+from app.core.database.filters import FilterSpec, filter_query
+from app.core.database.pagination import KeysetPaginator, Page
+from app.services.search_index import EMPLOYEE_SEARCH, get_search_index
+from config.settings import settings
+from app.data.input.sheet_parsers import EMPLOYEE_TEMPLATE, batches, build_template, parse_employee_sheet, stage_upload
+from app.ui.components.background_work import ProgressIndicator, run_blocking
+from app.ui.components.job_progress import JobProgress, job_errors, job_failed
+from app.ui.components.live_updates import LiveTable
+
+PAGE_SIZE = 50
+
+# 정렬 가능한 컬럼 (표 컬럼 이름 → DB 컬럼). (컬럼, EMP_ID) 복합 인덱스로 정렬/페이지 이동
+SORT_COLUMNS = {
+    '지점': EmpInfo.EMP_COMP,
+    '사번': EmpInfo.EMP_ID,
+    '이름': EmpInfo.EMP_NM,
+    '입사년도': EmpInfo.EMP_JOIN,
+    '입사일': EmpInfo.EMP_JOIN,
+}
+
+# 예전 데이터는 서울지점을 사업자번호로 저장함
+SEOUL_BRANCH_ALIASES = ('서울지점', '6182618882')
+
+# 검색 패널 조건 → SQL 조건
+EMPLOYEE_FILTERS = (
+    FilterSpec('branch', EmpInfo.EMP_COMP, 'eq',
+               to_db=lambda v: SEOUL_BRANCH_ALIASES if v == '서울지점' else v, null_value='서울지점'),
+    FilterSpec('emp_no', cast(EmpInfo.EMP_ID, String), 'like'),
+    # 이름은 메모리 검색 인덱스로 부분/초성 검색 ('ㄱㅁㅈ' → 김민준)
+    FilterSpec('name', EmpInfo.EMP_NM, 'search',
+               to_db=lambda v: get_search_index(EMPLOYEE_SEARCH).match_clause(v, 'name')),
+    FilterSpec('hire_year', EmpInfo.EMP_JOIN, 'year_range'),
+    FilterSpec('gender', EmpInfo.EMP_GENDER, 'eq', to_db=lambda v: '1' if v == '남자' else '2'),
+)
+
+
+def _format_ymd(value: Optional[str]) -> str:
+    """YYYYMMDD -> YYYY-MM-DD"""
+    if value and len(value) == 8:
+        return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
+    return ''
+
+
+def employee_row(emp: EmpInfo) -> dict:
+    """EmpInfo → 표 행"""
+    return {
+        '지점': '서울지점' if emp.EMP_COMP == '6182618882' else emp.EMP_COMP or '서울지점',
+        '사번': str(emp.EMP_ID),
+        '이름': emp.EMP_NM,
+        '생년월일': _format_ymd(emp.EMP_BIRTH),
+        '전화번호': emp.EMP_TEL or '',
+        '이메일': emp.EMP_EMAIL or '',
+        '입사년도': emp.EMP_JOIN[:4] if emp.EMP_JOIN and len(emp.EMP_JOIN) >= 4 else '',
+        '입사일': _format_ymd(emp.EMP_JOIN),
+        '산재발생횟수': emp.EMP_ACIDENT_CNT or 0,
+        '이사회여부': emp.EMP_BOARD_YN or 'N',
+        '성별': {'1': '남자', '2': '여자'}.get(emp.EMP_GENDER, ''),
+        '재직여부': emp.EMP_ENDYN or 'Y',
+        'db_id': emp.EMP_ID,  # 사번을 DB ID로 사용
+        'actions': '수정'  # 액션 컬럼 추가
+    }
+
+
+def save_employee_rows(session_factory, chunks: Iterable[List[dict]], chunk_size: int = 500):
+    """검증된 엑셀 행을 청크 단위로 저장 (작업 스레드에서 실행). 오류가 하나라도 있으면 전체 롤백.
+
+    청크마다 flush 하므로 메모리에는 한 청크만 남고, 앞 청크와 사번이 겹치면 조회로 찾아 덮어쓴다.
+    반환: (신규 건수, 수정 건수, 오류 메시지 목록)
+    """
+    saved_count = 0
+    updated_count = 0
+    errors = []
+    with session_factory() as db:
+        for chunk in batches(chunks, chunk_size):
+            ids = []
+            for emp_data in chunk:
+                try:
+                    ids.append(int(emp_data['사번']))
+                except (TypeError, ValueError):
+                    pass
+            existing = {emp.EMP_ID: emp for emp in db.query(EmpInfo).filter(EmpInfo.EMP_ID.in_(ids))}
+            for emp_data in chunk:
+                try:
+                    emp_id = int(emp_data['사번'])
+
+                    # 날짜 변환 (YYYY-MM-DD -> YYYYMMDD)
+                    birth_db = emp_data['생년월일'].replace('-', '') if emp_data['생년월일'] else ''
+                    hire_db = emp_data['입사일'].replace('-', '') if emp_data['입사일'] else ''
+
+                    # 성별 변환 (남자->1, 여자->2)
+                    gender_code = '1' if emp_data['성별'] == '남자' else '2'
+
+                    # 같은 파일 안에서 사번이 중복되면 뒤의 행으로 덮어씀
+                    existing_emp = existing.get(emp_id)
+                    if existing_emp:
+                        # 기존 직원 업데이트
+                        existing_emp.EMP_NM = emp_data['이름']
+                        existing_emp.EMP_BIRTH = birth_db
+                        existing_emp.EMP_TEL = emp_data['전화번호']
+                        existing_emp.EMP_EMAIL = emp_data['이메일']
+                        existing_emp.EMP_JOIN = hire_db
+                        existing_emp.EMP_ACIDENT_CNT = emp_data['산재발생횟수']
+                        existing_emp.EMP_BOARD_YN = emp_data['이사회여부']
+                        existing_emp.EMP_GENDER = gender_code
+                        existing_emp.EMP_ENDYN = emp_data['재직여부']
+                        existing_emp.EMP_COMP = emp_data['지점']
+                        updated_count += 1
+                    else:
+                        # 신규 직원 추가
+                        existing[emp_id] = EmpInfo(
+                            EMP_ID=emp_id,
+                            EMP_NM=emp_data['이름'],
+                            EMP_BIRTH=birth_db,
+                            EMP_TEL=emp_data['전화번호'],
+                            EMP_EMAIL=emp_data['이메일'],
+                            EMP_JOIN=hire_db,
+                            EMP_ACIDENT_CNT=emp_data['산재발생횟수'],
+                            EMP_BOARD_YN=emp_data['이사회여부'],
+                            EMP_GENDER=gender_code,
+                            EMP_ENDYN=emp_data['재직여부'],
+                            EMP_COMP=emp_data['지점']
+                        )
+                        db.add(existing[emp_id])
+                        saved_count += 1
+
+                except Exception as e:
+                    errors.append(f"사번 {emp_data['사번']}: {str(e)}")
+            if not errors:
+                db.flush()
+
+        if errors:
+            db.rollback()
+        else:
+            db.commit()
+    return saved_count, updated_count, errors
+
 
 class HRPage:
     async def render(self, db_session: Session, cmp_num: Optional[str] = None):
         ui.label('👨‍💼 직원관리').classes('text-2xl font-bold text-blue-600 mb-4')
 
-        # 현재 회사의 직원 데이터 조회
-        employees = []
+        # 직원 목록은 화면에 보이는 페이지만 DB에서 읽음 (keyset 페이지네이션)
+        sample_rows = []
         current_company = None
         available_branches = ['서울지점']  # 기본값
         
@@ -32,50 +168,16 @@ class HRPage:
                 if not available_branches:  # 빈 리스트인 경우 기본값 추가
                     available_branches = ['서울지점']
                 
-                # 모든 직원 조회 (새 스키마에는 company_id가 없음)
-                db_employees = db_session.query(EmpInfo).all()
-                
-                # DB 데이터를 테이블 형식으로 변환
-                for emp in db_employees:
-                        # 생년월일 포맷 변환 (YYYYMMDD -> YYYY-MM-DD)
-                        birth_formatted = ''
-                        if emp.EMP_BIRTH and len(emp.EMP_BIRTH) == 8:
-                            birth_formatted = f"{emp.EMP_BIRTH[:4]}-{emp.EMP_BIRTH[4:6]}-{emp.EMP_BIRTH[6:8]}"
-                        
-                        # 입사일 포맷 변환 (YYYYMMDD -> YYYY-MM-DD)
-                        join_formatted = ''
-                        if emp.EMP_JOIN and len(emp.EMP_JOIN) == 8:
-                            join_formatted = f"{emp.EMP_JOIN[:4]}-{emp.EMP_JOIN[4:6]}-{emp.EMP_JOIN[6:8]}"
-                        
-                        # 성별 변환 (1->남자, 2->여자)
-                        gender_text = ''
-                        if emp.EMP_GENDER == '1':
-                            gender_text = '남자'
-                        elif emp.EMP_GENDER == '2':
-                            gender_text = '여자'
-                        
-                        employees.append({
-                            '지점': '서울지점' if emp.EMP_COMP == '6182618882' else emp.EMP_COMP or '서울지점',
-                            '사번': str(emp.EMP_ID),
-                            '이름': emp.EMP_NM,
-                            '생년월일': birth_formatted,
-                            '전화번호': emp.EMP_TEL or '',
-                            '이메일': emp.EMP_EMAIL or '',
-                            '입사년도': emp.EMP_JOIN[:4] if emp.EMP_JOIN and len(emp.EMP_JOIN) >= 4 else '',
-                            '입사일': join_formatted,
-                            '산재발생횟수': emp.EMP_ACIDENT_CNT or 0,
-                            '이사회여부': emp.EMP_BOARD_YN or 'N',
-                            '성별': gender_text,
-                            '재직여부': emp.EMP_ENDYN or 'Y',
-                            'db_id': emp.EMP_ID,  # 사번을 DB ID로 사용
-                            'actions': '수정'  # 액션 컬럼 추가
-                        })
+                # 테이블 존재 여부 확인 (없으면 아래에서 샘플 데이터 사용)
+                db_session.query(EmpInfo.EMP_ID).limit(1).all()
             except Exception as e:
                 # 테이블이 존재하지 않거나 다른 DB 오류 시 샘플 데이터 사용
                 print(f"DB 오류로 샘플 데이터 사용: {str(e)}")
+                db_session.rollback()
+                db_session = None
                 current_company = None
                 available_branches = ['서울지점']  # 기본값 설정
-                employees = [
+                sample_rows = [
                     {
                         '지점': '서울지점',
                         '사번': '1001',
@@ -104,16 +206,16 @@ class HRPage:
         #         ui.label(f"📊 샘플 데이터 - 총 {len(employees)}명").classes('text-lg font-medium text-gray-700')
         #         ui.label(f"⚠️ DB 연결 없음").classes('text-sm text-orange-600')
 
-        # 테이블 컬럼 정의
+        # 테이블 컬럼 정의 (sortable 컬럼은 서버에서 정렬)
         columns = [
-            {'name': '지점', 'label': '지점', 'field': '지점', 'align': 'center'},
-            {'name': '사번', 'label': '사번', 'field': '사번', 'align': 'center'},
-            {'name': '이름', 'label': '이름', 'field': '이름', 'align': 'center'},
+            {'name': '지점', 'label': '지점', 'field': '지점', 'align': 'center', 'sortable': True},
+            {'name': '사번', 'label': '사번', 'field': '사번', 'align': 'center', 'sortable': True},
+            {'name': '이름', 'label': '이름', 'field': '이름', 'align': 'center', 'sortable': True},
             {'name': '생년월일', 'label': '생년월일', 'field': '생년월일', 'align': 'center'},
             {'name': '전화번호', 'label': '전화번호', 'field': '전화번호', 'align': 'center'},
             {'name': '이메일', 'label': '이메일', 'field': '이메일', 'align': 'center'},
-            {'name': '입사년도', 'label': '입사년도', 'field': '입사년도', 'align': 'center'},
-            {'name': '입사일', 'label': '입사일', 'field': '입사일', 'align': 'center'},
+            {'name': '입사년도', 'label': '입사년도', 'field': '입사년도', 'align': 'center', 'sortable': True},
+            {'name': '입사일', 'label': '입사일', 'field': '입사일', 'align': 'center', 'sortable': True},
             {'name': '산재발생횟수', 'label': '산재발생횟수', 'field': '산재발생횟수', 'align': 'center'},
             {'name': '이사회여부', 'label': '이사회여부', 'field': '이사회여부', 'align': 'center'},
             {'name': '성별', 'label': '성별', 'field': '성별', 'align': 'center'},
@@ -122,40 +224,202 @@ class HRPage:
         ]
 
         # =======================
-        # 검색 / 필터 UI
+        # 서버 페이지네이션 상태
         # =======================
-        original_employees = employees.copy()
-        filtered_employees = employees.copy()
+        # 커서는 서버에만 보관하고, 표에는 현재 페이지 행만 전송
+        grid = {
+            'paginator': None,
+            'page': Page(),
+            'page_no': 1,
+            'refetch': None,  # 현재 페이지를 다시 읽는 함수 (수정 후 새로고침용)
+            'rows_per_page': PAGE_SIZE,
+            'sort_by': '사번',
+            'descending': False,
+            'total': None,
+        }
+
+        def build_query():
+            """검색 조건을 WHERE 절로 변환"""
+            criteria = {
+                'branch': branch_input.value,
+                'emp_no': empno_input.value,
+                'name': name_input.value,
+                'hire_year': (hire_year_from_input.value, hire_year_to_input.value),
+                'gender': gender_select.value,
+            }
+            # 화면이 살아 있는 동안 쓰는 세션이라 이미 읽은 행은 identity map의 옛 값이 나옴 → 조회 때마다 DB 값으로 갱신
+            return filter_query(db_session.query(EmpInfo).populate_existing(), EMPLOYEE_FILTERS, criteria)
+
+        def visible_keys(keys) -> set:
+            """바뀐 직원 중 검색 조건에 맞고 현재 페이지 범위에 들어가는 사번"""
+            paginator = grid['paginator']
+            if paginator is None:
+                return set()
+            query = build_query().filter(
+                EmpInfo.EMP_ID.in_([k[0] for k in keys]), paginator.within(grid['page'])
+            ).with_entities(EmpInfo.EMP_ID)
+            return {(emp_id,) for (emp_id,) in query}
+
+        def row_sort_key(row: dict):
+            """표 행 정렬 (추가된 행을 현재 정렬 순서에 맞춰 끼움)"""
+            field = '입사일' if grid['sort_by'] == '입사년도' else grid['sort_by']
+            emp_id = int(row['사번'])
+            return (emp_id if field == '사번' else row.get(field) or '', emp_id)
+
+        def on_live_patch(changes) -> None:
+            if any(c.op != 'update' or c.previous_key for c in changes):
+                refresh_count()
+
+        def show(page: Page, page_no: int, refetch) -> None:
+            grid.update(page=page, page_no=page_no, refetch=refetch)
+            rows_per_page = grid['rows_per_page']
+            if grid['total'] is not None:
+                rows_number = grid['total']
+            else:
+                # 전체 건수를 세기 전에는 다음 페이지 존재 여부만으로 페이저 표시
+                rows_number = (page_no - 1) * rows_per_page + len(page.rows) + (1 if page.has_next else 0)
+            table.rows = [employee_row(emp) for emp in page.rows]
+            table.pagination = {
+                'page': page_no,
+                'rowsPerPage': rows_per_page,
+                'sortBy': grid['sort_by'],
+                'descending': grid['descending'],
+                'rowsNumber': rows_number,
+            }
+            table.update()
 
+        def restart(count: bool = True) -> None:
+            """조건/정렬이 바뀌면 첫 페이지부터 다시 조회"""
+            if not db_session:
+                return
+            paginator = KeysetPaginator(
+                build_query(),
+                key=EmpInfo.EMP_ID,
+                sort=SORT_COLUMNS.get(grid['sort_by'], EmpInfo.EMP_ID),
+                descending=grid['descending'],
+                page_size=grid['rows_per_page'],
+            )
+            grid['paginator'] = paginator
+            if count:
+                grid['total'] = None
+                result_count.text = '검색 결과: 집계 중...'
+                refresh_count()
+            show(paginator.first(), 1, paginator.first)
+
+        def refresh_count() -> None:
+            """전체 건수는 별도 세션으로 백그라운드에서 계산 (첫 페이지 표시를 막지 않음)"""
+            paginator = grid['paginator']
+            bind = db_session.get_bind()
+
+            def _count() -> int:
+                with Session(bind=bind) as session:
+                    return paginator.count(session)
+
+            async def _update() -> None:
+                try:
+                    total = await run.io_bound(_count)
+                except Exception as e:
+                    print(f"직원 수 집계 오류: {str(e)}")
+                    return
+                if grid['paginator'] is not paginator:  # 그 사이 조건이 바뀜
+                    return
+                grid['total'] = total
+                result_count.text = f'검색 결과: {total:,}건'
+                show(grid['page'], grid['page_no'], grid['refetch'])
+
+            background_tasks.create(_update(), name='hr_employee_count')
+
+        def reload_page() -> None:
+            """현재 페이지만 다시 조회 (직원 수정/추가 후)"""
+            if grid['refetch'] is None:
+                restart()
+                return
+            page = grid['refetch']()
+            if not page.rows and grid['page_no'] > 1:
+                restart()
+                return
+            show(page, grid['page_no'], grid['refetch'])
+            refresh_count()
+
+        def on_request(e) -> None:
+            """표의 정렬/페이지 이동 요청 (웹소켓 이벤트) 처리"""
+            pagination = e.args.get('pagination') or {}
+            sort_by = pagination.get('sortBy') or '사번'
+            descending = bool(pagination.get('descending')) if pagination.get('sortBy') else False
+            rows_per_page = pagination.get('rowsPerPage') or PAGE_SIZE
+            page_no = pagination.get('page') or 1
+            paginator = grid['paginator']
+            if paginator is None:
+                return
+
+            if (sort_by, descending, rows_per_page) != (grid['sort_by'], grid['descending'], grid['rows_per_page']):
+                grid.update(sort_by=sort_by, descending=descending, rows_per_page=rows_per_page)
+                restart(count=False)
+                return
+
+            current = grid['page']
+            if page_no == grid['page_no'] + 1 and current.last is not None:
+                cursor = current.last
+                show(paginator.after(cursor), page_no, lambda: paginator.after(cursor))
+            elif page_no == grid['page_no'] - 1 and current.first is not None and page_no > 1:
+                cursor = current.first
+                show(paginator.before(cursor), page_no, lambda: paginator.before(cursor))
+            elif page_no <= 1:
+                show(paginator.first(), 1, paginator.first)
+            elif grid['total'] is not None:
+                # 마지막 페이지로 이동
+                last_no = max(1, math.ceil(grid['total'] / rows_per_page))
+                size = grid['total'] - (last_no - 1) * rows_per_page or rows_per_page
+                show(paginator.last(size), last_no, lambda: paginator.last(size))
+
+        # =======================
+        # 검색 / 필터 UI
+        # =======================
         def apply_filters():
-            nonlocal filtered_employees
-            filtered_employees = original_employees.copy()
+            if not db_session:
+                return
+            restart()
+
+        async def search() -> None:
+            """검색 버튼/자동완성 선택: 초성 검색이면 이름 인덱스를 먼저 스레드에서 구성 (구성 중에는 안내 표시)"""
+            index = get_search_index(EMPLOYEE_SEARCH)
+            if db_session and index.needs_build(name_input.value):
+                result_count.text = '검색 결과: 검색 색인 준비 중...'
+                await run.io_bound(index.ensure_built)
+            apply_filters()
 
-            # 지점 검색 (SELECT BOX)
-            if branch_input.value and branch_input.value != '전체':
-                filtered_employees = [r for r in filtered_employees if r['지점'] == branch_input.value]
-            
-            # 사번 검색
-            if empno_input.value:
-                filtered_employees = [r for r in filtered_employees if empno_input.value in str(r['사번'])]
-            
-            # 이름 검색
-            if name_input.value:
-                filtered_employees = [r for r in filtered_employees if name_input.value.upper() in r['이름'].upper()]
-            
-            # 입사일 범위 검색 (년도 기준)
-            if hire_year_from_input.value:
-                filtered_employees = [r for r in filtered_employees if r['입사년도'] and int(r['입사년도']) >= hire_year_from_input.value]
-            if hire_year_to_input.value:
-                filtered_employees = [r for r in filtered_employees if r['입사년도'] and int(r['입사년도']) <= hire_year_to_input.value]
-            
-            # 성별 필터
-            if gender_select.value and gender_select.value != '전체':
-                filtered_employees = [r for r in filtered_employees if r['성별'] == gender_select.value]
+        suggest_state = {'seq': 0, 'picked': None}
 
-            table.rows = filtered_employees
-            table.update()
-            result_count.text = f'검색 결과: {len(filtered_employees)}건'
+        async def suggest_names(query: Optional[str]) -> None:
+            """이름 자동완성 (초성 입력 포함) - 검색 인덱스에서 조회, 늦게 도착한 이전 결과는 버림"""
+            suggest_state['seq'] += 1
+            seq = suggest_state['seq']
+            query = (query or '').strip()
+            if not db_session or not query or query == suggest_state['picked']:
+                name_suggestions.close()
+                return
+            try:
+                names = await run.io_bound(get_search_index(EMPLOYEE_SEARCH).suggest, query, 'name', 8)
+            except Exception as e:
+                print(f"이름 자동완성 오류: {str(e)}")
+                return
+            if seq != suggest_state['seq']:
+                return
+            names = [n for n in names if n != query]
+            name_suggestions.clear()
+            with name_suggestions:
+                for name in names:
+                    ui.menu_item(name, on_click=lambda n=name: pick_name(n))
+            if names:
+                name_suggestions.open()
+            else:
+                name_suggestions.close()
+
+        async def pick_name(name: str) -> None:
+            suggest_state['picked'] = name
+            name_input.set_value(name)
+            name_suggestions.close()
+            await search()
 
         def reset_filters():
             branch_input.set_value('전체')
@@ -164,10 +428,7 @@ class HRPage:
             hire_year_from_input.set_value(None)
             hire_year_to_input.set_value(None)
             gender_select.set_value('전체')
-
-            table.rows = original_employees
-            table.update()
-            result_count.text = f'검색 결과: {len(original_employees)}건'
+            apply_filters()
 
         # =======================
         # 검색 UI 카드
@@ -177,7 +438,7 @@ class HRPage:
                 with ui.row().classes('items-center gap-1'):
                     ui.icon('tune', size='1rem').classes('text-blue-600')
                     ui.label('검색 필터').classes('text-sm font-semibold text-gray-700')
-                result_count = ui.label(f'검색 결과: {len(employees)}건').classes('text-xs text-gray-500')
+                result_count = ui.label(f'검색 결과: {len(sample_rows)}건').classes('text-xs text-gray-500')
 
             uniform_width = 'w-24 h-7 text-xs'
 
@@ -193,7 +454,10 @@ class HRPage:
                 empno_input = ui.input(placeholder='사번').props('outlined dense clearable').classes(uniform_width)
 
                 ui.label('이름').classes('text-xs font-medium text-gray-600')
-                name_input = ui.input(placeholder='이름').props('outlined dense clearable').classes(uniform_width)
+                name_input = ui.input(placeholder='이름/초성').props('outlined dense clearable').classes(uniform_width)
+                with name_input:
+                    name_suggestions = ui.menu().props('no-parent-event no-focus no-refocus')
+                name_input.on_value_change(lambda e: suggest_names(e.value))
 
                 ui.label('입사년도').classes('text-xs font-medium text-gray-600')
                 with ui.row().classes('items-center gap-1'):
@@ -209,16 +473,33 @@ class HRPage:
 
                 # 버튼들을 오른쪽으로 밀어서 배치
                 with ui.row().classes('items-center gap-2 ml-auto'):
-                    ui.button('검색', color='primary', on_click=apply_filters) \
+                    ui.button('검색', color='primary', on_click=search) \
                         .classes('rounded-md shadow-sm px-4 py-2 text-sm font-medium')
                     ui.button('초기화', color='secondary', on_click=reset_filters) \
                         .classes('rounded-md shadow-sm px-4 py-2 text-sm font-medium')
 
-        table = ui.table(columns=columns, rows=filtered_employees, row_key='사번').classes(
+        table = ui.table(
+            columns=columns,
+            rows=sample_rows,
+            row_key='사번',
+            pagination={'rowsPerPage': PAGE_SIZE, 'sortBy': '사번', 'descending': False},
+        ).classes(
             'w-full text-center bordered dense flat rounded shadow-sm'
         ).props(
-             'table-header-class=bg-blue-200 text-white'
+             'table-header-class=bg-blue-200 text-white :rows-per-page-options="[20, 50, 100]"'
         )
+        table.on('request', on_request)
+        restart()
+        if db_session:
+            # 다른 화면/사용자가 저장한 변경도 표에 바로 반영 (바뀐 행만)
+            LiveTable(
+                table, EmpInfo, employee_row, '사번',
+                visible=visible_keys, sort=row_sort_key, reverse=lambda: grid['descending'],
+                reload=reload_page, on_patch=on_live_patch,
+            )
+        if db_session:
+            # 이름 검색/자동완성에 쓸 인덱스를 미리 구성 (최초 1회, 이후 커밋된 변경만 반영)
+            get_search_index(EMPLOYEE_SEARCH).build_in_background()
 
         # 각 행의 액션 컬럼에 수정 버튼 추가
         table.add_slot('body-cell-actions', '''
@@ -375,7 +656,11 @@ class HRPage:
                     
                     # 사번 중복 확인 (신규 등록 시에만)
                     emp_id = inputs['사번'].value
-                    if not edit_mode and any(emp['사번'] == emp_id for emp in employees):
+                    if db_session:
+                        exists = db_session.get(EmpInfo, int(emp_id)) is not None
+                    else:
+                        exists = any(emp['사번'] == emp_id for emp in table.rows)
+                    if not edit_mode and exists:
                         ui.notify('이미 존재하는 사번입니다', type='warning')
                         return
                     
@@ -453,12 +738,6 @@ class HRPage:
                                     
                                     db_session.commit()
                                     
-                                    # 테이블에서 해당 직원 데이터 업데이트
-                                    for i, emp in enumerate(employees):
-                                        if emp['사번'] == current_employee.get('사번'):
-                                            employees[i] = new_row
-                                            break
-                                    
                                     ui.notify(f"{existing_employee.EMP_NM} 님의 정보가 수정되었습니다 ✅", type='positive')
                                 else:
                                     ui.notify("수정할 직원을 찾을 수 없습니다", type='negative')
@@ -483,12 +762,9 @@ class HRPage:
                                 db_session.commit()
                                 new_row['db_id'] = new_employee.EMP_ID
                                 
-                                # 테이블에 새 직원 추가
-                                employees.append(new_row)
-                                
                                 ui.notify(f"{new_row['이름']} 님이 데이터베이스에 저장되었습니다 ✅", type='positive')
                             
-                            table.update()
+                            # 표는 LiveTable이 커밋된 변경만 반영
                             dialog.close()
                             
                             # 폼 초기화
@@ -517,7 +793,7 @@ class HRPage:
                     else:
                         ui.notify(f"{new_row['이름']} 님이 추가되었습니다 (임시) ⚠️", type='warning')
                         # 테이블 업데이트
-                        employees.append(new_row)
+                        table.rows.append(new_row)
                         table.update()
                         dialog.close()
                     
@@ -557,6 +833,15 @@ class HRPage:
             ui.button('엑셀 일괄등록', on_click=open_excel_dialog) \
                 .props('color=green-200 text-color=black').classes('rounded-lg shadow-md')
 
+        # 엑셀 일괄 저장 작업 진행률 (백그라운드 작업, 새로고침 후에도 이어서 표시)
+        def on_save_finished(job):
+            if job_failed(job):
+                ui.notify(f'❌ {job.message}\n{job_errors(job)}', type='negative', multi_line=True)
+            else:
+                ui.notify(f'✅ {job.message}', type='positive')
+
+        save_job = JobProgress(['employee_rows'], cmp_num, on_finished=on_save_finished)
+
         # =======================
         # 엑셀 일괄등록 다이얼로그
         # =======================
@@ -584,34 +869,10 @@ class HRPage:
                 ui.label('💡 열 이름에 공백이 있어도 자동으로 처리됩니다.').classes('text-sm text-blue-600 mt-1')
             
             # 엑셀 양식 다운로드 버튼
-            def download_template():
+            async def download_template():
                 try:
-                    # 엑셀 양식 데이터 생성
-                    template_data = {
-                        '지점': ['서울지점', '구미지사'],
-                        '사번': ['1001', '1002'],
-                        '이름': ['홍길동', '김철수'],
-                        '생년월일': ['1990-01-15', '1985-05-20'],
-                        '전화번호': ['010-1234-5678', '010-9876-5432'],
-                        '이메일': ['hong@company.com', 'kim@company.com'],
-                        '입사일': ['2020-03-01', '2018-07-15'],
-                        '산재발생횟수': [0, 1],
-                        '이사회여부': ['N', 'Y'],
-                        '성별': ['남자', '남자'],
-                        '재직여부': ['Y', 'Y']
-                    }
-                    
-                    # DataFrame 생성
-                    template_df = pd.DataFrame(template_data)
-                    
-                    # 메모리에 엑셀 파일 생성
-                    output = io.BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        template_df.to_excel(writer, sheet_name='직원정보양식', index=False)
-                    
-                    # 파일 다운로드
-                    output.seek(0)
-                    ui.download(output.getvalue(), filename='직원정보_업로드양식.xlsx')
+                    content = await run_blocking(build_template, EMPLOYEE_TEMPLATE, '직원정보양식')
+                    ui.download(content, filename='직원정보_업로드양식.xlsx')
                     ui.notify('✅ 엑셀 양식이 다운로드되었습니다', type='positive')
                     
                 except Exception as e:
@@ -625,142 +886,51 @@ class HRPage:
             upload_result = ui.label()
             preview_data = []
             preview_table = None
+            upload_name = None
+            staged = None  # 검증을 통과해 저장 작업이 다시 읽을 spool 파일
+            
+            progress = ProgressIndicator()
+            
+            def discard_staged():
+                nonlocal staged
+                if staged is not None:
+                    staged.close()
+                    staged = None
+            
+            # 저장하지 않고 창을 닫으면 spool 파일 정리
+            excel_dialog.on_value_change(lambda e: None if e.value else discard_staged())
             
-            def handle_upload(e):
-                nonlocal preview_data, preview_table
+            async def handle_upload(e):
+                nonlocal preview_data, preview_table, upload_name, staged
                 try:
                     upload_result.text = '파일 처리 중...'
                     upload_result.classes('text-blue-600')
                     
-                    # 업로드된 파일 읽기
-                    content = e.content.read()
-                    
-                    # 엑셀 파일 파싱
+                    # 디스크에 spool 후 파싱/검증은 작업 스레드에서 (메모리에 파일 전체를 올리지 않고, 다른 사용자 화면이 멈추지 않도록)
                     try:
-                        # 엑셀 파일 읽기 (첫 번째 시트)
-                        df = pd.read_excel(io.BytesIO(content), sheet_name=0)
-                        
-                        # 열 이름 정리 (모든 공백 제거)
-                        df.columns = df.columns.str.replace(' ', '').str.strip()
-                        
-                        # 필수 열 확인 (공백 제거된 버전)
-                        required_cols = ['지점', '사번', '이름', '생년월일', '전화번호', '이메일', 
-                                       '입사일', '산재발생횟수', '이사회여부', '성별', '재직여부']
-                        missing_cols = [col for col in required_cols if col not in df.columns]
+                        # 화면에는 건수/오류와 앞부분 표본만 받고, 파일은 저장 작업용으로 남김
+                        result, upload = await progress.run(
+                            '업로드 파일 저장 중...', stage_upload, e.content, e.name, parse_employee_sheet, tenant=cmp_num)
+                        discard_staged()  # 이전 업로드 파일 정리 (업로드가 겹쳐도 마지막 것만 남김)
+                        staged = upload
                         
-                        if missing_cols:
-                            upload_result.text = f'❌ 누락된 열: {", ".join(missing_cols)}'
+                        if result.missing_columns:
+                            upload_result.text = f'❌ 누락된 열: {", ".join(result.missing_columns)}'
                             upload_result.classes('text-red-600')
                             return
                         
-                        # 데이터 검증 및 임시 저장
-                        preview_data = []
-                        valid_count = 0
-                        error_count = 0
-                        error_messages = []
-                        
-                        for idx, row in df.iterrows():
-                            try:
-                                # 기본 데이터 검증
-                                emp_id = str(row['사번']).strip() if pd.notna(row['사번']) else ''
-                                if not emp_id or emp_id == 'nan':
-                                    error_messages.append(f'행 {idx + 2}: 사번이 비어있음')
-                                    error_count += 1
-                                    continue
-                                
-                                emp_name = str(row['이름']).strip() if pd.notna(row['이름']) else ''
-                                if not emp_name or emp_name == 'nan':
-                                    error_messages.append(f'행 {idx + 2}: 이름이 비어있음')
-                                    error_count += 1
-                                    continue
-                                
-                                # 지점 처리
-                                branch = str(row['지점']).strip() if pd.notna(row['지점']) else '서울지점'
-                                
-                                # 생년월일 처리
-                                birth_date = str(row['생년월일']).strip() if pd.notna(row['생년월일']) else ''
-                                birth_formatted = ''
-                                if birth_date and birth_date != 'nan':
-                                    try:
-                                        if len(birth_date) == 8 and birth_date.isdigit():
-                                            birth_formatted = f"{birth_date[:4]}-{birth_date[4:6]}-{birth_date[6:8]}"
-                                        else:
-                                            birth_parsed = pd.to_datetime(birth_date)
-                                            birth_formatted = birth_parsed.strftime('%Y-%m-%d')
-                                    except:
-                                        error_messages.append(f'행 {idx + 2}: 잘못된 생년월일 형식')
-                                        error_count += 1
-                                        continue
-                                
-                                # 입사일 처리
-                                hire_date = str(row['입사일']).strip() if pd.notna(row['입사일']) else ''
-                                hire_formatted = ''
-                                if hire_date and hire_date != 'nan':
-                                    try:
-                                        if len(hire_date) == 8 and hire_date.isdigit():
-                                            hire_formatted = f"{hire_date[:4]}-{hire_date[4:6]}-{hire_date[6:8]}"
-                                        else:
-                                            hire_parsed = pd.to_datetime(hire_date)
-                                            hire_formatted = hire_parsed.strftime('%Y-%m-%d')
-                                    except:
-                                        error_messages.append(f'행 {idx + 2}: 잘못된 입사일 형식')
-                                        error_count += 1
-                                        continue
-                                
-                                # 성별 검증
-                                gender = str(row['성별']).strip() if pd.notna(row['성별']) else '남자'
-                                if gender not in ['남자', '여자']:
-                                    error_messages.append(f'행 {idx + 2}: 성별은 남자/여자만 가능')
-                                    error_count += 1
-                                    continue
-                                
-                                # 산재발생횟수 처리
-                                try:
-                                    accident_count = int(float(row['산재발생횟수'])) if pd.notna(row['산재발생횟수']) else 0
-                                    if accident_count < 0:
-                                        accident_count = 0
-                                except (ValueError, TypeError):
-                                    accident_count = 0
-                                
-                                # Y/N 값 처리
-                                board_yn = str(row['이사회여부']).strip().upper() if pd.notna(row['이사회여부']) else 'N'
-                                employment_yn = str(row['재직여부']).strip().upper() if pd.notna(row['재직여부']) else 'Y'
-                                
-                                # Y/N 값 유효성 검사
-                                if board_yn not in ['Y', 'N']:
-                                    board_yn = 'N'
-                                if employment_yn not in ['Y', 'N']:
-                                    employment_yn = 'Y'
-                                
-                                # 유효한 데이터를 임시 저장
-                                preview_data.append({
-                                    '지점': branch,
-                                    '사번': emp_id,
-                                    '이름': emp_name,
-                                    '생년월일': birth_formatted,
-                                    '전화번호': str(row['전화번호']).strip() if pd.notna(row['전화번호']) else '',
-                                    '이메일': str(row['이메일']).strip() if pd.notna(row['이메일']) else '',
-                                    '입사년도': hire_formatted.split('-')[0] if hire_formatted else '',
-                                    '입사일': hire_formatted,
-                                    '산재발생횟수': accident_count,
-                                    '이사회여부': board_yn,
-                                    '성별': gender,
-                                    '재직여부': employment_yn,
-                                    '상태': '업로드 대기'
-                                })
-                                valid_count += 1
-                                
-                            except Exception as row_error:
-                                error_count += 1
-                                error_messages.append(f'행 {idx + 2}: {str(row_error)}')
+                        preview_data = result.rows
+                        upload_name = e.name
                         
                         # 결과 메시지
-                        if error_count == 0:
-                            upload_result.text = f'✅ 검증 완료: {valid_count}건의 유효한 데이터가 준비되었습니다.'
+                        if result.error_count == 0:
+                            upload_result.text = f'✅ 검증 완료: {result.valid_count}건의 유효한 데이터가 준비되었습니다.'
                             upload_result.classes('text-green-600')
                         else:
-                            upload_result.text = f'⚠️ 부분 성공: {valid_count}건 유효, {error_count}건 오류\n오류: {"; ".join(error_messages[:3])}'
+                            upload_result.text = f'⚠️ 부분 성공: {result.valid_count}건 유효, {result.error_count}건 오류\n오류: {"; ".join(result.errors[:3])}'
                             upload_result.classes('text-orange-600')
+                        if result.truncated:
+                            upload_result.text += f'\n🔍 미리보기: 처음 {len(preview_data)}건 (전체 {result.valid_count}건)'
                         
                         # 미리보기 테이블 업데이트
                         if preview_data:
@@ -798,15 +968,18 @@ class HRPage:
             
             # 파일 업로드 컴포넌트
             ui.upload(
-                label='엑셀 파일 선택 (.xlsx, .xls)',
+                label='엑셀/CSV 파일 선택 (.xlsx, .xls, .csv, .csv.gz, .zip)',
                 auto_upload=True,
                 on_upload=handle_upload,
+                max_file_size=settings.app.UPLOAD_MAX_BYTES,
+                on_rejected=lambda: ui.notify(f'❌ 파일이 너무 큽니다 (최대 {settings.app.UPLOAD_MAX_BYTES // (1024 * 1024)}MB)', type='negative'),
                 multiple=False
-            ).props('accept=".xlsx,.xls"').classes('w-full mb-4')
+            ).props('accept=".xlsx,.xls,.csv,.gz,.zip"').classes('w-full mb-4')
             
             # 일괄 저장 버튼
-            def save_all_data():
-                if not preview_data:
+            async def save_all_data():
+                nonlocal staged
+                if staged is None:
                     ui.notify('❌ 저장할 데이터가 없습니다', type='warning')
                     return
                 
@@ -815,71 +988,10 @@ class HRPage:
                     return
                 
                 try:
-                    saved_count = 0
-                    updated_count = 0
-                    errors = []
-                    
-                    for emp_data in preview_data:
-                        try:
-                            emp_id = int(emp_data['사번'])
-                            
-                            # 기존 직원 확인
-                            existing_emp = db_session.query(EmpInfo).filter_by(EMP_ID=emp_id).first()
-                            
-                            # 날짜 변환 (YYYY-MM-DD -> YYYYMMDD)
-                            birth_db = emp_data['생년월일'].replace('-', '') if emp_data['생년월일'] else ''
-                            hire_db = emp_data['입사일'].replace('-', '') if emp_data['입사일'] else ''
-                            
-                            # 성별 변환 (남자->1, 여자->2)
-                            gender_code = '1' if emp_data['성별'] == '남자' else '2'
-                            
-                            if existing_emp:
-                                # 기존 직원 업데이트
-                                existing_emp.EMP_NM = emp_data['이름']
-                                existing_emp.EMP_BIRTH = birth_db
-                                existing_emp.EMP_TEL = emp_data['전화번호']
-                                existing_emp.EMP_EMAIL = emp_data['이메일']
-                                existing_emp.EMP_JOIN = hire_db
-                                existing_emp.EMP_ACIDENT_CNT = emp_data['산재발생횟수']
-                                existing_emp.EMP_BOARD_YN = emp_data['이사회여부']
-                                existing_emp.EMP_GENDER = gender_code
-                                existing_emp.EMP_ENDYN = emp_data['재직여부']
-                                existing_emp.EMP_COMP = emp_data['지점']
-                                updated_count += 1
-                            else:
-                                # 신규 직원 추가
-                                new_emp = EmpInfo(
-                                    EMP_ID=emp_id,
-                                    EMP_NM=emp_data['이름'],
-                                    EMP_BIRTH=birth_db,
-                                    EMP_TEL=emp_data['전화번호'],
-                                    EMP_EMAIL=emp_data['이메일'],
-                                    EMP_JOIN=hire_db,
-                                    EMP_ACIDENT_CNT=emp_data['산재발생횟수'],
-                                    EMP_BOARD_YN=emp_data['이사회여부'],
-                                    EMP_GENDER=gender_code,
-                                    EMP_ENDYN=emp_data['재직여부'],
-                                    EMP_COMP=emp_data['지점']
-                                )
-                                db_session.add(new_emp)
-                                saved_count += 1
-                                
-                        except Exception as e:
-                            errors.append(f"사번 {emp_data['사번']}: {str(e)}")
-                    
-                    if errors:
-                        error_msg = f"❌ 일부 데이터 저장 실패:\n" + "\n".join(errors[:5])
-                        if len(errors) > 5:
-                            error_msg += f"\n... 외 {len(errors) - 5}개"
-                        ui.notify(error_msg, type='negative')
-                        db_session.rollback()
-                        return
-                    
-                    # 데이터베이스 커밋
-                    db_session.commit()
-                    
-                    # 메인 테이블 새로고침
-                    refresh_table_data()
+                    # 대량 저장은 작업 큐에서 (창을 닫거나 새로고침해도 계속, 표는 LiveTable이 반영)
+                    # 작업은 검증한 spool 파일을 다시 청크 단위로 읽어 저장 (행 전체를 작업 입력에 복사하지 않음)
+                    await save_job.submit('employee_rows', {'upload': staged.to_ref()}, source=upload_name)
+                    staged = None
                     
                     # 다이얼로그 닫기 및 초기화
                     excel_dialog.close()
@@ -889,67 +1001,13 @@ class HRPage:
                         preview_table.update()
                     upload_result.text = ''
                     
-                    ui.notify(f'✅ 저장 완료: 신규 {saved_count}명, 수정 {updated_count}명', type='positive')
+                    ui.notify('⏳ 백그라운드에서 저장을 시작했습니다. 창을 닫거나 새로고침해도 계속 진행됩니다.', type='info')
                     
                 except Exception as e:
                     ui.notify(f'❌ 저장 중 오류 발생: {str(e)}', type='negative')
-                    if db_session:
-                        db_session.rollback()
             
             # 다이얼로그 하단 버튼들
             with ui.row().classes('justify-end mt-4 gap-3'):
                 ui.button('저장', on_click=save_all_data).props('color=primary text-color=white').classes('px-6 py-2 rounded-lg')
                 ui.button('취소', on_click=excel_dialog.close).props('color=negative text-color=white').classes('px-6 py-2 rounded-lg')
 
-        # 테이블 새로고침 함수 (엑셀 저장 후 사용)
-        def refresh_table_data():
-            """테이블 데이터만 새로고침"""
-            nonlocal original_employees, filtered_employees
-            updated_employees = []
-            if db_session:
-                try:
-                    db_employees = db_session.query(EmpInfo).all()
-                    for emp in db_employees:
-                        # 생년월일 포맷 변환 (YYYYMMDD -> YYYY-MM-DD)
-                        birth_formatted = ''
-                        if emp.EMP_BIRTH and len(emp.EMP_BIRTH) == 8:
-                            birth_formatted = f"{emp.EMP_BIRTH[:4]}-{emp.EMP_BIRTH[4:6]}-{emp.EMP_BIRTH[6:8]}"
-                        
-                        # 입사일 포맷 변환 (YYYYMMDD -> YYYY-MM-DD)
-                        join_formatted = ''
-                        if emp.EMP_JOIN and len(emp.EMP_JOIN) == 8:
-                            join_formatted = f"{emp.EMP_JOIN[:4]}-{emp.EMP_JOIN[4:6]}-{emp.EMP_JOIN[6:8]}"
-                        
-                        # 성별 변환 (1->남자, 2->여자)
-                        gender_text = ''
-                        if emp.EMP_GENDER == '1':
-                            gender_text = '남자'
-                        elif emp.EMP_GENDER == '2':
-                            gender_text = '여자'
-                        
-                        updated_employees.append({
-                            '지점': emp.EMP_COMP or '서울지점',
-                            '사번': str(emp.EMP_ID),
-                            '이름': emp.EMP_NM,
-                            '생년월일': birth_formatted,
-                            '전화번호': emp.EMP_TEL or '',
-                            '이메일': emp.EMP_EMAIL or '',
-                            '입사년도': emp.EMP_JOIN[:4] if emp.EMP_JOIN and len(emp.EMP_JOIN) >= 4 else '',
-                            '입사일': join_formatted,
-                            '산재발생횟수': emp.EMP_ACIDENT_CNT or 0,
-                            '이사회여부': emp.EMP_BOARD_YN or 'N',
-                            '성별': gender_text,
-                            '재직여부': emp.EMP_ENDYN or 'Y',
-                            'db_id': emp.EMP_ID,
-                            'actions': '수정'
-                        })
-                except Exception as e:
-                    print(f"테이블 새로고침 오류: {str(e)}")
-            
-            # 전역 employees 업데이트
-            employees.clear()
-            employees.extend(updated_employees)
-            original_employees = updated_employees
-            # 필터 재적용
-            apply_filters()
-       
\ No newline at end of file
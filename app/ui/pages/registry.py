@@ -0,0 +1,93 @@
+"""Lazy page registry: each page is imported and constructed on its first route hit."""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from nicegui import run, ui
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 페이지 이름 → (모듈, 클래스). 챗봇(LangChain/LangGraph/OpenAI), pandas 페이지 등은
+# 서버 시작 시가 아니라 해당 경로에 처음 접속할 때 import 된다.
+PAGE_SPECS: Dict[str, Tuple[str, str]] = {
+    'dashboard': ('app.ui.pages.dashboard', 'DashboardPage'),
+    'data_input': ('app.ui.pages.data_input', 'DataInputPage'),
+    # 'visualization': ('app.ui.pages.visualization', 'VisualizationPage'),
+    'chatbot': ('app.ui.pages.chatbot_langgraph', 'ChatbotPage'),
+    'company_management': ('app.ui.pages.company_management', 'CompanyManagementPage'),
+    'hr': ('app.ui.pages.hr', 'HRPage'),
+    'environment': ('app.ui.pages.environment', 'EnvironmentPage'),
+}
+
+
+class UnavailablePage:
+    """import에 실패한 페이지 대신 표시 (다른 페이지는 계속 동작)"""
+
+    def __init__(self, name: str, error: Exception):
+        self.name = name
+        self.error = error
+
+    async def render(self, db_session: Session, cmp_num: Optional[str] = None) -> None:
+        ui.label('Page not implemented yet')
+        ui.label(f'{self.name}: {self.error}').classes('text-caption text-negative')
+
+
+class PageRegistry:
+    """페이지 객체를 이름별로 한 번만 만들어 공유.
+
+    - ``load(name)``: 모듈 import는 스레드에서 수행해 첫 접속 중에도 다른 클라이언트를 막지 않음
+    - 모듈별 import 시간(ms)은 ``import_ms``에 남기고 로그로 출력
+    """
+
+    def __init__(self, specs: Optional[Dict[str, Tuple[str, str]]] = None):
+        self.specs = dict(PAGE_SPECS if specs is None else specs)
+        self.import_ms: Dict[str, float] = {}
+        self._pages: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.specs
+
+    def loaded(self) -> Dict[str, object]:
+        """지금까지 만들어진 페이지 (이름 → 객체)"""
+        return dict(self._pages)
+
+    def _import(self, name: str) -> None:
+        module, _ = self.specs[name]
+        started = time.perf_counter()
+        importlib.import_module(module)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.import_ms.setdefault(name, elapsed)
+        logger.info("페이지 import %s (%s): %.0fms", name, module, elapsed)
+
+    def get(self, name: str):
+        """페이지 객체 반환 (처음이면 import 후 생성). 등록되지 않은 이름은 None."""
+        page = self._pages.get(name)
+        if page is not None or name not in self.specs:
+            return page
+        with self._lock:
+            page = self._pages.get(name)
+            if page is None:
+                module, class_name = self.specs[name]
+                try:
+                    if name not in self.import_ms:
+                        self._import(name)
+                    page = getattr(importlib.import_module(module), class_name)()
+                except ImportError as e:
+                    logger.error("페이지 import 오류 %s: %s", name, e)
+                    page = UnavailablePage(name, e)
+                self._pages[name] = page
+        return page
+
+    async def load(self, name: str):
+        """``get``과 같되 첫 import는 이벤트 루프 밖에서 수행"""
+        if name in self.specs and name not in self._pages and name not in self.import_ms:
+            try:
+                await run.io_bound(self._import, name)
+            except ImportError:
+                pass  # get()에서 다시 시도해 UnavailablePage로 대체
+        return self.get(name)
@@ -0,0 +1,169 @@
+"""In-memory key/value store bounded by entry count, age and total bytes."""
+
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """항목 크기(바이트) 추정 - JSON 직렬화 길이 기준, 실패 시 sys.getsizeof."""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class BoundedStore:
+    """LRU + TTL + 메모리 상한을 가진 스레드 안전 저장소.
+
+    - ``max_entries``: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+    - ``ttl_seconds``: 저장 후 만료 시간 (0이면 만료 없음)
+    - ``max_bytes``: 전체 항목 크기 합의 상한, 단일 항목이 이를 넘으면 저장하지 않음
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()  # key -> (value, size, expires_at)
+        # 저장 순서 = 만료 순서 (TTL이 모두 같음). _data는 조회 때마다 순서가 바뀌는 LRU 순서라 따로 둠
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+
+    def _expired(self, expires_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now >= expires_at
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._data.pop(key)
+        self._expiry.pop(key, None)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, _, expires_at = entry
+            if self._expired(expires_at, now):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> bool:
+        """저장 성공 여부 반환 (단일 항목이 메모리 상한보다 크면 False)."""
+        size = self._sizeof(value)
+        now = time.monotonic()
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                self.rejected += 1
+                logger.warning("[%s] 항목이 메모리 상한보다 커 저장하지 않습니다: %d bytes", self.name, size)
+                return False
+            self._data[key] = (value, size, now + self.ttl_seconds)
+            self._expiry[key] = now + self.ttl_seconds
+            self._bytes += size
+            self._evict(now)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._expiry.clear()
+            self._bytes = 0
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds:
+            # 가장 먼저 저장된 항목부터 보고 아직 만료되지 않은 항목을 만나면 멈춤 (만료된 개수만큼만 확인)
+            while self._expiry:
+                key, expires_at = next(iter(self._expiry.items()))
+                if now < expires_at:
+                    break
+                self._remove(key)
+                self.expirations += 1
+        while self._data and (
+            (self.max_entries and len(self._data) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            self._remove(key)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+            }
+
+
+_stores: Dict[str, BoundedStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_bounded_store(name: str, **kwargs: Any) -> BoundedStore:
+    """이름별 프로세스 전역 저장소 (최초 호출 시 kwargs로 생성)."""
+    store = _stores.get(name)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(name)
+            if store is None:
+                store = BoundedStore(name, **kwargs)
+                _stores[name] = store
+    return store
@@ -0,0 +1,152 @@
+"""Request-scoped cancellation tokens with deadlines."""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestCancelled(Exception):
+    """요청이 취소됨 (사용자 이탈/새 요청으로 대체)"""
+
+
+class DeadlineExceeded(RequestCancelled):
+    """요청 마감 시간 초과"""
+
+
+class CancellationToken:
+    """요청 하나의 취소 상태와 마감 시간.
+
+    - ``cancel()``은 어느 스레드에서 호출해도 안전하며 등록된 콜백을 실행
+    - ``check()``는 취소/마감 초과 시 예외를 던짐 (스레드 작업의 단계 사이에서 호출)
+    - ``run()``은 작업을 자식 태스크로 실행하고 취소/마감 시 즉시 해당 태스크를 취소
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancellationToken"] = None):
+        deadline = time.monotonic() + timeout if timeout else None
+        if parent is not None and parent.deadline is not None:
+            deadline = parent.deadline if deadline is None else min(deadline, parent.deadline)
+        self.deadline = deadline
+        self.reason: Optional[str] = None
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        if parent is not None:
+            parent.add_callback(lambda: self.cancel(parent.reason or "cancelled"))
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None or self.expired
+
+    def remaining(self) -> Optional[float]:
+        """마감까지 남은 초 (마감 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def timeout(self, seconds: Optional[float] = None) -> Optional[float]:
+        """작업별 타임아웃과 남은 시간 중 짧은 쪽"""
+        remaining = self.remaining()
+        if seconds is None:
+            return remaining
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        logger.debug("요청 취소: %s", reason)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("취소 콜백 오류: %s", e)
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """취소 시 실행할 콜백 등록 (이미 취소됐으면 즉시 실행). 등록 해제 함수 반환."""
+        with self._lock:
+            if self.reason is None:
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def check(self) -> None:
+        if self.reason is not None:
+            raise RequestCancelled(self.reason)
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+    async def run(self, aw: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """작업을 이 토큰 범위에서 실행 - 취소되거나 마감되면 작업을 취소하고 예외 발생."""
+        self.check()
+        loop = asyncio.get_running_loop()
+
+        async def _scoped() -> T:
+            _current.set(self)  # 자식 태스크 컨텍스트에만 적용
+            return await aw
+
+        task = loop.create_task(_scoped())
+        unregister = self.add_callback(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            return await asyncio.wait_for(task, self.timeout(timeout))
+        except asyncio.TimeoutError:
+            if self.expired:
+                self.cancel("deadline exceeded")
+                raise DeadlineExceeded("deadline exceeded") from None
+            raise
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            outer_cancelled = current is not None and getattr(current, "cancelling", lambda: 0)()
+            if self.reason is not None and not outer_cancelled:
+                raise RequestCancelled(self.reason) from None
+            raise
+        finally:
+            unregister()
+
+
+_current: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """현재 요청의 토큰 (명시적으로 전달되지 않은 하위 호출에서 사용)"""
+    return _current.get()
+
+
+def resolve_token(token: Optional[CancellationToken] = None) -> Optional[CancellationToken]:
+    return token if token is not None else _current.get()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+def check_cancelled(token: Optional[CancellationToken] = None) -> None:
+    """토큰(없으면 현재 컨텍스트의 토큰)이 취소됐으면 예외"""
+    token = resolve_token(token)
+    if token is not None:
+        token.check()
@@ -0,0 +1,76 @@
+"""Hangul helpers for search: 초성 extraction, normalization and n-grams."""
+
+import unicodedata
+from typing import Set
+
+_SYLLABLE_FIRST = 0xAC00  # '가'
+_SYLLABLE_LAST = 0xD7A3  # '힣'
+_SYLLABLES_PER_CHOSEONG = 21 * 28  # 중성 21개 × 종성 28개
+
+# 호환용 자모(키보드 입력) 순서 = 완성형 음절의 초성 순서
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 음절 → 초성 변환표 (str.translate로 한 번에 변환)
+_TO_CHOSEONG = {
+    code: CHOSEONG[(code - _SYLLABLE_FIRST) // _SYLLABLES_PER_CHOSEONG]
+    for code in range(_SYLLABLE_FIRST, _SYLLABLE_LAST + 1)
+}
+
+
+def is_syllable(ch: str) -> bool:
+    return _SYLLABLE_FIRST <= ord(ch) <= _SYLLABLE_LAST
+
+
+def is_choseong(ch: str) -> bool:
+    return ch in _CHOSEONG_SET
+
+
+def has_choseong(text: str) -> bool:
+    """초성(자음만 입력한 글자)이 섞여 있는지 - 예: 'ㄱㅁㅈ', '김ㅁ'"""
+    return not _CHOSEONG_SET.isdisjoint(text)
+
+
+def choseong(text: str) -> str:
+    """음절을 초성으로 바꾼 문자열 (그 외 글자는 그대로, 길이 동일). 예: '김민준' → 'ㄱㅁㅈ'"""
+    return text.translate(_TO_CHOSEONG)
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화: NFC 조합, 소문자, 공백 제거 ('서울 강남구' → '서울강남구')"""
+    if not text:
+        return ""
+    return "".join(unicodedata.normalize("NFC", str(text)).lower().split())
+
+
+def ngrams(text: str, n: int) -> Set[str]:
+    """길이 n 부분 문자열 집합 (text가 n보다 짧으면 빈 집합)"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def ngrams_upto(text: str, max_n: int) -> Set[str]:
+    """길이 1~max_n 부분 문자열 집합"""
+    size = len(text)
+    return {text[i:i + n] for n in range(1, max_n + 1) for i in range(size - n + 1)}
+
+
+def contains(text: str, query: str, text_choseong: str = "") -> bool:
+    """정규화된 text에 query가 들어 있는지.
+
+    query의 초성 글자는 text의 같은 위치 음절의 초성과 비교한다 ('김ㅁㅈ' ⊂ '김민준').
+    ``text_choseong``에 ``choseong(text)``를 미리 계산해 넘기면 다시 계산하지 않는다.
+    """
+    if not has_choseong(query):
+        return query in text
+    cho = text_choseong or choseong(text)
+    if choseong(query) not in cho:
+        return False
+    m = len(query)
+    for start in range(len(text) - m + 1):
+        for offset, q in enumerate(query):
+            i = start + offset
+            if q != text[i] and not (q in _CHOSEONG_SET and cho[i] == q):
+                break
+        else:
+            return True
+    return False
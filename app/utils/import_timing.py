@@ -0,0 +1,153 @@
+"""Per-module import timings and a startup import budget check.
+
+``python -X importtime``으로 새 인터프리터에서 모듈을 import 하여 모듈별 시간(자기 자신/누적)을 잰다.
+이미 import 된 모듈의 영향을 받지 않도록 항상 별도 프로세스에서 측정한다.
+
+    python -m app.utils.import_timing                      # 시작 경로(app.ui.main_app) 예산 확인
+    python -m app.utils.import_timing app.ui.pages.hr --top 20
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 서버 시작 경로. 페이지는 첫 접속 시 import 하므로 이 모듈은 가벼워야 한다.
+STARTUP_MODULE = "app.ui.main_app"
+
+# 시작 경로에서 import 되면 안 되는 무거운 패키지 (실행 환경과 무관하게 회귀를 잡음)
+STARTUP_FORBIDDEN = (
+    "pandas",
+    "langchain",
+    "langchain_core",
+    "langchain_openai",
+    "langgraph",
+    "openai",
+    "xhtml2pdf",
+    "app.ui.pages.chatbot_langgraph",
+    "app.ui.pages.hr",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """모듈 하나의 import 시간 (마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def self_ms(self) -> float:
+        return self.self_us / 1000
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+
+@dataclass
+class ImportReport:
+    """모듈 import 측정 결과와 예산 판정"""
+
+    module: str
+    timings: List[ImportTiming]
+    budget_ms: Optional[float] = None
+    forbidden: List[str] = field(default_factory=list)  # import 되면 안 되는데 import 된 모듈
+
+    @property
+    def total_ms(self) -> float:
+        for timing in self.timings:
+            if timing.module == self.module and timing.depth == 0:
+                return timing.cumulative_ms
+        return sum(t.self_ms for t in self.timings)
+
+    @property
+    def ok(self) -> bool:
+        over = self.budget_ms is not None and self.total_ms > self.budget_ms
+        return not over and not self.forbidden
+
+    def slowest(self, top: int = 15) -> List[ImportTiming]:
+        """자기 자신 시간 기준 느린 모듈"""
+        return sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:top]
+
+    def format(self, top: int = 15) -> str:
+        budget = f" / 예산 {self.budget_ms:.0f}ms" if self.budget_ms is not None else ""
+        lines = [f"{self.module}: {self.total_ms:.0f}ms{budget} ({len(self.timings)}개 모듈) {'OK' if self.ok else 'FAIL'}"]
+        lines.append(f"  {'self(ms)':>9} {'cum(ms)':>9}  module")
+        for timing in self.slowest(top):
+            lines.append(f"  {timing.self_ms:9.1f} {timing.cumulative_ms:9.1f}  {timing.module}")
+        if self.forbidden:
+            lines.append(f"  시작 경로에서 import 되면 안 되는 모듈: {', '.join(self.forbidden)}")
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """``-X importtime`` stderr 출력 파싱"""
+    timings = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return timings
+
+
+def measure_imports(module: str, python: str = sys.executable, timeout: float = 120) -> List[ImportTiming]:
+    """새 인터프리터에서 ``module``을 import 하며 모듈별 시간 측정"""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"{module} import 실패: {tail[0]}")
+    return parse_importtime(result.stderr)
+
+
+def check_imports(
+    module: str,
+    budget_ms: Optional[float] = None,
+    forbidden: Sequence[str] = (),
+    python: str = sys.executable,
+) -> ImportReport:
+    timings = measure_imports(module, python=python)
+    imported = {t.module for t in timings}
+    return ImportReport(module, timings, budget_ms, [name for name in forbidden if name in imported])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="모듈별 import 시간 측정 및 예산 확인")
+    parser.add_argument("modules", nargs="*", help=f"측정할 모듈 (기본: {STARTUP_MODULE})")
+    parser.add_argument("--budget-ms", type=float, default=None, help="누적 import 시간 예산 (ms)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 느린 모듈 수")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or [STARTUP_MODULE]
+    budget_ms = args.budget_ms
+    if budget_ms is None and not args.modules:
+        from config.settings import settings
+        budget_ms = settings.app.STARTUP_IMPORT_BUDGET_MS
+
+    failed = False
+    for module in modules:
+        forbidden = STARTUP_FORBIDDEN if module == STARTUP_MODULE else ()
+        report = check_imports(module, budget_ms, forbidden)
+        print(report.format(args.top))
+        failed |= not report.ok
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Single-flight de-duplication of concurrent identical async calls."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def digest_key(*parts: Any) -> str:
+    """여러 값을 안정적인 SHA-256 키로 변환."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    """진행 중인 실행 하나와 그 결과를 기다리는 호출자 수."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 요청은 하나의 실행 결과(Future)를 공유한다.
+
+    - 최초 호출자(leader)만 실제 코루틴을 실행하고 나머지는 결과를 기다린다.
+    - 기다리던 호출자가 모두 취소되면 실행 중인 작업도 취소한다.
+    - 이벤트 루프별로 분리되어 다른 루프의 Future를 await하지 않는다.
+    """
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._inflight: Dict[Tuple[int, str], _Flight] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        self.calls += 1
+
+        flight = self._inflight.get(slot)
+        if flight is None:
+            flight = _Flight(loop.create_task(fn()))
+            self._inflight[slot] = flight
+            flight.task.add_done_callback(lambda t, s=slot, f=flight: self._forget(s, f))
+        else:
+            self.shared += 1
+            logger.debug("[%s] 진행 중인 요청 공유: %s", self.name, key[:12])
+
+        # 슬롯이 아니라 자신이 기다리는 실행의 카운터를 증감 (같은 키의 다음 실행에 영향 없음)
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, slot: Tuple[int, str], flight: _Flight) -> None:
+        if self._inflight.get(slot) is flight:
+            del self._inflight[slot]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "inflight": len(self._inflight),
+            "dedup_rate": (self.shared / self.calls) if self.calls else 0.0,
+        }
@@ -55,6 +55,51 @@ class OpenAISettings(BaseSettings):
         extra = "ignore"
 
 
+class LLMSettings(BaseSettings):
+    """Shared LLM client pool and concurrency limits."""
+    
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="Max in-flight LLM requests across the whole process"
+    )
+    LLM_TENANT_CONCURRENCY: int = Field(
+        default=2,
+        description="Max in-flight LLM requests per tenant (company)"
+    )
+    LLM_MAX_CONNECTIONS: int = Field(
+        default=20,
+        description="Max pooled HTTP connections shared by all LLM clients"
+    )
+    LLM_REQUEST_TIMEOUT: float = Field(
+        default=60.0,
+        description="LLM HTTP request timeout (seconds)"
+    )
+    LLM_TOOL_RESULT_TOKEN_BUDGET: int = Field(
+        default=1500,
+        description="Token budget for compacted tool results in chatbot prompts"
+    )
+    LLM_PROVIDER: str = Field(
+        default="openai",
+        description="LLM backend: 'openai' or 'fake' (deterministic offline model for benchmarks)"
+    )
+    LLM_FAKE_PROFILE: str = Field(
+        default="realistic",
+        description="Fake LLM latency/failure profile: instant, fast, realistic, slow, flaky, timeouts"
+    )
+    LLM_FAKE_SEED: int = Field(
+        default=0,
+        description="Seed for fake LLM responses, jitter and injected failures"
+    )
+    LLM_FAKE_FAILURE_RATE: Optional[float] = Field(
+        default=None,
+        description="Override the fake LLM profile's failure probability (0.0-1.0)"
+    )
+    
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+
+
 class AppSettings(BaseSettings):
     """Main application settings."""
     
@@ -86,6 +131,116 @@ class AppSettings(BaseSettings):
         description="Secret key for session management"
     )
 
+    # AI enrichment cache
+    AI_CACHE_PATH: str = Field(
+        default="./ai_enrich_cache.db",
+        description="SQLite file for cached AI report enrichment results"
+    )
+    AI_CACHE_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        description="Time-to-live of cached enrichment results (seconds)"
+    )
+    AI_CACHE_MAX_ENTRIES: int = Field(
+        default=500,
+        description="Max cached enrichment results before LRU eviction"
+    )
+    CHECKPOINT_DB_PATH: str = Field(
+        default="./langgraph_checkpoints.db",
+        description="SQLite file for LangGraph checkpoints (resumable chat turns and report generation)"
+    )
+    CHECKPOINT_TTL_SECONDS: int = Field(
+        default=24 * 3600,
+        description="Checkpoints of interrupted runs not resumed within this time are deleted (seconds, 0 = keep)"
+    )
+
+    # Chat memory
+    CHAT_MEMORY_WINDOW_TURNS: int = Field(
+        default=6,
+        description="Recent chat turns put verbatim into the prompt (older turns are summarized)"
+    )
+    CHAT_MEMORY_SUMMARY_MAX_CHARS: int = Field(
+        default=2000,
+        description="Max length of the rolling summary of older chat turns"
+    )
+    CHAT_OUTCOME_MAX_ENTRIES: int = Field(
+        default=1000,
+        description="Max chat sessions whose last outcome is kept in memory"
+    )
+    CHAT_OUTCOME_TTL_SECONDS: int = Field(
+        default=6 * 3600,
+        description="Time-to-live of a session's last outcome (seconds)"
+    )
+    CHAT_OUTCOME_MAX_BYTES: int = Field(
+        default=32 * 1024 * 1024,
+        description="Hard memory cap for all stored session outcomes (bytes)"
+    )
+    CHAT_REQUEST_TIMEOUT_SECONDS: int = Field(
+        default=180,
+        description="Deadline for one chat request (graph run + LLM streaming)"
+    )
+    REPORT_REQUEST_TIMEOUT_SECONDS: int = Field(
+        default=600,
+        description="Deadline for one report request (generation + PDF export)"
+    )
+
+    # Dashboard aggregates
+    DASHBOARD_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="Time-to-live of shared dashboard card aggregates (seconds, invalidated on writes)"
+    )
+    DASHBOARD_CACHE_MAX_ENTRIES: int = Field(
+        default=256,
+        description="Max companies whose dashboard aggregates are kept in memory"
+    )
+
+    # Blocking work offloaded from UI handlers (Excel parsing, bulk saves)
+    BLOCKING_WORK_CONCURRENCY: int = Field(
+        default=4,
+        description="Max blocking pandas/DB jobs from UI handlers running at once in worker threads/processes"
+    )
+
+    # Spooled uploads (Excel/CSV/gzip·zip CSV copied to disk and parsed from there)
+    UPLOAD_MAX_BYTES: int = Field(
+        default=512 * 1024 * 1024,
+        description="Max size of one spooled upload as received (512MB)"
+    )
+    UPLOAD_MAX_DECOMPRESSED_BYTES: int = Field(
+        default=2 * 1024 * 1024 * 1024,
+        description="Max decompressed size of a gzip/zip CSV upload (2GB)"
+    )
+    UPLOAD_TENANT_QUOTA_BYTES: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Max bytes of uploads one company may hold on disk at once (1GB)"
+    )
+    UPLOAD_SPOOL_TTL_SECONDS: int = Field(
+        default=24 * 3600,
+        description="Validated uploads not saved within this time are deleted from the spool directory (seconds)"
+    )
+    UPLOAD_PREVIEW_ROWS: int = Field(
+        default=100,
+        description="Rows of a validated upload sent to the browser as a preview sample"
+    )
+
+    # Background import jobs (app.services.jobs, persisted in import_jobs)
+    IMPORT_JOB_WORKERS: int = Field(
+        default=2,
+        description="Worker threads running queued import jobs"
+    )
+    IMPORT_JOB_POLL_SECONDS: float = Field(
+        default=2.0,
+        description="Idle workers re-check the jobs table this often (picks up jobs queued by other processes)"
+    )
+    IMPORT_JOB_PROGRESS_FLUSH_SECONDS: float = Field(
+        default=1.0,
+        description="Min interval between progress writes of a running job to the jobs table"
+    )
+
+    # Startup
+    STARTUP_IMPORT_BUDGET_MS: int = Field(
+        default=2500,
+        description="Import-time budget for the server entry module (ms), checked by app.utils.import_timing"
+    )
+
     
     class Config:
         env_file = ".env"
@@ -97,6 +252,7 @@ class Settings:
     def __init__(self):
         self.app = AppSettings()
         self.database = DatabaseSettings()
+        self.llm = LLMSettings()
         
         # Only load OpenAI settings if API key is available
         try:
@@ -0,0 +1,20 @@
+"""공용 테스트 픽스처"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database.base import Base
+import app.core.database.models  # noqa: F401  (테이블 등록)
+
+
+@pytest.fixture
+def session_factory():
+    """테스트마다 새로 만드는 메모리 SQLite DB의 세션 팩토리"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
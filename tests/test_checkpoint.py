@@ -0,0 +1,50 @@
+"""체크포인트 스레드 정리 테스트"""
+
+import asyncio
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from app.services.checkpoint import maybe_sweep, pending_nodes, sweep_stale_threads, thread_config
+
+
+class _State(TypedDict, total=False):
+    value: int
+
+
+def _graph(saver):
+    builder = StateGraph(_State)
+    builder.add_node("step", lambda state: {"value": state.get("value", 0) + 1})
+    builder.add_edge(START, "step")
+    builder.add_edge("step", END)
+    return builder.compile(checkpointer=saver, interrupt_before=["step"])
+
+
+def test_sweep_deletes_only_stale_threads():
+    async def scenario():
+        saver = MemorySaver()
+        graph = _graph(saver)
+        config = thread_config("chat:abandoned")
+        await graph.ainvoke({"value": 1}, config=config)  # step 전에 중단된 실행
+        assert await pending_nodes(graph, config) == ("step",)
+
+        assert await sweep_stale_threads(saver, max_age_seconds=3600) == 0
+        assert await pending_nodes(graph, config) == ("step",)
+
+        # 기준 시각이 미래가 되도록 음수 보관 시간을 주면 모든 스레드가 오래된 것으로 간주됨
+        assert await sweep_stale_threads(saver, max_age_seconds=-1) == 1
+        assert await pending_nodes(graph, config) == ()
+
+    asyncio.run(scenario())
+
+
+def test_sweep_disabled_and_throttled():
+    async def scenario():
+        saver = MemorySaver()
+        await _graph(saver).ainvoke({"value": 1}, config=thread_config("t1"))
+        assert await sweep_stale_threads(saver, max_age_seconds=0) == 0
+        await maybe_sweep(saver)
+        await maybe_sweep(saver)  # 간격 안의 두 번째 호출은 건너뜀
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+"""빠른 답변(LLM 없이 템플릿 답변) 질문 매칭 테스트"""
+
+import pytest
+
+from app.services.chatbot.fast_answer import FastAnswerEngine
+
+REPORT = {
+    "company_info": {"cmp_nm": "테스트회사"},
+    "esg_metrics": {
+        "social": {
+            "diversity": {"total_employees": 120, "female_count": 48, "male_count": 72, "female_ratio": 0.4},
+            "board_composition": {"total_board_members": 7, "female_board_ratio": 0.2857},
+            "safety": {"total_accidents": 2, "accident_rate": 0.0167},
+        },
+        "environmental": {
+            "current_status": {"latest_year": 2024, "energy_use": 1234.5, "green_use": 56.78, "renewable_ratio": 0.12},
+            "trends": [{"year": 2023, "energy_use": 1100.0, "green_use": 60.0, "renewable_ratio": 0.1}],
+        },
+        "governance": {"basic_governance": {"external_directors": 3, "ethics_policy": "Y", "compliance_policy": "N"}},
+    },
+}
+
+
+@pytest.fixture
+def engine():
+    return FastAnswerEngine()
+
+
+@pytest.mark.parametrize("query, keys", [
+    ("직원 수는?", ["employee_count"]),
+    ("직원수 알려줘", ["employee_count"]),
+    ("전체 직원은 몇명이니", ["employee_count"]),
+    ("여성 직원 비율은?", ["female_ratio"]),
+    ("여직원 몇 명이야?", ["female_count"]),
+    ("이사회 인원은?", ["board_members"]),
+    ("여성 이사 비율은?", ["female_board_ratio"]),
+    ("사외이사 몇 명이야?", ["external_directors"]),
+    ("산재율은?", ["accident_rate"]),
+    ("2023년 에너지 사용량은?", ["energy_use"]),
+    ("탄소 배출량 얼마야?", ["ghg_emissions"]),
+    ("준법 경영 도입했어?", ["compliance_policy"]),
+    ("임직원 수와 사외이사 수", ["employee_count", "external_directors"]),
+])
+def test_metric_questions_match(engine, query, keys):
+    assert [spec.key for spec in engine.match(query)] == keys
+
+
+@pytest.mark.parametrize("query", [
+    "수요일에 직원 회의 있어?",
+    "에너지 사용량 줄이는 법",
+    "탄소중립 목표는 언제까지야?",
+    "사외이사 제도가 뭐야?",
+    "윤리경영이 뭐야?",
+    "직원 수가 왜 줄었어?",
+    "여성 직원 비율을 높이는 방안 추천해줘",
+    "에너지",
+])
+def test_open_questions_go_to_llm(engine, query):
+    assert engine.match(query) == []
+    assert engine.answer(query, REPORT) is None
+
+
+def test_answer_renders_values(engine):
+    assert engine.answer("직원 수는?", REPORT) == "테스트회사의 전체 직원 수는 120명입니다."
+    assert engine.answer("2023년 에너지 사용량은?", REPORT) == "테스트회사의 2023년 에너지 사용량은 1,100 kWh입니다."
+    assert engine.answer("사외이사 몇 명이야?", {"esg_metrics": {}}) is None
@@ -0,0 +1,81 @@
+"""검색 조건 → WHERE 절 변환 테스트"""
+
+import pytest
+
+from app.core.database.filters import FilterSpec, filter_query
+from app.core.database.models import EmpInfo, Env
+
+ENV_FILTERS = (
+    FilterSpec('year', Env.year, 'range'),
+    FilterSpec('renewable', Env.renewable_yn, 'flag', null_value='N'),
+    FilterSpec('energy', Env.energy_use, 'range', null_value=0),
+    FilterSpec('ratio', Env.renewable_ratio, 'range', unit=100, null_value=0),
+)
+
+EMPLOYEE_FILTERS = (
+    FilterSpec('name', EmpInfo.EMP_NM, 'like'),
+    FilterSpec('hire_year', EmpInfo.EMP_JOIN, 'year_range'),
+    FilterSpec('gender', EmpInfo.EMP_GENDER, 'eq', to_db=lambda v: '1' if v == '남자' else '2'),
+)
+
+
+@pytest.fixture
+def db(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Env(year=2021, energy_use=None, renewable_yn=None, renewable_ratio=None),
+            Env(year=2022, energy_use=100.0, renewable_yn='Y', renewable_ratio=0.25),
+            Env(year=2023, energy_use=250.0, renewable_yn='N', renewable_ratio=0.5),
+            EmpInfo(EMP_ID=1, EMP_NM='김민준', EMP_JOIN='20190301', EMP_GENDER='1'),
+            EmpInfo(EMP_ID=2, EMP_NM='이서연', EMP_JOIN='20201231', EMP_GENDER='2'),
+            EmpInfo(EMP_ID=3, EMP_NM='박100%', EMP_JOIN='20210101', EMP_GENDER='1'),
+        ])
+        session.commit()
+        yield session
+
+
+def _years(db, **criteria):
+    return sorted(env.year for env in filter_query(db.query(Env), ENV_FILTERS, criteria))
+
+
+def _employees(db, **criteria):
+    return sorted(emp.EMP_ID for emp in filter_query(db.query(EmpInfo), EMPLOYEE_FILTERS, criteria))
+
+
+def test_empty_criteria_add_no_conditions(db):
+    assert _years(db, year=(None, ''), renewable='전체', energy=('', None)) == [2021, 2022, 2023]
+
+
+def test_range_bounds_are_inclusive_and_optional(db):
+    assert _years(db, year=(2022, None)) == [2022, 2023]
+    assert _years(db, year=(None, 2022)) == [2021, 2022]
+
+
+def test_null_rows_match_their_displayed_value(db):
+    # 화면에 0 / N으로 보이는 NULL 행도 조건에 맞으면 포함
+    assert _years(db, energy=(0, 150)) == [2021, 2022]
+    assert _years(db, energy=(50, None)) == [2022, 2023]
+    assert _years(db, renewable='N') == [2021, 2023]
+
+
+def test_range_unit_converts_percent(db):
+    assert _years(db, ratio=(30, 100)) == [2023]
+
+
+def test_like_escapes_wildcards(db):
+    assert _employees(db, name='0%') == [3]
+    assert _employees(db, name=' 서연 ') == [2]
+
+
+def test_year_range_on_yyyymmdd_column(db):
+    assert _employees(db, hire_year=(2020, 2020)) == [2]
+    assert _employees(db, hire_year=(2020, None)) == [2, 3]
+
+
+def test_to_db_maps_display_value(db):
+    assert _employees(db, gender='여자') == [2]
+
+
+def test_unknown_op_is_rejected():
+    with pytest.raises(ValueError):
+        FilterSpec('x', Env.year, 'between')
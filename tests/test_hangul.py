@@ -0,0 +1,31 @@
+"""한글 검색 도우미 테스트 (초성, 정규화, 포함 검사)"""
+
+from app.utils.hangul import choseong, contains, has_choseong, ngrams, ngrams_upto, normalize
+
+
+def test_choseong_keeps_other_characters():
+    assert choseong('김민준') == 'ㄱㅁㅈ'
+    assert choseong('kim김 1') == 'kimㄱ 1'
+
+
+def test_normalize_composes_lowercases_and_drops_spaces():
+    decomposed = '\u1100\u1175\u11b7'  # '김' 자모 분해형
+    assert normalize(decomposed) == '김'
+    assert normalize(' 서울 강남구 ABC ') == '서울강남구abc'
+    assert normalize(None) == ''
+
+
+def test_ngrams():
+    assert ngrams('abc', 2) == {'ab', 'bc'}
+    assert ngrams('a', 2) == set()
+    assert ngrams_upto('abc', 2) == {'a', 'b', 'c', 'ab', 'bc'}
+
+
+def test_contains_with_choseong_positions():
+    assert has_choseong('김ㅁ') and not has_choseong('김민')
+    assert contains('김민준', 'ㄱㅁㅈ')
+    assert contains('김민준', '김ㅁㅈ')
+    assert contains('김민준', 'ㅁ준')
+    assert not contains('김민준', 'ㅁㄱ')
+    assert not contains('김민준', '이ㅁ')
+    assert contains('hong@company.com', 'company')
@@ -0,0 +1,28 @@
+"""공용 의도/엔티티 분류기 테스트"""
+
+from app.services.chatbot.intent_classifier import classify_intent
+
+
+def test_to_dict_keeps_entity_contract():
+    result = classify_intent("show environmental energy data for last year and 2024, quarterly")
+    entities = result.to_dict()["entities"]
+
+    assert {"type": "category", "value": "Environmental", "confidence": 0.9} in entities
+    assert {"type": "time_period", "value": "last year", "confidence": 0.8} in entities
+    assert {"type": "time_period", "value": "quarterly", "confidence": 0.8} in entities
+    assert {"type": "metric", "value": "energy", "confidence": 0.7} in entities
+    # 'environmental'과 지표 'energy'가 같은 카테고리를 가리켜도 한 번만
+    assert [e["value"] for e in entities if e["type"] == "category"] == ["Environmental"]
+
+
+def test_overlapping_keywords_resolve_leftmost_longest():
+    result = classify_intent("재생에너지 비율 보여줘")
+
+    assert result.metrics == ["renewable_ratio"]
+    assert result.category == "environmental"
+    assert result.intent == "data_query"
+
+
+def test_granularity_is_not_a_period():
+    assert classify_intent("annual governance report").period is None
+    assert classify_intent("작년 분기별 사회 보고서").period == "last_year"
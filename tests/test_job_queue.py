@@ -0,0 +1,147 @@
+"""가져오기 작업 큐 상태 전이 테스트"""
+
+import io
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.base import Base
+from app.core.database.models import CmpInfo, DataImportLog, EmpInfo, ImportJob
+from app.data.input.sheet_parsers import parse_company_sheet, parse_employee_sheet, stage_upload
+from app.services.jobs.handlers import HANDLERS, register_handler
+from app.services.jobs.queue import JobOutcome, JobQueue, JobStatus
+
+
+@register_handler("test_rows")
+def _save_rows(ctx):
+    ctx.open_import_log("excel_test")
+    rows = ctx.payload.get("rows", [])
+    bad = [f"{i}행: 이름 없음" for i, row in enumerate(rows, 1) if not row.get("name")]
+    if bad:  # 전체 롤백
+        return JobOutcome(processed=len(rows), rejected=len(bad), errors=bad, message="저장 실패 (전체 취소)")
+    return JobOutcome(processed=len(rows), imported=len(rows), message=f"{len(rows)}건 저장")
+
+
+@register_handler("test_locked_progress")
+def _report_inside_transaction(ctx):
+    """쓰기 트랜잭션을 연 채로 진행률을 보고하는 처리기 (``holding_writes`` 없이)"""
+    with ctx.session_factory() as db:
+        for i in range(3):
+            db.add(CmpInfo(cmp_num=f"{i:010d}", cmp_branch="본사", cmp_nm=f"회사{i}"))
+            db.flush()
+            ctx.progress((i + 1) / 3, f"{i + 1}/3")
+        db.commit()
+    return JobOutcome(processed=3, imported=3, message="3건 저장")
+
+
+@pytest.fixture
+def file_session_factory(tmp_path):
+    """파일 SQLite DB (연결마다 잠금이 따로 걸리는 실제 환경, 잠금 대기는 짧게)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}",
+                           connect_args={"check_same_thread": False, "timeout": 0.2})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _run_next(queue):
+    ctx = queue._claim()
+    queue._run(ctx)
+    return ctx.job_id
+
+
+def test_rolled_back_save_fails_and_can_retry(session_factory):
+    queue = JobQueue(session_factory, workers=1)
+    job = queue.submit("test_rows", {"rows": [{"name": "김민준"}, {}]}, company_id="1234567890")
+
+    _run_next(queue)
+
+    snapshot = queue.get(job.id)
+    assert snapshot.status == JobStatus.FAILED
+    assert snapshot.result["error_count"] == 1
+    with session_factory() as db:
+        assert db.get(ImportJob, job.id).payload == {"rows": [{"name": "김민준"}, {}]}
+        assert db.get(DataImportLog, snapshot.import_log_id).status == "error"
+
+    assert queue.retry(job.id)
+    assert queue.get(job.id).status == JobStatus.QUEUED
+
+
+def test_successful_save_clears_payload(session_factory):
+    queue = JobQueue(session_factory, workers=1)
+    job = queue.submit("test_rows", {"rows": [{"name": "김민준"}]}, company_id="1234567890")
+
+    _run_next(queue)
+
+    snapshot = queue.get(job.id)
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert snapshot.result["imported"] == 1
+    with session_factory() as db:
+        assert db.get(ImportJob, job.id).payload is None
+    assert not queue.retry(job.id)
+
+
+def test_staged_upload_is_saved_in_chunks_and_removed(session_factory, monkeypatch, tmp_path):
+    from config.settings import settings
+
+    monkeypatch.setattr(settings.app, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(settings.app, "UPLOAD_PREVIEW_ROWS", 2)
+    lines = ["지점,업종,산업,주소,사외이사회수,윤리경영여부,컴플라이언스정책여부"]
+    lines += [f"지점{i % 5},제조업,전자,서울,{i},Y,N" for i in range(12)]  # 청크를 넘는 같은 지점은 덮어씀
+    csv = ("\n".join(lines) + "\n").encode("utf-8")
+
+    result, upload = stage_upload(io.BytesIO(csv), "companies.csv", parse_company_sheet)
+    assert (result.valid_count, len(result.rows), result.truncated) == (12, 2, True)
+
+    queue = JobQueue(session_factory, workers=1)
+    monkeypatch.setattr("app.data.input.upload_spool.CSV_CHUNK_ROWS", 4)
+    job = queue.submit("company_rows", {"upload": upload.to_ref()})
+    _run_next(queue)
+
+    snapshot = queue.get(job.id)
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert snapshot.result["imported"] == 12
+    with session_factory() as db:
+        assert db.query(CmpInfo).count() == 5
+        assert db.query(CmpInfo).filter(CmpInfo.cmp_branch == "지점0").one().cmp_extemp == 10
+    assert not Path(upload.to_ref()["path"]).exists()
+
+
+def test_multi_chunk_upload_succeeds_on_file_database(file_session_factory, monkeypatch, tmp_path):
+    from config.settings import settings
+
+    monkeypatch.setattr(settings.app, "UPLOAD_DIR", str(tmp_path))
+    lines = ["사번,이름,지점,생년월일,전화번호,이메일,입사일,산재발생횟수,이사회여부,성별,재직여부"]
+    lines += [f"{1000 + i},직원{i},서울지점,1990-01-01,010,a@b,2020-03-01,0,N,남자,Y" for i in range(40)]
+    csv = ("\n".join(lines) + "\n").encode("utf-8")
+    _, upload = stage_upload(io.BytesIO(csv), "employees.csv", parse_employee_sheet)
+
+    queue = JobQueue(file_session_factory, workers=1, flush_seconds=0)
+    monkeypatch.setattr("app.data.input.upload_spool.CSV_CHUNK_ROWS", 7)
+    job = queue.submit("employee_rows", {"upload": upload.to_ref()})
+    _run_next(queue)
+
+    snapshot = queue.get(job.id)
+    assert snapshot.status == JobStatus.SUCCEEDED, snapshot.error
+    assert snapshot.result["saved"] == 40
+    with file_session_factory() as db:
+        assert db.query(EmpInfo).count() == 40
+
+
+def test_locked_progress_write_does_not_fail_job(file_session_factory):
+    queue = JobQueue(file_session_factory, workers=1, flush_seconds=0)
+    job = queue.submit("test_locked_progress")
+
+    _run_next(queue)
+
+    snapshot = queue.get(job.id)
+    assert snapshot.status == JobStatus.SUCCEEDED, snapshot.error
+    with file_session_factory() as db:
+        assert db.query(CmpInfo).count() == 3
+
+
+def teardown_module(module):
+    HANDLERS.pop("test_rows", None)
+    HANDLERS.pop("test_locked_progress", None)
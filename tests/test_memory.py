@@ -0,0 +1,77 @@
+"""대화 메모리 (창/요약만 세션에, 전체 기록은 chat_messages) 테스트"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.database.models import ChatSession
+from app.services.chatbot.memory import ConversationMemory
+
+
+def _session_with_turns(memory, turns):
+    session = ChatSession(session_id="s1", messages=[], context={})
+    for i in range(turns):
+        memory.append_turn(session, f"질문 {i}", f"답변 {i}입니다. 자세한 내용")
+    return session
+
+
+def test_session_keeps_window_and_transcript_keeps_everything(session_factory):
+    memory = ConversationMemory(window_turns=2, summary_max_chars=2000)
+    with session_factory() as db:
+        session = ChatSession(session_id="s1", messages=[], context={})
+        db.add(session)
+        for i in range(5):
+            memory.append_turn(session, f"질문 {i}", f"답변 {i}입니다. 자세한 내용")
+            db.commit()
+
+        assert [m["content"] for m in session.messages] == ["질문 3", "답변 3입니다. 자세한 내용",
+                                                            "질문 4", "답변 4입니다. 자세한 내용"]
+        assert session.message_count == 10
+        history = memory.transcript(db, session)
+        assert len(history) == 10
+        assert history[0]["content"] == "질문 0" and history[0]["type"] == "human"
+
+
+def test_prompt_uses_window_and_separate_summary():
+    memory = ConversationMemory(window_turns=2, summary_max_chars=2000)
+    session = _session_with_turns(memory, 5)
+
+    window = memory.window_messages(session)
+    assert [m.content for m in window] == ["질문 3", "답변 3입니다. 자세한 내용", "질문 4", "답변 4입니다. 자세한 내용"]
+    assert isinstance(window[0], HumanMessage) and isinstance(window[1], AIMessage)
+
+    summary = memory.summary(session)
+    assert summary.splitlines() == [f"- Q: 질문 {i} / A: 답변 {i}입니다." for i in range(3)]
+    assert memory.summary_message(summary)[0].content.endswith(summary)
+    assert memory.summary_message("") == []
+
+
+def test_session_saved_without_summary_is_summarized_on_load():
+    memory = ConversationMemory(window_turns=1, summary_max_chars=2000)
+    messages = []
+    for i in range(3):
+        messages += [{"type": "human", "content": f"질문 {i}"}, {"type": "ai", "content": f"답변 {i}"}]
+    session = ChatSession(session_id="s2", messages=messages, context={})
+
+    summary, window = memory.load(session)
+    assert [m["content"] for m in window] == ["질문 2", "답변 2"]
+    assert summary.count("- Q:") == 2
+
+
+def test_full_transcript_of_older_session_moves_to_table_once(session_factory):
+    memory = ConversationMemory(window_turns=1, summary_max_chars=2000)
+    messages = []
+    for i in range(3):
+        messages += [{"type": "human", "content": f"질문 {i}"}, {"type": "ai", "content": f"답변 {i}"}]
+    with session_factory() as db:
+        session = ChatSession(session_id="s3", messages=messages, context={}, message_count=6)
+        db.add(session)
+        db.commit()
+        assert len(memory.transcript(db, session)) == 6
+
+        memory.append_turn(session, "질문 3", "답변 3")
+        memory.append_turn(session, "질문 4", "답변 4")
+        db.commit()
+
+        assert [m["content"] for m in memory.transcript(db, session)][-4:] == ["질문 3", "답변 3", "질문 4", "답변 4"]
+        assert len(memory.transcript(db, session)) == 10
+        assert [m["content"] for m in session.messages] == ["질문 4", "답변 4"]
+        assert memory.summary(session).count("- Q:") == 4
@@ -0,0 +1,78 @@
+"""Keyset 페이지네이션 테스트 (앞/뒤 이동, NULL 정렬값, 페이지 범위 조건)"""
+
+import pytest
+
+from app.core.database.models import EmpInfo
+from app.core.database.pagination import KeysetPaginator
+
+
+@pytest.fixture
+def db(session_factory):
+    with session_factory() as session:
+        for emp_id in range(1, 24):
+            # 입사일: 동순위 여러 개 + NULL 섞임
+            join = None if emp_id % 5 == 0 else f"20{10 + emp_id % 4:02d}0101"
+            session.add(EmpInfo(EMP_ID=emp_id, EMP_NM=f"직원{emp_id}", EMP_JOIN=join))
+        session.commit()
+        yield session
+
+
+def _expected(db, descending):
+    """NULL을 가장 작은 값으로 본 (입사일, 사번) 정렬"""
+    rows = sorted(db.query(EmpInfo).all(), key=lambda e: (e.EMP_JOIN is not None, e.EMP_JOIN or "", e.EMP_ID))
+    ids = [e.EMP_ID for e in rows]
+    return ids[::-1] if descending else ids
+
+
+def _walk_forward(paginator):
+    page = paginator.first()
+    pages = [page]
+    while page.has_next:
+        page = paginator.after(page.last)
+        pages.append(page)
+    return pages
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_all_rows_in_order(db, descending):
+    paginator = KeysetPaginator(db.query(EmpInfo), key=EmpInfo.EMP_ID, sort=EmpInfo.EMP_JOIN,
+                                descending=descending, page_size=5)
+
+    pages = _walk_forward(paginator)
+
+    assert [e.EMP_ID for page in pages for e in page.rows] == _expected(db, descending)
+    assert [len(page.rows) for page in pages] == [5, 5, 5, 5, 3]
+    assert not pages[0].has_prev and all(page.has_prev for page in pages[1:])
+    assert paginator.count() == 23
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_before_returns_previous_page(db, descending):
+    paginator = KeysetPaginator(db.query(EmpInfo), key=EmpInfo.EMP_ID, sort=EmpInfo.EMP_JOIN,
+                                descending=descending, page_size=5)
+    pages = _walk_forward(paginator)
+
+    for previous, page in zip(pages, pages[1:]):
+        back = paginator.before(page.first)
+        assert [e.EMP_ID for e in back.rows] == [e.EMP_ID for e in previous.rows]
+
+    last = paginator.last(3)
+    assert [e.EMP_ID for e in last.rows] == [e.EMP_ID for e in pages[-1].rows]
+    assert last.has_prev and not last.has_next
+
+
+def test_within_matches_rows_of_middle_page(db):
+    paginator = KeysetPaginator(db.query(EmpInfo), key=EmpInfo.EMP_ID, sort=EmpInfo.EMP_JOIN, page_size=5)
+    page = paginator.after(paginator.first().last)
+
+    inside = db.query(EmpInfo.EMP_ID).filter(paginator.within(page)).all()
+
+    assert sorted(emp_id for (emp_id,) in inside) == sorted(e.EMP_ID for e in page.rows)
+
+
+def test_sort_by_key_only(db):
+    paginator = KeysetPaginator(db.query(EmpInfo), key=EmpInfo.EMP_ID, sort=EmpInfo.EMP_ID, page_size=10)
+
+    pages = _walk_forward(paginator)
+
+    assert [e.EMP_ID for page in pages for e in page.rows] == list(range(1, 24))
@@ -0,0 +1,135 @@
+"""검색 인덱스 (n-gram/초성 역색인, 구성 중 변경 반영) 테스트"""
+
+from app.core.database import events
+from app.core.database.models import EmpInfo
+from app.services.search_index import EMPLOYEE_SEARCH, NgramIndex, SearchIndex
+
+
+class _FakeQuery:
+    def __init__(self, rows, during=None):
+        self.rows = rows
+        self.during = during
+
+    def yield_per(self, n):
+        return self
+
+    def __iter__(self):
+        for i, row in enumerate(self.rows):
+            if i == 1 and self.during is not None:
+                self.during()
+            yield row
+
+
+class _FakeSession:
+    def __init__(self, query):
+        self._query = query
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def query(self, *columns):
+        return self._query
+
+
+def _employee(emp_id, name, email=''):
+    return events.RowChange('insert', EmpInfo, (emp_id,), {'EMP_ID': emp_id, 'EMP_NM': name, 'EMP_EMAIL': email})
+
+
+def test_changes_committed_during_build_are_applied():
+    rows = [(1, '김민준', ''), (2, '이서연', '')]
+    index = SearchIndex(EMPLOYEE_SEARCH, session_factory=None)
+    # 구성 중(두 번째 행을 읽기 직전)에 다른 세션이 커밋한 변경
+    query = _FakeQuery(rows, during=lambda: index._on_changes([
+        _employee(3, '박지훈'),
+        events.RowChange('delete', EmpInfo, (1,), {'EMP_ID': 1, 'EMP_NM': '김민준'}),
+    ]))
+    index.session_factory = lambda: _FakeSession(query)
+
+    index.ensure_built()
+
+    assert index.search('박지훈', ('name',)) == [(3,)]
+    assert index.search('김민준', ('name',)) == []
+    assert index.search('이서연', ('name',)) == [(2,)]
+
+
+def test_bulk_change_during_build_rebuilds():
+    calls = []
+    index = SearchIndex(EMPLOYEE_SEARCH, session_factory=None)
+
+    def factory():
+        calls.append(1)
+        during = (lambda: index._on_changes([events.RowChange('bulk', EmpInfo)])) if len(calls) == 1 else None
+        return _FakeSession(_FakeQuery([(1, '김민준', ''), (2, '이서연', '')], during))
+
+    index.session_factory = factory
+    index.ensure_built()
+
+    assert len(calls) == 2
+    assert index.search('이서', ('name',)) == [(2,)]
+
+
+def test_match_clause_falls_back_to_like_until_built():
+    index = SearchIndex(EMPLOYEE_SEARCH, session_factory=lambda: _FakeSession(_FakeQuery([(1, '김민준', '')])))
+
+    assert index.match_clause('김민', 'name') is None
+    index._builder.join(timeout=5)
+    assert index.match_clause('김민', 'name') is not None
+
+
+def test_choseong_match_clause_builds_index_first():
+    # 초성은 LIKE로 찾을 수 없으므로 인덱스가 없으면 구성한 뒤 검색 (빈 결과를 돌려주지 않음)
+    index = SearchIndex(EMPLOYEE_SEARCH, session_factory=lambda: _FakeSession(_FakeQuery([(1, '김민준', '')])))
+    assert index.needs_build('ㄱㅁㅈ') and not index.needs_build('김민')
+
+    clause = index.match_clause('ㄱㅁㅈ', 'name')
+
+    assert clause is not None and 'false' not in str(clause).lower()
+    assert not index.needs_build('ㄱㅁㅈ')
+
+
+def test_ngram_index_substring_and_choseong_search():
+    index = NgramIndex(('name', 'email'))
+    index.rebuild([
+        (1, {'name': '김민준', 'email': 'minjun@corp.com'}),
+        (2, {'name': '김민서', 'email': None}),
+        (3, {'name': '이 서 연', 'email': 'seo@corp.com'}),
+    ])
+
+    assert index.search('민', ('name',)) == [1, 2]
+    assert index.search('ㄱㅁㅈ', ('name',)) == [1]
+    assert index.search('김ㅁ', ('name',)) == [1, 2]
+    assert index.search('서연', ('name',)) == [3]  # 공백은 무시
+    assert index.search('corp') == [1, 3]
+    assert index.search('민', ('name',), limit=1) == [1]
+    assert index.search('없는이름') == []
+
+
+def test_ngram_index_upsert_and_remove():
+    index = NgramIndex(('name',))
+    index.upsert(1, {'name': '김민준'})
+    index.upsert(2, {'name': '박지훈'})
+
+    index.upsert(1, {'name': '최민준'})
+    index.remove(2)
+
+    assert index.search('김') == []
+    assert index.search('최민') == [1]
+    assert index.search('ㅂㅈㅎ') == []
+    assert len(index) == 1
+
+
+def test_ngram_index_compacts_dead_documents():
+    index = NgramIndex(('name',))
+    for i in range(1500):
+        index.upsert(i, {'name': f'직원{i}'})
+    for prefix in ('사원', '직원', '사원'):  # 무효 번호가 살아 있는 문서 수를 넘으면 다시 만듦
+        for i in range(1500):
+            index.upsert(i, {'name': f'{prefix}{i}'})
+
+    assert len(index) == 1500
+    assert index._dead < 1500
+    assert index.search('사원149') == [149] + list(range(1490, 1500))
+    assert index.search('직원') == []
@@ -0,0 +1,167 @@
+"""엑셀/CSV 업로드 검증 테스트 (열 단위 검증 ↔ 기존 행 단위 검증 동등성, 엑셀 스트리밍)"""
+
+import datetime
+import io
+import random
+
+import pandas as pd
+
+from app.data.input.sheet_parsers import (
+    EMPLOYEE_COLUMNS,
+    SheetResult,
+    _cell,
+    _format_date,
+    iter_sheet,
+    validate_employee_frame,
+)
+from app.data.input.upload_spool import spool_upload
+
+
+def _reference_validate(df: pd.DataFrame) -> SheetResult:
+    """열 단위 검증으로 바꾸기 전의 행 단위 검증 (동작 기준)"""
+    result = SheetResult(missing_columns=[col for col in EMPLOYEE_COLUMNS if col not in df.columns])
+    if result.missing_columns:
+        return result
+
+    for idx, row in df.iterrows():
+        try:
+            emp_id = _cell(row, '사번')
+            if not emp_id or emp_id == 'nan':
+                result.errors.append(f'행 {idx + 2}: 사번이 비어있음')
+                continue
+
+            emp_name = _cell(row, '이름')
+            if not emp_name or emp_name == 'nan':
+                result.errors.append(f'행 {idx + 2}: 이름이 비어있음')
+                continue
+
+            branch = _cell(row, '지점', '서울지점')
+
+            birth_date = _cell(row, '생년월일')
+            birth_formatted = ''
+            if birth_date and birth_date != 'nan':
+                try:
+                    birth_formatted = _format_date(birth_date)
+                except Exception:
+                    result.errors.append(f'행 {idx + 2}: 잘못된 생년월일 형식')
+                    continue
+
+            hire_date = _cell(row, '입사일')
+            hire_formatted = ''
+            if hire_date and hire_date != 'nan':
+                try:
+                    hire_formatted = _format_date(hire_date)
+                except Exception:
+                    result.errors.append(f'행 {idx + 2}: 잘못된 입사일 형식')
+                    continue
+
+            gender = _cell(row, '성별', '남자')
+            if gender not in ['남자', '여자']:
+                result.errors.append(f'행 {idx + 2}: 성별은 남자/여자만 가능')
+                continue
+
+            try:
+                accident_count = int(float(row['산재발생횟수'])) if pd.notna(row['산재발생횟수']) else 0
+                if accident_count < 0:
+                    accident_count = 0
+            except (ValueError, TypeError):
+                accident_count = 0
+
+            board_yn = _cell(row, '이사회여부', 'N').upper()
+            employment_yn = _cell(row, '재직여부', 'Y').upper()
+            if board_yn not in ['Y', 'N']:
+                board_yn = 'N'
+            if employment_yn not in ['Y', 'N']:
+                employment_yn = 'Y'
+
+            result.rows.append({
+                '지점': branch,
+                '사번': emp_id,
+                '이름': emp_name,
+                '생년월일': birth_formatted,
+                '전화번호': _cell(row, '전화번호'),
+                '이메일': _cell(row, '이메일'),
+                '입사년도': hire_formatted.split('-')[0] if hire_formatted else '',
+                '입사일': hire_formatted,
+                '산재발생횟수': accident_count,
+                '이사회여부': board_yn,
+                '성별': gender,
+                '재직여부': employment_yn,
+                '상태': '업로드 대기'
+            })
+        except Exception as row_error:
+            result.errors.append(f'행 {idx + 2}: {str(row_error)}')
+    return result
+
+
+def _employee_frame(n: int, seed: int) -> pd.DataFrame:
+    """빈 칸/공백/숫자 셀/잘못된 날짜 등이 섞인 직원 시트"""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        rows.append({
+            '지점': rnd.choice(['서울지점', ' 구미지사 ', None, 123, 'nan']),
+            '사번': rnd.choice([1000 + i, str(2000 + i), f' {3000 + i} ', None, '', 'nan', 4.0 + i]),
+            '이름': rnd.choice(['홍길동', ' 김 ', None, '', 'nan', 77]),
+            '생년월일': rnd.choice(['1990-01-15', '19900115', '1990/01/15', 'bad', None, '',
+                                 datetime.datetime(1991, 2, 3), '2020-13-45', '20201399', '1990.3.4',
+                                 19900115, 'nan', 'Jan 5 2001', '1990-1-5']),
+            '전화번호': rnd.choice(['010-1', None, 1012345678]),
+            '이메일': rnd.choice(['a@b', None, ' x ']),
+            '입사일': rnd.choice(['2020-03-01', '20200301', None, 'zz', datetime.datetime(2019, 1, 1, 12, 30),
+                               '2020-03-01 00:00:00']),
+            '산재발생횟수': rnd.choice([0, 1, -3, '2', ' 3 ', 'x', None, 2.7, -0.5, float('inf'), '1e2', 'nan']),
+            '이사회여부': rnd.choice(['y', 'N', ' n ', 'maybe', None, 1]),
+            '성별': rnd.choice(['남자', '여자', ' 여자 ', '男', None, '']),
+            '재직여부': rnd.choice(['Y', 'n', 'X', None]),
+        })
+    return pd.DataFrame(rows)
+
+
+def test_vectorized_validation_matches_row_loop():
+    for seed in range(3):
+        df = _employee_frame(1500, seed)
+        expected = _reference_validate(df.copy())
+        actual = validate_employee_frame(df.copy())
+        assert actual.rows == expected.rows
+        assert actual.errors == expected.errors
+
+
+def test_vectorized_validation_matches_row_loop_after_excel_round_trip():
+    out = io.BytesIO()
+    _employee_frame(500, 9).to_excel(out, index=False)
+    df = pd.read_excel(io.BytesIO(out.getvalue()))
+
+    expected = _reference_validate(df.copy())
+    actual = validate_employee_frame(df.copy())
+    assert actual.rows == expected.rows
+    assert actual.errors == expected.errors
+
+
+def test_streamed_excel_matches_read_excel(monkeypatch, tmp_path):
+    from config.settings import settings
+
+    monkeypatch.setattr(settings.app, "UPLOAD_DIR", str(tmp_path))
+    df = _employee_frame(300, 4)
+    df.loc[10:12] = None  # 중간의 빈 행은 유지 (행 번호가 read_excel과 같아야 함)
+    df.loc[len(df)] = [None] * len(df.columns)  # 끝의 빈 행은 버림
+    out = io.BytesIO()
+    df.to_excel(out, index=False)
+    data = out.getvalue()
+
+    with spool_upload(io.BytesIO(data), 'employees.xlsx') as upload:
+        chunks = list(upload.iter_frames(chunksize=64))
+    assert len(chunks) > 1
+    streamed = pd.concat(chunks)
+
+    expected = pd.read_excel(io.BytesIO(data))
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False, check_index_type=False)
+    assert validate_employee_frame(streamed).errors == validate_employee_frame(expected).errors
+
+
+def test_iter_sheet_normalizes_column_names():
+    out = io.BytesIO()
+    pd.DataFrame({' 사 번 ': [1], ' 에너지 사용량 ': [2]}).to_excel(out, index=False)
+
+    assert list(next(iter_sheet(out.getvalue())).columns) == ['사번', '에너지사용량']
+    assert list(next(iter_sheet(out.getvalue(), strip_spaces=False)).columns) == ['사 번', '에너지 사용량']